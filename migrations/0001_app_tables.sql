@@ -0,0 +1,83 @@
+-- ============================================================================
+-- 0001 APP TABLES
+-- ============================================================================
+-- Tables the app used to create on page render (users, contracts, payments,
+-- cast & crew, producers). Existing databases already have them.
+
+CREATE TABLE IF NOT EXISTS RGC_USERS (
+    USER_ID VARCHAR(30) PRIMARY KEY,
+    USERNAME VARCHAR(50) UNIQUE NOT NULL,
+    PASSWORD_HASH VARCHAR(64) NOT NULL,
+    USER_TYPE ENUM('VIEWER', 'PRODUCER', 'ADMIN') NOT NULL,
+    EMAIL VARCHAR(100) NOT NULL,
+    CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    LINKED_ACCOUNT VARCHAR(30),
+    INDEX idx_username (USERNAME)
+);
+
+CREATE TABLE IF NOT EXISTS RGC_CONTRACTS (
+    CONTRACT_ID VARCHAR(30) PRIMARY KEY,
+    SERIES_ID VARCHAR(10),
+    HOUSE_ID VARCHAR(10),
+    CONTRACT_TYPE ENUM('PRODUCTION', 'DISTRIBUTION', 'LICENSING', 'TALENT') NOT NULL,
+    CONTRACT_VALUE DECIMAL(15, 2),
+    START_DATE DATE NOT NULL,
+    END_DATE DATE,
+    STATUS ENUM('ACTIVE', 'PENDING', 'EXPIRED', 'TERMINATED') DEFAULT 'PENDING',
+    PAYMENT_TERMS TEXT,
+    MILESTONE_DETAILS JSON,
+    CREATED_BY VARCHAR(30),
+    CREATED_DATE TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    LAST_UPDATED TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (SERIES_ID) REFERENCES RGC_WEB_SERIES(SERIES_ID) ON DELETE CASCADE,
+    FOREIGN KEY (HOUSE_ID) REFERENCES RGC_PRODUCTION_HOUSE(HOUSE_ID),
+    INDEX idx_series (SERIES_ID),
+    INDEX idx_house (HOUSE_ID),
+    INDEX idx_status (STATUS)
+);
+
+CREATE TABLE IF NOT EXISTS RGC_CONTRACT_PAYMENTS (
+    PAYMENT_ID VARCHAR(30) PRIMARY KEY,
+    CONTRACT_ID VARCHAR(30),
+    PAYMENT_DATE DATE,
+    AMOUNT DECIMAL(15, 2),
+    PAYMENT_STATUS ENUM('PENDING', 'COMPLETED', 'OVERDUE', 'CANCELLED') DEFAULT 'PENDING',
+    PAYMENT_METHOD VARCHAR(50),
+    NOTES TEXT,
+    FOREIGN KEY (CONTRACT_ID) REFERENCES RGC_CONTRACTS(CONTRACT_ID) ON DELETE CASCADE,
+    INDEX idx_contract (CONTRACT_ID),
+    INDEX idx_status (PAYMENT_STATUS),
+    INDEX idx_date (PAYMENT_DATE)
+);
+
+CREATE TABLE IF NOT EXISTS RGC_CAST_CREW (
+    ASSOCIATION_ID VARCHAR(30) PRIMARY KEY,
+    SERIES_ID VARCHAR(10),
+    PERSON_NAME VARCHAR(100) NOT NULL,
+    ROLE_TYPE ENUM('ACTOR', 'DIRECTOR', 'WRITER', 'PRODUCER', 'CINEMATOGRAPHER', 'EDITOR', 'OTHER') NOT NULL,
+    CHARACTER_NAME VARCHAR(100),
+    ROLE_DESCRIPTION TEXT,
+    START_DATE DATE,
+    END_DATE DATE,
+    COMPENSATION DECIMAL(15, 2),
+    STATUS ENUM('ACTIVE', 'COMPLETED', 'TERMINATED') DEFAULT 'ACTIVE',
+    FOREIGN KEY (SERIES_ID) REFERENCES RGC_WEB_SERIES(SERIES_ID) ON DELETE CASCADE,
+    INDEX idx_series (SERIES_ID),
+    INDEX idx_person (PERSON_NAME),
+    INDEX idx_role (ROLE_TYPE)
+);
+
+CREATE TABLE IF NOT EXISTS RGC_PRODUCERS (
+    PRODUCER_ID VARCHAR(30) PRIMARY KEY,
+    PRODUCER_NAME VARCHAR(100) NOT NULL,
+    EMAIL VARCHAR(100),
+    PHONE VARCHAR(20),
+    COMPANY_NAME VARCHAR(100),
+    ADDRESS TEXT,
+    SPECIALIZATION VARCHAR(100),
+    YEARS_EXPERIENCE INT,
+    STATUS ENUM('ACTIVE', 'INACTIVE') DEFAULT 'ACTIVE',
+    CREATED_DATE TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_name (PRODUCER_NAME),
+    INDEX idx_email (EMAIL)
+);
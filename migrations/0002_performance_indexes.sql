@@ -0,0 +1,35 @@
+-- ============================================================================
+-- PERFORMANCE INDEXES (Database Optimization)
+-- ============================================================================
+
+-- Index for series name searches (most common query)
+CREATE INDEX idx_series_name ON RGC_WEB_SERIES(SERIES_NAME);
+
+-- Index for feedback queries by series and rating
+CREATE INDEX idx_feedback_series_rating ON RGC_FEEDBACK(SERIES_ID, RATING);
+
+-- Index for viewer country lookups
+CREATE INDEX idx_viewer_country ON RGC_VIEWER(COUNTRY_CODE);
+
+-- Composite index for episode queries
+CREATE INDEX idx_episode_series_viewers ON RGC_EPISODE(SERIES_ID, TOTAL_VIEWERS);
+
+-- Index for contract queries - CORRECTED TABLE NAME
+CREATE INDEX idx_contract_series ON RGC_CONTRACT(SERIES_ID);
+
+-- Index for episode schedules
+CREATE INDEX idx_schedule_episode ON RGC_AIRING_SCHEDULE(EPISODE_ID);
+
+-- Index for producer lookups
+CREATE INDEX idx_producer_email ON RGC_PRODUCER(P_EMAIL);
+
+-- Index for production house lookups
+CREATE INDEX idx_house_name ON RGC_PRODUCTION_HOUSE(HOUSE_NAME);
+
+-- Full-text search indexes (rgc_search.py, catalog search, sp_search_series).
+-- Names and titles use the ngram parser so substrings, partial words and small
+-- typos match; review text uses the standard word parser with prefix terms.
+CREATE FULLTEXT INDEX ft_series_name ON RGC_WEB_SERIES(SERIES_NAME) WITH PARSER ngram;
+CREATE FULLTEXT INDEX ft_episode_title ON RGC_EPISODE(EPISODE_TITLE) WITH PARSER ngram;
+CREATE FULLTEXT INDEX ft_cast_person ON RGC_CAST_CREW(PERSON_NAME) WITH PARSER ngram;
+CREATE FULLTEXT INDEX ft_feedback_text ON RGC_FEEDBACK(FEEDBACK_TEXT);
@@ -0,0 +1,79 @@
+-- ============================================================================
+-- AUDIT TABLE (Security & History Tracking)
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS RGC_AUDIT_LOG (
+    LOG_ID INT AUTO_INCREMENT PRIMARY KEY,
+    TABLE_NAME VARCHAR(50) NOT NULL,
+    OPERATION_TYPE ENUM('INSERT', 'UPDATE', 'DELETE') NOT NULL,
+    RECORD_ID VARCHAR(50),
+    OLD_VALUES TEXT,
+    NEW_VALUES TEXT,
+    CHANGED_BY VARCHAR(50),
+    CHANGE_TIMESTAMP TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_table_timestamp (TABLE_NAME, CHANGE_TIMESTAMP),
+    INDEX idx_operation (OPERATION_TYPE)
+);
+
+-- ============================================================================
+-- TRIGGERS FOR AUDIT LOGGING
+-- ============================================================================
+
+DELIMITER $$
+
+-- Trigger: Log series updates
+DROP TRIGGER IF EXISTS trg_series_after_update$$
+CREATE TRIGGER trg_series_after_update
+AFTER UPDATE ON RGC_WEB_SERIES
+FOR EACH ROW
+BEGIN
+    INSERT INTO RGC_AUDIT_LOG 
+    (TABLE_NAME, OPERATION_TYPE, RECORD_ID, OLD_VALUES, NEW_VALUES)
+    VALUES 
+    ('RGC_WEB_SERIES', 'UPDATE', NEW.SERIES_ID,
+     CONCAT('Episodes: ', OLD.NUM_EPISODES, ', Name: ', OLD.SERIES_NAME),
+     CONCAT('Episodes: ', NEW.NUM_EPISODES, ', Name: ', NEW.SERIES_NAME));
+END$$
+
+-- Trigger: Log series deletions
+DROP TRIGGER IF EXISTS trg_series_after_delete$$
+CREATE TRIGGER trg_series_after_delete
+AFTER DELETE ON RGC_WEB_SERIES
+FOR EACH ROW
+BEGIN
+    INSERT INTO RGC_AUDIT_LOG 
+    (TABLE_NAME, OPERATION_TYPE, RECORD_ID, OLD_VALUES)
+    VALUES 
+    ('RGC_WEB_SERIES', 'DELETE', OLD.SERIES_ID,
+     CONCAT('Deleted: ', OLD.SERIES_NAME, ' (', OLD.NUM_EPISODES, ' episodes)'));
+END$$
+
+-- Trigger: Log feedback submissions
+DROP TRIGGER IF EXISTS trg_feedback_after_insert$$
+CREATE TRIGGER trg_feedback_after_insert
+AFTER INSERT ON RGC_FEEDBACK
+FOR EACH ROW
+BEGIN
+    INSERT INTO RGC_AUDIT_LOG 
+    (TABLE_NAME, OPERATION_TYPE, RECORD_ID, NEW_VALUES)
+    VALUES 
+    ('RGC_FEEDBACK', 'INSERT', NEW.FEEDBACK_ID,
+     CONCAT('Series: ', NEW.SERIES_ID, ', Rating: ', NEW.RATING, 
+            ', Account: ', NEW.ACCOUNT_ID));
+END$$
+
+-- Trigger: Log contract changes - CORRECTED TABLE NAME
+DROP TRIGGER IF EXISTS trg_contract_after_update$$
+CREATE TRIGGER trg_contract_after_update
+AFTER UPDATE ON RGC_CONTRACT
+FOR EACH ROW
+BEGIN
+    INSERT INTO RGC_AUDIT_LOG 
+    (TABLE_NAME, OPERATION_TYPE, RECORD_ID, OLD_VALUES, NEW_VALUES)
+    VALUES 
+    ('RGC_CONTRACT', 'UPDATE', NEW.CONTRACT_ID,
+     CONCAT('Rate: ', OLD.EPISODE_RATE, ', End: ', OLD.END_DATE),
+     CONCAT('Rate: ', NEW.EPISODE_RATE, ', End: ', NEW.END_DATE));
+END$$
+
+DELIMITER ;
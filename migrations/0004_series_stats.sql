@@ -0,0 +1,166 @@
+-- ============================================================================
+-- SERIES STATISTICS SUMMARY (Pre-aggregated, maintained by triggers)
+-- ============================================================================
+-- Average rating, review count, episode count and total viewers per series.
+-- Read paths use this table instead of aggregating RGC_FEEDBACK/RGC_EPISODE,
+-- so top-N and sort-by-rating become index scans.
+
+CREATE TABLE IF NOT EXISTS RGC_SERIES_STATS (
+    SERIES_ID VARCHAR(10) NOT NULL,
+    REVIEW_COUNT INT NOT NULL DEFAULT 0,
+    RATING_SUM INT NOT NULL DEFAULT 0,
+    AVG_RATING DECIMAL(6,4) NOT NULL DEFAULT 0 COMMENT '0 WHEN THERE ARE NO REVIEWS',
+    EPISODE_COUNT INT NOT NULL DEFAULT 0,
+    TOTAL_VIEWERS BIGINT NOT NULL DEFAULT 0,
+    LAST_UPDATED TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (SERIES_ID),
+    CONSTRAINT FK_WS_SERIES_STATS FOREIGN KEY (SERIES_ID)
+        REFERENCES RGC_WEB_SERIES (SERIES_ID) ON DELETE CASCADE,
+    INDEX idx_stats_rating (AVG_RATING DESC, SERIES_ID),
+    INDEX idx_stats_episodes (EPISODE_COUNT DESC, SERIES_ID),
+    INDEX idx_stats_viewers (TOTAL_VIEWERS DESC, SERIES_ID)
+);
+
+DELIMITER $$
+
+-- Rebuild the whole summary from the base tables (run after bulk loads
+-- or if the triggers were ever disabled)
+DROP PROCEDURE IF EXISTS sp_rebuild_series_stats$$
+CREATE PROCEDURE sp_rebuild_series_stats()
+BEGIN
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        ROLLBACK;
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Error rebuilding series statistics';
+    END;
+
+    START TRANSACTION;
+
+    DELETE FROM RGC_SERIES_STATS;
+
+    INSERT INTO RGC_SERIES_STATS
+    (SERIES_ID, REVIEW_COUNT, RATING_SUM, AVG_RATING, EPISODE_COUNT, TOTAL_VIEWERS)
+    SELECT ws.SERIES_ID,
+           IFNULL(f.review_count, 0),
+           IFNULL(f.rating_sum, 0),
+           IFNULL(f.rating_sum / f.review_count, 0),
+           IFNULL(e.episode_count, 0),
+           IFNULL(e.total_viewers, 0)
+    FROM RGC_WEB_SERIES ws
+    LEFT JOIN (SELECT SERIES_ID, COUNT(*) as review_count, SUM(RATING) as rating_sum
+               FROM RGC_FEEDBACK GROUP BY SERIES_ID) f ON ws.SERIES_ID = f.SERIES_ID
+    LEFT JOIN (SELECT SERIES_ID, COUNT(*) as episode_count, SUM(TOTAL_VIEWERS) as total_viewers
+               FROM RGC_EPISODE GROUP BY SERIES_ID) e ON ws.SERIES_ID = e.SERIES_ID;
+
+    COMMIT;
+END$$
+
+-- Trigger: every series gets a summary row
+DROP TRIGGER IF EXISTS trg_series_stats_after_insert$$
+CREATE TRIGGER trg_series_stats_after_insert
+AFTER INSERT ON RGC_WEB_SERIES
+FOR EACH ROW
+BEGIN
+    INSERT IGNORE INTO RGC_SERIES_STATS (SERIES_ID) VALUES (NEW.SERIES_ID);
+END$$
+
+-- Triggers: feedback changes adjust review count and rating
+DROP TRIGGER IF EXISTS trg_feedback_stats_after_insert$$
+CREATE TRIGGER trg_feedback_stats_after_insert
+AFTER INSERT ON RGC_FEEDBACK
+FOR EACH ROW
+BEGIN
+    INSERT INTO RGC_SERIES_STATS (SERIES_ID, REVIEW_COUNT, RATING_SUM, AVG_RATING)
+    VALUES (NEW.SERIES_ID, 1, NEW.RATING, NEW.RATING)
+    ON DUPLICATE KEY UPDATE
+        REVIEW_COUNT = REVIEW_COUNT + 1,
+        RATING_SUM = RATING_SUM + NEW.RATING,
+        AVG_RATING = RATING_SUM / REVIEW_COUNT;
+END$$
+
+DROP TRIGGER IF EXISTS trg_feedback_stats_after_update$$
+CREATE TRIGGER trg_feedback_stats_after_update
+AFTER UPDATE ON RGC_FEEDBACK
+FOR EACH ROW
+BEGIN
+    IF OLD.SERIES_ID <> NEW.SERIES_ID OR OLD.RATING <> NEW.RATING THEN
+        UPDATE RGC_SERIES_STATS
+        SET REVIEW_COUNT = REVIEW_COUNT - 1,
+            RATING_SUM = RATING_SUM - OLD.RATING,
+            AVG_RATING = IF(REVIEW_COUNT > 0, RATING_SUM / REVIEW_COUNT, 0)
+        WHERE SERIES_ID = OLD.SERIES_ID;
+
+        INSERT INTO RGC_SERIES_STATS (SERIES_ID, REVIEW_COUNT, RATING_SUM, AVG_RATING)
+        VALUES (NEW.SERIES_ID, 1, NEW.RATING, NEW.RATING)
+        ON DUPLICATE KEY UPDATE
+            REVIEW_COUNT = REVIEW_COUNT + 1,
+            RATING_SUM = RATING_SUM + NEW.RATING,
+            AVG_RATING = RATING_SUM / REVIEW_COUNT;
+    END IF;
+END$$
+
+DROP TRIGGER IF EXISTS trg_feedback_stats_after_delete$$
+CREATE TRIGGER trg_feedback_stats_after_delete
+AFTER DELETE ON RGC_FEEDBACK
+FOR EACH ROW
+BEGIN
+    UPDATE RGC_SERIES_STATS
+    SET REVIEW_COUNT = REVIEW_COUNT - 1,
+        RATING_SUM = RATING_SUM - OLD.RATING,
+        AVG_RATING = IF(REVIEW_COUNT > 0, RATING_SUM / REVIEW_COUNT, 0)
+    WHERE SERIES_ID = OLD.SERIES_ID;
+END$$
+
+-- Triggers: episode changes adjust episode count and viewers
+DROP TRIGGER IF EXISTS trg_episode_stats_after_insert$$
+CREATE TRIGGER trg_episode_stats_after_insert
+AFTER INSERT ON RGC_EPISODE
+FOR EACH ROW
+BEGIN
+    INSERT INTO RGC_SERIES_STATS (SERIES_ID, EPISODE_COUNT, TOTAL_VIEWERS)
+    VALUES (NEW.SERIES_ID, 1, NEW.TOTAL_VIEWERS)
+    ON DUPLICATE KEY UPDATE
+        EPISODE_COUNT = EPISODE_COUNT + 1,
+        TOTAL_VIEWERS = TOTAL_VIEWERS + NEW.TOTAL_VIEWERS;
+END$$
+
+DROP TRIGGER IF EXISTS trg_episode_stats_after_update$$
+CREATE TRIGGER trg_episode_stats_after_update
+AFTER UPDATE ON RGC_EPISODE
+FOR EACH ROW
+BEGIN
+    IF OLD.SERIES_ID = NEW.SERIES_ID THEN
+        IF OLD.TOTAL_VIEWERS <> NEW.TOTAL_VIEWERS THEN
+            UPDATE RGC_SERIES_STATS
+            SET TOTAL_VIEWERS = TOTAL_VIEWERS + NEW.TOTAL_VIEWERS - OLD.TOTAL_VIEWERS
+            WHERE SERIES_ID = NEW.SERIES_ID;
+        END IF;
+    ELSE
+        UPDATE RGC_SERIES_STATS
+        SET EPISODE_COUNT = EPISODE_COUNT - 1,
+            TOTAL_VIEWERS = TOTAL_VIEWERS - OLD.TOTAL_VIEWERS
+        WHERE SERIES_ID = OLD.SERIES_ID;
+
+        INSERT INTO RGC_SERIES_STATS (SERIES_ID, EPISODE_COUNT, TOTAL_VIEWERS)
+        VALUES (NEW.SERIES_ID, 1, NEW.TOTAL_VIEWERS)
+        ON DUPLICATE KEY UPDATE
+            EPISODE_COUNT = EPISODE_COUNT + 1,
+            TOTAL_VIEWERS = TOTAL_VIEWERS + NEW.TOTAL_VIEWERS;
+    END IF;
+END$$
+
+DROP TRIGGER IF EXISTS trg_episode_stats_after_delete$$
+CREATE TRIGGER trg_episode_stats_after_delete
+AFTER DELETE ON RGC_EPISODE
+FOR EACH ROW
+BEGIN
+    UPDATE RGC_SERIES_STATS
+    SET EPISODE_COUNT = EPISODE_COUNT - 1,
+        TOTAL_VIEWERS = TOTAL_VIEWERS - OLD.TOTAL_VIEWERS
+    WHERE SERIES_ID = OLD.SERIES_ID;
+END$$
+
+DELIMITER ;
+
+-- Populate the summary for the existing data
+CALL sp_rebuild_series_stats();
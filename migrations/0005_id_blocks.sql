@@ -0,0 +1,12 @@
+-- ============================================================================
+-- ID BLOCK ALLOCATION (Primary keys for app-inserted rows, see rgc_ids.py)
+-- ============================================================================
+-- One row per ID sequence. A process reserves a block of values with
+--   UPDATE RGC_ID_BLOCKS SET NEXT_VALUE = LAST_INSERT_ID(NEXT_VALUE + n)
+-- and hands them out from memory, so IDs never collide across processes.
+
+CREATE TABLE IF NOT EXISTS RGC_ID_BLOCKS (
+    SEQ_NAME VARCHAR(10) NOT NULL COMMENT 'ID PREFIX, E.G. F FOR FEEDBACK',
+    NEXT_VALUE BIGINT UNSIGNED NOT NULL DEFAULT 1 COMMENT 'FIRST VALUE NOT YET RESERVED',
+    PRIMARY KEY (SEQ_NAME)
+);
@@ -0,0 +1,54 @@
+-- ============================================================================
+-- VIEWS FOR COMMON QUERIES (Performance Optimization)
+-- ============================================================================
+
+-- View: Series with full details
+CREATE OR REPLACE VIEW vw_series_full_details AS
+SELECT 
+    ws.SERIES_ID,
+    ws.SERIES_NAME,
+    ws.NUM_EPISODES,
+    ws.RELEASE_DATE,
+    ws.COUNTRY_OF_ORIGIN,
+    ws.LANGUAGE,
+    ph.HOUSE_NAME,
+    ph.ADDRESS_CITY as production_city,
+    ss.EPISODE_COUNT as episodes_created,
+    ss.TOTAL_VIEWERS as total_viewers,
+    IF(ss.REVIEW_COUNT > 0, ss.AVG_RATING, NULL) as avg_rating,
+    ss.REVIEW_COUNT as review_count,
+    GROUP_CONCAT(DISTINCT st.SERIES_TYPE_NAME) as genres
+FROM RGC_WEB_SERIES ws
+JOIN RGC_PRODUCTION_HOUSE ph ON ws.HOUSE_ID = ph.HOUSE_ID
+JOIN RGC_SERIES_STATS ss ON ws.SERIES_ID = ss.SERIES_ID
+LEFT JOIN RGC_WEB_SERIES_SERIES_TYPE wst ON ws.SERIES_ID = wst.SERIES_ID
+LEFT JOIN RGC_SERIES_TYPE st ON wst.SERIES_TYPE_ID = st.SERIES_TYPE_ID
+GROUP BY ws.SERIES_ID;
+
+-- View: Top rated series
+CREATE OR REPLACE VIEW vw_top_rated_series AS
+SELECT 
+    ws.SERIES_ID,
+    ws.SERIES_NAME,
+    ss.AVG_RATING as avg_rating,
+    ss.REVIEW_COUNT as review_count
+FROM RGC_SERIES_STATS ss
+JOIN RGC_WEB_SERIES ws ON ss.SERIES_ID = ws.SERIES_ID
+WHERE ss.REVIEW_COUNT > 0
+ORDER BY ss.AVG_RATING DESC, ss.REVIEW_COUNT DESC;
+
+-- View: Active contracts - CORRECTED TABLE NAME
+CREATE OR REPLACE VIEW vw_active_contracts AS
+SELECT 
+    c.CONTRACT_ID,
+    ws.SERIES_NAME,
+    ph.HOUSE_NAME,
+    c.CONTRACT_DATE,
+    c.END_DATE,
+    c.EPISODE_RATE,
+    DATEDIFF(c.END_DATE, CURDATE()) as days_remaining
+FROM RGC_CONTRACT c
+JOIN RGC_WEB_SERIES ws ON c.SERIES_ID = ws.SERIES_ID
+JOIN RGC_PRODUCTION_HOUSE ph ON ws.HOUSE_ID = ph.HOUSE_ID
+WHERE c.END_DATE > CURDATE()
+ORDER BY c.END_DATE;
@@ -0,0 +1,13 @@
+-- ============================================================================
+-- 0007 HOT PATH INDEXES
+-- ============================================================================
+-- Indexes for page queries that still sorted or scanned without one
+
+-- Series details review list: WHERE SERIES_ID = ? ORDER BY FEEDBACK_DATE DESC
+CREATE INDEX idx_feedback_series_date ON RGC_FEEDBACK(SERIES_ID, FEEDBACK_DATE);
+
+-- Settings activity tab: WHERE ACCOUNT_ID = ? ORDER BY FEEDBACK_DATE DESC
+CREATE INDEX idx_feedback_account_date ON RGC_FEEDBACK(ACCOUNT_ID, FEEDBACK_DATE);
+
+-- Schedule list and 30-day timeline filter and sort on START_TS
+CREATE INDEX idx_schedule_start ON RGC_AIRING_SCHEDULE(START_TS);
@@ -0,0 +1,9 @@
+-- ============================================================================
+-- 0008 LOOKUP INDEXES
+-- ============================================================================
+-- Prefix searches behind the typeahead pickers (rgc_lookup.py). Series, house
+-- and platform names are already indexed; viewer accounts are searched by
+-- first or last name.
+
+CREATE INDEX idx_viewer_fname ON RGC_VIEWER(ACC_FNAME);
+CREATE INDEX idx_viewer_lname ON RGC_VIEWER(ACC_LNAME);
@@ -0,0 +1,10 @@
+-- ============================================================================
+-- 0009 STATUS MAINTENANCE INDEXES
+-- ============================================================================
+-- rgc_maintenance.py flips ACTIVE contracts past END_DATE to EXPIRED and
+-- PENDING payments past PAYMENT_DATE to OVERDUE, walking these indexes in
+-- chunks. Pages use the same contract index for live and expiring contracts:
+-- STATUS = 'ACTIVE' AND END_DATE BETWEEN CURDATE() AND CURDATE() + INTERVAL n DAY
+
+CREATE INDEX idx_contract_status_end ON RGC_CONTRACTS(STATUS, END_DATE);
+CREATE INDEX idx_payment_status_date ON RGC_CONTRACT_PAYMENTS(PAYMENT_STATUS, PAYMENT_DATE);
@@ -0,0 +1,73 @@
+-- ============================================================================
+-- 0010 SERIES NEIGHBORS ("viewers who liked this also liked")
+-- ============================================================================
+-- rgc_recommend.py computes the top-k most similar series per series from
+-- RGC_FEEDBACK ratings (adjusted cosine) and stores them here. The series
+-- details page reads one series' list with a primary-key range lookup:
+-- WHERE SERIES_ID = ? ORDER BY RANK_NO
+
+CREATE TABLE IF NOT EXISTS RGC_SERIES_NEIGHBORS (
+    SERIES_ID VARCHAR(10) NOT NULL,
+    RANK_NO SMALLINT NOT NULL,
+    NEIGHBOR_ID VARCHAR(10) NOT NULL,
+    SIMILARITY FLOAT NOT NULL,
+    CO_RATERS INT NOT NULL COMMENT 'VIEWERS WHO RATED BOTH SERIES',
+    PRIMARY KEY (SERIES_ID, RANK_NO),
+    CONSTRAINT FK_WS_NEIGHBORS_SERIES FOREIGN KEY (SERIES_ID)
+        REFERENCES RGC_WEB_SERIES (SERIES_ID) ON DELETE CASCADE,
+    CONSTRAINT FK_WS_NEIGHBORS_NEIGHBOR FOREIGN KEY (NEIGHBOR_ID)
+        REFERENCES RGC_WEB_SERIES (SERIES_ID) ON DELETE CASCADE
+);
+
+-- Length of each series' mean-centered rating vector at the last build, so an
+-- incremental update can score changed series against the rest without
+-- reloading every rating
+CREATE TABLE IF NOT EXISTS RGC_SERIES_RATING_NORMS (
+    SERIES_ID VARCHAR(10) NOT NULL,
+    RATING_NORM DOUBLE NOT NULL,
+    RATERS INT NOT NULL,
+    UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (SERIES_ID),
+    CONSTRAINT FK_WS_RATING_NORMS FOREIGN KEY (SERIES_ID)
+        REFERENCES RGC_WEB_SERIES (SERIES_ID) ON DELETE CASCADE
+);
+
+-- Series whose feedback changed since their neighbors were last computed
+CREATE TABLE IF NOT EXISTS RGC_RECOMMEND_DIRTY (
+    SERIES_ID VARCHAR(10) NOT NULL,
+    CHANGED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (SERIES_ID)
+);
+
+DELIMITER $$
+
+DROP TRIGGER IF EXISTS trg_feedback_recommend_after_insert$$
+CREATE TRIGGER trg_feedback_recommend_after_insert
+AFTER INSERT ON RGC_FEEDBACK
+FOR EACH ROW
+BEGIN
+    INSERT INTO RGC_RECOMMEND_DIRTY (SERIES_ID) VALUES (NEW.SERIES_ID)
+    ON DUPLICATE KEY UPDATE CHANGED_AT = CURRENT_TIMESTAMP;
+END$$
+
+DROP TRIGGER IF EXISTS trg_feedback_recommend_after_update$$
+CREATE TRIGGER trg_feedback_recommend_after_update
+AFTER UPDATE ON RGC_FEEDBACK
+FOR EACH ROW
+BEGIN
+    IF OLD.SERIES_ID <> NEW.SERIES_ID OR OLD.RATING <> NEW.RATING OR OLD.ACCOUNT_ID <> NEW.ACCOUNT_ID THEN
+        INSERT INTO RGC_RECOMMEND_DIRTY (SERIES_ID) VALUES (OLD.SERIES_ID), (NEW.SERIES_ID)
+        ON DUPLICATE KEY UPDATE CHANGED_AT = CURRENT_TIMESTAMP;
+    END IF;
+END$$
+
+DROP TRIGGER IF EXISTS trg_feedback_recommend_after_delete$$
+CREATE TRIGGER trg_feedback_recommend_after_delete
+AFTER DELETE ON RGC_FEEDBACK
+FOR EACH ROW
+BEGIN
+    INSERT INTO RGC_RECOMMEND_DIRTY (SERIES_ID) VALUES (OLD.SERIES_ID)
+    ON DUPLICATE KEY UPDATE CHANGED_AT = CURRENT_TIMESTAMP;
+END$$
+
+DELIMITER ;
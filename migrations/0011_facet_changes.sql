@@ -0,0 +1,119 @@
+-- ============================================================================
+-- 0011 FACET CHANGE LOG (catalog facet bitmaps)
+-- ============================================================================
+-- rgc_facets.py keeps one in-memory bitmap per catalog facet value (genre,
+-- subtitle and dubbing language, country, release year, production house,
+-- rating band). These triggers log every series whose facets or sort keys may
+-- have changed, so the index reloads just those series by polling
+-- WHERE CHANGE_ID > last seen instead of rebuilding on every write.
+-- rgc_maintenance.py prunes rows older than a day.
+
+CREATE TABLE IF NOT EXISTS RGC_FACET_CHANGES (
+    CHANGE_ID BIGINT NOT NULL AUTO_INCREMENT,
+    SERIES_ID VARCHAR(10) NOT NULL COMMENT 'NO FOREIGN KEY: DELETED SERIES ARE LOGGED TOO',
+    CHANGED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (CHANGE_ID),
+    INDEX idx_facet_changes_time (CHANGED_AT)
+);
+
+DELIMITER $$
+
+DROP TRIGGER IF EXISTS trg_series_facets_after_insert$$
+CREATE TRIGGER trg_series_facets_after_insert
+AFTER INSERT ON RGC_WEB_SERIES
+FOR EACH ROW
+BEGIN
+    INSERT INTO RGC_FACET_CHANGES (SERIES_ID) VALUES (NEW.SERIES_ID);
+END$$
+
+DROP TRIGGER IF EXISTS trg_series_facets_after_update$$
+CREATE TRIGGER trg_series_facets_after_update
+AFTER UPDATE ON RGC_WEB_SERIES
+FOR EACH ROW
+BEGIN
+    IF OLD.SERIES_ID <> NEW.SERIES_ID THEN
+        INSERT INTO RGC_FACET_CHANGES (SERIES_ID) VALUES (OLD.SERIES_ID), (NEW.SERIES_ID);
+    ELSE
+        INSERT INTO RGC_FACET_CHANGES (SERIES_ID) VALUES (NEW.SERIES_ID);
+    END IF;
+END$$
+
+DROP TRIGGER IF EXISTS trg_series_facets_after_delete$$
+CREATE TRIGGER trg_series_facets_after_delete
+AFTER DELETE ON RGC_WEB_SERIES
+FOR EACH ROW
+BEGIN
+    INSERT INTO RGC_FACET_CHANGES (SERIES_ID) VALUES (OLD.SERIES_ID);
+END$$
+
+DROP TRIGGER IF EXISTS trg_genre_facets_after_insert$$
+CREATE TRIGGER trg_genre_facets_after_insert
+AFTER INSERT ON RGC_WEB_SERIES_SERIES_TYPE
+FOR EACH ROW
+BEGIN
+    INSERT INTO RGC_FACET_CHANGES (SERIES_ID) VALUES (NEW.SERIES_ID);
+END$$
+
+DROP TRIGGER IF EXISTS trg_genre_facets_after_delete$$
+CREATE TRIGGER trg_genre_facets_after_delete
+AFTER DELETE ON RGC_WEB_SERIES_SERIES_TYPE
+FOR EACH ROW
+BEGIN
+    INSERT INTO RGC_FACET_CHANGES (SERIES_ID) VALUES (OLD.SERIES_ID);
+END$$
+
+DROP TRIGGER IF EXISTS trg_subtitle_facets_after_insert$$
+CREATE TRIGGER trg_subtitle_facets_after_insert
+AFTER INSERT ON RGC_WEBSERIES_SUBTITLE
+FOR EACH ROW
+BEGIN
+    INSERT INTO RGC_FACET_CHANGES (SERIES_ID) VALUES (NEW.SERIES_ID);
+END$$
+
+DROP TRIGGER IF EXISTS trg_subtitle_facets_after_delete$$
+CREATE TRIGGER trg_subtitle_facets_after_delete
+AFTER DELETE ON RGC_WEBSERIES_SUBTITLE
+FOR EACH ROW
+BEGIN
+    INSERT INTO RGC_FACET_CHANGES (SERIES_ID) VALUES (OLD.SERIES_ID);
+END$$
+
+DROP TRIGGER IF EXISTS trg_dubbing_facets_after_insert$$
+CREATE TRIGGER trg_dubbing_facets_after_insert
+AFTER INSERT ON RGC_WEBSERIES_DUBBING
+FOR EACH ROW
+BEGIN
+    INSERT INTO RGC_FACET_CHANGES (SERIES_ID) VALUES (NEW.SERIES_ID);
+END$$
+
+DROP TRIGGER IF EXISTS trg_dubbing_facets_after_delete$$
+CREATE TRIGGER trg_dubbing_facets_after_delete
+AFTER DELETE ON RGC_WEBSERIES_DUBBING
+FOR EACH ROW
+BEGIN
+    INSERT INTO RGC_FACET_CHANGES (SERIES_ID) VALUES (OLD.SERIES_ID);
+END$$
+
+-- Rating band and the rating and episode sorts come from RGC_SERIES_STATS;
+-- viewer counts are not faceted, so TOTAL_VIEWERS updates are not logged
+DROP TRIGGER IF EXISTS trg_stats_facets_after_insert$$
+CREATE TRIGGER trg_stats_facets_after_insert
+AFTER INSERT ON RGC_SERIES_STATS
+FOR EACH ROW
+BEGIN
+    INSERT INTO RGC_FACET_CHANGES (SERIES_ID) VALUES (NEW.SERIES_ID);
+END$$
+
+DROP TRIGGER IF EXISTS trg_stats_facets_after_update$$
+CREATE TRIGGER trg_stats_facets_after_update
+AFTER UPDATE ON RGC_SERIES_STATS
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.REVIEW_COUNT <=> NEW.REVIEW_COUNT
+            AND OLD.AVG_RATING <=> NEW.AVG_RATING
+            AND OLD.EPISODE_COUNT <=> NEW.EPISODE_COUNT) THEN
+        INSERT INTO RGC_FACET_CHANGES (SERIES_ID) VALUES (NEW.SERIES_ID);
+    END IF;
+END$$
+
+DELIMITER ;
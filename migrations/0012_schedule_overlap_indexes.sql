@@ -0,0 +1,14 @@
+-- ============================================================================
+-- 0012 SCHEDULE OVERLAP INDEXES
+-- ============================================================================
+-- rgc_schedule_index.py re-checks a new airing slot inside its INSERT
+-- transaction with a locking read:
+--   WHERE PLATFORM_ID = ? AND START_TS < ? AND END_TS > ? FOR UPDATE
+-- (and the same on EPISODE_ID). These indexes keep its next-key locks on one
+-- platform's or one episode's slots instead of the whole table.
+
+CREATE INDEX idx_schedule_platform_start ON RGC_AIRING_SCHEDULE(PLATFORM_ID, START_TS);
+CREATE INDEX idx_schedule_episode_start ON RGC_AIRING_SCHEDULE(EPISODE_ID, START_TS);
+
+-- The episode foreign key is served by the new (EPISODE_ID, START_TS) index
+DROP INDEX idx_schedule_episode ON RGC_AIRING_SCHEDULE;
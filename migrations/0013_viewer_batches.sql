@@ -0,0 +1,14 @@
+-- ============================================================================
+-- 0013 VIEWER INGEST BATCHES (rgc_viewer_ingest.py)
+-- ============================================================================
+-- Every viewer-count flush inserts its batch ID here in the same transaction
+-- as its UPDATEs. When the connection drops around COMMIT the ingestor looks
+-- the ID up before putting the increments back, so a flush that did commit is
+-- never applied twice. rgc_maintenance.py prunes rows older than a day.
+
+CREATE TABLE IF NOT EXISTS RGC_VIEWER_BATCHES (
+    BATCH_ID CHAR(32) NOT NULL COMMENT 'UUID4 HEX OF ONE FLUSH',
+    APPLIED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (BATCH_ID),
+    INDEX idx_viewer_batches_time (APPLIED_AT)
+);
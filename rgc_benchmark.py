@@ -0,0 +1,323 @@
+"""
+RGC Stream - Query benchmark
+Times each page's query set and the read-only stored procedures against a
+MySQL database, optionally regenerating the data at several scale factors
+with rgc_datagen first, and writes a JSON and CSV report.
+
+The page query sets are the statements the rgc_pages modules (and the facet
+index in rgc_facets.py) run on a first render, imported from those modules so
+a page's SQL change is benchmarked without touching this file.
+
+Usage:
+    python rgc_benchmark.py --scales 0.001 0.01 0.1 --generate --out reports/v2
+    python rgc_benchmark.py --out reports/current --baseline reports/v2.json
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import mysql.connector
+
+from rgc_datagen import (DEFAULT_SEED, DataGenerator, add_connection_args,
+                         connection_config, load_tables, reset_tables)
+from rgc_facets import CHANGES_QUERY, FULL_RELOAD_CHANGES, LINK_QUERIES, SERIES_QUERY
+from rgc_lookup import LOOKUPS, build_lookup_query
+from rgc_search import build_search_query
+from rgc_pages import admin, catalog, dashboard, feedback, producer_portal, series_details
+from rgc_pages.contracts import contracts_query
+
+DEFAULT_REPEAT = 5
+DEFAULT_REGRESSION_PCT = 20.0
+
+
+# page -> [(query name, SQL, params built from the sample values)]
+# SQL None means the params callable is a builder returning (query, params)
+PAGE_QUERIES = {
+    'catalog': [
+        # facet index: full load once per process, then a change-log poll with nothing new
+        ('facet_series', SERIES_QUERY, lambda s: None),
+        ('facet_genres', LINK_QUERIES['genre'], lambda s: None),
+        ('facet_subtitles', LINK_QUERIES['subtitle'], lambda s: None),
+        ('facet_dubbings', LINK_QUERIES['dubbing'], lambda s: None),
+        ('facet_poll', CHANGES_QUERY, lambda s: (2 ** 62, FULL_RELOAD_CHANGES + 1)),
+        ('search_ids', None, lambda s: catalog.name_search_query(s['search'])),
+        ('page_cards', catalog.CATALOG_CARDS_QUERY.format(placeholders='%s'),
+         lambda s: (s['series_id'],)),
+        ('card_details', catalog.CARD_DETAILS_QUERY.format(placeholders='%s'),
+         lambda s: (s['series_id'],) * 3),
+        ('search_all', None, lambda s: build_search_query(s['search'])),
+    ],
+    'series_details': [
+        ('series', series_details.SERIES_DETAILS_QUERY, lambda s: (s['series_id'],)),
+        ('episodes', series_details.SERIES_EPISODES_QUERY, lambda s: (s['series_id'],)),
+        ('neighbors', series_details.SERIES_NEIGHBORS_QUERY, lambda s: (s['series_id'],)),
+        ('reviews', series_details.SERIES_REVIEWS_QUERY, lambda s: (s['series_id'],)),
+    ],
+    'dashboard': [
+        ('kpis', dashboard.dashboard_kpi_query(True), lambda s: None),
+        ('genre_tab', dashboard.GENRE_CHART_QUERY, lambda s: None),
+        ('geography_tab', dashboard.GEOGRAPHY_CHART_QUERY, lambda s: None),
+        ('top_rated_tab', dashboard.TOP_RATED_CHART_QUERY, lambda s: None),
+        ('production_tab', dashboard.PRODUCTION_CHART_QUERY, lambda s: None),
+    ],
+    'feedback': [
+        ('recent_reviews', feedback.RECENT_REVIEWS_QUERY, lambda s: None),
+        # the series picker's lookup for the first letters typed
+        ('series_lookup', None, lambda s: build_lookup_query(LOOKUPS['series'], s['search'][:3])),
+    ],
+    'admin': [
+        ('series_count', admin.SERIES_COUNT_QUERY, lambda s: None),
+        ('series_page', admin.SERIES_PAGE_QUERY, lambda s: (admin.SERIES_PAGE_SIZE, 0)),
+        ('episodes_for_series', admin.SERIES_EPISODES_QUERY, lambda s: (s['series_id'],)),
+        ('houses', admin.HOUSES_QUERY, lambda s: None),
+        ('viewers', admin.VIEWERS_QUERY, lambda s: None),
+        ('contracts', None, lambda s: contracts_query()),
+    ],
+    'producer': [
+        *[(f'overview_{name}', query, lambda s: None)
+          for name, query in producer_portal.OVERVIEW_QUERIES.items()],
+        ('contracts_count', None, lambda s: producer_portal.producer_contracts_count_query('ACTIVE')),
+        ('contracts', None, lambda s: producer_portal.producer_contracts_query('ACTIVE')),
+        ('payments', producer_portal.PRODUCER_PAYMENTS_QUERY, lambda s: None),
+    ],
+}
+
+# Read-only procedures and functions; the write procedures commit internally
+# and would change the data between runs
+PROCEDURES = [
+    ('sp_get_series_statistics', lambda s: [s['series_id']]),
+    ('sp_search_series', lambda s: [s['search'], None, None, None]),
+    ('sp_get_contract_analytics', lambda s: [None]),
+    ('sp_get_producer_houses', lambda s: [s['producer_id']]),
+]
+FUNCTIONS = [
+    ('fn_get_series_avg_rating', "SELECT fn_get_series_avg_rating(%s) as v", lambda s: (s['series_id'],)),
+    ('fn_get_series_total_viewers', "SELECT fn_get_series_total_viewers(%s) as v", lambda s: (s['series_id'],)),
+]
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+def sample_values(cursor):
+    """Parameters for the parameterized queries, picked from the loaded data"""
+    def first(query):
+        cursor.execute(query)
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    series_name = first("""
+        SELECT ws.SERIES_NAME FROM RGC_SERIES_STATS ss
+        JOIN RGC_WEB_SERIES ws ON ss.SERIES_ID = ws.SERIES_ID
+        ORDER BY ss.REVIEW_COUNT DESC LIMIT 1
+    """) or "Stranger"
+    return {
+        # the most reviewed series is the slowest detail page
+        'series_id': first("SELECT SERIES_ID FROM RGC_SERIES_STATS ORDER BY REVIEW_COUNT DESC LIMIT 1"),
+        'producer_id': first("SELECT PRODUCER_ID FROM RGC_PRODUCER ORDER BY PRODUCER_ID LIMIT 1"),
+        'search': series_name.split()[1] if len(series_name.split()) > 1 else series_name,
+    }
+
+
+def _summary(timings_ms, rows):
+    ordered = sorted(timings_ms)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return {
+        'runs': len(ordered),
+        'rows': rows,
+        'min_ms': round(ordered[0], 3),
+        'median_ms': round(statistics.median(ordered), 3),
+        'p95_ms': round(p95, 3),
+        'max_ms': round(ordered[-1], 3),
+    }
+
+
+def _time(run, repeat):
+    """Run once to warm up, then `repeat` timed runs; returns (timings, rows)"""
+    rows = run()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings, rows
+
+
+def bench_query(cursor, query, params, repeat):
+    def run():
+        cursor.execute(query, params or ())
+        return len(cursor.fetchall())
+    return _summary(*_time(run, repeat))
+
+
+def bench_procedure(cursor, name, args, repeat):
+    def run():
+        cursor.callproc(name, args)
+        return sum(len(result.fetchall()) for result in cursor.stored_results())
+    return _summary(*_time(run, repeat))
+
+
+def run_benchmarks(conn, scale, repeat, pages=None, log=None):
+    """Time every page query set and procedure; returns a list of result rows"""
+    cursor = conn.cursor()
+    results = []
+    try:
+        samples = sample_values(cursor)
+        jobs = []
+        for page, queries in PAGE_QUERIES.items():
+            if pages and page not in pages:
+                continue
+            for name, query, make_params in queries:
+                params = make_params(samples)
+                if query is None:
+                    query, params = params
+                jobs.append((page, name, 'query',
+                             lambda q=query, p=params: bench_query(cursor, q, p, repeat)))
+        if not pages or 'procedures' in pages:
+            for name, make_args in PROCEDURES:
+                jobs.append(('procedures', name, 'procedure',
+                             lambda n=name, a=make_args(samples): bench_procedure(cursor, n, a, repeat)))
+            for name, query, make_params in FUNCTIONS:
+                jobs.append(('procedures', name, 'function',
+                             lambda q=query, p=make_params(samples): bench_query(cursor, q, p, repeat)))
+
+        for page, name, kind, job in jobs:
+            result = {'scale': scale, 'page': page, 'name': name, 'kind': kind}
+            try:
+                result.update(job())
+            except mysql.connector.Error as e:
+                result['error'] = str(e)
+            results.append(result)
+            if log:
+                timing = result.get('error') or f"{result['median_ms']:.2f}ms median, {result['rows']} rows"
+                log(f"[scale {scale}] {page}.{name}: {timing}")
+    finally:
+        cursor.close()
+    return results
+
+
+# ============================================================================
+# REPORTS
+# ============================================================================
+REPORT_FIELDS = ['scale', 'page', 'name', 'kind', 'runs', 'rows',
+                 'min_ms', 'median_ms', 'p95_ms', 'max_ms', 'error']
+
+
+def _git_revision():
+    try:
+        return subprocess.check_output(['git', 'describe', '--always', '--dirty'],
+                                       cwd=os.path.dirname(os.path.abspath(__file__)),
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_report(out_prefix, meta, results):
+    """Write <out_prefix>.json (meta + results) and <out_prefix>.csv (results)"""
+    directory = os.path.dirname(out_prefix)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(f"{out_prefix}.json", 'w', encoding='utf-8') as f:
+        json.dump({'meta': meta, 'results': results}, f, indent=2, default=str)
+    with open(f"{out_prefix}.csv", 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def compare(results, baseline_path, threshold_pct):
+    """Median-time regressions against an earlier JSON report"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {(r['scale'], r['page'], r['name']): r
+                    for r in json.load(f)['results'] if 'median_ms' in r}
+    regressions = []
+    for r in results:
+        before = baseline.get((r['scale'], r['page'], r['name']))
+        if not before or 'median_ms' not in r or not before['median_ms']:
+            continue
+        change = (r['median_ms'] - before['median_ms']) / before['median_ms'] * 100
+        if change > threshold_pct:
+            regressions.append((r, before, change))
+    return regressions
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+def _log(message):
+    print(message, file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark RGC page queries and procedures")
+    parser.add_argument('--scales', type=float, nargs='+', default=[0.001],
+                        help="scale factors (with --generate, data is reloaded for each)")
+    parser.add_argument('--generate', action='store_true',
+                        help="reset and load rgc_datagen data before each scale")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    parser.add_argument('--pages', nargs='+', choices=list(PAGE_QUERIES) + ['procedures'])
+    parser.add_argument('--label', help="name for this run in the report (default: git revision)")
+    parser.add_argument('--out', default='benchmark_report',
+                        help="report path prefix; writes PREFIX.json and PREFIX.csv")
+    parser.add_argument('--baseline', help="earlier JSON report to compare against")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_PCT,
+                        help="median slowdown (%%) reported as a regression")
+    add_connection_args(parser)
+    args = parser.parse_args(argv)
+
+    if not args.generate and len(args.scales) > 1:
+        parser.error("several --scales need --generate (the database holds one data set)")
+
+    conn = mysql.connector.connect(**connection_config(args))
+    results = []
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT VERSION()")
+        server_version = cursor.fetchone()[0]
+        cursor.close()
+
+        for scale in args.scales:
+            if args.generate:
+                _log(f"generating scale {scale} (seed {args.seed})")
+                reset_tables(conn)
+                load_tables(conn, DataGenerator(scale, args.seed), log=_log)
+            results += run_benchmarks(conn, scale, args.repeat, args.pages, log=_log)
+    finally:
+        conn.close()
+
+    revision = _git_revision()
+    meta = {
+        'label': args.label or revision,
+        'git_revision': revision,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'mysql_version': server_version,
+        'python_version': platform.python_version(),
+        'host': platform.node(),
+        'repeat': args.repeat,
+        'seed': args.seed if args.generate else None,
+        'scales': args.scales,
+    }
+    write_report(args.out, meta, results)
+    _log(f"wrote {args.out}.json and {args.out}.csv")
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.threshold)
+        for r, before, change in regressions:
+            print(f"REGRESSION [scale {r['scale']}] {r['page']}.{r['name']}: "
+                  f"{before['median_ms']:.2f}ms -> {r['median_ms']:.2f}ms (+{change:.0f}%)")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,650 @@
+"""
+RGC Stream - Bulk import
+Loads series, episodes, viewers, feedback and airing schedules from CSV or
+Parquet files far faster than the one-row admin forms.
+
+Files are streamed in chunks. Every row is validated against the column
+widths, NOT NULL and CHECK constraints of RGC_Tables.sql. Small reference
+tables (production houses, genres, languages, countries, platforms) are
+loaded once into lookup maps, so foreign keys can be given as IDs or names.
+References to large tables (series, episodes, viewer accounts) are checked
+with one IN (...) query per chunk. Airing slots are also checked for overlaps
+with existing slots and earlier rows on the same platform or episode, as the
+schedule page does. Valid rows are inserted with multi-row executemany, one
+transaction per chunk; rows the database still rejects are retried one by
+one so a bad row never sinks its whole chunk. Rejected rows are written out
+with a REJECT_REASON column.
+
+Column headers match the table's column names (case-insensitive). Blank ID
+columns get IDs from rgc_ids. Series also accept GENRES, SUBTITLES and
+DUBBING columns holding ';'-separated IDs or names.
+
+Usage:
+    python rgc_bulk_import.py series partner_series.csv
+    python rgc_bulk_import.py episodes episodes.parquet --chunk-size 5000 --rejects bad.csv
+
+Parquet files are read with pyarrow (listed in requirements.txt).
+"""
+
+import argparse
+import csv
+import io
+import os
+import sys
+import time
+from collections import namedtuple
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+
+from mysql.connector import Error, errorcode
+
+from rgc_cache import affected_tables
+from rgc_db import (ConnectionPool, get_connection_pool, in_placeholders, invalidate_tables,
+                    is_disconnect_error)
+from rgc_ids import ID_PREFIXES, IdGenerator
+from rgc_schedule_index import ScheduleIndex, Slot, load_slots, locked_conflicts, slot_length_error
+
+DEFAULT_CHUNK_SIZE = 2000
+MAX_ATTEMPTS = 3
+NULL_VALUES = {'', '\\N', 'NULL'}
+LIST_SEPARATOR = ';'
+
+# Deadlocks and lock timeouts: the chunk is rolled back and tried again
+RETRY_ERRORS = {
+    errorcode.ER_LOCK_DEADLOCK,
+    errorcode.ER_LOCK_WAIT_TIMEOUT,
+}
+
+
+class RowError(ValueError):
+    """A row that fails validation; the message becomes its REJECT_REASON"""
+
+
+Field = namedtuple('Field', ['column', 'kind', 'required', 'max_len', 'choices', 'low', 'high',
+                             'default', 'lookup'],
+                   defaults=('str', False, None, None, None, None, None, None))
+Field.__doc__ = "One input column: type, constraints, and an optional reference lookup"
+
+# Link columns on a series row: input column -> (link table, link column, lookup)
+SERIES_LINKS = {
+    'GENRES': ('RGC_WEB_SERIES_SERIES_TYPE', 'SERIES_TYPE_ID', 'genre'),
+    'SUBTITLES': ('RGC_WEBSERIES_SUBTITLE', 'S_LANGUAGE_ID', 'subtitle_language'),
+    'DUBBING': ('RGC_WEBSERIES_DUBBING', 'D_LANGUAGE_ID', 'dubbing_language'),
+}
+
+ImportSpec = namedtuple('ImportSpec', ['table', 'id_column', 'fields', 'references', 'links',
+                                       'row_check', 'chunk_check'], defaults=(None, None))
+ImportSpec.__doc__ = "Target table, its fields, large-table references checked per chunk, link columns"
+
+# chunk_check: a class made once per import, whose check(conn, rows) returns
+# {row position: REJECT_REASON} and whose loaded(rows) sees the rows inserted;
+# an optional locked(conn, rows) returns the same inside the insert transaction
+
+
+def _check_schedule(values):
+    error = slot_length_error(values['START_TS'], values['END_TS'])
+    if error:
+        raise RowError(error)
+
+
+def _slot(values):
+    return Slot(values['AIRING_SCHEDULE_ID'], values['EPISODE_ID'], values['PLATFORM_ID'],
+                values['START_TS'], values['END_TS'])
+
+
+def _overlap_reason(conflict):
+    other = conflict.slot
+    return (f"overlaps {other.schedule_id} on the same {conflict.kind} "
+            f"({other.start:%Y-%m-%d %H:%M} - {other.end:%Y-%m-%d %H:%M})")
+
+
+class ScheduleOverlaps:
+    """
+    Rejects slots overlapping an existing slot, or an earlier row of the
+    import, on the same platform or episode; existing slots load once per
+    import, and each chunk is re-checked with a locking read before its
+    INSERT for slots booked from the app since then
+    """
+
+    def __init__(self):
+        self.index = None
+
+    def check(self, conn, rows):
+        if self.index is None:
+            self.index = ScheduleIndex()
+            self.index.load(load_slots(conn))
+        pending = ScheduleIndex()
+        reasons = {}
+        for pos, (values, _, _) in enumerate(rows):
+            slot = _slot(values)
+            found = self.index.conflicts(slot) or pending.conflicts(slot)
+            if found:
+                reasons[pos] = _overlap_reason(found[0])
+            else:
+                pending.add(slot)
+        return reasons
+
+    def locked(self, conn, rows):
+        """Conflicts with rows committed since the index loaded, read with FOR UPDATE"""
+        positions = {values['AIRING_SCHEDULE_ID']: pos for pos, (values, _, _) in enumerate(rows)}
+        cursor = conn.cursor(dictionary=True)
+        try:
+            found = locked_conflicts(cursor, [_slot(values) for values, _, _ in rows])
+        finally:
+            cursor.close()
+        reasons = {}
+        for slot, conflict in found:
+            reasons.setdefault(positions[slot.schedule_id], _overlap_reason(conflict))
+        self.index.update([conflict.slot for _, conflict in found])
+        return reasons
+
+    def loaded(self, rows):
+        for values, _, _ in rows:
+            self.index.add(_slot(values))
+
+
+ENTITIES = {
+    'series': ImportSpec('RGC_WEB_SERIES', 'SERIES_ID', [
+        Field('SERIES_ID', max_len=10),
+        Field('SERIES_NAME', required=True, max_len=50),
+        Field('NUM_EPISODES', 'int', required=True, low=0),
+        Field('RELEASE_DATE', 'date', required=True),
+        Field('COUNTRY_OF_ORIGIN', required=True, max_len=30),
+        Field('LANGUAGE', required=True, max_len=30),
+        Field('HOUSE_ID', required=True, lookup='house'),
+    ], {}, SERIES_LINKS),
+    'episodes': ImportSpec('RGC_EPISODE', 'EPISODE_ID', [
+        Field('EPISODE_ID', max_len=10),
+        Field('EPISODE_TITLE', required=True, max_len=50),
+        Field('TOTAL_VIEWERS', 'int', low=0, default=0),
+        Field('TECHNICAL_INTERRUPTION', 'enum', choices=('YES', 'NO'), default='NO'),
+        Field('SERIES_ID', required=True, max_len=10),
+    ], {'SERIES_ID': ('RGC_WEB_SERIES', 'SERIES_ID')}, {}),
+    'viewers': ImportSpec('RGC_VIEWER', 'ACCOUNT_ID', [
+        Field('ACCOUNT_ID', max_len=30),
+        Field('ACC_FNAME', required=True, max_len=15),
+        Field('ACC_LNAME', max_len=15),
+        Field('ADDRESS_STREET', required=True, max_len=50),
+        Field('ADDRESS_CITY', required=True, max_len=30),
+        Field('ADDRESS_ZIP', required=True, max_len=10),
+        Field('DATE_OPENED', 'date', required=True),
+        Field('MONTHLY_CHARGE', 'decimal', required=True, low=Decimal('0.01'), high=Decimal('9999.99')),
+        Field('COUNTRY_CODE', required=True, lookup='country'),
+    ], {}, {}),
+    'feedback': ImportSpec('RGC_FEEDBACK', 'FEEDBACK_ID', [
+        Field('FEEDBACK_ID', max_len=30),
+        Field('FEEDBACK_TEXT', required=True, max_len=300),
+        Field('RATING', 'int', required=True, low=1, high=5),
+        Field('FEEDBACK_DATE', 'date', required=True),
+        Field('SERIES_ID', required=True, max_len=10),
+        Field('ACCOUNT_ID', required=True, max_len=30),
+    ], {'SERIES_ID': ('RGC_WEB_SERIES', 'SERIES_ID'),
+        'ACCOUNT_ID': ('RGC_VIEWER', 'ACCOUNT_ID')}, {}),
+    'schedules': ImportSpec('RGC_AIRING_SCHEDULE', 'AIRING_SCHEDULE_ID', [
+        Field('AIRING_SCHEDULE_ID', max_len=10),
+        Field('START_TS', 'datetime', required=True),
+        Field('END_TS', 'datetime', required=True),
+        Field('EPISODE_ID', required=True, max_len=10),
+        Field('PLATFORM_ID', lookup='platform'),
+    ], {'EPISODE_ID': ('RGC_EPISODE', 'EPISODE_ID')}, {}, _check_schedule, ScheduleOverlaps),
+}
+
+# lookup -> (table, ID column, name column); small enough to hold in memory
+LOOKUP_SOURCES = {
+    'house': ('RGC_PRODUCTION_HOUSE', 'HOUSE_ID', 'HOUSE_NAME'),
+    'genre': ('RGC_SERIES_TYPE', 'SERIES_TYPE_ID', 'SERIES_TYPE_NAME'),
+    'subtitle_language': ('RGC_SUBTITLE_LANGUAGE', 'S_LANGUAGE_ID', 'S_LANGUAGE_NAME'),
+    'dubbing_language': ('RGC_DUBBING_LANGUAGE', 'D_LANGUAGE_ID', 'D_LANGUAGE_NAME'),
+    'country': ('RGC_COUNTRY', 'COUNTRY_CODE', 'COUNTRY_NAME'),
+    'platform': ('RGC_PLATFORM', 'PLATFORM_ID', 'PLATFORM_NAME'),
+}
+
+
+# ============================================================================
+# VALIDATION
+# ============================================================================
+def _clean(value):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        return None if value in NULL_VALUES else value
+    return value
+
+
+def convert(field, value):
+    """Typed, constraint-checked value for one field (lookups resolved separately)"""
+    value = _clean(value)
+    if value is None:
+        if field.default is not None:
+            return field.default
+        if field.required:
+            raise RowError(f"{field.column} is required")
+        return None
+    try:
+        if field.kind == 'int':
+            value = int(value)
+        elif field.kind == 'decimal':
+            value = Decimal(str(value))
+            if not value.is_finite():
+                raise ValueError(value)
+        elif field.kind == 'date':
+            if isinstance(value, datetime):
+                value = value.date()
+            elif not isinstance(value, date):
+                value = date.fromisoformat(str(value))
+        elif field.kind == 'datetime':
+            if not isinstance(value, datetime):
+                value = datetime.fromisoformat(str(value))
+        else:
+            value = str(value)
+    except (ValueError, OverflowError, InvalidOperation):
+        raise RowError(f"{field.column}: {value!r} is not a valid {field.kind}") from None
+
+    if field.kind == 'enum':
+        value = value.upper()
+        if value not in field.choices:
+            raise RowError(f"{field.column} must be one of {', '.join(field.choices)}")
+    if field.max_len and len(value) > field.max_len:
+        raise RowError(f"{field.column} is longer than {field.max_len} characters")
+    if field.low is not None and value < field.low:
+        raise RowError(f"{field.column} must be at least {field.low}")
+    if field.high is not None and value > field.high:
+        raise RowError(f"{field.column} must be at most {field.high}")
+    return value
+
+
+class LookupMaps:
+    """ID sets and lower-cased name -> ID maps for the small reference tables"""
+
+    def __init__(self, conn, names):
+        self.ids = {}
+        self.by_name = {}
+        cursor = conn.cursor()
+        try:
+            for name in names:
+                table, id_column, name_column = LOOKUP_SOURCES[name]
+                cursor.execute(f"SELECT {id_column}, {name_column} FROM {table}")
+                rows = cursor.fetchall()
+                self.ids[name] = {row[0] for row in rows}
+                self.by_name[name] = {str(row[1]).strip().lower(): row[0] for row in rows}
+        finally:
+            cursor.close()
+
+    def resolve(self, name, value):
+        """ID for `value` given as an ID or a name; None when unknown"""
+        if value in self.ids[name]:
+            return value
+        return self.by_name[name].get(str(value).strip().lower())
+
+
+def needed_lookups(spec):
+    return {f.lookup for f in spec.fields if f.lookup} | {link[2] for link in spec.links.values()}
+
+
+def validate_row(spec, raw, lookups):
+    """(column values, link rows) for one input row; raises RowError"""
+    values = {}
+    for field in spec.fields:
+        value = convert(field, raw.get(field.column))
+        if field.lookup and value is not None:
+            resolved = lookups.resolve(field.lookup, value)
+            if resolved is None:
+                raise RowError(f"{field.column}: unknown {field.lookup.replace('_', ' ')} {value!r}")
+            value = resolved
+        values[field.column] = value
+
+    if spec.row_check:
+        spec.row_check(values)
+
+    links = []
+    for column, (link_table, link_column, lookup) in spec.links.items():
+        items = _clean(raw.get(column))
+        if items is None:
+            continue
+        resolved = []
+        for item in str(items).split(LIST_SEPARATOR):
+            item = item.strip()
+            if not item:
+                continue
+            link_id = lookups.resolve(lookup, item)
+            if link_id is None:
+                raise RowError(f"{column}: unknown {lookup.replace('_', ' ')} {item!r}")
+            if link_id not in resolved:
+                resolved.append(link_id)
+        links.extend((link_table, link_column, link_id) for link_id in resolved)
+    return values, links
+
+
+# ============================================================================
+# FILE READERS
+# ============================================================================
+def _normalize_keys(row):
+    return {str(k).strip().upper(): v for k, v in row.items() if k is not None}
+
+
+def read_csv_chunks(f, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Chunks of rows (dicts keyed by upper-cased header) from a text-mode CSV file"""
+    chunk = []
+    for row in csv.DictReader(f):
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def read_parquet_chunks(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Chunks of rows from a Parquet file path or binary file object (needs pyarrow)"""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet import needs pyarrow: pip install pyarrow") from None
+    for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_size):
+        yield batch.to_pylist()
+
+
+def count_rows(source, fmt):
+    """Data rows in a CSV (binary file object) or Parquet source, for progress bars"""
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(source).metadata.num_rows
+    lines = sum(1 for _ in source)
+    source.seek(0)
+    return max(lines - 1, 0)
+
+
+def detect_format(filename):
+    return 'parquet' if filename.lower().endswith(('.parquet', '.pq')) else 'csv'
+
+
+# ============================================================================
+# IMPORT
+# ============================================================================
+class ImportStats:
+    """Running counters for one import"""
+
+    def __init__(self, total=None):
+        self.started = time.monotonic()
+        self.total = total
+        self.read = 0
+        self.loaded = 0
+        self.rejected = 0
+        self.chunks = 0
+        self.retries = 0
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    @property
+    def rows_per_sec(self):
+        return self.loaded / max(self.elapsed, 1e-9)
+
+    @property
+    def fraction(self):
+        """Share of the input processed so far, when the total is known"""
+        return min(self.read / self.total, 1.0) if self.total else None
+
+    def format(self):
+        return (f"{self.read} read, {self.loaded} loaded, {self.rejected} rejected "
+                f"in {self.elapsed:.1f}s ({self.rows_per_sec:.0f} rows/s)")
+
+
+class RejectWriter:
+    """CSV of rejected input rows with a REJECT_REASON column; header on first reject"""
+
+    def __init__(self, f):
+        self.f = f
+        self._writer = None
+
+    def write(self, raw, reason):
+        if self._writer is None:
+            self._writer = csv.DictWriter(self.f, fieldnames=list(raw.keys()) + ['REJECT_REASON'],
+                                          extrasaction='ignore')
+            self._writer.writeheader()
+        self._writer.writerow(dict(raw, REJECT_REASON=reason))
+
+
+class BulkImporter:
+    """
+    Validates and loads chunks of input rows into one entity's tables
+    `progress` is called with the ImportStats after every chunk.
+    """
+
+    def __init__(self, entity, pool=None, rejects=None, progress=None):
+        self.spec = ENTITIES[entity]
+        self.pool = pool or get_connection_pool()
+        self.rejects = rejects
+        self.progress = progress
+        self.ids = IdGenerator(self.pool)
+        self.stats = ImportStats()
+        self._lookups = None
+        self._chunk_check = self.spec.chunk_check() if self.spec.chunk_check else None
+        self._locked_check = getattr(self._chunk_check, 'locked', None)
+
+    def _reject(self, raw, reason):
+        self.stats.rejected += 1
+        if self.rejects is not None:
+            self.rejects.write(raw, reason)
+
+    def _missing_references(self, conn, rows):
+        """{column: set of referenced values that do not exist} for the chunk"""
+        missing = {}
+        cursor = conn.cursor()
+        try:
+            for column, (table, key) in self.spec.references.items():
+                wanted = list({values[column] for values, _, _ in rows})
+                if not wanted:
+                    continue
+                cursor.execute(f"SELECT {key} FROM {table} WHERE {key} IN ({in_placeholders(wanted)})",
+                               tuple(wanted))
+                found = {row[0] for row in cursor.fetchall()}
+                missing[column] = set(wanted) - found
+        finally:
+            cursor.close()
+        return missing
+
+    def _statements(self, rows):
+        """(INSERT, params) pairs for the main table and each link table"""
+        spec = self.spec
+        columns = [f.column for f in spec.fields]
+        statements = [(
+            f"INSERT INTO {spec.table} ({', '.join(columns)}) "
+            f"VALUES ({in_placeholders(columns)})",
+            [tuple(values[c] for c in columns) for values, _, _ in rows],
+        )]
+        for link_table, link_column, _ in spec.links.values():
+            params = [(values[spec.id_column], link_id)
+                      for values, links, _ in rows
+                      for table, _, link_id in links if table == link_table]
+            if params:
+                statements.append((
+                    f"INSERT INTO {link_table} ({spec.id_column}, {link_column}) VALUES (%s, %s)",
+                    params))
+        return statements
+
+    def _locked_rejects(self, conn, rows):
+        """(rows to insert, [(raw, reason)]) after the spec's locking re-check, if any"""
+        if self._locked_check is None:
+            return rows, []
+        reasons = self._locked_check(conn, rows)
+        return ([row for pos, row in enumerate(rows) if pos not in reasons],
+                [(rows[pos][2], reason) for pos, reason in reasons.items()])
+
+    def _insert(self, conn, rows):
+        """All rows in one transaction; on a data error, each row in its own. Returns the rows loaded"""
+        cursor = conn.cursor()
+        try:
+            for attempt in range(1, MAX_ATTEMPTS + 1):
+                try:
+                    conn.start_transaction()
+                    kept, rejected = self._locked_rejects(conn, rows)
+                    if kept:
+                        for query, params in self._statements(kept):
+                            cursor.executemany(query, params)
+                    conn.commit()
+                    # only once committed, so a retried attempt reports nothing twice
+                    for raw, reason in rejected:
+                        self._reject(raw, reason)
+                    return kept
+                except Error as e:
+                    conn.rollback()
+                    if e.errno in RETRY_ERRORS and attempt < MAX_ATTEMPTS:
+                        self.stats.retries += 1
+                        continue
+                    if e.errno in RETRY_ERRORS or is_disconnect_error(e):
+                        raise
+                    break
+            return self._insert_individually(conn, cursor, rows)
+        finally:
+            cursor.close()
+
+    def _insert_individually(self, conn, cursor, rows):
+        loaded = []
+        for row in rows:
+            try:
+                conn.start_transaction()
+                kept, rejected = self._locked_rejects(conn, [row])
+                if rejected:
+                    conn.rollback()
+                    self._reject(*rejected[0])
+                    continue
+                for query, params in self._statements(kept):
+                    cursor.executemany(query, params)
+                conn.commit()
+                loaded.append(row)
+            except Error as e:
+                conn.rollback()
+                self._reject(row[2], f"database: {e}")
+        return loaded
+
+    def load_chunk(self, raw_rows):
+        """Validate, resolve and insert one chunk; returns rows loaded"""
+        raw_rows = [_normalize_keys(raw) for raw in raw_rows]
+        self.stats.read += len(raw_rows)
+        with self.pool.connection() as conn:
+            if self._lookups is None:
+                self._lookups = LookupMaps(conn, needed_lookups(self.spec))
+
+            rows = []
+            for raw in raw_rows:
+                try:
+                    values, links = validate_row(self.spec, raw, self._lookups)
+                except RowError as e:
+                    self._reject(raw, str(e))
+                    continue
+                rows.append((values, links, raw))
+
+            missing = self._missing_references(conn, rows)
+            if any(missing.values()):
+                kept = []
+                for row in rows:
+                    bad = [c for c, values in missing.items() if row[0][c] in values]
+                    if bad:
+                        self._reject(row[2], "; ".join(
+                            f"{c}: {row[0][c]!r} does not exist" for c in bad))
+                    else:
+                        kept.append(row)
+                rows = kept
+
+            unnamed = [row for row in rows if row[0][self.spec.id_column] is None]
+            if unnamed:
+                prefix = ID_PREFIXES[self.spec.table]
+                for row, new_id in zip(unnamed, self.ids.next_ids(prefix, len(unnamed))):
+                    row[0][self.spec.id_column] = new_id
+
+            if self._chunk_check and rows:
+                reasons = self._chunk_check.check(conn, rows)
+                for pos in reasons:
+                    self._reject(rows[pos][2], reasons[pos])
+                rows = [row for pos, row in enumerate(rows) if pos not in reasons]
+
+            loaded = self._insert(conn, rows) if rows else []
+            if self._chunk_check:
+                self._chunk_check.loaded(loaded)
+            loaded = len(loaded)
+
+        self.stats.loaded += loaded
+        self.stats.chunks += 1
+        if self.progress:
+            self.progress(self.stats)
+        return loaded
+
+    def run(self, chunks):
+        """Load every chunk, then drop cached reads of the tables written"""
+        try:
+            for chunk in chunks:
+                self.load_chunk(chunk)
+        finally:
+            tables = {self.spec.table} | {link[0] for link in self.spec.links.values()}
+            invalidate_tables(affected_tables(tables))
+        return self.stats
+
+
+def import_file(entity, source, fmt='csv', chunk_size=DEFAULT_CHUNK_SIZE, pool=None,
+                rejects=None, progress=None, total=None):
+    """
+    Import a CSV or Parquet file into an entity's tables; returns ImportStats
+    `source` is a path or a binary file object. Rejected rows go to the
+    `rejects` text file object as CSV, when given.
+    """
+    importer = BulkImporter(entity, pool, RejectWriter(rejects) if rejects else None, progress)
+    importer.stats.total = total
+    if fmt == 'parquet':
+        return importer.run(read_parquet_chunks(source, chunk_size))
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, newline='', encoding='utf-8-sig') as f:
+            return importer.run(read_csv_chunks(f, chunk_size))
+    text = io.TextIOWrapper(source, encoding='utf-8-sig', newline='')
+    try:
+        return importer.run(read_csv_chunks(text, chunk_size))
+    finally:
+        text.detach()
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+def main(argv=None):
+    from rgc_datagen import add_connection_args, connection_config
+
+    parser = argparse.ArgumentParser(description="Bulk import RGC data from CSV or Parquet")
+    parser.add_argument('entity', choices=list(ENTITIES))
+    parser.add_argument('path')
+    parser.add_argument('--format', choices=['csv', 'parquet'],
+                        help="default: from the file extension")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--rejects', metavar='PATH',
+                        help="rejected rows CSV (default: <path>.rejected.csv)")
+    add_connection_args(parser)
+    args = parser.parse_args(argv)
+
+    fmt = args.format or detect_format(args.path)
+    rejects_path = args.rejects or f"{args.path}.rejected.csv"
+    pool = ConnectionPool(connection_config(args), size=2)
+
+    def report(stats):
+        print(f"\r{stats.format()}", end='', file=sys.stderr, flush=True)
+
+    try:
+        with open(rejects_path, 'w', newline='', encoding='utf-8') as rejects:
+            stats = import_file(args.entity, args.path, fmt, args.chunk_size, pool,
+                                rejects, report)
+    except UnicodeDecodeError as e:
+        print(f"\n{args.path} is not UTF-8 text (byte {e.start}); "
+              f"chunks before that point were imported", file=sys.stderr)
+        return 1
+    finally:
+        pool.close()
+    print(file=sys.stderr)
+    if stats.rejected:
+        print(f"{stats.rejected} rejected rows written to {rejects_path}", file=sys.stderr)
+    else:
+        os.remove(rejects_path)
+    return 1 if stats.rejected else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
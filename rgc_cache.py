@@ -0,0 +1,449 @@
+"""
+RGC Stream - Query result cache
+LRU cache for read-only query results with per-entry TTL, a memory cap and
+invalidation by table name when a write touches one of the cached tables.
+
+With RGC_QUERY_CACHE_BACKEND=shared, every Streamlit worker (and CLI tool) on
+the host also shares results through one SQLite file. Invalidation there is
+versioned: a write bumps a counter per table, and a shared entry is only
+served while the versions it was read under are still current.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_TTL = float(os.environ.get('RGC_QUERY_CACHE_TTL', 60))
+MAX_BYTES = int(float(os.environ.get('RGC_QUERY_CACHE_MB', 64)) * 1024 * 1024)
+
+# 'local' keeps results per process; 'shared' adds the cross-process store
+BACKEND = os.environ.get('RGC_QUERY_CACHE_BACKEND', 'local')
+# Entries are pickled, so the file must be writable by this user only: the
+# default lives in a per-user directory, and _private_file() refuses a file or
+# directory another user owns or can write
+SHARED_PATH = os.environ.get('RGC_SHARED_CACHE_PATH', os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'rgc_stream', 'query_cache.sqlite'))
+SHARED_MAX_BYTES = int(float(os.environ.get('RGC_SHARED_CACHE_MB', 256)) * 1024 * 1024)
+# Longest a worker keeps serving an in-process copy after another process
+# invalidated it
+SHARED_SYNC_INTERVAL = float(os.environ.get('RGC_SHARED_CACHE_SYNC', 1.0))
+
+# Version counter bumped by clear(); every snapshot includes it
+ALL_TABLES = '*'
+
+_TABLE_RE = re.compile(r'\bRGC_[A-Z0-9_]+\b', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+_READ_PREFIXES = ('SELECT', 'WITH', 'SHOW', 'EXPLAIN', 'DESCRIBE', 'DESC')
+
+# Tables written by triggers when the key table changes, so cached reads of
+# the derived table are dropped together with the table that fired the trigger
+TRIGGER_WRITES = {
+    'RGC_WEB_SERIES': {'RGC_AUDIT_LOG', 'RGC_SERIES_STATS', 'RGC_FACET_CHANGES'},
+    'RGC_FEEDBACK': {'RGC_AUDIT_LOG', 'RGC_SERIES_STATS', 'RGC_RECOMMEND_DIRTY', 'RGC_FACET_CHANGES'},
+    'RGC_EPISODE': {'RGC_SERIES_STATS', 'RGC_FACET_CHANGES'},
+    'RGC_CONTRACT': {'RGC_AUDIT_LOG'},
+    'RGC_SERIES_STATS': {'RGC_FACET_CHANGES'},
+    'RGC_WEB_SERIES_SERIES_TYPE': {'RGC_FACET_CHANGES'},
+    'RGC_WEBSERIES_SUBTITLE': {'RGC_FACET_CHANGES'},
+    'RGC_WEBSERIES_DUBBING': {'RGC_FACET_CHANGES'},
+}
+
+
+def normalize_sql(query):
+    """Collapse whitespace so formatting differences share one cache entry"""
+    return _WHITESPACE_RE.sub(' ', query).strip()
+
+
+def tables_in(query):
+    """Upper-cased RGC_* table names referenced by a statement"""
+    return {name.upper() for name in _TABLE_RE.findall(query)}
+
+
+def is_read_query(query):
+    """True for statements that cannot change data"""
+    return normalize_sql(query).upper().startswith(_READ_PREFIXES)
+
+
+def affected_tables(tables):
+    """Expand written tables with the tables their triggers write to"""
+    affected = set(tables)
+    for table in tables:
+        affected |= TRIGGER_WRITES.get(table, set())
+    return affected
+
+
+def estimate_size(value, _sample=20):
+    """Rough in-memory size of a query result in bytes"""
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return sys.getsizeof(value)
+        sample = value[:_sample]
+        per_item = sum(estimate_size(v) for v in sample) / len(sample)
+        return sys.getsizeof(value) + int(per_item * len(value))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    memory_usage = getattr(value, 'memory_usage', None)
+    if callable(memory_usage):  # pandas DataFrame
+        try:
+            return int(memory_usage(deep=True).sum())
+        except TypeError:
+            pass
+    return sys.getsizeof(value)
+
+
+class QueryCache:
+    """
+    Thread-safe LRU of query results
+    Entries are keyed on (normalized SQL, params), expire after their TTL and
+    are evicted least-recently-used first once the byte budget is exceeded.
+    """
+
+    def __init__(self, max_bytes=MAX_BYTES, default_ttl=DEFAULT_TTL):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._entries = OrderedDict()  # key -> (value, expires_at, size, tables)
+        self._by_table = {}  # table -> set of keys
+        self._versions = {}  # table -> invalidation count
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(query, params=None, variant=None):
+        if params is not None and not isinstance(params, tuple):
+            params = tuple(params)
+        return normalize_sql(query), params, variant
+
+    def get(self, key):
+        """Return (True, value) for a live entry, (False, None) otherwise"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            value, expires_at, _, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def snapshot(self, tables):
+        """
+        Invalidation state of `tables`; take it before running the query and
+        pass it to put(), which then skips results a concurrent write made stale
+        """
+        with self._lock:
+            return self._snapshot(tables)
+
+    def _snapshot(self, tables):
+        names = sorted({t.upper() for t in tables} | {ALL_TABLES})
+        return tuple((name, self._versions.get(name, 0)) for name in names)
+
+    def put(self, key, value, tables, ttl=None, snapshot=None):
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        with self._lock:
+            if snapshot is not None and snapshot != self._snapshot(tables):
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, expires_at, size, frozenset(tables))
+            self._bytes += size
+            for table in tables:
+                self._by_table.setdefault(table, set()).add(key)
+            while self._bytes > self.max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        _, _, size, tables = self._entries.pop(key)
+        self._bytes -= size
+        for table in tables:
+            keys = self._by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_table[table]
+
+    def invalidate(self, tables):
+        """Drop every entry that read from any of the given tables"""
+        with self._lock:
+            for table in affected_tables({t.upper() for t in tables}):
+                self._versions[table] = self._versions.get(table, 0) + 1
+                for key in list(self._by_table.get(table, ())):
+                    if key in self._entries:
+                        self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._versions[ALL_TABLES] = self._versions.get(ALL_TABLES, 0) + 1
+            self._entries.clear()
+            self._by_table.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+
+# ============================================================================
+# SHARED CACHE (ONE HOST, MANY PROCESSES)
+# ============================================================================
+SHARED_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS table_versions (
+        name TEXT PRIMARY KEY,
+        version INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS entries (
+        key TEXT PRIMARY KEY,
+        value BLOB NOT NULL,
+        versions TEXT NOT NULL,
+        expires_at REAL NOT NULL,
+        accessed_at REAL NOT NULL,
+        size INTEGER NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at);
+"""
+
+
+def _private_file(path):
+    """
+    Create `path` (and its directory) accessible to this user only
+    Raises PermissionError if either belongs to, or is writable by, another user.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_NOFOLLOW', 0), 0o600)
+    try:
+        info = os.fstat(fd)
+    finally:
+        os.close(fd)
+    dir_info = os.stat(directory)
+    if not hasattr(os, 'getuid'):  # Windows: rely on the per-user profile directory
+        return
+    if info.st_uid != os.getuid() or dir_info.st_uid != os.getuid():
+        raise PermissionError(f"{path} or its directory belongs to another user")
+    if (info.st_mode | dir_info.st_mode) & 0o022:
+        raise PermissionError(f"{path} or its directory is writable by other users")
+
+
+# Failures of the shared store; the cache falls back to the in-process copy
+_STORE_ERRORS = (sqlite3.Error, OSError)
+
+
+class SharedQueryCache:
+    """
+    Query cache shared by every process on the host through one SQLite file
+
+    Protocol:
+      - invalidate(tables) bumps table_versions for each affected table in one
+        transaction; clear() bumps the '*' counter that every entry depends on.
+      - put() stores the pickled result with the versions snapshotted before
+        the query ran, unless a write has bumped them since.
+      - get() serves a stored entry only while all of its versions are still
+        current, so a write in any process hides stale entries immediately.
+
+    Results are also kept in an in-process QueryCache to skip unpickling. Each
+    worker re-reads table_versions at most every `sync_interval` seconds and
+    drops its in-process copies of tables that changed elsewhere, which bounds
+    how long another worker's write can go unseen. SQLite errors, an unsafe
+    cache file and entries that fail to unpickle never reach the page: the
+    cache falls back to the in-process copy and counts them.
+    """
+
+    def __init__(self, path=SHARED_PATH, max_bytes=SHARED_MAX_BYTES, default_ttl=DEFAULT_TTL,
+                 sync_interval=SHARED_SYNC_INTERVAL, local=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.sync_interval = sync_interval
+        self.local = local or QueryCache(default_ttl=default_ttl)
+        self._thread = threading.local()
+        self._seen = {}  # table -> version the in-process copies agree with
+        self._synced_at = 0.0
+        self._sync_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    make_key = staticmethod(QueryCache.make_key)
+
+    def _db(self):
+        """This thread's SQLite connection"""
+        conn = getattr(self._thread, 'conn', None)
+        if conn is None:
+            _private_file(self.path)
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SHARED_SCHEMA)
+            self._thread.conn = conn
+        return conn
+
+    @staticmethod
+    def _key_hash(key):
+        return hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+
+    def _versions(self, db, names):
+        placeholders = ', '.join('?' * len(names))
+        rows = db.execute(f"SELECT name, version FROM table_versions WHERE name IN ({placeholders})",
+                          list(names)).fetchall()
+        versions = dict.fromkeys(names, 0)
+        versions.update(rows)
+        return versions
+
+    def _sync(self):
+        """Drop in-process copies of tables another process has invalidated"""
+        now = time.monotonic()
+        if now - self._synced_at < self.sync_interval or not self._sync_lock.acquire(blocking=False):
+            return
+        try:
+            current = dict(self._db().execute("SELECT name, version FROM table_versions").fetchall())
+            changed = {name for name, version in current.items() if self._seen.get(name) != version}
+            if ALL_TABLES in changed:
+                self.local.clear()
+            elif changed:
+                self.local.invalidate(changed)
+            self._seen = current
+            self._synced_at = now
+        except _STORE_ERRORS:
+            self.errors += 1
+        finally:
+            self._sync_lock.release()
+
+    def get(self, key):
+        """Return (True, value) for a live entry, (False, None) otherwise"""
+        self._sync()
+        hit, value = self.local.get(key)
+        if hit:
+            self.hits += 1
+            return True, value
+        try:
+            db = self._db()
+            row = db.execute("SELECT value, versions, expires_at FROM entries WHERE key = ?",
+                             (self._key_hash(key),)).fetchone()
+            if row is not None and row[2] > time.time():
+                versions = json.loads(row[1])
+                if self._versions(db, list(versions)) == versions:
+                    db.execute("UPDATE entries SET accessed_at = ? WHERE key = ?",
+                               (time.time(), self._key_hash(key)))
+                    try:
+                        value = pickle.loads(row[0])
+                    except Exception:
+                        # Corrupt or from an incompatible version: treat as a miss
+                        self.errors += 1
+                        self.misses += 1
+                        return False, None
+                    tables = [name for name in versions if name != ALL_TABLES]
+                    self.local.put(key, value, tables, row[2] - time.time())
+                    self.hits += 1
+                    return True, value
+        except _STORE_ERRORS:
+            self.errors += 1
+        self.misses += 1
+        return False, None
+
+    def snapshot(self, tables):
+        """Shared table versions to pass to put(); see QueryCache.snapshot"""
+        names = sorted({t.upper() for t in tables} | {ALL_TABLES})
+        try:
+            return self._versions(self._db(), names)
+        except _STORE_ERRORS:
+            self.errors += 1
+            return None
+
+    def put(self, key, value, tables, ttl=None, snapshot=None):
+        ttl = self.default_ttl if ttl is None else ttl
+        try:
+            db = self._db()
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            if len(blob) > self.max_bytes:
+                return
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                versions = self._versions(db, sorted({t.upper() for t in tables} | {ALL_TABLES}))
+                if snapshot is not None and snapshot != versions:
+                    db.execute("ROLLBACK")
+                    return
+                now = time.time()
+                db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                           (self._key_hash(key), blob, json.dumps(versions), now + ttl, now, len(blob)))
+                self._evict(db, now)
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        except _STORE_ERRORS:
+            self.errors += 1
+        self.local.put(key, value, tables, ttl)
+
+    def _evict(self, db, now):
+        """Drop expired entries, then least recently read ones over the byte budget"""
+        db.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in db.execute("SELECT key, size FROM entries ORDER BY accessed_at").fetchall():
+            db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def _bump(self, names):
+        try:
+            db = self._db()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                db.executemany("INSERT INTO table_versions (name, version) VALUES (?, 1) "
+                               "ON CONFLICT(name) DO UPDATE SET version = version + 1",
+                               [(name,) for name in sorted(names)])
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        except _STORE_ERRORS:
+            self.errors += 1
+
+    def invalidate(self, tables):
+        """Hide every entry, in every process, that read from any of the given tables"""
+        self._bump(affected_tables({t.upper() for t in tables}))
+        self.local.invalidate(tables)
+
+    def clear(self):
+        self._bump({ALL_TABLES})
+        self.local.clear()
+
+    def stats(self):
+        local = self.local.stats()
+        stats = {'entries': local['entries'], 'bytes': local['bytes'],
+                 'hits': self.hits, 'misses': self.misses, 'errors': self.errors,
+                 'shared_entries': 0, 'shared_bytes': 0}
+        try:
+            stats['shared_entries'], stats['shared_bytes'] = self._db().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        except _STORE_ERRORS:
+            self.errors += 1
+        return stats
+
+
+query_cache = SharedQueryCache() if BACKEND == 'shared' else QueryCache()
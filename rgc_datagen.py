@@ -0,0 +1,629 @@
+"""
+RGC Stream - Synthetic data generator
+Deterministic, production-scale data for every RGC_* table, respecting all
+foreign keys, CHECK constraints and column widths of RGC_Tables.sql.
+
+Scale 1.0 is production size (100k series, 1M viewers, 50M feedback rows);
+the benchmark usually runs 0.001, 0.01 and 0.1. The same --seed and --scale
+always produce the same rows. RGC_AUDIT_LOG and RGC_SERIES_STATS are not
+generated: the triggers fill them while loading and the stats summary is
+rebuilt at the end.
+
+Usage:
+    python rgc_datagen.py --scale 0.01 --reset          # load into DB_CONFIG
+    python rgc_datagen.py --scale 0.01 --csv data/      # write one CSV per table
+    python rgc_datagen.py --scale 1 --counts            # print row counts only
+"""
+
+import argparse
+import csv
+import hashlib
+import os
+import random
+import sys
+import time
+from array import array
+from datetime import date, datetime, timedelta
+
+DEFAULT_SEED = 42
+DEFAULT_BATCH_SIZE = 5000
+# Dates are generated relative to this day so a seed always gives the same
+# rows; pass --as-of to line contract expiry up with the real calendar
+REFERENCE_DATE = date(2025, 1, 1)
+
+# Row counts at scale 1.0
+BASE_COUNTS = {
+    'series': 100_000,
+    'viewers': 1_000_000,
+    'feedback': 50_000_000,
+    'houses': 2_000,
+    'producers': 5_000,
+    'users': 10_000,
+}
+
+# Fixed-size reference tables (do not scale)
+N_COUNTRIES = 60
+N_LANGUAGES = 40
+N_GENRES = 20
+N_PLATFORMS = 20
+
+AVG_EPISODES = 10  # per series
+AVG_CAST = 8  # per series
+MAX_PAYMENTS = 4  # per contract
+
+# Same salt as hash_password() in rgc_stream_app.py; every generated user's
+# password is "password123"
+PASSWORD_SALT = "streamvault_salt_2025"
+GENERATED_PASSWORD = "password123"
+
+_COUNTRY_NAMES = [
+    'United States', 'India', 'United Kingdom', 'Canada', 'Australia', 'Japan',
+    'South Korea', 'France', 'Germany', 'Italy', 'Brazil', 'Spain', 'Mexico',
+    'China', 'South Africa', 'Sweden', 'Norway', 'Denmark', 'Netherlands',
+    'Turkey', 'Argentina', 'Nigeria', 'Egypt', 'Poland', 'Ireland',
+]
+_LANGUAGE_NAMES = [
+    'English', 'Spanish', 'French', 'German', 'Hindi', 'Korean', 'Japanese',
+    'Italian', 'Portuguese', 'Arabic', 'Mandarin', 'Russian', 'Turkish',
+    'Dutch', 'Swedish', 'Tamil', 'Telugu', 'Polish', 'Danish', 'Norwegian',
+]
+_GENRE_NAMES = [
+    'Drama', 'Comedy', 'Action', 'Thriller', 'Romance', 'Documentary',
+    'Animation', 'Horror', 'Sci-Fi', 'Fantasy', 'Crime', 'Mystery',
+    'Reality', 'Biography', 'History', 'Sports', 'Musical', 'Family',
+    'Western', 'War',
+]
+_FIRST_NAMES = [
+    'James', 'Mary', 'Robert', 'Priya', 'Chen', 'Aiko', 'Lucas', 'Sofia',
+    'Omar', 'Fatima', 'Ivan', 'Elena', 'Kwame', 'Amara', 'Diego', 'Lena',
+    'Raj', 'Mei', 'Noah', 'Zara', 'Hiro', 'Ines', 'Tariq', 'Olga',
+]
+_LAST_NAMES = [
+    'Smith', 'Patel', 'Kim', 'Garcia', 'Mueller', 'Rossi', 'Tanaka', 'Silva',
+    'Okafor', 'Novak', 'Cohen', 'Haddad', 'Singh', 'Dubois', 'Larsen', 'Moreau',
+    'Ivanov', 'Wong', 'Khan', 'Lopez', 'Sato', 'Berg', 'Costa', 'Nowak',
+]
+_TITLE_ADJECTIVES = [
+    'Silent', 'Crimson', 'Hidden', 'Last', 'Broken', 'Golden', 'Dark', 'Wild',
+    'Lost', 'Frozen', 'Electric', 'Hollow', 'Iron', 'Midnight', 'Secret', 'Burning',
+]
+_TITLE_NOUNS = [
+    'Harbor', 'Kingdom', 'Signal', 'Empire', 'River', 'Protocol', 'Garden',
+    'Frontier', 'Circuit', 'Legacy', 'Station', 'Horizon', 'Archive', 'Tide',
+    'Verdict', 'Orbit',
+]
+_REVIEW_OPENINGS = [
+    'Absolutely loved', 'Really enjoyed', 'Could not stop watching',
+    'Mixed feelings about', 'Disappointed by', 'Slow start but great',
+    'Brilliant writing in', 'Stunning visuals throughout',
+]
+_REVIEW_DETAILS = [
+    'the acting was superb', 'the pacing dragged in the middle',
+    'the soundtrack is unforgettable', 'the ending felt rushed',
+    'the characters are well developed', 'the plot twists kept me guessing',
+    'the dialogue felt natural', 'the cinematography is gorgeous',
+    'the villain steals every scene', 'some episodes felt like filler',
+]
+_STREETS = ['Main St', 'Oak Ave', 'Park Rd', 'Lake Dr', 'Hill St', 'River Rd', 'Elm St', 'Pine Ave']
+_CITIES = ['Springfield', 'Riverton', 'Lakeside', 'Fairview', 'Greenville', 'Bristol', 'Madison', 'Franklin']
+_PAYMENT_METHODS = ['Bank Transfer', 'Wire Transfer', 'Check', 'ACH']
+
+# Insert order respects every foreign key
+TABLE_COLUMNS = {
+    'RGC_COUNTRY': ('COUNTRY_CODE', 'COUNTRY_NAME'),
+    'RGC_SUBTITLE_LANGUAGE': ('S_LANGUAGE_ID', 'S_LANGUAGE_NAME'),
+    'RGC_DUBBING_LANGUAGE': ('D_LANGUAGE_ID', 'D_LANGUAGE_NAME'),
+    'RGC_SERIES_TYPE': ('SERIES_TYPE_ID', 'SERIES_TYPE_NAME'),
+    'RGC_PLATFORM': ('PLATFORM_ID', 'PLATFORM_NAME', 'PLATFORM_TYPE', 'WEBSITE_URL',
+                     'LAUNCH_DATE', 'SUBSCRIPTION_FEE'),
+    'RGC_VIEWER': ('ACCOUNT_ID', 'ACC_FNAME', 'ACC_LNAME', 'ADDRESS_STREET', 'ADDRESS_CITY',
+                   'ADDRESS_ZIP', 'DATE_OPENED', 'MONTHLY_CHARGE', 'COUNTRY_CODE'),
+    'RGC_PRODUCER': ('PRODUCER_ID', 'P_FNAME', 'P_LNAME', 'P_PHONE', 'P_EMAIL',
+                     'P_ADDRESS_STREET', 'P_ADDRESS_CITY', 'P_ADDRESS_STATE',
+                     'P_ADDRESS_ZIP', 'P_ADDRESS_COUNTRY'),
+    'RGC_PRODUCERS': ('PRODUCER_ID', 'PRODUCER_NAME', 'EMAIL', 'PHONE', 'COMPANY_NAME',
+                      'ADDRESS', 'SPECIALIZATION', 'YEARS_EXPERIENCE', 'STATUS'),
+    'RGC_PRODUCTION_HOUSE': ('HOUSE_ID', 'HOUSE_NAME', 'ADDRESS_STREET', 'ADDRESS_CITY',
+                             'ADDRESS_STATE', 'ADDRESS_ZIP', 'ADDRESS_COUNTRY',
+                             'YEAR_ESTABLISHED'),
+    'RGC_PRODUCER_PRODUCTION_HOUSE': ('PRODUCER_ID', 'HOUSE_ID', 'ASSOCIATION_DATE', 'END_DATE'),
+    'RGC_WEB_SERIES': ('SERIES_ID', 'SERIES_NAME', 'NUM_EPISODES', 'RELEASE_DATE',
+                       'COUNTRY_OF_ORIGIN', 'LANGUAGE', 'HOUSE_ID'),
+    'RGC_WEB_SERIES_SERIES_TYPE': ('SERIES_ID', 'SERIES_TYPE_ID'),
+    'RGC_WEBSERIES_SUBTITLE': ('SERIES_ID', 'S_LANGUAGE_ID'),
+    'RGC_WEBSERIES_DUBBING': ('SERIES_ID', 'D_LANGUAGE_ID'),
+    'RGC_WS_RELEASE_COUNTRY': ('RELEASE_DATE_IN_COUNTRY', 'SERIES_ID', 'COUNTRY_CODE'),
+    'RGC_EPISODE': ('EPISODE_ID', 'EPISODE_TITLE', 'TOTAL_VIEWERS',
+                    'TECHNICAL_INTERRUPTION', 'SERIES_ID'),
+    'RGC_AIRING_SCHEDULE': ('AIRING_SCHEDULE_ID', 'START_TS', 'END_TS', 'EPISODE_ID',
+                            'PLATFORM_ID'),
+    'RGC_CONTRACT': ('CONTRACT_ID', 'CONTRACT_DATE', 'END_DATE', 'EPISODE_RATE', 'SERIES_ID'),
+    'RGC_CONTRACTS': ('CONTRACT_ID', 'SERIES_ID', 'HOUSE_ID', 'CONTRACT_TYPE',
+                      'CONTRACT_VALUE', 'START_DATE', 'END_DATE', 'STATUS',
+                      'PAYMENT_TERMS', 'CREATED_BY'),
+    'RGC_CONTRACT_PAYMENTS': ('PAYMENT_ID', 'CONTRACT_ID', 'PAYMENT_DATE', 'AMOUNT',
+                              'PAYMENT_STATUS', 'PAYMENT_METHOD', 'NOTES'),
+    'RGC_CAST_CREW': ('ASSOCIATION_ID', 'SERIES_ID', 'PERSON_NAME', 'ROLE_TYPE',
+                      'CHARACTER_NAME', 'ROLE_DESCRIPTION', 'START_DATE', 'END_DATE',
+                      'COMPENSATION', 'STATUS'),
+    'RGC_FEEDBACK': ('FEEDBACK_ID', 'FEEDBACK_TEXT', 'RATING', 'FEEDBACK_DATE',
+                     'SERIES_ID', 'ACCOUNT_ID'),
+    'RGC_USERS': ('USER_ID', 'USERNAME', 'PASSWORD_HASH', 'USER_TYPE', 'EMAIL',
+                  'LINKED_ACCOUNT'),
+}
+TABLE_ORDER = list(TABLE_COLUMNS)
+
+# Filled by triggers / sp_rebuild_series_stats; cleared by --reset
+DERIVED_TABLES = ['RGC_AUDIT_LOG', 'RGC_SERIES_STATS']
+
+
+# ============================================================================
+# ID FORMATS
+# ============================================================================
+def country_code(i):
+    return f"C{i:04d}"  # CHAR(5), COUNTRY_CODE_CHECK wants exactly 5 chars
+
+def series_id(i):
+    return f"S{i:07d}"
+
+def episode_id(i):
+    return f"E{i:08d}"
+
+def account_id(i):
+    return f"A{i:08d}"
+
+def house_id(i):
+    return f"PH{i:06d}"
+
+def producer_id(i):
+    return f"P{i:07d}"
+
+def platform_id(i):
+    return f"PLT{i:03d}"
+
+
+def scaled_counts(scale):
+    """Row counts for the scaled tables at a scale factor"""
+    counts = {name: max(1, int(round(n * scale))) for name, n in BASE_COUNTS.items()}
+    counts['houses'] = max(2, counts['houses'])
+    counts['producers'] = max(2, counts['producers'])
+    return counts
+
+
+def _random_date(rng, start, end):
+    return start + timedelta(days=rng.randrange(max(1, (end - start).days)))
+
+
+# ============================================================================
+# GENERATOR
+# ============================================================================
+class DataGenerator:
+    """
+    Row streams for each RGC_* table at a given scale and seed
+    Each table draws from its own seeded RNG, so generating (or skipping)
+    one table never changes the rows of another.
+    """
+
+    def __init__(self, scale=0.01, seed=DEFAULT_SEED, as_of=REFERENCE_DATE):
+        self.scale = scale
+        self.seed = seed
+        self.as_of = as_of
+        self.counts = scaled_counts(scale)
+        n_series = self.counts['series']
+
+        # Per-series facts several tables need, drawn once up front
+        rng = self._rng('series-shape')
+        self.series_house = array('I', (rng.randrange(self.counts['houses']) for _ in range(n_series)))
+        self.series_episodes = array('H', (rng.randint(1, 2 * AVG_EPISODES - 1) for _ in range(n_series)))
+        self.series_release = array('I', (rng.randrange(365 * 15) for _ in range(n_series)))
+        self.n_episodes = sum(self.series_episodes)
+
+    def _rng(self, table):
+        return random.Random(f"{self.seed}:{table}")
+
+    def release_date(self, i):
+        return self.as_of - timedelta(days=365 * 15 - self.series_release[i])
+
+    def row_count(self, table):
+        """Exact row count for tables with a fixed size, else an estimate"""
+        n_series = self.counts['series']
+        return {
+            'RGC_COUNTRY': N_COUNTRIES,
+            'RGC_SUBTITLE_LANGUAGE': N_LANGUAGES,
+            'RGC_DUBBING_LANGUAGE': N_LANGUAGES,
+            'RGC_SERIES_TYPE': N_GENRES,
+            'RGC_PLATFORM': N_PLATFORMS,
+            'RGC_VIEWER': self.counts['viewers'],
+            'RGC_PRODUCER': self.counts['producers'],
+            'RGC_PRODUCERS': self.counts['producers'],
+            'RGC_PRODUCTION_HOUSE': self.counts['houses'],
+            'RGC_PRODUCER_PRODUCTION_HOUSE': int(self.counts['producers'] * 1.5),
+            'RGC_WEB_SERIES': n_series,
+            'RGC_WEB_SERIES_SERIES_TYPE': n_series * 2,
+            'RGC_WEBSERIES_SUBTITLE': n_series * 3,
+            'RGC_WEBSERIES_DUBBING': int(n_series * 1.5),
+            'RGC_WS_RELEASE_COUNTRY': int(n_series * 2.5),
+            'RGC_EPISODE': self.n_episodes,
+            'RGC_AIRING_SCHEDULE': self.n_episodes,
+            'RGC_CONTRACT': n_series,
+            'RGC_CONTRACTS': int(n_series * 1.5),
+            'RGC_CONTRACT_PAYMENTS': int(n_series * 1.5 * MAX_PAYMENTS / 2),
+            'RGC_CAST_CREW': n_series * AVG_CAST,
+            'RGC_FEEDBACK': self.counts['feedback'],
+            'RGC_USERS': self.counts['users'],
+        }[table]
+
+    def rows(self, table):
+        """Iterator of row tuples in TABLE_COLUMNS[table] order"""
+        method = getattr(self, '_gen_' + table[len('RGC_'):].lower())
+        return method(self._rng(table))
+
+    # ------------------------------------------------------------------
+    # Reference tables
+    # ------------------------------------------------------------------
+    def _gen_country(self, rng):
+        for i in range(1, N_COUNTRIES + 1):
+            name = _COUNTRY_NAMES[i - 1] if i <= len(_COUNTRY_NAMES) else f"Region {i}"
+            yield country_code(i), name
+
+    def _languages(self, prefix):
+        for i in range(1, N_LANGUAGES + 1):
+            name = _LANGUAGE_NAMES[i - 1] if i <= len(_LANGUAGE_NAMES) else f"Language {i}"
+            yield f"{prefix}{i:03d}", name
+
+    def _gen_subtitle_language(self, rng):
+        return self._languages('SL')
+
+    def _gen_dubbing_language(self, rng):
+        return self._languages('DL')
+
+    def _gen_series_type(self, rng):
+        for i in range(1, N_GENRES + 1):
+            yield f"T{i:03d}", _GENRE_NAMES[i - 1]
+
+    def _gen_platform(self, rng):
+        types = ['STREAMING', 'STREAMING', 'TV', 'CABLE', 'ONLINE']
+        for i in range(1, N_PLATFORMS + 1):
+            yield (platform_id(i), f"Platform {i}", rng.choice(types),
+                   f"https://platform{i}.example.com",
+                   _random_date(rng, date(2000, 1, 1), date(2022, 1, 1)),
+                   round(rng.uniform(4.99, 19.99), 2))
+
+    # ------------------------------------------------------------------
+    # People and companies
+    # ------------------------------------------------------------------
+    def _gen_viewer(self, rng):
+        for i in range(1, self.counts['viewers'] + 1):
+            yield (account_id(i), rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES),
+                   f"{rng.randint(1, 9999)} {rng.choice(_STREETS)}", rng.choice(_CITIES),
+                   f"{rng.randint(10000, 99999)}",
+                   _random_date(rng, date(2010, 1, 1), self.as_of),
+                   rng.choice((5.99, 9.99, 12.99, 15.99, 19.99)),
+                   country_code(rng.randint(1, N_COUNTRIES)))
+
+    def _producer_people(self, rng):
+        for i in range(1, self.counts['producers'] + 1):
+            yield i, rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES), rng.randint(1000000, 9999999)
+
+    def _gen_producer(self, rng):
+        for i, first, last, phone in self._producer_people(self._rng('producer-people')):
+            yield (producer_id(i), first, last, f"555-{phone}", f"producer{i}@example.com",
+                   f"{rng.randint(1, 9999)} {rng.choice(_STREETS)}", rng.choice(_CITIES),
+                   'State', f"{rng.randint(10000, 99999)}",
+                   _COUNTRY_NAMES[rng.randrange(len(_COUNTRY_NAMES))])
+
+    def _gen_producers(self, rng):
+        # Same people as RGC_PRODUCER, as the schema migration would copy them
+        for i, first, last, phone in self._producer_people(self._rng('producer-people')):
+            yield (producer_id(i), f"{first} {last}", f"producer{i}@example.com", f"555-{phone}",
+                   None, f"{rng.randint(1, 9999)} {rng.choice(_STREETS)}",
+                   'Film & TV Production', rng.randint(1, 35),
+                   'ACTIVE' if rng.random() < 0.9 else 'INACTIVE')
+
+    def _gen_production_house(self, rng):
+        for i in range(1, self.counts['houses'] + 1):
+            yield (house_id(i), f"{rng.choice(_TITLE_ADJECTIVES)} {rng.choice(_TITLE_NOUNS)} Studios {i}",
+                   f"{rng.randint(1, 9999)} {rng.choice(_STREETS)}", rng.choice(_CITIES), 'State',
+                   f"{rng.randint(10000, 99999)}",
+                   _COUNTRY_NAMES[rng.randrange(len(_COUNTRY_NAMES))], rng.randint(1920, 2020))
+
+    def _gen_producer_production_house(self, rng):
+        n_houses = self.counts['houses']
+        for i in range(1, self.counts['producers'] + 1):
+            for h in rng.sample(range(1, n_houses + 1), rng.randint(1, 2)):
+                start = _random_date(rng, date(2005, 1, 1), self.as_of)
+                yield producer_id(i), house_id(h), start, start + timedelta(days=rng.randint(180, 3650))
+
+    # ------------------------------------------------------------------
+    # Series and their associations
+    # ------------------------------------------------------------------
+    def _gen_web_series(self, rng):
+        for i in range(self.counts['series']):
+            name = f"The {rng.choice(_TITLE_ADJECTIVES)} {rng.choice(_TITLE_NOUNS)} {i + 1}"
+            planned = self.series_episodes[i] + rng.randint(0, 4)
+            yield (series_id(i + 1), name, planned, self.release_date(i),
+                   _COUNTRY_NAMES[rng.randrange(len(_COUNTRY_NAMES))],
+                   _LANGUAGE_NAMES[rng.randrange(len(_LANGUAGE_NAMES))],
+                   house_id(self.series_house[i] + 1))
+
+    def _series_links(self, rng, pool_size, low, high, make_id):
+        for i in range(1, self.counts['series'] + 1):
+            for k in sorted(rng.sample(range(1, pool_size + 1), rng.randint(low, high))):
+                yield series_id(i), make_id(k)
+
+    def _gen_web_series_series_type(self, rng):
+        return self._series_links(rng, N_GENRES, 1, 3, lambda k: f"T{k:03d}")
+
+    def _gen_webseries_subtitle(self, rng):
+        return self._series_links(rng, N_LANGUAGES, 1, 5, lambda k: f"SL{k:03d}")
+
+    def _gen_webseries_dubbing(self, rng):
+        return self._series_links(rng, N_LANGUAGES, 0, 3, lambda k: f"DL{k:03d}")
+
+    def _gen_ws_release_country(self, rng):
+        for i in range(self.counts['series']):
+            release = self.release_date(i)
+            for c in rng.sample(range(1, N_COUNTRIES + 1), rng.randint(1, 4)):
+                yield release + timedelta(days=rng.randint(0, 90)), series_id(i + 1), country_code(c)
+
+    def _gen_episode(self, rng):
+        eid = 0
+        for i in range(self.counts['series']):
+            for n in range(1, self.series_episodes[i] + 1):
+                eid += 1
+                title = f"Chapter {n}: {rng.choice(_TITLE_ADJECTIVES)} {rng.choice(_TITLE_NOUNS)}"
+                viewers = int(rng.paretovariate(1.2) * 10000)
+                yield (episode_id(eid), title, min(viewers, 2_000_000_000),
+                       'YES' if rng.random() < 0.05 else 'NO', series_id(i + 1))
+
+    def _gen_airing_schedule(self, rng):
+        start_floor = datetime.combine(self.as_of, datetime.min.time()) - timedelta(days=365 * 3)
+        for e in range(1, self.n_episodes + 1):
+            start = start_floor + timedelta(minutes=30 * rng.randrange(365 * 4 * 48))
+            end = start + timedelta(minutes=rng.choice((30, 45, 60, 90)))
+            yield f"AS{e:08d}", start, end, episode_id(e), platform_id(rng.randint(1, N_PLATFORMS))
+
+    # ------------------------------------------------------------------
+    # Contracts and payments
+    # ------------------------------------------------------------------
+    def _gen_contract(self, rng):
+        for i in range(self.counts['series']):
+            start = self.release_date(i) - timedelta(days=rng.randint(30, 365))
+            yield (f"C{i + 1:07d}", start, start + timedelta(days=rng.randint(180, 2000)),
+                   round(rng.uniform(1000, 100000), 2), series_id(i + 1))
+
+    def _contracts(self, rng):
+        """(contract_id, start, end, value, status) for RGC_CONTRACTS, shared with payments"""
+        cid = 0
+        for i in range(self.counts['series']):
+            for _ in range(rng.randint(1, 2)):
+                cid += 1
+                start = _random_date(rng, self.release_date(i) - timedelta(days=365), self.as_of)
+                end = start + timedelta(days=rng.randint(30, 1500))
+                roll = rng.random()
+                if roll < 0.05:
+                    status = 'PENDING'
+                elif roll < 0.08:
+                    status = 'TERMINATED'
+                else:
+                    status = 'ACTIVE' if end >= self.as_of else 'EXPIRED'
+                yield i, f"CT{cid:09d}", start, end, round(rng.uniform(10000, 5000000), 2), status
+
+    def _gen_contracts(self, rng):
+        types = ('PRODUCTION', 'DISTRIBUTION', 'LICENSING', 'TALENT')
+        for i, cid, start, end, value, status in self._contracts(self._rng('contract-shape')):
+            yield (cid, series_id(i + 1), house_id(self.series_house[i] + 1), rng.choice(types),
+                   value, start, end, status, 'Net 30', None)
+
+    def _gen_contract_payments(self, rng):
+        pid = 0
+        for _, cid, start, end, value, status in self._contracts(self._rng('contract-shape')):
+            n = rng.randint(0, MAX_PAYMENTS)
+            for k in range(n):
+                pid += 1
+                paid = start + timedelta(days=(end - start).days * k // max(n, 1))
+                if paid > self.as_of:
+                    pay_status = 'PENDING'
+                else:
+                    pay_status = 'COMPLETED' if rng.random() < 0.9 else 'OVERDUE'
+                yield (f"PAY{pid:09d}", cid, paid, round(value / n, 2), pay_status,
+                       rng.choice(_PAYMENT_METHODS), f"Installment {k + 1} of {n}")
+
+    # ------------------------------------------------------------------
+    # Cast, feedback, users
+    # ------------------------------------------------------------------
+    def _gen_cast_crew(self, rng):
+        roles = ('ACTOR', 'ACTOR', 'ACTOR', 'DIRECTOR', 'WRITER', 'PRODUCER',
+                 'CINEMATOGRAPHER', 'EDITOR', 'OTHER')
+        aid = 0
+        for i in range(self.counts['series']):
+            start = self.release_date(i) - timedelta(days=rng.randint(30, 365))
+            for _ in range(rng.randint(3, 2 * AVG_CAST - 3)):
+                aid += 1
+                role = rng.choice(roles)
+                ended = rng.random() < 0.5
+                yield (f"ASSOC{aid:09d}", series_id(i + 1),
+                       f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}", role,
+                       f"{rng.choice(_FIRST_NAMES)}" if role == 'ACTOR' else None,
+                       'Main cast' if role == 'ACTOR' else 'Crew', start,
+                       start + timedelta(days=rng.randint(60, 1500)) if ended else None,
+                       round(rng.uniform(20000, 800000), 2),
+                       'COMPLETED' if ended else 'ACTIVE')
+
+    def _gen_feedback(self, rng):
+        n_series = self.counts['series']
+        n_viewers = self.counts['viewers']
+        span = (self.as_of - date(2015, 1, 1)).days
+        for f in range(1, self.counts['feedback'] + 1):
+            # popularity skew: low series numbers collect most of the reviews
+            s = int(n_series * rng.random() ** 3)
+            rating = rng.choices((1, 2, 3, 4, 5), weights=(5, 8, 20, 37, 30))[0]
+            text = f"{rng.choice(_REVIEW_OPENINGS)} this series, {rng.choice(_REVIEW_DETAILS)}."
+            if rng.random() < 0.4:
+                text += f" Also {rng.choice(_REVIEW_DETAILS)}."
+            yield (f"F{f:09d}", text[:300], rating,
+                   date(2015, 1, 1) + timedelta(days=rng.randrange(span)),
+                   series_id(s + 1), account_id(rng.randint(1, n_viewers)))
+
+    def _gen_users(self, rng):
+        pwd_hash = hashlib.sha256(f"{GENERATED_PASSWORD}{PASSWORD_SALT}".encode()).hexdigest()
+        n_users = self.counts['users']
+        n_admins = max(1, n_users // 1000)
+        n_producers = max(1, n_users // 20)
+        for u in range(1, n_users + 1):
+            if u <= n_admins:
+                user_type, name, linked = 'ADMIN', f"admin{u}", None
+            elif u <= n_admins + n_producers:
+                user_type, name, linked = 'PRODUCER', f"producer{u - n_admins}", None
+            else:
+                k = u - n_admins - n_producers
+                user_type, name = 'VIEWER', f"viewer{k}"
+                linked = account_id((k - 1) % self.counts['viewers'] + 1)
+            yield f"U{u:09d}", name, pwd_hash, user_type, f"{name}@example.com", linked
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+def _batches(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def reset_tables(conn, tables=TABLE_ORDER):
+    """Empty the generated tables (and the trigger-maintained ones)"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+        for table in list(reversed(tables)) + DERIVED_TABLES:
+            cursor.execute(f"TRUNCATE TABLE {table}")
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+    finally:
+        cursor.close()
+
+
+def load_tables(conn, generator, tables=TABLE_ORDER, batch_size=DEFAULT_BATCH_SIZE, log=None):
+    """Insert generated rows in batches, one commit per batch; returns rows per table"""
+    loaded = {}
+    cursor = conn.cursor()
+    try:
+        for table in tables:
+            columns = TABLE_COLUMNS[table]
+            query = (f"INSERT INTO {table} ({', '.join(columns)}) "
+                     f"VALUES ({', '.join(['%s'] * len(columns))})")
+            start = time.monotonic()
+            count = 0
+            for batch in _batches(generator.rows(table), batch_size):
+                conn.start_transaction()
+                cursor.executemany(query, batch)
+                conn.commit()
+                count += len(batch)
+            loaded[table] = count
+            if log:
+                elapsed = time.monotonic() - start
+                log(f"{table}: {count} rows in {elapsed:.1f}s ({count / max(elapsed, 1e-9):.0f} rows/s)")
+        cursor.execute("CALL sp_rebuild_series_stats()")
+        # Keep app-allocated IDs (rgc_ids.py) clear of the generated keys
+        from rgc_ids import sync_sequences
+        sync_sequences(conn, tables)
+        for table in tables:
+            cursor.execute(f"ANALYZE TABLE {table}")
+            cursor.fetchall()
+    finally:
+        cursor.close()
+    return loaded
+
+
+def write_csv(generator, out_dir, tables=TABLE_ORDER, log=None):
+    """
+    One CSV per table, NULL written as \\N so the files load with
+    LOAD DATA INFILE ... FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"' IGNORE 1 LINES
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    written = {}
+    for table in tables:
+        path = os.path.join(out_dir, f"{table}.csv")
+        count = 0
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(TABLE_COLUMNS[table])
+            for row in generator.rows(table):
+                writer.writerow(['\\N' if v is None else v for v in row])
+                count += 1
+        written[table] = count
+        if log:
+            log(f"{path}: {count} rows")
+    return written
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+def add_connection_args(parser):
+    """--host/--port/--user/--password/--database overrides for DB_CONFIG"""
+    parser.add_argument('--host')
+    parser.add_argument('--port', type=int)
+    parser.add_argument('--user')
+    parser.add_argument('--password')
+    parser.add_argument('--database')
+
+
+def connection_config(args):
+    from rgc_db import DB_CONFIG
+    overrides = {key: getattr(args, key) for key in ('host', 'port', 'user', 'password', 'database')
+                 if getattr(args, key) is not None}
+    return dict(DB_CONFIG, **overrides)
+
+
+def _log(message):
+    print(message, file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic RGC data")
+    parser.add_argument('--scale', type=float, default=0.01,
+                        help="1.0 = 100k series, 1M viewers, 50M feedback rows")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--as-of', type=date.fromisoformat, default=REFERENCE_DATE,
+                        help="reference 'today' for generated dates (YYYY-MM-DD)")
+    parser.add_argument('--tables', nargs='+', choices=TABLE_ORDER, metavar='TABLE',
+                        help="only these tables (their parents must already be loaded)")
+    parser.add_argument('--csv', metavar='DIR', help="write CSV files instead of loading")
+    parser.add_argument('--reset', action='store_true',
+                        help="truncate the generated tables before loading")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--counts', action='store_true', help="print row counts and exit")
+    add_connection_args(parser)
+    args = parser.parse_args(argv)
+
+    generator = DataGenerator(args.scale, args.seed, args.as_of)
+    tables = [t for t in TABLE_ORDER if not args.tables or t in args.tables]
+
+    if args.counts:
+        for table in tables:
+            print(f"{table:32s} {generator.row_count(table):>12,}")
+        return 0
+
+    if args.csv:
+        write_csv(generator, args.csv, tables, log=_log)
+        return 0
+
+    import mysql.connector
+    conn = mysql.connector.connect(**connection_config(args))
+    try:
+        if args.reset:
+            reset_tables(conn, tables)
+        load_tables(conn, generator, tables, args.batch_size, log=_log)
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
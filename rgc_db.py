@@ -0,0 +1,660 @@
+"""
+RGC Stream - Database access layer
+Pooled MySQL connections shared by the Streamlit app and the command line tools
+
+Every execute_query call and transaction() block borrows its own connection
+from the pool and hands it back when done, so concurrent sessions no longer
+share one socket (or one another's rollbacks).
+"""
+
+import os
+import queue
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+import mysql.connector
+from mysql.connector import Error, errorcode
+from mysql.connector.constants import FieldType
+
+from rgc_cache import query_cache, tables_in, is_read_query
+from rgc_metrics import record_query, attributed_to, current_page, calling_function
+
+# ============================================================================
+# DATABASE CONFIGURATION
+# ============================================================================
+DB_CONFIG = {
+    'host': 'localhost',
+    'database': 'RGC',
+    'user': '',  # UPDATE THIS
+    'password': '',  # UPDATE THIS
+    'port': 3306,
+    # Pooled connections run in autocommit mode so a plain SELECT does not
+    # leave a read snapshot open on the connection; transaction() still opens
+    # an explicit transaction with start_transaction().
+    'autocommit': True,
+}
+
+POOL_SIZE = int(os.environ.get('RGC_DB_POOL_SIZE', 8))
+POOL_TIMEOUT = float(os.environ.get('RGC_DB_POOL_TIMEOUT', 10))
+# Idle connections older than this are pinged before being handed out
+HEALTH_CHECK_INTERVAL = float(os.environ.get('RGC_DB_HEALTH_CHECK_INTERVAL', 30))
+# Server-side prepared statements kept open per pooled connection (0 turns
+# prepared execution off); the server caps the total at max_prepared_stmt_count
+STATEMENT_CACHE_SIZE = int(os.environ.get('RGC_DB_STATEMENT_CACHE_SIZE', 64))
+
+# "MySQL server has gone away" / "Lost connection to MySQL server"
+RECONNECT_ERRORS = {
+    errorcode.CR_SERVER_GONE_ERROR,
+    errorcode.CR_SERVER_LOST,
+    errorcode.CR_SERVER_LOST_EXTENDED,
+}
+
+
+class PoolExhaustedError(Error):
+    """Raised when no connection frees up within the pool timeout"""
+
+
+def is_disconnect_error(error):
+    """True when the error means the server connection was dropped"""
+    return getattr(error, 'errno', None) in RECONNECT_ERRORS
+
+
+# ============================================================================
+# PREPARED STATEMENTS
+# ============================================================================
+# Plain DML; CALL, SHOW and DDL keep going through the text protocol
+_PREPARABLE_RE = re.compile(r'^\s*(SELECT|WITH|INSERT|UPDATE|DELETE|REPLACE)\b', re.IGNORECASE)
+
+
+class StatementCache:
+    """
+    LRU of prepared cursors for one connection, keyed by SQL text
+    MySQL parses and plans a statement once when it is prepared; executing it
+    again only sends the parameters. At most `size` statements stay open, the
+    least recently used one is closed on the server to make room. Statements
+    belong to a server session, so after a reconnect the cache starts over.
+    """
+
+    def __init__(self, conn, size=STATEMENT_CACHE_SIZE):
+        self.conn = conn
+        self.size = size
+        self.session = conn.connection_id
+        self._cursors = OrderedDict()  # (query, dictionary) -> (cursor, query)
+        self.hits = 0
+        self.prepares = 0
+
+    def __len__(self):
+        return len(self._cursors)
+
+    def cursor(self, query, dictionary=True):
+        """
+        (cursor, query) to execute `query` as a prepared statement
+        Pass the returned query object to cursor.execute(): the connector only
+        skips re-preparing when it gets the very string it prepared.
+        """
+        if self.conn.connection_id != self.session:
+            self.reset()
+        key = (query, dictionary)
+        entry = self._cursors.get(key)
+        if entry is not None:
+            self._cursors.move_to_end(key)
+            self.hits += 1
+            return entry
+        while len(self._cursors) >= self.size:
+            _, (old, _) = self._cursors.popitem(last=False)
+            self._close(old)
+        entry = self._cursors[key] = (self.conn.cursor(prepared=True, dictionary=dictionary), query)
+        self.prepares += 1
+        return entry
+
+    def evict(self, query, dictionary=True):
+        """Close and forget one statement, e.g. after the server lost it"""
+        entry = self._cursors.pop((query, dictionary), None)
+        if entry is not None:
+            self._close(entry[0])
+
+    def reset(self):
+        """Forget every statement of a dropped session without closing them"""
+        # Statement IDs restart with each session: closing an old ID on the
+        # new session could close someone else's statement
+        self._cursors.clear()
+        self.session = self.conn.connection_id
+
+    def close(self):
+        """Close every statement on a still-open connection"""
+        while self._cursors:
+            _, (cursor, _) = self._cursors.popitem()
+            self._close(cursor)
+
+    @staticmethod
+    def _close(cursor):
+        try:
+            cursor.close()
+        except Error:
+            pass
+
+
+# ============================================================================
+# CONNECTION POOL
+# ============================================================================
+class ConnectionPool:
+    """
+    Thread-safe pool of MySQL connections
+    Connections are opened lazily up to `size`, health checked when handed
+    out after sitting idle, and replaced if the server dropped them.
+    """
+
+    def __init__(self, config, size=POOL_SIZE, timeout=POOL_TIMEOUT,
+                 health_check_interval=HEALTH_CHECK_INTERVAL,
+                 statement_cache_size=STATEMENT_CACHE_SIZE):
+        self.config = dict(config)
+        self.size = size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.statement_cache_size = statement_cache_size
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._statements = {}  # id(connection) -> StatementCache
+
+    def _connect(self):
+        return mysql.connector.connect(**self.config)
+
+    def _open_slot(self):
+        """Reserve room for a new connection, False if the pool is full"""
+        with self._lock:
+            if self._opened >= self.size:
+                return False
+            self._opened += 1
+            return True
+
+    def _discard(self, conn):
+        with self._lock:
+            self._opened -= 1
+            self._statements.pop(id(conn), None)
+        try:
+            conn.close()
+        except Error:
+            pass
+
+    def _is_healthy(self, conn, idle_since):
+        if time.monotonic() - idle_since < self.health_check_interval:
+            return True
+        try:
+            conn.ping(reconnect=True, attempts=2, delay=0)
+            return True
+        except Error:
+            return False
+
+    def acquire(self):
+        """Borrow a connection, opening a new one while under the pool size"""
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                conn, idle_since = self._idle.get_nowait()
+            except queue.Empty:
+                if self._open_slot():
+                    try:
+                        return self._connect()
+                    except Error:
+                        with self._lock:
+                            self._opened -= 1
+                        raise
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolExhaustedError(
+                        msg=f"No database connection available after {self.timeout:.0f}s "
+                            f"(pool size {self.size})")
+                try:
+                    conn, idle_since = self._idle.get(timeout=remaining)
+                except queue.Empty:
+                    continue
+
+            if self._is_healthy(conn, idle_since):
+                return conn
+            self._discard(conn)
+
+    def release(self, conn):
+        """Return a connection to the pool, rolling back anything left open"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except Error:
+            self._discard(conn)
+            return
+        if not conn.is_connected():
+            self._discard(conn)
+            return
+        self._idle.put((conn, time.monotonic()))
+
+    def discard(self, conn):
+        """Close a borrowed connection that cannot be reused (e.g. mid-result) instead of releasing it"""
+        self._discard(conn)
+
+    def reconnect(self, conn):
+        """Re-open a connection the server has dropped"""
+        conn.reconnect(attempts=2, delay=0)
+        statements = self.statements(conn)
+        if statements is not None:
+            statements.reset()
+
+    def statements(self, conn):
+        """Prepared statement cache of a connection from this pool (None when turned off)"""
+        if self.statement_cache_size <= 0:
+            return None
+        with self._lock:
+            cache = self._statements.get(id(conn))
+            if cache is None:
+                cache = self._statements[id(conn)] = StatementCache(conn, self.statement_cache_size)
+            return cache
+
+    def statement_stats(self):
+        """Open prepared statements and reuse counts across the pool's connections"""
+        with self._lock:
+            caches = list(self._statements.values())
+        return {
+            'open': sum(len(cache) for cache in caches),
+            'hits': sum(cache.hits for cache in caches),
+            'prepares': sum(cache.prepares for cache in caches),
+        }
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for the duration of a with-block"""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self):
+        """Close every idle connection"""
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+
+@st.cache_resource
+def get_connection_pool():
+    """Create the process-wide connection pool (once per server process)"""
+    return ConnectionPool(DB_CONFIG)
+
+
+@contextmanager
+def pooled_connection():
+    """Borrow a pooled connection; reports connection errors like the app pages do"""
+    pool = get_connection_pool()
+    try:
+        conn = pool.acquire()
+    except Error as e:
+        st.error(f"❌ Database Connection Error: {e}")
+        st.info("💡 Please update database credentials in rgc_db.py (DB_CONFIG)")
+        yield None
+        return
+    try:
+        yield conn
+    finally:
+        pool.release(conn)
+
+
+# ============================================================================
+# QUERY EXECUTION
+# ============================================================================
+_INT_TYPES = {FieldType.TINY, FieldType.SHORT, FieldType.LONG, FieldType.LONGLONG,
+              FieldType.INT24, FieldType.YEAR}
+_FLOAT_TYPES = {FieldType.FLOAT, FieldType.DOUBLE, FieldType.DECIMAL, FieldType.NEWDECIMAL}
+_DATE_TYPES = {FieldType.DATE, FieldType.NEWDATE, FieldType.DATETIME, FieldType.TIMESTAMP}
+
+
+def _column(values, type_code):
+    """One typed column from a tuple of raw values"""
+    if type_code in _INT_TYPES:
+        if None in values:
+            return pd.array(values, dtype='Int64')
+        return np.array(values, dtype=np.int64)
+    if type_code in _FLOAT_TYPES:
+        # DECIMAL becomes float64 (None -> NaN); fine for sums and charts
+        return np.array(values, dtype=np.float64)
+    if type_code in _DATE_TYPES:
+        return pd.to_datetime(list(values))
+    return np.array(values, dtype=object)
+
+
+def frame_from_cursor(cursor):
+    """
+    Fetch a result as a DataFrame, one typed column per result column
+    Rows come back as plain tuples and are transposed straight into columns,
+    skipping the per-row dicts of a dictionary cursor.
+    """
+    names = [col[0] for col in cursor.description]
+    rows = cursor.fetchall()
+    columns = zip(*rows) if rows else [()] * len(names)
+    return pd.DataFrame({name: _column(values, col[1])
+                         for name, values, col in zip(names, columns, cursor.description)},
+                        columns=list(dict.fromkeys(names)))
+
+
+def _run(conn, query, params, fetch, commit, columnar=False, statements=None):
+    """
+    Run one statement; returns (result, rows, seconds spent in the database)
+    With a StatementCache, DML runs as a server-side prepared statement.
+    """
+    prepared = statements is not None and _PREPARABLE_RE.match(query)
+    if prepared:
+        cursor, operation = statements.cursor(query, dictionary=not columnar)
+    else:
+        cursor = conn.cursor() if columnar else conn.cursor(dictionary=True)
+        operation = query
+    start = time.perf_counter()
+    try:
+        cursor.execute(operation, params or ())
+        if commit:
+            conn.commit()
+            result = rows = cursor.rowcount
+        elif fetch:
+            result = frame_from_cursor(cursor) if columnar else cursor.fetchall()
+            rows = len(result)
+        else:
+            if cursor.with_rows:
+                cursor.fetchall()  # prepared results are unbuffered
+            result, rows = True, cursor.rowcount
+        return result, rows, time.perf_counter() - start
+    except Error as e:
+        if prepared and e.errno == errorcode.ER_UNKNOWN_STMT_HANDLER:
+            # The server lost the statement: run it as text this time, the
+            # next call prepares it again
+            statements.evict(query, dictionary=not columnar)
+            return _run(conn, query, params, fetch, commit, columnar)
+        raise
+    finally:
+        if not prepared:
+            cursor.close()
+
+
+def execute_query(query, params=None, fetch=True, commit=False):
+    """Execute query with prepared statements to prevent SQL injection"""
+    return _execute(query, params, fetch, commit)
+
+
+def execute_query_frame(query, params=None):
+    """
+    Read query returning a pandas DataFrame instead of a list of dicts
+    Integer columns are int64 (nullable Int64 when they hold NULLs), DECIMAL
+    and floats float64, DATE/DATETIME datetime64, everything else object.
+    None on error, like execute_query.
+    """
+    return _execute(query, params, True, False, columnar=True)
+
+
+def _execute(query, params, fetch, commit, columnar=False):
+    pool = get_connection_pool()
+    start = time.perf_counter()
+    rows, db_time, error = None, 0.0, None
+    try:
+        with pooled_connection() as conn:
+            if not conn:
+                error = "no connection"
+                return None
+
+            statements = pool.statements(conn)
+            try:
+                try:
+                    result, rows, db_time = _run(conn, query, params, fetch, commit, columnar,
+                                                 statements)
+                except Error as e:
+                    # Reads are safe to replay on a fresh socket; a write may
+                    # already have been applied when the connection dropped
+                    if not is_disconnect_error(e) or not is_read_query(query):
+                        raise
+                    pool.reconnect(conn)
+                    result, rows, db_time = _run(conn, query, params, fetch, commit, columnar,
+                                                 statements)
+                if not is_read_query(query):
+                    invalidate_tables(tables_in(query))
+                return result
+            except Error as e:
+                error = str(e)
+                try:
+                    conn.rollback()
+                except Error:
+                    pass
+                st.error(f"Database Error: {e}")
+                return None
+    finally:
+        record_query(query, params, rows, (time.perf_counter() - start) * 1000,
+                     db_time * 1000, error)
+
+
+def in_placeholders(values):
+    """Placeholder list for a parameterized IN (...) over `values`"""
+    return ", ".join(["%s"] * len(values))
+
+
+# ============================================================================
+# CACHED READS
+# ============================================================================
+def invalidate_tables(tables):
+    """Drop cached reads of the given tables; with no table names, drop everything"""
+    if tables:
+        query_cache.invalidate(tables)
+    else:
+        # e.g. CALL sp_...: the tables it writes are not visible in the SQL text
+        query_cache.clear()
+
+
+def cached_query(query, params=None, ttl=None):
+    """
+    Read-only execute_query served from the query cache
+    Results stay cached until their TTL runs out or a write through
+    execute_query/transaction() touches one of the tables they read.
+    Treat the returned rows as read-only; they are shared between sessions.
+    """
+    key = query_cache.make_key(query, params)
+    hit, rows = query_cache.get(key)
+    if hit:
+        return rows
+    tables = tables_in(query)
+    snapshot = query_cache.snapshot(tables)
+    rows = execute_query(query, params)
+    if rows is not None:
+        query_cache.put(key, rows, tables, ttl, snapshot)
+    return rows
+
+
+def cached_query_frame(query, params=None, ttl=None):
+    """execute_query_frame served from the query cache; treat the frame as read-only"""
+    key = query_cache.make_key(query, params, variant='frame')
+    hit, frame = query_cache.get(key)
+    if hit:
+        return frame
+    tables = tables_in(query)
+    snapshot = query_cache.snapshot(tables)
+    frame = execute_query_frame(query, params)
+    if frame is not None:
+        query_cache.put(key, frame, tables, ttl, snapshot)
+    return frame
+
+
+# ============================================================================
+# PARALLEL READS
+# ============================================================================
+# Kept below the pool size so the page's own thread can still check out a
+# connection while one of its batches is running
+QUERY_WORKERS = max(1, min(int(os.environ.get('RGC_DB_QUERY_WORKERS', 4)), POOL_SIZE - 1))
+BATCH_TIMEOUT = float(os.environ.get('RGC_DB_BATCH_TIMEOUT', 15))
+
+_SELECT_RE = re.compile(r'^\s*SELECT\b', re.IGNORECASE)
+
+
+@st.cache_resource
+def get_query_executor():
+    """Process-wide worker pool shared by every session's query batches"""
+    return ThreadPoolExecutor(max_workers=QUERY_WORKERS, thread_name_prefix='rgc-query')
+
+
+def with_time_limit(query, timeout):
+    """Add a MAX_EXECUTION_TIME hint so the server abandons a SELECT past the timeout"""
+    return _SELECT_RE.sub(f"SELECT /*+ MAX_EXECUTION_TIME({int(timeout * 1000)}) */", query, count=1)
+
+
+def _fetch_rows(pool, query, params, timeout, page, function, columnar=False):
+    """Worker body: one read on its own pooled connection; raises instead of calling st.*"""
+    limited = with_time_limit(query, timeout)
+    start = time.perf_counter()
+    rows, db_time, error = None, 0.0, None
+    with attributed_to(page, function):
+        try:
+            conn = pool.acquire()
+            statements = pool.statements(conn)
+            try:
+                try:
+                    result, rows, db_time = _run(conn, limited, params, True, False, columnar,
+                                                 statements)
+                except Error as e:
+                    if not is_disconnect_error(e):
+                        raise
+                    pool.reconnect(conn)
+                    result, rows, db_time = _run(conn, limited, params, True, False, columnar,
+                                                 statements)
+                return result
+            finally:
+                pool.release(conn)
+        except Error as e:
+            error = str(e)
+            raise
+        finally:
+            record_query(query, params, rows, (time.perf_counter() - start) * 1000,
+                         db_time * 1000, error)
+
+
+def run_batch(queries, timeout=BATCH_TIMEOUT, cached=False, ttl=None, frames=()):
+    """
+    Run a page's independent reads concurrently, one pooled connection each
+    `queries` maps a name to (query, params); returns {name: rows} once every
+    query is back, so the page waits for the slowest query instead of the sum
+    of all of them. A query that fails or runs past `timeout` seconds comes
+    back as None and is reported here, on the page's thread, without
+    affecting the rest. With cached=True results go through the query cache.
+    Names listed in `frames` come back as DataFrames (see execute_query_frame).
+    """
+    results = {}
+    pending = {}
+    snapshots = {}
+    # resolved here: workers have no Streamlit script context
+    pool, executor = get_connection_pool(), get_query_executor()
+    page, function = current_page(), calling_function()
+    for name, (query, params) in queries.items():
+        if not is_read_query(query):
+            raise ValueError(f"run_batch only runs read queries ({name})")
+        columnar = name in frames
+        if cached:
+            hit, rows = query_cache.get(
+                query_cache.make_key(query, params, 'frame' if columnar else None))
+            if hit:
+                results[name] = rows
+                continue
+            snapshots[name] = query_cache.snapshot(tables_in(query))
+        future = executor.submit(_fetch_rows, pool, query, params, timeout, page, function,
+                                 columnar)
+        pending[future] = name
+
+    done, not_done = wait(pending, timeout=timeout)
+    for future in not_done:
+        # the worker finishes (or the server aborts it) and returns its connection
+        results[pending[future]] = None
+        st.warning(f"⏱️ Query '{pending[future]}' timed out after {timeout:g}s")
+    for future in done:
+        name = pending[future]
+        try:
+            rows = future.result()
+        except Exception as e:
+            results[name] = None
+            st.error(f"Database Error ({name}): {e}")
+            continue
+        results[name] = rows
+        if cached:
+            query, params = queries[name]
+            key = query_cache.make_key(query, params, 'frame' if name in frames else None)
+            query_cache.put(key, rows, tables_in(query), ttl, snapshots[name])
+    return {name: results[name] for name in queries}
+
+
+class _TrackingCursor:
+    """Cursor proxy that remembers which tables a transaction wrote and times each statement"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.written_tables = set()
+        self.wrote_unknown = False
+
+    def _track(self, operation):
+        if not is_read_query(operation):
+            tables = tables_in(operation)
+            self.written_tables |= tables
+            self.wrote_unknown = self.wrote_unknown or not tables
+
+    def _timed(self, method, operation, params, record_params, *args, **kwargs):
+        start = time.perf_counter()
+        error = None
+        try:
+            return method(operation, params, *args, **kwargs)
+        except Error as e:
+            error = str(e)
+            raise
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            rows = self._cursor.rowcount
+            record_query(operation, record_params, rows if rows >= 0 else None,
+                         elapsed, elapsed, error)
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        self._track(operation)
+        return self._timed(self._cursor.execute, operation, params, params, *args, **kwargs)
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        self._track(operation)
+        # keep the batch out of the metrics buffer; it can be thousands of rows
+        return self._timed(self._cursor.executemany, operation, seq_params, None, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+
+# concurrency example with transaction management
+@contextmanager
+def transaction():
+    """Transaction context manager with automatic rollback"""
+    with pooled_connection() as conn:
+        if not conn:
+            yield None
+            return
+
+        if not conn.is_connected():
+            get_connection_pool().reconnect(conn)
+
+        cursor = _TrackingCursor(conn.cursor(dictionary=True))
+        try:
+            conn.start_transaction()
+            yield cursor
+            conn.commit()
+            if cursor.wrote_unknown or cursor.written_tables:
+                invalidate_tables(None if cursor.wrote_unknown else cursor.written_tables)
+        except Error as e:
+            conn.rollback()
+            st.error(f"Transaction Error: {e}")
+            raise
+        finally:
+            cursor.close()
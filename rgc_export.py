@@ -0,0 +1,437 @@
+"""
+RGC Stream - Streaming report export
+Feedback, payments, the contract ledger, viewers and the audit log as CSV,
+JSON Lines or Parquet, without ever holding the full result in memory.
+
+Rows are read through an unbuffered cursor on a dedicated pooled connection,
+so the server streams the result set and the client pulls CHUNK_ROWS rows at
+a time with fetchmany(). Each chunk is encoded and handed on before the next
+one is fetched: memory stays flat however many rows the report has, and the
+first bytes are ready as soon as the first chunk arrives.
+
+Usage:
+    python rgc_export.py dump feedback --format csv -o feedback.csv
+    python rgc_export.py dump audit_log --format jsonl          # to stdout
+    python rgc_export.py serve --port 8600 --token SECRET
+
+`serve` streams exports over HTTP with chunked transfer encoding, so a
+browser download starts while the query is still running. The reports hold
+viewer names and addresses, so it only starts without a token when bound to
+a loopback address. Scripts send the token as a header and browsers use a link from signed_url(), which
+carries an HMAC of the path and an expiry instead of the token itself:
+    curl -H "Authorization: Bearer SECRET" http://127.0.0.1:8600/feedback.csv
+
+Parquet output is written with pyarrow (listed in requirements.txt).
+"""
+
+import argparse
+import csv
+import hashlib
+import hmac
+import io
+import ipaddress
+import json
+import os
+import re
+import sys
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from mysql.connector import Error
+from mysql.connector.constants import FieldType
+
+from rgc_db import ConnectionPool, get_connection_pool
+from rgc_metrics import record_query
+
+CHUNK_ROWS = 5000
+LINK_TTL = 300  # seconds a signed download link stays valid
+# The server stalls writing when a slow download stops pulling rows; give it
+# longer than the default 60s before it drops the connection
+NET_WRITE_TIMEOUT = 3600
+
+EXPORTS = {
+    'feedback': """
+        SELECT f.FEEDBACK_ID, f.SERIES_ID, ws.SERIES_NAME, f.ACCOUNT_ID,
+               f.RATING, f.FEEDBACK_DATE, f.FEEDBACK_TEXT
+        FROM RGC_FEEDBACK f
+        JOIN RGC_WEB_SERIES ws ON f.SERIES_ID = ws.SERIES_ID
+        ORDER BY f.FEEDBACK_ID
+    """,
+    'payments': """
+        SELECT p.PAYMENT_ID, p.CONTRACT_ID, c.CONTRACT_TYPE, ws.SERIES_NAME, ph.HOUSE_NAME,
+               p.PAYMENT_DATE, p.AMOUNT, p.PAYMENT_STATUS, p.PAYMENT_METHOD, p.NOTES
+        FROM RGC_CONTRACT_PAYMENTS p
+        JOIN RGC_CONTRACTS c ON p.CONTRACT_ID = c.CONTRACT_ID
+        LEFT JOIN RGC_WEB_SERIES ws ON c.SERIES_ID = ws.SERIES_ID
+        LEFT JOIN RGC_PRODUCTION_HOUSE ph ON c.HOUSE_ID = ph.HOUSE_ID
+        ORDER BY p.PAYMENT_ID
+    """,
+    'contracts': """
+        SELECT c.CONTRACT_ID, c.CONTRACT_TYPE, c.STATUS, c.SERIES_ID, ws.SERIES_NAME,
+               c.HOUSE_ID, ph.HOUSE_NAME, c.CONTRACT_VALUE, c.START_DATE, c.END_DATE,
+               c.PAYMENT_TERMS, c.CREATED_BY, c.CREATED_DATE,
+               IFNULL(p.paid, 0) as AMOUNT_PAID,
+               IFNULL(p.outstanding, 0) as AMOUNT_OUTSTANDING,
+               IFNULL(p.payment_count, 0) as PAYMENT_COUNT
+        FROM RGC_CONTRACTS c
+        LEFT JOIN RGC_WEB_SERIES ws ON c.SERIES_ID = ws.SERIES_ID
+        LEFT JOIN RGC_PRODUCTION_HOUSE ph ON c.HOUSE_ID = ph.HOUSE_ID
+        LEFT JOIN (
+            SELECT CONTRACT_ID,
+                   SUM(CASE WHEN PAYMENT_STATUS = 'COMPLETED' THEN AMOUNT ELSE 0 END) as paid,
+                   SUM(CASE WHEN PAYMENT_STATUS IN ('PENDING', 'OVERDUE') THEN AMOUNT ELSE 0 END) as outstanding,
+                   COUNT(*) as payment_count
+            FROM RGC_CONTRACT_PAYMENTS
+            GROUP BY CONTRACT_ID
+        ) p ON c.CONTRACT_ID = p.CONTRACT_ID
+        ORDER BY c.CONTRACT_ID
+    """,
+    'viewers': """
+        SELECT v.ACCOUNT_ID, v.ACC_FNAME, v.ACC_LNAME, v.ADDRESS_STREET, v.ADDRESS_CITY,
+               v.ADDRESS_ZIP, v.COUNTRY_CODE, c.COUNTRY_NAME, v.DATE_OPENED, v.MONTHLY_CHARGE
+        FROM RGC_VIEWER v
+        LEFT JOIN RGC_COUNTRY c ON v.COUNTRY_CODE = c.COUNTRY_CODE
+        ORDER BY v.ACCOUNT_ID
+    """,
+    'audit_log': """
+        SELECT LOG_ID, TABLE_NAME, OPERATION_TYPE, RECORD_ID, OLD_VALUES, NEW_VALUES,
+               CHANGED_BY, CHANGE_TIMESTAMP
+        FROM RGC_AUDIT_LOG
+        ORDER BY LOG_ID
+    """,
+}
+
+# format -> (MIME type, file extension)
+FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'jsonl': ('application/x-ndjson', 'jsonl'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+}
+
+
+# ============================================================================
+# STREAMING READS
+# ============================================================================
+def stream_rows(query, params=None, pool=None, chunk_rows=CHUNK_ROWS):
+    """
+    Yield the column names, then lists of up to `chunk_rows` row tuples
+    The connection is held for the whole stream; if the consumer stops early
+    it is closed rather than returned to the pool with unread rows on it.
+    A finished stream restores the session's net_write_timeout before the
+    connection goes back to the pool.
+    """
+    pool = pool or get_connection_pool()
+    conn = pool.acquire()
+    cursor = None
+    finished = False
+    rows = 0
+    start = time.perf_counter()
+    error = None
+    try:
+        cursor = conn.cursor(buffered=False)
+        cursor.execute("SELECT @@SESSION.net_write_timeout")
+        write_timeout = cursor.fetchall()[0][0]
+        cursor.execute("SET SESSION net_write_timeout = %s", (NET_WRITE_TIMEOUT,))
+        cursor.execute(query, params or ())
+        yield [col[0] for col in cursor.description], [col[1] for col in cursor.description]
+        while True:
+            chunk = cursor.fetchmany(chunk_rows)
+            if not chunk:
+                break
+            rows += len(chunk)
+            yield chunk
+        finished = True
+    except Error as e:
+        error = str(e)
+        raise
+    finally:
+        elapsed = (time.perf_counter() - start) * 1000
+        record_query(query, params, rows, elapsed, elapsed, error)
+        if finished:
+            try:
+                cursor.execute("SET SESSION net_write_timeout = %s", (write_timeout,))
+                cursor.close()
+                pool.release(conn)
+            except Error:
+                pool.discard(conn)
+        else:
+            pool.discard(conn)
+
+
+# ============================================================================
+# ENCODERS
+# ============================================================================
+def _json_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode('utf-8', errors='replace')
+    return str(value)
+
+
+def encode_csv(columns, chunks):
+    yield (','.join(columns) + '\r\n').encode('utf-8')
+    for chunk in chunks:
+        out = io.StringIO()
+        csv.writer(out).writerows(chunk)
+        yield out.getvalue().encode('utf-8')
+
+
+def encode_jsonl(columns, chunks):
+    for chunk in chunks:
+        lines = [json.dumps(dict(zip(columns, row)), default=_json_value) for row in chunk]
+        yield ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+_INT_TYPES = {FieldType.TINY, FieldType.SHORT, FieldType.LONG, FieldType.LONGLONG,
+              FieldType.INT24, FieldType.YEAR}
+_FLOAT_TYPES = {FieldType.FLOAT, FieldType.DOUBLE}
+_DECIMAL_TYPES = {FieldType.DECIMAL, FieldType.NEWDECIMAL}
+_TIMESTAMP_TYPES = {FieldType.DATETIME, FieldType.TIMESTAMP}
+
+
+def arrow_schema(columns, type_codes):
+    """Parquet column types from the cursor's MySQL field types"""
+    import pyarrow as pa
+
+    def arrow_type(code):
+        if code in _INT_TYPES:
+            return pa.int64()
+        if code in _FLOAT_TYPES:
+            return pa.float64()
+        if code in _DECIMAL_TYPES:
+            return pa.decimal128(38, 10)
+        if code in (FieldType.DATE, FieldType.NEWDATE):
+            return pa.date32()
+        if code in _TIMESTAMP_TYPES:
+            return pa.timestamp('us')
+        if code == FieldType.TIME:
+            return pa.duration('us')
+        return pa.string()
+
+    return pa.schema([(name, arrow_type(code)) for name, code in zip(columns, type_codes)])
+
+
+class _ChunkSink:
+    """Write-only file object that hands back whatever was written since the last take()"""
+
+    def __init__(self):
+        self._parts = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data):
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def take(self):
+        data = b''.join(self._parts)
+        self._parts = []
+        return data
+
+
+def encode_parquet(columns, type_codes, chunks):
+    """One Parquet row group per chunk, each yielded as soon as it is written"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export needs pyarrow: pip install pyarrow") from None
+    schema = arrow_schema(columns, type_codes)
+    sink = _ChunkSink()
+    with pq.ParquetWriter(pa.PythonFile(sink, mode='w'), schema) as writer:
+        for chunk in chunks:
+            arrays = [pa.array(values, type=field.type) for values, field in zip(zip(*chunk), schema)]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            data = sink.take()
+            if data:
+                yield data
+    yield sink.take()
+
+
+def export_stream(report, fmt='csv', pool=None, chunk_rows=CHUNK_ROWS):
+    """Bytes chunks of one report in the given format"""
+    if report not in EXPORTS:
+        raise KeyError(f"unknown report {report!r}")
+    if fmt not in FORMATS:
+        raise KeyError(f"unknown format {fmt!r}")
+    rows = stream_rows(EXPORTS[report], pool=pool, chunk_rows=chunk_rows)
+    columns, type_codes = next(rows)
+    if fmt == 'csv':
+        return encode_csv(columns, rows)
+    if fmt == 'jsonl':
+        return encode_jsonl(columns, rows)
+    return encode_parquet(columns, type_codes, rows)
+
+
+def export_filename(report, fmt):
+    return f"rgc_{report}_{date.today():%Y%m%d}.{FORMATS[fmt][1]}"
+
+
+def write_export(report, fmt, out, pool=None, chunk_rows=CHUNK_ROWS):
+    """Stream a report into a binary file object; returns bytes written"""
+    written = 0
+    for data in export_stream(report, fmt, pool, chunk_rows):
+        out.write(data)
+        written += len(data)
+    return written
+
+
+# ============================================================================
+# HTTP STREAMING SERVER
+# ============================================================================
+_QUERY_RE = re.compile(r'\?\S*')
+
+
+def sign_path(path, token, expires):
+    """HMAC-SHA256 of a download path and its expiry time, keyed by the server token"""
+    return hmac.new(token.encode(), f"{path}\n{expires}".encode(), hashlib.sha256).hexdigest()
+
+
+def signed_url(base_url, report, fmt, token, ttl=LINK_TTL):
+    """Download link for the export server that stays valid for `ttl` seconds"""
+    path = f"/{report}.{FORMATS[fmt][1]}"
+    expires = int(time.time() + ttl)
+    return f"{base_url.rstrip('/')}{path}?expires={expires}&sig={sign_path(path, token, expires)}"
+
+
+def is_loopback(host):
+    """True for localhost and loopback IP addresses"""
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class _ExportHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # chunked transfer encoding is HTTP/1.1 only
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if not self._authorized(url):
+            self.send_error(403)
+            return
+        report, _, ext = url.path.strip('/').rpartition('.')
+        fmt = next((f for f, (_, e) in FORMATS.items() if e == ext), None)
+        if report not in EXPORTS or fmt is None:
+            self.send_error(404, "Use /<report>.<csv|jsonl|parquet>: " + ", ".join(EXPORTS))
+            return
+        try:
+            stream = export_stream(report, fmt, self.server.pool)
+        except (Error, ImportError) as e:
+            self.send_error(500, str(e))
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', FORMATS[fmt][0])
+        self.send_header('Content-Disposition',
+                         f'attachment; filename="{export_filename(report, fmt)}"')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        try:
+            for data in stream:
+                self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            stream.close()  # client went away; discards the half-read connection
+
+    def _authorized(self, url):
+        """A matching Bearer token, or an unexpired signature of this path"""
+        token = self.server.token
+        if not token:
+            return True
+        scheme, _, given = self.headers.get('Authorization', '').partition(' ')
+        if scheme.lower() == 'bearer' and hmac.compare_digest(given.strip().encode(), token.encode()):
+            return True
+        query = parse_qs(url.query)
+        expires, sig = query.get('expires', [''])[0], query.get('sig', [''])[0]
+        if not expires.isdigit() or int(expires) < time.time():
+            return False
+        return hmac.compare_digest(sig.encode(), sign_path(url.path, token, int(expires)).encode())
+
+    def log_message(self, format, *args):
+        # Keep link signatures (and any stray ?token=) out of the server log
+        args = tuple(_QUERY_RE.sub('?...', arg) if isinstance(arg, str) else arg for arg in args)
+        print(f"{self.address_string()} {format % args}", file=sys.stderr)
+
+
+class ExportServer(ThreadingHTTPServer):
+    """HTTP server streaming /<report>.<ext> downloads with chunked transfer encoding"""
+    daemon_threads = True
+
+    def __init__(self, address, pool, token=None):
+        super().__init__(address, _ExportHandler)
+        self.pool = pool
+        self.token = token
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+def main(argv=None):
+    from rgc_datagen import add_connection_args, connection_config
+
+    parser = argparse.ArgumentParser(description="Stream RGC reports as CSV, JSON Lines or Parquet")
+    add_connection_args(parser)
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    sub = parser.add_subparsers(dest='command', required=True)
+    dump_cmd = sub.add_parser('dump', help="write one report to a file or stdout")
+    dump_cmd.add_argument('report', choices=list(EXPORTS))
+    dump_cmd.add_argument('--format', choices=list(FORMATS), default='csv')
+    dump_cmd.add_argument('-o', '--output', help="output path (default: stdout)")
+    serve_cmd = sub.add_parser('serve', help="stream reports over HTTP")
+    serve_cmd.add_argument('--bind', default='127.0.0.1')
+    # own dest: a subcommand default would overwrite the database --port
+    serve_cmd.add_argument('--port', dest='listen_port', type=int, default=8600)
+    serve_cmd.add_argument('--token', default=os.environ.get('RGC_EXPORT_TOKEN'),
+                           help="secret for Bearer auth and signed links (default: $RGC_EXPORT_TOKEN)")
+    args = parser.parse_args(argv)
+    if args.command == 'serve' and not args.token and not is_loopback(args.bind):
+        parser.error(f"serve --bind {args.bind} needs --token or RGC_EXPORT_TOKEN: "
+                     "without one anyone who can reach the port can download every report")
+
+    pool = ConnectionPool(connection_config(args), size=4)
+    try:
+        if args.command == 'dump':
+            start = time.monotonic()
+            if args.output:
+                with open(args.output, 'wb') as out:
+                    written = write_export(args.report, args.format, out, pool, args.chunk_rows)
+            else:
+                written = write_export(args.report, args.format, sys.stdout.buffer, pool,
+                                       args.chunk_rows)
+            print(f"{args.report}: {written / 1024 / 1024:.1f} MB in "
+                  f"{time.monotonic() - start:.1f}s", file=sys.stderr)
+        else:
+            with ExportServer((args.bind, args.listen_port), pool, args.token) as server:
+                print(f"serving exports on http://{args.bind}:{args.listen_port}/", file=sys.stderr)
+                try:
+                    server.serve_forever()
+                except KeyboardInterrupt:
+                    pass
+    finally:
+        pool.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
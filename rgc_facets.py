@@ -0,0 +1,556 @@
+"""
+RGC Stream - Faceted catalog browsing
+Keeps one bitmap of catalog series per facet value in memory: genre, subtitle
+and dubbing language, country of origin, release year, production house and
+rating band. A series is one bit position; a bitmap is a Python int with that
+bit set for every series carrying the value. Filters combine with OR inside a
+facet and AND across facets, so any selection is a few int ORs and ANDs, and
+each facet value's result count is one AND plus a popcount, instead of a
+ten-way join per filter change.
+
+Counts are disjunctive: a facet's own selection is left out when counting
+its values, so picking "Comedy" still shows how many series "Drama" would
+add. Each position also keeps the Name / Rating / Episodes sort keys, each
+ending in SERIES_ID, and a page is the matching positions ranked after a
+keyset cursor: the sort key of the last series shown, found by bisection in
+the keys' sorted order.
+
+The index is built once per server process. Triggers from
+migrations/0011_facet_changes.sql log every series whose facets or sort keys
+may have changed in RGC_FACET_CHANGES; at most once per POLL_INTERVAL the
+index reads the new change rows and reloads just those series.
+REFRESH_INTERVAL forces a full rebuild, as does a burst of more than
+FULL_RELOAD_CHANGES changes (bulk imports, sp_rebuild_series_stats). A
+change committed after a higher CHANGE_ID was already read is also caught by
+that rebuild at the latest.
+
+Polls and rebuilds read MySQL without holding the index lock, so catalog
+renders keep using the current bitmaps meanwhile. A rebuild loads a new index
+and swaps it in, keeping every known series at its bit position, so a bitmap
+taken before the swap still names the same series. Positions of deleted
+series stay unused until the process restarts.
+"""
+
+import bisect
+import os
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+import streamlit as st
+from mysql.connector import Error
+
+from rgc_db import in_placeholders, pooled_connection
+
+REFRESH_INTERVAL = float(os.environ.get('RGC_FACET_REFRESH', 900))
+POLL_INTERVAL = 1.0
+FULL_RELOAD_CHANGES = 5000
+LOAD_BATCH_ROWS = 10000
+ID_CHUNK = 1000
+
+FACETS = ('genre', 'subtitle', 'dubbing', 'country', 'year', 'house', 'rating')
+
+FACET_LABELS = {
+    'genre': "Genre",
+    'subtitle': "Subtitles",
+    'dubbing': "Dubbing",
+    'country': "Country",
+    'year': "Release Year",
+    'house': "Production House",
+    'rating': "Rating",
+}
+
+# band -> label; a series with reviews is in band int(AVG_RATING), clamped to 1-4
+RATING_BANDS = {4: "4+ ⭐", 3: "3 - 4 ⭐", 2: "2 - 3 ⭐", 1: "Under 2 ⭐", 0: "No ratings"}
+
+SORTS = ('Name', 'Rating', 'Episodes')
+
+# Sort key of positions without a series (deleted before a rebuild)
+_DEAD_SORT_KEYS = {'Name': '', 'Rating': 0.0, 'Episodes': 0}
+
+SERIES_QUERY = """
+    SELECT ws.SERIES_ID, ws.SERIES_NAME, ws.COUNTRY_OF_ORIGIN, YEAR(ws.RELEASE_DATE),
+           ws.HOUSE_ID, ss.REVIEW_COUNT, ss.AVG_RATING, ss.EPISODE_COUNT
+    FROM RGC_WEB_SERIES ws
+    LEFT JOIN RGC_SERIES_STATS ss ON ws.SERIES_ID = ss.SERIES_ID
+"""
+
+# facet -> (SERIES_ID, value) rows of its link table
+LINK_QUERIES = {
+    'genre': "SELECT SERIES_ID, SERIES_TYPE_ID FROM RGC_WEB_SERIES_SERIES_TYPE",
+    'subtitle': "SELECT SERIES_ID, S_LANGUAGE_ID FROM RGC_WEBSERIES_SUBTITLE",
+    'dubbing': "SELECT SERIES_ID, D_LANGUAGE_ID FROM RGC_WEBSERIES_DUBBING",
+}
+
+# facet -> (value, label) rows for facets whose values are IDs
+LABEL_QUERIES = {
+    'genre': "SELECT SERIES_TYPE_ID, SERIES_TYPE_NAME FROM RGC_SERIES_TYPE",
+    'subtitle': "SELECT S_LANGUAGE_ID, S_LANGUAGE_NAME FROM RGC_SUBTITLE_LANGUAGE",
+    'dubbing': "SELECT D_LANGUAGE_ID, D_LANGUAGE_NAME FROM RGC_DUBBING_LANGUAGE",
+    'house': "SELECT HOUSE_ID, HOUSE_NAME FROM RGC_PRODUCTION_HOUSE",
+}
+
+CHANGES_QUERY = """
+    SELECT CHANGE_ID, SERIES_ID FROM RGC_FACET_CHANGES
+    WHERE CHANGE_ID > %s ORDER BY CHANGE_ID LIMIT %s
+"""
+
+SeriesRow = namedtuple('SeriesRow', ['series_id', 'name', 'country', 'year', 'house_id',
+                                     'review_count', 'avg_rating', 'episode_count'])
+
+
+# ============================================================================
+# BITMAPS
+# ============================================================================
+if hasattr(int, 'bit_count'):
+    def popcount(bitmap):
+        """Number of set bits"""
+        return bitmap.bit_count()
+else:  # Python < 3.10
+    def popcount(bitmap):
+        """Number of set bits"""
+        return bin(bitmap).count('1')
+
+
+def bitmap_from_positions(positions, size):
+    """Bitmap with the given bit positions (all below `size`) set"""
+    bits = np.zeros(size, dtype=np.uint8)
+    bits[np.asarray(positions, dtype=np.int64)] = 1
+    return int.from_bytes(np.packbits(bits, bitorder='little').tobytes(), 'little')
+
+
+def positions_of(bitmap, size):
+    """Ascending array of the set bit positions of a bitmap below `size`"""
+    raw = np.frombuffer(bitmap.to_bytes((size + 7) // 8, 'little'), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(raw, bitorder='little'))
+
+
+def rating_band(review_count, avg_rating):
+    """RATING_BANDS key of a series' rating"""
+    if not review_count:
+        return 0
+    return max(1, min(4, int(avg_rating)))
+
+
+# ============================================================================
+# FACET INDEX
+# ============================================================================
+class FacetIndex:
+    """Facet bitmaps and sort keys of every catalog series"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.refresh_lock = threading.Lock()  # one poll or rebuild at a time
+        self.loaded_at = None
+        self.polled_at = 0.0
+        self.last_change = 0
+        self.load_ms = 0.0
+        self._clear()
+
+    def _clear(self):
+        self.series_ids = []
+        self._position = {}
+        self.alive = 0
+        self.labels = {facet: {} for facet in FACETS}
+        self.labels['rating'] = dict(RATING_BANDS)
+        self._bitmaps = {facet: {} for facet in FACETS}
+        # facet -> position -> values, to clear a series' old bits on change
+        self._values = {facet: {} for facet in FACETS}
+        self._sort_keys = {sort: [] for sort in SORTS}
+        self._ranks = {}
+
+    @staticmethod
+    def _row_values(row):
+        """Values of the facets that come from RGC_WEB_SERIES and RGC_SERIES_STATS"""
+        return {
+            'country': (row.country,),
+            'year': (row.year,) if row.year is not None else (),
+            'house': (row.house_id,),
+            'rating': (rating_band(row.review_count, row.avg_rating),),
+        }
+
+    @staticmethod
+    def _row_sort_keys(row):
+        return {
+            'Name': (row.name.casefold(), row.series_id),
+            'Rating': (-float(row.avg_rating or 0), row.series_id),
+            'Episodes': (-(row.episode_count or 0), row.series_id),
+        }
+
+    def load(self, rows, links, labels, last_change, keep_ids=()):
+        """
+        Replace the index with `rows` and their link table `links` {facet: [(id, value)]}
+        Series in `keep_ids` keep their position in it; new ones are appended.
+        """
+        with self.lock:
+            self._clear()
+            self.series_ids = list(keep_ids)
+            self._position = {series_id: pos for pos, series_id in enumerate(self.series_ids)}
+            values = {facet: {} for facet in FACETS}
+            live = []
+            row_keys = []
+            for row in rows:
+                pos = self._position.get(row.series_id)
+                if pos is None:
+                    pos = len(self.series_ids)
+                    self.series_ids.append(row.series_id)
+                    self._position[row.series_id] = pos
+                live.append(pos)
+                for facet, row_values in self._row_values(row).items():
+                    values[facet][pos] = row_values
+                row_keys.append((pos, self._row_sort_keys(row)))
+            size = len(self.series_ids)
+            for sort in SORTS:
+                keys = self._sort_keys[sort] = [(_DEAD_SORT_KEYS[sort], s) for s in self.series_ids]
+                for pos, row_sort_keys in row_keys:
+                    keys[pos] = row_sort_keys[sort]
+            for facet, pairs in links.items():
+                for series_id, value in pairs:
+                    pos = self._position.get(series_id)
+                    if pos is not None:
+                        values[facet].setdefault(pos, []).append(value)
+
+            for facet in FACETS:
+                members = {}
+                for pos, pos_values in values[facet].items():
+                    self._values[facet][pos] = tuple(pos_values)
+                    for value in pos_values:
+                        members.setdefault(value, []).append(pos)
+                self._bitmaps[facet] = {value: bitmap_from_positions(positions, size)
+                                        for value, positions in members.items()}
+            self.alive = bitmap_from_positions(live, size)
+            self.set_labels(labels)
+            self.last_change = last_change
+            self.loaded_at = time.monotonic()
+
+    def swap(self, other):
+        """Take over the contents of `other`, a freshly loaded index"""
+        with self.lock:
+            for name, value in vars(other).items():
+                if name not in ('lock', 'refresh_lock', 'polled_at'):
+                    setattr(self, name, value)
+
+    def set_labels(self, labels):
+        with self.lock:
+            for facet, facet_labels in labels.items():
+                self.labels[facet].update(facet_labels)
+
+    def _assign(self, pos, facet, values):
+        """Move series `pos` from its old values of `facet` to `values`"""
+        bit = 1 << pos
+        bitmaps = self._bitmaps[facet]
+        for value in self._values[facet].get(pos, ()):
+            remaining = bitmaps[value] & ~bit
+            if remaining:
+                bitmaps[value] = remaining
+            else:
+                del bitmaps[value]
+        for value in values:
+            bitmaps[value] = bitmaps.get(value, 0) | bit
+        if values:
+            self._values[facet][pos] = tuple(values)
+        else:
+            self._values[facet].pop(pos, None)
+
+    def apply(self, series_ids, rows, links, last_change):
+        """
+        Reload `series_ids` from their current `rows` and `links`; a changed
+        series without a row has been deleted
+        """
+        with self.lock:
+            by_id = {row.series_id: row for row in rows}
+            linked = {facet: {} for facet in LINK_QUERIES}
+            for facet, pairs in links.items():
+                for series_id, value in pairs:
+                    linked[facet].setdefault(series_id, []).append(value)
+
+            for series_id in series_ids:
+                row = by_id.get(series_id)
+                pos = self._position.get(series_id)
+                if row is None:
+                    if pos is not None:
+                        self.alive &= ~(1 << pos)
+                        for facet in FACETS:
+                            self._assign(pos, facet, ())
+                    continue
+                if pos is None:
+                    pos = len(self.series_ids)
+                    self.series_ids.append(series_id)
+                    self._position[series_id] = pos
+                    for keys in self._sort_keys.values():
+                        keys.append(None)
+                self.alive |= 1 << pos
+                values = self._row_values(row)
+                for facet in LINK_QUERIES:
+                    values[facet] = linked[facet].get(series_id, ())
+                for facet, facet_values in values.items():
+                    if set(facet_values) != set(self._values[facet].get(pos, ())):
+                        self._assign(pos, facet, facet_values)
+                for sort, key in self._row_sort_keys(row).items():
+                    if self._sort_keys[sort][pos] != key:
+                        self._sort_keys[sort][pos] = key
+                        self._move_rank(sort, pos, key)
+            self.last_change = last_change
+
+    def _move_rank(self, sort, pos, key):
+        """
+        Re-place `pos` under its new sort `key` in the cached order of `sort`
+        by bisection, shifting the ranks in between, instead of re-sorting
+        every position on the next page; a new position joins at the end first
+        """
+        cached = self._ranks.get(sort)
+        if cached is None:
+            return
+        rank, ordered = cached
+        if pos < len(rank):
+            old = int(rank[pos])
+            del ordered[old]
+        else:
+            old = len(ordered)
+            rank = np.append(rank, old)
+            self._ranks[sort] = (rank, ordered)
+        new = bisect.bisect_left(ordered, key)
+        ordered.insert(new, key)
+        if new > old:
+            rank[(rank > old) & (rank <= new)] -= 1
+        elif new < old:
+            rank[(rank >= new) & (rank < old)] += 1
+        rank[pos] = new
+
+    def missing_labels(self):
+        """True if some value of a labelled facet has no label yet"""
+        with self.lock:
+            return any(value not in self.labels[facet]
+                       for facet in LABEL_QUERIES for value in self._bitmaps[facet])
+
+    def bitmap_of(self, series_ids):
+        """Bitmap of the given series; IDs the index does not know are skipped"""
+        with self.lock:
+            positions = [self._position[s] for s in series_ids if s in self._position]
+            return bitmap_from_positions(positions, len(self.series_ids)) & self.alive
+
+    def search(self, selections, within=None):
+        """
+        Series matching `selections` {facet: selected values} (and `within`, a
+        bitmap), and {facet: {value: count}} for every value with matches
+        """
+        with self.lock:
+            base = self.alive if within is None else self.alive & within
+            chosen = {}
+            for facet, values in selections.items():
+                if values:
+                    bitmaps = self._bitmaps[facet]
+                    union = 0
+                    for value in values:
+                        union |= bitmaps.get(value, 0)
+                    chosen[facet] = union
+            matched = base
+            for bitmap in chosen.values():
+                matched &= bitmap
+
+            counts = {}
+            for facet in FACETS:
+                scope = matched
+                if facet in chosen:
+                    scope = base
+                    for other, bitmap in chosen.items():
+                        if other != facet:
+                            scope &= bitmap
+                facet_counts = {}
+                for value, bitmap in self._bitmaps[facet].items():
+                    count = popcount(bitmap & scope)
+                    if count:
+                        facet_counts[value] = count
+                counts[facet] = facet_counts
+            return matched, counts
+
+    def _rank(self, sort):
+        """
+        (position -> rank in `sort` order, sort keys in rank order), sorted on
+        first use after a load and kept current by _move_rank()
+        """
+        cached = self._ranks.get(sort)
+        if cached is None:
+            keys = self._sort_keys[sort]
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            rank = np.empty(len(keys), dtype=np.int64)
+            rank[order] = np.arange(len(keys))
+            cached = self._ranks[sort] = (rank, [keys[pos] for pos in order])
+        return cached
+
+    def page(self, matched, sort, after, limit):
+        """
+        One page of the `matched` bitmap in `sort` order, starting after the
+        sort key `after` (None for the first page). Returns (SERIES_IDs, sort
+        key of the last one, matches sorting before the page); keys end in
+        SERIES_ID, so a series added or removed elsewhere never shifts a page.
+        """
+        with self.lock:
+            positions = positions_of(matched, len(self.series_ids))
+            rank, ordered_keys = self._rank(sort)
+            ranks = rank[positions]
+            if after is not None:
+                later = ranks >= bisect.bisect_right(ordered_keys, after)
+                positions, ranks = positions[later], ranks[later]
+            before = popcount(matched) - len(positions)
+            if limit < len(positions):
+                top = np.argpartition(ranks, limit - 1)[:limit]
+                top = top[np.argsort(ranks[top])]
+            else:
+                top = np.argsort(ranks)
+            page = positions[top]
+            if not len(page):
+                return [], after, before
+            return [self.series_ids[pos] for pos in page], self._sort_keys[sort][page[-1]], before
+
+    def label(self, facet, value):
+        return self.labels[facet].get(value, str(value))
+
+    def stats(self):
+        with self.lock:
+            return {
+                'series': popcount(self.alive),
+                'values': {facet: len(self._bitmaps[facet]) for facet in FACETS},
+                'last_change': self.last_change,
+                'load_ms': self.load_ms,
+            }
+
+
+# ============================================================================
+# LOADING
+# ============================================================================
+def _fetch_all(cursor, query, params=None, batch_rows=LOAD_BATCH_ROWS):
+    cursor.execute(query, params)
+    rows = []
+    while True:
+        batch = cursor.fetchmany(batch_rows)
+        if not batch:
+            return rows
+        rows += batch
+
+
+def load_series(conn, series_ids=None):
+    """
+    (SeriesRow list, {facet: [(SERIES_ID, value)]}) for every series, or
+    for just `series_ids`
+    """
+    cursor = conn.cursor()
+    try:
+        rows = []
+        links = {facet: [] for facet in LINK_QUERIES}
+        if series_ids is None:
+            chunks = [None]
+        else:
+            series_ids = list(series_ids)
+            chunks = [series_ids[i:i + ID_CHUNK] for i in range(0, len(series_ids), ID_CHUNK)]
+        for chunk in chunks:
+            if chunk is None:
+                rows += _fetch_all(cursor, SERIES_QUERY)
+                for facet, query in LINK_QUERIES.items():
+                    links[facet] += _fetch_all(cursor, query)
+                continue
+            rows += _fetch_all(cursor, SERIES_QUERY + f" WHERE ws.SERIES_ID IN ({in_placeholders(chunk)})",
+                               tuple(chunk))
+            for facet, query in LINK_QUERIES.items():
+                links[facet] += _fetch_all(cursor, query + f" WHERE SERIES_ID IN ({in_placeholders(chunk)})",
+                                           tuple(chunk))
+        return [SeriesRow(*row) for row in rows], links
+    finally:
+        cursor.close()
+
+
+def load_labels(conn):
+    """{facet: {value: label}} for the facets whose values are IDs"""
+    cursor = conn.cursor()
+    try:
+        return {facet: dict(_fetch_all(cursor, query)) for facet, query in LABEL_QUERIES.items()}
+    finally:
+        cursor.close()
+
+
+def latest_change(conn):
+    """Highest CHANGE_ID logged so far (0 when the log is empty)"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT IFNULL(MAX(CHANGE_ID), 0) FROM RGC_FACET_CHANGES")
+        return cursor.fetchone()[0]
+    finally:
+        cursor.close()
+
+
+def changes_since(conn, change_id, limit=FULL_RELOAD_CHANGES + 1):
+    """Up to `limit` (CHANGE_ID, SERIES_ID) rows logged after `change_id`"""
+    cursor = conn.cursor()
+    try:
+        return _fetch_all(cursor, CHANGES_QUERY, (change_id, limit))
+    finally:
+        cursor.close()
+
+
+def rebuild(index, conn):
+    """
+    Load every series into a new index and swap it into `index`; changes
+    logged while loading are picked up by the next poll
+    """
+    start = time.perf_counter()
+    last_change = latest_change(conn)
+    rows, links = load_series(conn)
+    fresh = FacetIndex()
+    fresh.load(rows, links, load_labels(conn), last_change, keep_ids=index.series_ids)
+    fresh.load_ms = (time.perf_counter() - start) * 1000
+    index.swap(fresh)
+
+
+def refresh(index, conn):
+    """
+    Apply the changes logged since the index last looked, or rebuild it
+    Only the in-memory update holds the index lock.
+    """
+    changes = changes_since(conn, index.last_change)
+    if not changes:
+        return
+    if len(changes) > FULL_RELOAD_CHANGES:
+        rebuild(index, conn)
+        return
+    series_ids = list(dict.fromkeys(series_id for _, series_id in changes))
+    rows, links = load_series(conn, series_ids)
+    index.apply(series_ids, rows, links, changes[-1][0])
+    if index.missing_labels():
+        index.set_labels(load_labels(conn))
+
+
+@st.cache_resource
+def get_facet_index():
+    """The process-wide facet index (loaded on first use)"""
+    return FacetIndex()
+
+
+def facet_index():
+    """The facet index with recent writes applied; None if loading failed"""
+    index = get_facet_index()
+    if index.loaded_at is not None and time.monotonic() - index.polled_at < POLL_INTERVAL:
+        return index
+    # Once loaded, renders arriving during another render's poll or rebuild
+    # use the current bitmaps rather than wait for it
+    if not index.refresh_lock.acquire(blocking=index.loaded_at is None):
+        return index
+    try:
+        now = time.monotonic()
+        if index.loaded_at is not None and now - index.polled_at < POLL_INTERVAL:
+            return index
+        with pooled_connection() as conn:
+            if not conn:
+                return None
+            try:
+                if index.loaded_at is None or now - index.loaded_at > REFRESH_INTERVAL:
+                    rebuild(index, conn)
+                else:
+                    refresh(index, conn)
+            except Error as e:
+                st.error(f"Database Error: {e}")
+                return None
+        index.polled_at = time.monotonic()
+        return index
+    finally:
+        index.refresh_lock.release()
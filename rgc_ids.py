@@ -0,0 +1,177 @@
+"""
+RGC Stream - Primary key generation
+Collision-free IDs for rows the app and the bulk importer insert (users,
+feedback, contracts, payments, schedules, cast & crew, producers, series,
+episodes, viewers).
+
+Each entity has a named sequence in RGC_ID_BLOCKS. A process reserves a block
+of values with one atomic UPDATE ... LAST_INSERT_ID() and then hands them out
+from memory, so IDs are unique across every app and CLI process without
+locks held between inserts, and thousands of IDs per second cost one round
+trip per block.
+
+IDs are the entity prefix followed by the value in zero-padded base 36,
+ID_LENGTH characters in all, so they fit the VARCHAR(10) key columns and
+sort in allocation order:
+
+    new_id('RGC_FEEDBACK')  ->  'F00000002S'
+
+Rows loaded by other means (rgc_datagen.py, hand-written SQL) can have keys
+of the same shape; 'F000000009' is also base-36 value 9. Before a process
+first reserves from a sequence, sync_sequence() moves NEXT_VALUE past the
+largest such key already in the table, and rgc_datagen.py does the same
+after loading, so allocated IDs never repeat an existing key.
+"""
+
+import threading
+
+from mysql.connector import Error
+
+from rgc_db import get_connection_pool
+
+ID_LENGTH = 10
+BLOCK_SIZE = 1000
+
+# table -> ID prefix; prefixes are also the sequence names in RGC_ID_BLOCKS
+ID_PREFIXES = {
+    'RGC_WEB_SERIES': 'S',
+    'RGC_EPISODE': 'E',
+    'RGC_VIEWER': 'V',
+    'RGC_USERS': 'U',
+    'RGC_FEEDBACK': 'F',
+    'RGC_CONTRACTS': 'CT',
+    'RGC_CONTRACT_PAYMENTS': 'PAY',
+    'RGC_AIRING_SCHEDULE': 'AS',
+    'RGC_CAST_CREW': 'CC',
+    'RGC_PRODUCERS': 'PR',
+}
+
+# table -> primary key column
+KEY_COLUMNS = {
+    'RGC_WEB_SERIES': 'SERIES_ID',
+    'RGC_EPISODE': 'EPISODE_ID',
+    'RGC_VIEWER': 'ACCOUNT_ID',
+    'RGC_USERS': 'USER_ID',
+    'RGC_FEEDBACK': 'FEEDBACK_ID',
+    'RGC_CONTRACTS': 'CONTRACT_ID',
+    'RGC_CONTRACT_PAYMENTS': 'PAYMENT_ID',
+    'RGC_AIRING_SCHEDULE': 'AIRING_SCHEDULE_ID',
+    'RGC_CAST_CREW': 'ASSOCIATION_ID',
+    'RGC_PRODUCERS': 'PRODUCER_ID',
+}
+
+_TABLES = {prefix: table for table, prefix in ID_PREFIXES.items()}
+
+# Keys are fixed-width base 36, so the last in index order holds the largest
+# value; CONV reads the payload of datagen-style decimal keys as base 36 too
+SYNC_QUERY = """
+    INSERT INTO RGC_ID_BLOCKS (SEQ_NAME, NEXT_VALUE)
+    SELECT %s, IFNULL(MAX(CAST(CONV(SUBSTRING(newest.ID, %s), 36, 10) AS UNSIGNED)), 0) + 1
+    FROM (SELECT {column} as ID FROM {table}
+          WHERE {column} LIKE %s AND CHAR_LENGTH({column}) = %s
+          ORDER BY {column} DESC LIMIT 1) newest
+    ON DUPLICATE KEY UPDATE NEXT_VALUE = GREATEST(NEXT_VALUE, VALUES(NEXT_VALUE))
+"""
+
+_DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+def to_base36(value, width):
+    """Zero-padded upper-case base-36 text for a non-negative integer"""
+    chars = []
+    while value:
+        value, rem = divmod(value, 36)
+        chars.append(_DIGITS[rem])
+    text = ''.join(reversed(chars)) or '0'
+    if len(text) > width:
+        raise OverflowError(f"ID value needs {len(text)} base-36 digits, only {width} fit")
+    return text.rjust(width, '0')
+
+
+def format_id(prefix, value):
+    return prefix + to_base36(value, ID_LENGTH - len(prefix))
+
+
+def sync_sequence(cursor, table):
+    """Move the table's sequence past every key of allocator shape already in it"""
+    prefix = ID_PREFIXES[table]
+    cursor.execute(SYNC_QUERY.format(table=table, column=KEY_COLUMNS[table]),
+                   (prefix, len(prefix) + 1, prefix + '%', ID_LENGTH))
+
+
+def sync_sequences(conn, tables=None):
+    """sync_sequence() for every table with an ID sequence (or just `tables`)"""
+    cursor = conn.cursor()
+    try:
+        for table in tables or ID_PREFIXES:
+            if table in ID_PREFIXES:
+                sync_sequence(cursor, table)
+        conn.commit()
+    finally:
+        cursor.close()
+
+
+class IdGenerator:
+    """Hands out IDs from database-reserved blocks, one block per sequence at a time"""
+
+    def __init__(self, pool=None, block_size=BLOCK_SIZE):
+        self.pool = pool
+        self.block_size = block_size
+        self._blocks = {}  # sequence -> [next value, end of block]
+        self._synced = set()  # sequences checked against their table's keys
+        self._lock = threading.Lock()
+
+    def _reserve(self, sequence, count):
+        """Claim `count` values from the sequence; returns the first one"""
+        pool = self.pool or get_connection_pool()
+        with pool.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    "INSERT IGNORE INTO RGC_ID_BLOCKS (SEQ_NAME, NEXT_VALUE) VALUES (%s, 1)",
+                    (sequence,))
+                if sequence not in self._synced:
+                    sync_sequence(cursor, _TABLES[sequence])
+                # LAST_INSERT_ID(expr) makes the new value readable on this
+                # connection only, so concurrent reservations never overlap
+                cursor.execute(
+                    "UPDATE RGC_ID_BLOCKS SET NEXT_VALUE = LAST_INSERT_ID(NEXT_VALUE + %s) "
+                    "WHERE SEQ_NAME = %s", (count, sequence))
+                cursor.execute("SELECT LAST_INSERT_ID()")
+                end = cursor.fetchone()[0]
+                conn.commit()
+                self._synced.add(sequence)
+            except Error:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+        return end - count
+
+    def next_ids(self, prefix, count=1):
+        """`count` new IDs with the given prefix, in increasing order"""
+        values = []
+        with self._lock:
+            block = self._blocks.get(prefix)
+            while len(values) < count:
+                if block is None or block[0] >= block[1]:
+                    size = max(self.block_size, count - len(values))
+                    start = self._reserve(prefix, size)
+                    block = self._blocks[prefix] = [start, start + size]
+                take = min(count - len(values), block[1] - block[0])
+                values.extend(range(block[0], block[0] + take))
+                block[0] += take
+        return [format_id(prefix, value) for value in values]
+
+
+id_generator = IdGenerator()
+
+
+def new_id(table):
+    """A fresh primary key for a row of `table`"""
+    return id_generator.next_ids(ID_PREFIXES[table])[0]
+
+
+def new_ids(table, count):
+    """`count` fresh primary keys for rows of `table` (one reservation at most)"""
+    return id_generator.next_ids(ID_PREFIXES[table], count)
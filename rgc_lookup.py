@@ -0,0 +1,97 @@
+"""
+RGC Stream - Typeahead lookups for entity pickers
+Forms that pick a series, production house, platform, viewer account or
+contract search by prefix and show only the first LOOKUP_LIMIT matches, so a
+page never loads a whole table to fill a selectbox.
+
+Each search column is matched with an indexable `LIKE 'text%'` in its own
+branch, ordered and limited on that column's index before the branches are
+merged (see migrations/0008_lookup_indexes.sql), so a keystroke costs a few
+index range reads however large the table grows.
+"""
+
+from collections import namedtuple
+
+import streamlit as st
+
+from rgc_db import cached_query
+from rgc_search import like_prefix, normalize_query
+
+LOOKUP_LIMIT = 20
+LOOKUP_CACHE_TTL = 60
+
+# source: FROM clause; id / label: SQL expressions; search: prefix-matched
+# columns, each backed by an index; where: fixed filter for every branch
+Lookup = namedtuple('Lookup', ['source', 'id', 'label', 'search', 'where'])
+
+LOOKUPS = {
+    'series': Lookup('RGC_WEB_SERIES', 'SERIES_ID', 'SERIES_NAME', ('SERIES_NAME',), None),
+    'house': Lookup('RGC_PRODUCTION_HOUSE', 'HOUSE_ID', 'HOUSE_NAME', ('HOUSE_NAME',), None),
+    'platform': Lookup('RGC_PLATFORM', 'PLATFORM_ID', 'PLATFORM_NAME', ('PLATFORM_NAME',), None),
+    'viewer': Lookup(
+        'RGC_VIEWER', 'ACCOUNT_ID',
+        "CONCAT(ACCOUNT_ID, ' - ', ACC_FNAME, IFNULL(CONCAT(' ', ACC_LNAME), ''))",
+        ('ACC_FNAME', 'ACC_LNAME', 'ACCOUNT_ID'), None),
+    'active_contract': Lookup(
+        """RGC_CONTRACTS c
+           LEFT JOIN RGC_WEB_SERIES ws ON c.SERIES_ID = ws.SERIES_ID
+           LEFT JOIN RGC_PRODUCTION_HOUSE ph ON c.HOUSE_ID = ph.HOUSE_ID""",
+        'c.CONTRACT_ID',
+        "CONCAT(c.CONTRACT_ID, ' - ', COALESCE(ws.SERIES_NAME, ph.HOUSE_NAME, ''))",
+        ('c.CONTRACT_ID', 'ws.SERIES_NAME', 'ph.HOUSE_NAME'), "c.STATUS = 'ACTIVE'"),
+}
+
+
+def build_lookup_query(lookup, text, limit=LOOKUP_LIMIT):
+    """
+    (query, params) for the first `limit` rows, by label, whose search columns
+    start with `text`; with no text, the first `limit` rows by the first column
+    """
+    text = normalize_query(text)
+    where = [lookup.where] if lookup.where else []
+    if not text:
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+        return (f"SELECT {lookup.id} as id, {lookup.label} as label FROM {lookup.source} "
+                f"{clause} ORDER BY {lookup.search[0]} LIMIT %s"), (limit,)
+
+    pattern = like_prefix(text)
+    branches, params = [], []
+    for column in lookup.search:
+        conditions = ' AND '.join(where + [f"{column} LIKE %s"])
+        branches.append(f"SELECT {lookup.id} as id, {lookup.label} as label FROM {lookup.source} "
+                        f"WHERE {conditions} ORDER BY {column} LIMIT %s")
+        params += [pattern, limit]
+    if len(branches) == 1:
+        return branches[0], tuple(params)
+    union = " UNION ".join(f"({branch})" for branch in branches)
+    return f"SELECT id, label FROM ({union}) matches ORDER BY label LIMIT %s", tuple(params + [limit])
+
+
+def lookup(entity, text='', limit=LOOKUP_LIMIT):
+    """Top matches for `text` as [{'id', 'label'}]; None if the query failed"""
+    query, params = build_lookup_query(LOOKUPS[entity], text, limit)
+    return cached_query(query, params, ttl=LOOKUP_CACHE_TTL)
+
+
+# ============================================================================
+# WIDGET
+# ============================================================================
+def lookup_select(label, entity, key, empty_option=None, limit=LOOKUP_LIMIT):
+    """
+    Search box and a selectbox of its top matches; returns the chosen ID
+    `empty_option` adds a first choice (e.g. "All Series") that returns None.
+    Place it outside st.form: widgets in a form only update on submit.
+    """
+    text = st.text_input(f"Search {label.lower()}", key=f"{key}_search",
+                         placeholder="Type the first letters...")
+    matches = lookup(entity, text, limit) or []
+    labels = {m['id']: m['label'] for m in matches}
+    options = ([None] if empty_option is not None else []) + list(labels)
+    if text.strip() and not matches:
+        st.caption(f"Nothing starts with \"{normalize_query(text)}\"")
+    elif len(matches) >= limit:
+        st.caption(f"Showing the first {limit} matches - type more to narrow")
+    if not options:
+        return None
+    return st.selectbox(label, options, key=key,
+                        format_func=lambda value: empty_option if value is None else labels[value])
@@ -0,0 +1,199 @@
+"""
+RGC Stream - Contract and payment status maintenance
+Advances the statuses that only change with the calendar: ACTIVE contracts
+whose END_DATE has passed become EXPIRED, and PENDING payments past their
+PAYMENT_DATE (plus a grace period) become OVERDUE. It also prunes rows
+older than FACET_CHANGES_KEEP_DAYS from RGC_FACET_CHANGES, the change log the
+catalog facet index (rgc_facets.py) reads within seconds of each write, and
+flush IDs older than VIEWER_BATCHES_KEEP_DAYS from RGC_VIEWER_BATCHES, which
+rgc_viewer_ingest.py only looks up right after a dropped connection.
+
+Each status task walks the (STATUS, END_DATE) or (PAYMENT_STATUS,
+PAYMENT_DATE) index from migrations/0009_status_maintenance_indexes.sql in
+chunks of BATCH_ROWS rows, one short autocommitted UPDATE per chunk, so no
+chunk holds row locks for long however far behind the statuses are; the
+prunes walk the CHANGED_AT and APPLIED_AT indexes the same way with DELETE. With statuses kept
+current, pages find live and expiring contracts with STATUS = 'ACTIVE' plus a
+range on END_DATE, read from the same index, instead of DATEDIFF per row.
+
+Usage (cron or a systemd timer, or --every to keep it running):
+    python rgc_maintenance.py run [--every 3600] [--batch-rows 1000]
+    python rgc_maintenance.py status
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import namedtuple
+from datetime import date, timedelta
+
+from mysql.connector import Error, errorcode
+
+from rgc_db import invalidate_tables
+
+BATCH_ROWS = 1000
+BATCH_PAUSE = 0.05  # seconds between chunks, to leave room for page writes
+OVERDUE_GRACE_DAYS = int(os.environ.get('RGC_OVERDUE_GRACE_DAYS', 0))
+EXPIRING_WINDOW_DAYS = 30
+FACET_CHANGES_KEEP_DAYS = 1
+VIEWER_BATCHES_KEEP_DAYS = 1
+MAX_CHUNK_RETRIES = 3
+
+# A chunk that loses a lock race is simply run again
+RETRY_ERRORS = {
+    errorcode.ER_LOCK_DEADLOCK,
+    errorcode.ER_LOCK_WAIT_TIMEOUT,
+}
+
+# update: one chunk, params (cutoff, limit); pending: rows the next pass changes
+MaintenanceTask = namedtuple('MaintenanceTask', ['name', 'table', 'update', 'pending'])
+
+TASKS = (
+    MaintenanceTask(
+        'expire_contracts', 'RGC_CONTRACTS',
+        """UPDATE RGC_CONTRACTS SET STATUS = 'EXPIRED'
+           WHERE STATUS = 'ACTIVE' AND END_DATE < %s
+           ORDER BY END_DATE LIMIT %s""",
+        "SELECT COUNT(*) FROM RGC_CONTRACTS WHERE STATUS = 'ACTIVE' AND END_DATE < %s"),
+    MaintenanceTask(
+        'overdue_payments', 'RGC_CONTRACT_PAYMENTS',
+        """UPDATE RGC_CONTRACT_PAYMENTS SET PAYMENT_STATUS = 'OVERDUE'
+           WHERE PAYMENT_STATUS = 'PENDING' AND PAYMENT_DATE < %s
+           ORDER BY PAYMENT_DATE LIMIT %s""",
+        "SELECT COUNT(*) FROM RGC_CONTRACT_PAYMENTS WHERE PAYMENT_STATUS = 'PENDING' AND PAYMENT_DATE < %s"),
+    MaintenanceTask(
+        'prune_facet_changes', 'RGC_FACET_CHANGES',
+        """DELETE FROM RGC_FACET_CHANGES
+           WHERE CHANGED_AT < %s
+           ORDER BY CHANGED_AT LIMIT %s""",
+        "SELECT COUNT(*) FROM RGC_FACET_CHANGES WHERE CHANGED_AT < %s"),
+    MaintenanceTask(
+        'prune_viewer_batches', 'RGC_VIEWER_BATCHES',
+        """DELETE FROM RGC_VIEWER_BATCHES
+           WHERE APPLIED_AT < %s
+           ORDER BY APPLIED_AT LIMIT %s""",
+        "SELECT COUNT(*) FROM RGC_VIEWER_BATCHES WHERE APPLIED_AT < %s"),
+)
+
+EXPIRING_COUNT_QUERY = """
+    SELECT COUNT(*) FROM RGC_CONTRACTS
+    WHERE STATUS = 'ACTIVE' AND END_DATE BETWEEN %s AND %s
+"""
+
+
+def cutoffs(today=None, grace_days=OVERDUE_GRACE_DAYS):
+    """{task name: first date that is still current} for a pass run on `today`"""
+    today = today or date.today()
+    return {
+        'expire_contracts': today,
+        'overdue_payments': today - timedelta(days=grace_days),
+        'prune_facet_changes': today - timedelta(days=FACET_CHANGES_KEEP_DAYS),
+        'prune_viewer_batches': today - timedelta(days=VIEWER_BATCHES_KEEP_DAYS),
+    }
+
+
+def run_task(conn, task, cutoff, batch_rows=BATCH_ROWS, pause=BATCH_PAUSE):
+    """Flip every row of one task in committed chunks; returns rows changed"""
+    total = 0
+    cursor = conn.cursor()
+    try:
+        while True:
+            for attempt in range(MAX_CHUNK_RETRIES):
+                try:
+                    cursor.execute(task.update, (cutoff, batch_rows))
+                    changed = cursor.rowcount
+                    conn.commit()
+                    break
+                except Error as e:
+                    conn.rollback()
+                    if e.errno not in RETRY_ERRORS or attempt == MAX_CHUNK_RETRIES - 1:
+                        raise
+            total += changed
+            if changed < batch_rows:
+                return total
+            time.sleep(pause)
+    finally:
+        cursor.close()
+
+
+def run_maintenance(conn, today=None, batch_rows=BATCH_ROWS, pause=BATCH_PAUSE, log=None):
+    """One pass of every task; returns {task name: rows changed}"""
+    log = log or (lambda message: None)
+    dates = cutoffs(today)
+    changed = {}
+    for task in TASKS:
+        start = time.perf_counter()
+        changed[task.name] = run_task(conn, task, dates[task.name], batch_rows, pause)
+        log(f"{task.name}: {changed[task.name]} rows in {time.perf_counter() - start:.2f}s")
+    tables = {task.table for task in TASKS if changed[task.name]}
+    if tables:
+        invalidate_tables(tables)
+    return changed
+
+
+def maintenance_status(conn, today=None):
+    """Rows the next pass would change, and active contracts expiring soon"""
+    today = today or date.today()
+    dates = cutoffs(today)
+    cursor = conn.cursor()
+    try:
+        status = {}
+        for task in TASKS:
+            cursor.execute(task.pending, (dates[task.name],))
+            status[task.name] = cursor.fetchone()[0]
+        cursor.execute(EXPIRING_COUNT_QUERY, (today, today + timedelta(days=EXPIRING_WINDOW_DAYS)))
+        status['expiring_soon'] = cursor.fetchone()[0]
+        return status
+    finally:
+        cursor.close()
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+def main(argv=None):
+    import mysql.connector
+    from rgc_datagen import add_connection_args, connection_config
+
+    parser = argparse.ArgumentParser(description="Expire contracts, flag overdue payments and prune change logs")
+    add_connection_args(parser)
+    sub = parser.add_subparsers(dest='command', required=True)
+    run_cmd = sub.add_parser('run', help="apply one maintenance pass (or one every --every seconds)")
+    run_cmd.add_argument('--every', type=float, metavar='SECONDS',
+                         help="keep running, one pass per interval")
+    run_cmd.add_argument('--batch-rows', type=int, default=BATCH_ROWS, help="rows per UPDATE chunk")
+    run_cmd.add_argument('--pause', type=float, default=BATCH_PAUSE, help="seconds between chunks")
+    sub.add_parser('status', help="show what the next pass would change")
+    args = parser.parse_args(argv)
+
+    def log(message):
+        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} {message}", file=sys.stderr)
+
+    while True:
+        started = time.monotonic()
+        try:
+            # A fresh connection per pass: --every can sleep past wait_timeout
+            conn = mysql.connector.connect(**connection_config(args))
+            try:
+                if args.command == 'status':
+                    for name, count in maintenance_status(conn).items():
+                        print(f"{name:<20} {count:>10,}")
+                    return 0
+                run_maintenance(conn, batch_rows=args.batch_rows, pause=args.pause, log=log)
+            finally:
+                conn.close()
+        except Error as e:
+            log(f"error: {e}")
+            if not args.every:
+                return 1
+        if not args.every:
+            return 0
+        try:
+            time.sleep(max(0.0, args.every - (time.monotonic() - started)))
+        except KeyboardInterrupt:
+            return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
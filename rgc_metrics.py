@@ -0,0 +1,236 @@
+"""
+RGC Stream - Query and page latency metrics
+Every statement run through rgc_db is recorded with its normalized SQL
+fingerprint, the page and show_* function that issued it, rows returned,
+wall time (including waiting for a pooled connection) and database time.
+
+Recent statements are kept in a bounded ring buffer for the slow-query view
+and export; per-fingerprint and per-page latency histograms keep aggregating
+after records fall out of the buffer.
+"""
+
+import bisect
+import csv
+import io
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque, namedtuple
+from contextlib import contextmanager
+from datetime import datetime
+
+ENABLED = os.environ.get('RGC_QUERY_METRICS', '1') != '0'
+BUFFER_SIZE = int(os.environ.get('RGC_QUERY_METRICS_BUFFER', 5000))
+
+MAX_SQL_CHARS = 2000
+_STACK_DEPTH = 40
+
+# Log-scaled latency buckets: 0.05ms growing 25% per bucket (~100s at the top)
+BUCKET_BOUNDS_MS = [0.05 * 1.25 ** k for k in range(66)]
+
+_STRING_RE = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER_RE = re.compile(r'%s|%\(\w+\)s')
+_IN_LIST_RE = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+QueryRecord = namedtuple('QueryRecord', [
+    'timestamp', 'fingerprint', 'sql', 'params', 'page', 'function',
+    'rows', 'wall_ms', 'db_ms', 'error', 'truncated',
+])
+
+# truncated: sql holds only the first MAX_SQL_CHARS characters of the statement
+# Exported columns; params stay in memory only (they can hold user data)
+EXPORT_FIELDS = ['timestamp', 'fingerprint', 'sql', 'page', 'function',
+                 'rows', 'wall_ms', 'db_ms', 'error']
+
+# Page name under which whole Streamlit script runs (reruns) are recorded
+SCRIPT_PAGE = '(script run)'
+
+_current = threading.local()
+
+
+def fingerprint(query):
+    """SQL with literals and placeholders replaced by ?, IN lists collapsed"""
+    text = _STRING_RE.sub('?', query)
+    text = _PLACEHOLDER_RE.sub('?', text)
+    text = _NUMBER_RE.sub('?', text)
+    text = _IN_LIST_RE.sub('(?+)', text)
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+def calling_function():
+    """Name of the innermost show_* page function on the current stack"""
+    bound = getattr(_current, 'function', None)
+    if bound:
+        return bound
+    frame = sys._getframe(2)
+    for _ in range(_STACK_DEPTH):
+        if frame is None:
+            break
+        name = frame.f_code.co_name
+        if name.startswith('show_'):
+            return name
+        frame = frame.f_back
+    return None
+
+
+def current_page():
+    return getattr(_current, 'page', None)
+
+
+class Histogram:
+    """Fixed log-scale latency histogram with count, sum and max"""
+
+    __slots__ = ('counts', 'count', 'total', 'max')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS_MS, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, pct):
+        """Upper bound of the bucket holding the pct-th percentile"""
+        if not self.count:
+            return 0.0
+        rank = pct / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                bound = BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            'calls': self.count,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'max_ms': self.max,
+            'mean_ms': self.total / self.count if self.count else 0.0,
+            'total_ms': self.total,
+        }
+
+
+class QueryMetrics:
+    """Thread-safe ring buffer of query records plus latency histograms"""
+
+    def __init__(self, buffer_size=BUFFER_SIZE):
+        self._records = deque(maxlen=buffer_size)
+        self._queries = {}  # fingerprint -> [Histogram, total rows, errors]
+        self._pages = {}  # page -> Histogram
+        self._lock = threading.Lock()
+
+    def record_query(self, query, params, rows, wall_ms, db_ms, error=None):
+        fp = fingerprint(query)
+        record = QueryRecord(
+            time.time(), fp, query[:MAX_SQL_CHARS], params, current_page(),
+            calling_function(), rows, wall_ms, db_ms, error, len(query) > MAX_SQL_CHARS)
+        with self._lock:
+            self._records.append(record)
+            stats = self._queries.get(fp)
+            if stats is None:
+                stats = self._queries[fp] = [Histogram(), 0, 0]
+            stats[0].add(wall_ms)
+            stats[1] += rows or 0
+            stats[2] += error is not None
+
+    def record_page(self, page, elapsed_ms):
+        with self._lock:
+            hist = self._pages.get(page)
+            if hist is None:
+                hist = self._pages[page] = Histogram()
+            hist.add(elapsed_ms)
+
+    def records(self):
+        with self._lock:
+            return list(self._records)
+
+    def query_summary(self):
+        """Per-fingerprint latency summary, most total time first"""
+        with self._lock:
+            rows = [dict(fingerprint=fp, **hist.summary(),
+                         avg_rows=total_rows / hist.count if hist.count else 0,
+                         errors=errors)
+                    for fp, (hist, total_rows, errors) in self._queries.items()]
+        return sorted(rows, key=lambda r: r['total_ms'], reverse=True)
+
+    def page_summary(self):
+        with self._lock:
+            rows = [dict(page=page, **hist.summary()) for page, hist in self._pages.items()]
+        return sorted(rows, key=lambda r: r['p95_ms'], reverse=True)
+
+    def slowest(self, n=10):
+        """The n slowest statements still in the buffer"""
+        return sorted(self.records(), key=lambda r: r.wall_ms, reverse=True)[:n]
+
+    def export(self, fmt='csv'):
+        """Buffered records as CSV or JSON lines text"""
+        rows = [{field: getattr(r, field) for field in EXPORT_FIELDS} for r in self.records()]
+        for row in rows:
+            row['timestamp'] = datetime.fromtimestamp(row['timestamp']).isoformat(timespec='milliseconds')
+        if fmt == 'json':
+            return '\n'.join(json.dumps(row, default=str) for row in rows) + '\n'
+        out = io.StringIO()
+        writer = csv.DictWriter(out, fieldnames=EXPORT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+        return out.getvalue()
+
+    def reset(self):
+        with self._lock:
+            self._records.clear()
+            self._queries.clear()
+            self._pages.clear()
+
+
+query_metrics = QueryMetrics()
+
+
+def record_query(query, params, rows, wall_ms, db_ms, error=None):
+    if ENABLED:
+        query_metrics.record_query(query, params, rows, wall_ms, db_ms, error)
+
+
+@contextmanager
+def attributed_to(page, function):
+    """Attribute queries run on this thread (e.g. a pool worker) to a page and function"""
+    previous = current_page(), getattr(_current, 'function', None)
+    _current.page, _current.function = page, function
+    try:
+        yield
+    finally:
+        _current.page, _current.function = previous
+
+
+@contextmanager
+def page_timer(page):
+    """Attribute queries to `page` and record how long it took to render"""
+    previous = current_page()
+    _current.page = page
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _current.page = previous
+        if ENABLED:
+            query_metrics.record_page(page, (time.perf_counter() - start) * 1000)
+
+
+def record_script(start):
+    """Record one full script run (a Streamlit rerun) begun at perf_counter() `start`"""
+    if ENABLED:
+        query_metrics.record_page(SCRIPT_PAGE, (time.perf_counter() - start) * 1000)
@@ -0,0 +1,245 @@
+"""
+RGC Stream - Versioned schema migrations
+Tables, indexes, triggers and views the app depends on live in ordered files
+under migrations/ (NNNN_description.sql). Applied versions are recorded in
+RGC_SCHEMA_VERSION with a checksum of the file, so each migration runs once
+per database, as a deploy step, and never while a page renders: the app only
+checks for pending migrations and warns about them.
+
+Usage:
+    python rgc_migrate.py status
+    python rgc_migrate.py up [--to 5]
+
+Files are plain MySQL scripts; DELIMITER lines work as in the mysql client.
+Migrations should be safe to re-run (IF NOT EXISTS, DROP ... IF EXISTS,
+CREATE OR REPLACE): DDL commits implicitly, so a migration that fails half
+way is simply run again from the top once fixed. Indexes and columns that a
+database set up with the old scripts already has, and ones a DROP finds
+already gone, are treated as applied.
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+import time
+from collections import namedtuple
+
+from mysql.connector import Error, errorcode
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+# Deploys run `rgc_migrate.py up`; the app only looks for pending migrations.
+# RGC_AUTO_MIGRATE=1 has its first render apply them instead, which is only
+# sensible on small development databases: FULLTEXT builds and the like run
+# as long DDL while other workers wait on the lock for up to LOCK_TIMEOUT
+AUTO_MIGRATE = os.environ.get('RGC_AUTO_MIGRATE', '0') == '1'
+LOCK_NAME = 'rgc_schema_migrate'
+LOCK_TIMEOUT = 120
+
+# Errors from statements that an older setup script, or an earlier run of a
+# migration that failed part way, already applied: the index or column exists
+# already, or the index or column being dropped is already gone
+ALREADY_APPLIED_ERRORS = {errorcode.ER_DUP_KEYNAME, errorcode.ER_DUP_FIELDNAME,
+                          errorcode.ER_CANT_DROP_FIELD_OR_KEY}
+
+_FILENAME_RE = re.compile(r'^(\d+)_(\w+)\.sql$')
+
+VERSION_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS RGC_SCHEMA_VERSION (
+        VERSION INT NOT NULL,
+        NAME VARCHAR(100) NOT NULL,
+        CHECKSUM CHAR(64) NOT NULL,
+        APPLIED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        EXECUTION_MS INT,
+        PRIMARY KEY (VERSION)
+    )
+"""
+
+Migration = namedtuple('Migration', ['version', 'name', 'path', 'checksum'])
+
+
+class MigrationError(Exception):
+    """A migration statement failed; earlier statements of the file stay applied"""
+
+
+# ============================================================================
+# MIGRATION FILES
+# ============================================================================
+def discover(directory=MIGRATIONS_DIR):
+    """Migration files in version order"""
+    migrations = {}
+    for filename in os.listdir(directory):
+        match = _FILENAME_RE.match(filename)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise MigrationError(f"duplicate migration version {version}: "
+                                 f"{migrations[version].name}, {filename}")
+        path = os.path.join(directory, filename)
+        with open(path, 'rb') as f:
+            checksum = hashlib.sha256(f.read()).hexdigest()
+        migrations[version] = Migration(version, filename[:-4], path, checksum)
+    return [migrations[v] for v in sorted(migrations)]
+
+
+def split_statements(sql):
+    """Statements of a script, honouring DELIMITER lines like the mysql client"""
+    delimiter = ';'
+    statements, current = [], []
+    for line in sql.splitlines():
+        stripped = line.strip()
+        if stripped.upper().startswith('DELIMITER '):
+            delimiter = stripped.split(None, 1)[1]
+            continue
+        if not stripped or stripped.startswith('--'):
+            continue
+        current.append(line)
+        if stripped.endswith(delimiter):
+            statement = '\n'.join(current).rstrip()[:-len(delimiter)].strip()
+            if statement:
+                statements.append(statement)
+            current = []
+    if current:
+        statements.append('\n'.join(current).strip())
+    return statements
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+def applied_versions(conn):
+    """{version: (checksum, applied_at)} from RGC_SCHEMA_VERSION"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(VERSION_TABLE_DDL)
+        cursor.execute("SELECT VERSION, CHECKSUM, APPLIED_AT FROM RGC_SCHEMA_VERSION")
+        return {version: (checksum, applied_at) for version, checksum, applied_at in cursor.fetchall()}
+    finally:
+        cursor.close()
+
+
+def apply_migration(conn, migration):
+    """Run one migration file and record it; returns milliseconds taken"""
+    with open(migration.path, encoding='utf-8') as f:
+        statements = split_statements(f.read())
+    cursor = conn.cursor(buffered=True)
+    start = time.perf_counter()
+    try:
+        for number, statement in enumerate(statements, 1):
+            try:
+                cursor.execute(statement)
+                if cursor.with_rows:
+                    cursor.fetchall()
+            except Error as e:
+                if e.errno in ALREADY_APPLIED_ERRORS:
+                    continue
+                raise MigrationError(f"{migration.name}, statement {number}: {e}") from e
+        elapsed = int((time.perf_counter() - start) * 1000)
+        cursor.execute(
+            "INSERT INTO RGC_SCHEMA_VERSION (VERSION, NAME, CHECKSUM, EXECUTION_MS) "
+            "VALUES (%s, %s, %s, %s)",
+            (migration.version, migration.name, migration.checksum, elapsed))
+        conn.commit()
+        return elapsed
+    finally:
+        cursor.close()
+
+
+def status(conn, directory=MIGRATIONS_DIR):
+    """(migration, applied_at or None, checksum matches) for every migration file"""
+    applied = applied_versions(conn)
+    rows = []
+    for migration in discover(directory):
+        checksum, applied_at = applied.get(migration.version, (None, None))
+        rows.append((migration, applied_at, checksum in (None, migration.checksum)))
+    return rows
+
+
+def migrate(conn, target=None, directory=MIGRATIONS_DIR, log=None):
+    """
+    Apply pending migrations up to `target` (default: all) in version order
+    A server-side named lock keeps concurrent app processes from applying the
+    same migration twice. Returns the migrations that were applied.
+    """
+    log = log or (lambda message: None)
+    cursor = conn.cursor(buffered=True)
+    try:
+        cursor.execute("SELECT GET_LOCK(%s, %s)", (LOCK_NAME, LOCK_TIMEOUT))
+        if cursor.fetchone()[0] != 1:
+            raise MigrationError(f"another process held the migration lock for {LOCK_TIMEOUT}s")
+        try:
+            done = []
+            # Re-read under the lock: another process may just have finished
+            for migration, applied_at, checksum_ok in status(conn, directory):
+                if target is not None and migration.version > target:
+                    break
+                if applied_at is not None:
+                    if not checksum_ok:
+                        log(f"warning: {migration.name} changed after it was applied")
+                    continue
+                log(f"applying {migration.name} ...")
+                elapsed = apply_migration(conn, migration)
+                log(f"applied {migration.name} in {elapsed} ms")
+                done.append(migration)
+            return done
+        finally:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (LOCK_NAME,))
+            cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def ensure_schema(pool=None, auto=AUTO_MIGRATE):
+    """
+    Startup check for the app: look for pending migrations (or, with auto
+    on, apply them). Returns the names of migrations still pending.
+    """
+    if pool is None:
+        from rgc_db import get_connection_pool
+        pool = get_connection_pool()
+    with pool.connection() as conn:
+        if auto:
+            migrate(conn)
+            return []
+        return [migration.name for migration, applied_at, _ in status(conn) if applied_at is None]
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+def main(argv=None):
+    import mysql.connector
+    from rgc_datagen import add_connection_args, connection_config
+
+    parser = argparse.ArgumentParser(description="Apply versioned RGC schema migrations")
+    add_connection_args(parser)
+    parser.add_argument('--dir', default=MIGRATIONS_DIR, help="migrations directory")
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('status', help="list migrations and whether they are applied")
+    up_cmd = sub.add_parser('up', help="apply pending migrations")
+    up_cmd.add_argument('--to', type=int, metavar='VERSION', help="stop after this version")
+    args = parser.parse_args(argv)
+
+    conn = mysql.connector.connect(**connection_config(args))
+    try:
+        if args.command == 'status':
+            for migration, applied_at, checksum_ok in status(conn, args.dir):
+                state = f"applied {applied_at:%Y-%m-%d %H:%M}" if applied_at else "pending"
+                if not checksum_ok:
+                    state += " (file changed since)"
+                print(f"{migration.version:04d}  {migration.name:<40} {state}")
+        else:
+            done = migrate(conn, args.to, args.dir, log=lambda m: print(m, file=sys.stderr))
+            print(f"{len(done)} migration(s) applied", file=sys.stderr)
+    except MigrationError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
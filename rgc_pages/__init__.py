@@ -0,0 +1,36 @@
+"""
+RGC Stream - Page modules
+Each page lives in its own module and is imported the first time it is shown.
+Streamlit re-executes only rgc_stream_app.py on every interaction; imported
+modules stay loaded in the server process, so a rerun costs the entry script
+plus the active page function instead of re-defining every page, the CSS and
+the carousel data.
+"""
+
+import importlib
+
+# page key -> (module, page function)
+PAGES = {
+    'auth': ('rgc_pages.auth', 'show_auth'),
+    'dashboard': ('rgc_pages.dashboard', 'show_dashboard'),
+    'catalog': ('rgc_pages.catalog', 'show_catalog'),
+    'series_details': ('rgc_pages.series_details', 'show_series_details'),
+    'feedback': ('rgc_pages.feedback', 'show_feedback'),
+    'settings': ('rgc_pages.settings', 'show_settings'),
+    'producer': ('rgc_pages.producer_portal', 'show_producer_dashboard'),
+    'associations': ('rgc_pages.associations', 'show_associations'),
+    'producers': ('rgc_pages.producers', 'show_producers'),
+    'schedule': ('rgc_pages.schedule', 'show_schedule_management'),
+    'admin': ('rgc_pages.admin', 'show_admin'),
+}
+
+
+def load_page(page):
+    """The page function, importing its module on first use"""
+    module, function = PAGES[page]
+    return getattr(importlib.import_module(module), function)
+
+
+def show_page(page):
+    """Render the selected page"""
+    load_page(page)()
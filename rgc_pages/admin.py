@@ -0,0 +1,659 @@
+"""
+RGC Stream - Admin panel: series, episodes, houses, viewers, contracts,
+performance, bulk import and export
+"""
+
+import io
+import os
+import tempfile
+import time
+from datetime import datetime, date, timedelta
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+from mysql.connector import Error
+
+from rgc_db import execute_query, execute_query_frame, get_connection_pool, pooled_connection, transaction
+from rgc_metrics import MAX_SQL_CHARS, query_metrics
+from rgc_cache import query_cache
+from rgc_bulk_import import ENTITIES as IMPORT_ENTITIES, count_rows, detect_format, import_file
+from rgc_export import EXPORTS, FORMATS as EXPORT_FORMATS, export_filename, signed_url, write_export
+from rgc_lookup import lookup_select
+from rgc_maintenance import EXPIRING_WINDOW_DAYS, run_maintenance
+from rgc_pages.common import apply_bulk_action, generate_id, show_bulk_actions
+from rgc_pages.contracts import get_contract_analytics, get_contract_payments, get_contracts
+
+# ADMIN PANEL
+# ============================================================================
+SLOW_QUERY_COUNT = 20
+SERIES_PAGE_SIZE = 50
+
+SERIES_COUNT_QUERY = "SELECT COUNT(*) as total FROM RGC_WEB_SERIES"
+
+SERIES_PAGE_QUERY = """
+    SELECT ws.SERIES_ID, ws.SERIES_NAME, ws.NUM_EPISODES, 
+           ws.RELEASE_DATE, ph.HOUSE_NAME
+    FROM RGC_WEB_SERIES ws
+    JOIN RGC_PRODUCTION_HOUSE ph ON ws.HOUSE_ID = ph.HOUSE_ID
+    ORDER BY ws.SERIES_NAME, ws.SERIES_ID
+    LIMIT %s OFFSET %s
+"""
+
+RECENT_EPISODES_QUERY = """
+    SELECT e.*, ws.SERIES_NAME
+    FROM RGC_EPISODE e
+    JOIN RGC_WEB_SERIES ws ON e.SERIES_ID = ws.SERIES_ID
+    ORDER BY ws.SERIES_NAME, e.EPISODE_ID
+    LIMIT 50
+"""
+
+SERIES_EPISODES_QUERY = """
+    SELECT e.*, ws.SERIES_NAME
+    FROM RGC_EPISODE e
+    JOIN RGC_WEB_SERIES ws ON e.SERIES_ID = ws.SERIES_ID
+    WHERE e.SERIES_ID = %s
+    ORDER BY e.EPISODE_ID
+"""
+
+HOUSES_QUERY = """
+    SELECT ph.*, COUNT(ws.SERIES_ID) as series_count
+    FROM RGC_PRODUCTION_HOUSE ph
+    LEFT JOIN RGC_WEB_SERIES ws ON ph.HOUSE_ID = ws.HOUSE_ID
+    GROUP BY ph.HOUSE_ID
+    ORDER BY ph.HOUSE_NAME
+"""
+
+VIEWERS_QUERY = """
+    SELECT v.ACCOUNT_ID, v.ACC_FNAME, v.ACC_LNAME, c.COUNTRY_NAME,
+           COUNT(DISTINCT f.FEEDBACK_ID) as reviews
+    FROM RGC_VIEWER v
+    LEFT JOIN RGC_COUNTRY c ON v.COUNTRY_CODE = c.COUNTRY_CODE
+    LEFT JOIN RGC_FEEDBACK f ON v.ACCOUNT_ID = f.ACCOUNT_ID
+    GROUP BY v.ACCOUNT_ID
+    ORDER BY v.ACC_FNAME
+    LIMIT 50
+"""
+
+def _format_ms_columns(df):
+    """Round the *_ms latency columns for display"""
+    for col in df.columns:
+        if col.endswith('_ms'):
+            df[col] = df[col].round(2)
+    return df
+
+def show_bulk_import_panel():
+    """Chunked CSV/Parquet import of series, episodes, viewers, feedback and schedules"""
+    st.subheader("📥 Bulk Import")
+    
+    entity = st.selectbox("Import", list(IMPORT_ENTITIES.keys()), key="bulk_import_entity",
+                          format_func=str.title)
+    spec = IMPORT_ENTITIES[entity]
+    columns = [f.column + (" *" if f.required else "") for f in spec.fields] + list(spec.links.keys())
+    st.caption("Columns: " + ", ".join(columns) + " — * required. Blank IDs are generated; "
+               "houses, genres, languages, countries and platforms can be given by name.")
+    
+    uploaded = st.file_uploader("CSV or Parquet file", type=["csv", "parquet"], key="bulk_import_file")
+    chunk_size = st.number_input("Rows per transaction", min_value=100, max_value=20000,
+                                 value=2000, step=500, key="bulk_import_chunk")
+    
+    if uploaded and st.button("🚀 Start Import", key="bulk_import_start", use_container_width=True):
+        fmt = detect_format(uploaded.name)
+        total = count_rows(uploaded, fmt)
+        progress_bar = st.progress(0.0)
+        status = st.empty()
+        rejects = io.StringIO()
+        
+        def report(stats):
+            progress_bar.progress(stats.fraction or 0.0)
+            status.text(stats.format())
+        
+        try:
+            stats = import_file(entity, uploaded, fmt, int(chunk_size), rejects=rejects,
+                                progress=report, total=total)
+        except (Error, ImportError) as e:
+            st.error(f"❌ Import failed: {e}")
+            return
+        except UnicodeDecodeError as e:
+            st.error(f"❌ Import stopped: the file is not UTF-8 text (byte {e.start}). "
+                     "Chunks before that point were imported; save the file as UTF-8 CSV and "
+                     "re-import the rest.")
+            return
+        
+        progress_bar.progress(1.0)
+        st.success(f"✅ {stats.format()}")
+        if stats.rejected:
+            st.warning(f"⚠️ {stats.rejected} row(s) rejected")
+            st.download_button("📥 Download Rejected Rows", rejects.getvalue(),
+                               file_name=f"{entity}_rejected.csv", mime="text/csv",
+                               use_container_width=True)
+
+def show_export_panel():
+    """Large report exports streamed from an unbuffered cursor"""
+    st.subheader("📤 Export Reports")
+    
+    report = st.selectbox("Report", list(EXPORTS.keys()), key="export_report",
+                          format_func=lambda name: name.replace('_', ' ').title())
+    fmt = st.radio("Format", list(EXPORT_FORMATS.keys()), horizontal=True, key="export_format",
+                   format_func=lambda f: {'csv': 'CSV', 'jsonl': 'JSON Lines', 'parquet': 'Parquet'}[f])
+    filename = export_filename(report, fmt)
+    
+    # With the streaming server running the browser downloads straight from
+    # it, and the file starts arriving while the query is still being read
+    export_url = os.environ.get('RGC_EXPORT_URL')
+    token = os.environ.get('RGC_EXPORT_TOKEN')
+    if export_url and token:
+        # Signed and short-lived: the token itself never goes into the page
+        url = signed_url(export_url, report, fmt, token)
+        st.link_button(f"📥 Download {filename}", url, use_container_width=True)
+        return
+    if export_url:
+        # An unsigned link would hand the full reports to anyone who has it
+        st.warning("⚠️ RGC_EXPORT_URL is set without RGC_EXPORT_TOKEN; set both to link to "
+                   "the streaming export server. Exports are prepared here meanwhile.")
+    
+    # Without it, rows are still read in chunks but spooled to disk, because
+    # st.download_button needs the finished file
+    if st.button("⚙️ Prepare Export", key="export_prepare", use_container_width=True):
+        spool = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+        start = time.time()
+        try:
+            with st.spinner(f"Exporting {report}..."):
+                written = write_export(report, fmt, spool)
+        except (Error, ImportError) as e:
+            spool.close()
+            st.error(f"❌ Export failed: {e}")
+            return
+        spool.seek(0)
+        st.success(f"✅ {written / 1024 / 1024:.1f} MB in {time.time() - start:.1f}s")
+        st.download_button(f"📥 Download {filename}", spool, file_name=filename,
+                           mime=EXPORT_FORMATS[fmt][0], use_container_width=True)
+
+def show_performance_panel():
+    """Query latency percentiles, page render times and the slowest recent queries"""
+    st.subheader("⚡ Query Performance")
+    
+    records = query_metrics.records()
+    cache = query_cache.stats()
+    lookups = cache['hits'] + cache['misses']
+    statements = get_connection_pool().statement_stats()
+    executions = statements['hits'] + statements['prepares']
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1.metric("Queries Buffered", len(records))
+    col2.metric("Fingerprints", len(query_metrics.query_summary()))
+    col3.metric("Cache Hit Rate", f"{cache['hits'] / lookups * 100:.0f}%" if lookups else "N/A")
+    col4.metric("Cache Size", f"{cache['bytes'] / 1024 / 1024:.1f} MB",
+                help=(f"In this process; the shared cache holds {cache['shared_entries']} results "
+                      f"({cache['shared_bytes'] / 1024 / 1024:.1f} MB)") if 'shared_entries' in cache else None)
+    col5.metric("Prepared Reuse", f"{statements['hits'] / executions * 100:.0f}%" if executions else "N/A",
+                help=f"{statements['open']} prepared statements open across pooled connections")
+    
+    st.markdown("**Latency by query fingerprint**")
+    summary = query_metrics.query_summary()
+    if summary:
+        df = _format_ms_columns(pd.DataFrame(summary))
+        st.dataframe(df[['fingerprint', 'calls', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms',
+                         'total_ms', 'avg_rows', 'errors']], use_container_width=True)
+    else:
+        st.info("No queries recorded yet")
+    
+    st.markdown("**Page render time**")
+    pages = query_metrics.page_summary()
+    if pages:
+        df = _format_ms_columns(pd.DataFrame(pages))
+        st.dataframe(df[['page', 'calls', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms']],
+                     use_container_width=True)
+    
+    st.markdown(f"**Slowest {SLOW_QUERY_COUNT} recent queries**")
+    slowest = query_metrics.slowest(SLOW_QUERY_COUNT)
+    if slowest:
+        df = _format_ms_columns(pd.DataFrame([{
+            'when': datetime.fromtimestamp(r.timestamp).strftime('%H:%M:%S'),
+            'wall_ms': r.wall_ms, 'db_ms': r.db_ms, 'rows': r.rows,
+            'page': r.page, 'function': r.function, 'sql': r.fingerprint,
+        } for r in slowest]))
+        st.dataframe(df, use_container_width=True)
+        
+        # A truncated statement would not parse or match its params
+        explainable = [(i, r) for i, r in enumerate(slowest)
+                       if not r.truncated and r.sql.lstrip().upper().startswith(('SELECT', 'WITH'))]
+        if any(r.truncated for r in slowest):
+            st.caption(f"Statements longer than {MAX_SQL_CHARS} characters are stored truncated "
+                       "and cannot be explained.")
+        if explainable:
+            labels = {f"#{i + 1} ({r.wall_ms:.1f} ms) {r.fingerprint[:80]}": r for i, r in explainable}
+            choice = st.selectbox("Query to explain", list(labels.keys()), key="perf_explain_choice")
+            if st.button("🔍 EXPLAIN", key="perf_explain"):
+                r = labels[choice]
+                plan = execute_query(f"EXPLAIN {r.sql}", r.params)
+                st.code(r.sql, language="sql")
+                if plan:
+                    st.dataframe(pd.DataFrame(plan), use_container_width=True)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.download_button("📥 Export CSV", query_metrics.export('csv'),
+                           file_name="rgc_query_metrics.csv", mime="text/csv",
+                           use_container_width=True)
+    with col2:
+        st.download_button("📥 Export JSON Lines", query_metrics.export('json'),
+                           file_name="rgc_query_metrics.jsonl", mime="application/json",
+                           use_container_width=True)
+    with col3:
+        if st.button("🗑️ Reset Metrics", key="perf_reset", use_container_width=True):
+            query_metrics.reset()
+            st.rerun()
+
+def show_admin():
+    """Admin panel for database management"""
+    st.title("⚙️ Admin Panel")
+    
+    if st.session_state.user_type not in ['PRODUCER', 'ADMIN']:
+        st.error("❌ Access Denied: Admin/Producer privileges required")
+        return
+    
+    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs(["🎬 Manage Series", "📺 Manage Episodes", "🏢 Production Houses", "👥 Manage Viewers", "📜 Contracts", "⚡ Performance", "📥 Bulk Import", "📤 Export"])
+    
+    with tab6:
+        show_performance_panel()
+    
+    with tab7:
+        show_bulk_import_panel()
+    
+    with tab8:
+        show_export_panel()
+    
+    with tab1:
+        st.subheader("Web Series Management")
+        
+        total = execute_query(SERIES_COUNT_QUERY)
+        total = total[0]['total'] if total else 0
+        pages = max(1, -(-total // SERIES_PAGE_SIZE))
+        page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1,
+                               key="admin_series_page")
+        series = execute_query(SERIES_PAGE_QUERY, (SERIES_PAGE_SIZE, (page - 1) * SERIES_PAGE_SIZE))
+        
+        if series:
+            df = pd.DataFrame(series)
+            st.dataframe(df, use_container_width=True)
+            st.caption(f"{total:,} series")
+            
+            if st.button("🔄 Rebuild Series Statistics", key="rebuild_stats",
+                         help="Recompute ratings, episode counts and viewers in RGC_SERIES_STATS from scratch"):
+                if execute_query("CALL sp_rebuild_series_stats()", commit=True) is not None:
+                    st.success("✅ Series statistics rebuilt!")
+            
+            st.markdown("---")
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                with st.expander("✏️ Update Series"):
+                    series_id = lookup_select("Series", 'series', key="upd_series")
+                    current = execute_query(
+                        "SELECT SERIES_NAME, NUM_EPISODES FROM RGC_WEB_SERIES WHERE SERIES_ID = %s",
+                        (series_id,)) if series_id else None
+                    if current:
+                        with st.form("update_series"):
+                            new_name = st.text_input("New Name", value=current[0]['SERIES_NAME'])
+                            new_eps = st.number_input("Episodes", 1, 200,
+                                                      min(max(current[0]['NUM_EPISODES'], 1), 200))
+                            
+                            if st.form_submit_button("Update"):
+                                query = "UPDATE RGC_WEB_SERIES SET SERIES_NAME = %s, NUM_EPISODES = %s WHERE SERIES_ID = %s"
+                                if execute_query(query, (new_name, new_eps, series_id), commit=True):
+                                    st.success("✅ Series updated!")
+                                    time.sleep(1)
+                                    st.rerun()
+            
+            with col2:
+                with st.expander("🗑️ Delete Series"):
+                    series_id = lookup_select("Series", 'series', key="del_series")
+                    if series_id:
+                        with st.form("delete_series"):
+                            st.warning("⚠️ This will delete all related episodes, feedback, and schedules!")
+                            confirm = st.checkbox("I understand this cannot be undone")
+                            
+                            if st.form_submit_button("Delete", type="primary"):
+                                if confirm:
+                                    try:
+                                        #deadlock - delete in a specific order to avoid locks
+                                        #parameterised queries to prevent SQL injection
+                                        with transaction() as cursor:
+                                            cursor.execute("DELETE FROM RGC_FEEDBACK WHERE SERIES_ID = %s", (series_id,))
+                                            cursor.execute("DELETE FROM RGC_AIRING_SCHEDULE WHERE EPISODE_ID IN (SELECT EPISODE_ID FROM RGC_EPISODE WHERE SERIES_ID = %s)", (series_id,))
+                                            cursor.execute("DELETE FROM RGC_EPISODE WHERE SERIES_ID = %s", (series_id,))
+                                            cursor.execute("DELETE FROM RGC_WEB_SERIES_SERIES_TYPE WHERE SERIES_ID = %s", (series_id,))
+                                            cursor.execute("DELETE FROM RGC_WEB_SERIES WHERE SERIES_ID = %s", (series_id,))
+                                        st.success("✅ Series deleted!")
+                                        time.sleep(1)
+                                        st.rerun()
+                                    except:
+                                        st.error("❌ Delete failed")
+                                else:
+                                    st.warning("⚠️ Please confirm deletion")
+        else:
+            st.info("No series found")
+    
+    with tab2:
+        st.subheader("Episode Management")
+        
+        series_filter = lookup_select("Filter by Series", 'series', key="admin_episode_series",
+                                      empty_option="All")
+        
+        if series_filter is None:
+            episodes = execute_query(RECENT_EPISODES_QUERY)
+        else:
+            episodes = execute_query(SERIES_EPISODES_QUERY, (series_filter,))
+        
+        if episodes:
+            df = pd.DataFrame(episodes)
+            st.dataframe(df[['SERIES_NAME', 'EPISODE_ID', 'EPISODE_TITLE', 
+                           'TOTAL_VIEWERS', 'TECHNICAL_INTERRUPTION']], 
+                       use_container_width=True)
+        else:
+            st.info("No episodes found")
+        
+        with st.expander("➕ Add Episode"):
+            ep_series_id = lookup_select("Series", 'series', key="admin_add_episode_series")
+            with st.form("add_episode"):
+                ep_id = st.text_input("Episode ID", placeholder="E001")
+                ep_title = st.text_input("Title")
+                ep_viewers = st.number_input("Initial Viewers", 0, 10000000, 0)
+                ep_tech = st.checkbox("Technical Interruption")
+                
+                if st.form_submit_button("Add Episode"):
+                    if ep_series_id and ep_id and ep_title:
+                        query = """
+                        INSERT INTO RGC_EPISODE 
+                        (EPISODE_ID, SERIES_ID, EPISODE_TITLE, TOTAL_VIEWERS, TECHNICAL_INTERRUPTION)
+                        VALUES (%s, %s, %s, %s, %s)
+                        """
+                        if execute_query(query, (ep_id, ep_series_id, ep_title, 
+                                               ep_viewers, ep_tech), commit=True):
+                            st.success("✅ Episode added!")
+                            time.sleep(1)
+                            st.rerun()
+                    else:
+                        st.warning("⚠️ Fill all fields")
+
+    with tab3:
+        st.subheader("Production Houses")
+        
+        houses = execute_query(HOUSES_QUERY)
+        
+        if houses:
+            df = pd.DataFrame(houses)
+            st.dataframe(df, use_container_width=True)
+            
+            with st.expander("➕ Add Production House"):
+                with st.form("add_house"):
+                    h_id = st.text_input("House ID", placeholder="PH016")
+                    h_name = st.text_input("Name")
+                    h_city = st.text_input("City")
+                    h_country = st.text_input("Country")
+                    
+                    if st.form_submit_button("Add House"):
+                        if h_id and h_name:
+                            query = """
+                            INSERT INTO RGC_PRODUCTION_HOUSE 
+                            (HOUSE_ID, HOUSE_NAME, ADDRESS_CITY, ADDRESS_COUNTRY)
+                            VALUES (%s, %s, %s, %s)
+                            """
+                            if execute_query(query, (h_id, h_name, h_city, h_country), commit=True):
+                                st.success("✅ Production house added!")
+                                time.sleep(1)
+                                st.rerun()
+                        else:
+                            st.warning("⚠️ Fill required fields")
+        else:
+            st.info("No production houses found")
+    
+    with tab4:
+        st.subheader("Viewer Accounts")
+        
+        df = execute_query_frame(VIEWERS_QUERY)
+        
+        if df is not None and not df.empty:
+            st.dataframe(df, use_container_width=True)
+            
+            st.metric("Total Viewers", len(df))
+        else:
+            st.info("No viewers found")
+    
+    with tab5:
+        st.subheader("📜 Contract Management")
+        
+        # Contract Analytics - WITH NULL HANDLING
+        analytics = get_contract_analytics()
+        if analytics:
+            a = analytics[0]
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                total = a.get('total_contracts') or 0
+                st.metric("Total Contracts", total)
+            with col2:
+                active = a.get('active_contracts') or 0
+                active_val = a.get('active_value') or 0
+                st.metric("Active", active, delta=f"${active_val:,.2f}")
+            with col3:
+                pending = a.get('pending_contracts') or 0
+                st.metric("Pending", pending)
+            with col4:
+                total_val = a.get('total_value') or 0
+                st.metric("Total Value", f"${total_val:,.2f}")
+        
+        if st.button("🔄 Run Status Maintenance", key="run_contract_maintenance",
+                     help="Expire ended contracts and flag overdue payments now "
+                          "(normally run on a schedule by rgc_maintenance.py)"):
+            with pooled_connection() as conn:
+                if conn:
+                    try:
+                        changed = run_maintenance(conn)
+                        st.success(f"✅ {changed['expire_contracts']} contracts expired, "
+                                   f"{changed['overdue_payments']} payments marked overdue")
+                    except Error as e:
+                        st.error(f"Maintenance Error: {e}")
+        
+        st.markdown("---")
+        
+        # Filter options
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            status_filter = st.selectbox("Filter by Status", 
+                                        ["All", "ACTIVE", f"EXPIRING ({EXPIRING_WINDOW_DAYS} days)", "PENDING", "EXPIRED",
+                                         "TERMINATED"])
+        with col2:
+            type_filter = st.selectbox("Filter by Type",
+                                      ["All", "PRODUCTION", "DISTRIBUTION", "LICENSING", "TALENT"])
+        with col3:
+            house_filter = lookup_select("Filter by House", 'house', key="contract_house_filter",
+                                         empty_option="All")
+        
+        # View Contracts - filtered in SQL
+        expiring = status_filter.startswith("EXPIRING")
+        contracts = get_contracts(
+            status=None if status_filter == "All" or expiring else status_filter,
+            expiring_within=EXPIRING_WINDOW_DAYS if expiring else None,
+            contract_type=None if type_filter == "All" else type_filter,
+            house_id=house_filter)
+        
+        if contracts:
+            total_matches = contracts[0]['total_matches']
+            if total_matches > len(contracts):
+                st.write(f"**Showing {len(contracts)} of {total_matches} contracts (newest first)**")
+            else:
+                st.write(f"**Showing {len(contracts)} contracts**")
+            
+            # Payment history for every visible contract in one query
+            payments_by_contract = get_contract_payments([c['CONTRACT_ID'] for c in contracts])
+            
+            # Display contracts
+            for c in contracts:
+                status_color = {
+                    'ACTIVE': '🟢',
+                    'PENDING': '🟡',
+                    'EXPIRED': '🔴',
+                    'TERMINATED': '⚫'
+                }.get(c['STATUS'], '⚪')
+                
+                days_left = c.get('days_remaining', 0)
+                expiry_warning = ""
+                if days_left and days_left < 30 and c['STATUS'] == 'ACTIVE':
+                    expiry_warning = f" ⚠️ Expires in {days_left} days"
+                
+                with st.expander(f"{status_color} {c['CONTRACT_ID']} - {c['SERIES_NAME'] or 'N/A'} - ${c['CONTRACT_VALUE']:,.2f}{expiry_warning}"):
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.write(f"**Type:** {c['CONTRACT_TYPE']}")
+                        st.write(f"**Status:** {c['STATUS']}")
+                        st.write(f"**Production House:** {c['HOUSE_NAME'] or 'N/A'}")
+                        st.write(f"**Value:** ${c['CONTRACT_VALUE']:,.2f}")
+                    with col2:
+                        st.write(f"**Start Date:** {c['START_DATE']}")
+                        st.write(f"**End Date:** {c['END_DATE'] or 'Ongoing'}")
+                        st.write(f"**Payment Terms:** {c['PAYMENT_TERMS'] or 'N/A'}")
+                        st.write(f"**Created:** {c['CREATED_DATE'].strftime('%Y-%m-%d')}")
+                    
+                    # View payments
+                    payments = payments_by_contract[c['CONTRACT_ID']]
+                    if payments:
+                        st.write("**Payment History:**")
+                        payment_df = pd.DataFrame(payments)
+                        st.dataframe(payment_df[['PAYMENT_DATE', 'AMOUNT', 'PAYMENT_STATUS', 'PAYMENT_METHOD']], 
+                                   use_container_width=True)
+            
+            # Bulk actions
+            st.markdown("**Bulk Actions**")
+            show_bulk_actions(
+                "contract_bulk_actions",
+                {f"{c['CONTRACT_ID']} - {c['SERIES_NAME'] or c['HOUSE_NAME'] or 'N/A'} ({c['STATUS']})": c['CONTRACT_ID']
+                 for c in contracts},
+                {
+                    "✅ Activate": lambda ids: apply_bulk_action(
+                        "UPDATE RGC_CONTRACTS SET STATUS = 'ACTIVE'", "CONTRACT_ID", ids,
+                        " AND STATUS = 'PENDING'"),
+                    "🗑️ Delete": lambda ids: apply_bulk_action(
+                        "DELETE FROM RGC_CONTRACTS", "CONTRACT_ID", ids),
+                },
+                label="Contracts")
+        
+        else:
+            st.info("No contracts found")
+        
+        st.markdown("---")
+        
+        # Add New Contract
+        with st.expander("➕ Add New Contract", expanded=False):
+            col1, col2 = st.columns(2)
+            with col1:
+                series_id = lookup_select("Series", 'series', key="contract_add_series", empty_option="None")
+            with col2:
+                house_id = lookup_select("Production House", 'house', key="contract_add_house")
+            
+            with st.form("add_contract"):
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    contract_id = st.text_input("Contract ID", placeholder="Leave blank to auto-generate")
+                    
+                    contract_type = st.selectbox("Contract Type", 
+                                                ["PRODUCTION", "DISTRIBUTION", "LICENSING", "TALENT"])
+                    contract_value = st.number_input("Contract Value ($)", min_value=0.0, step=1000.0)
+                
+                with col2:
+                    start_date = st.date_input("Start Date", value=date.today())
+                    end_date = st.date_input("End Date", value=date.today() + timedelta(days=365))
+                    status = st.selectbox("Status", ["PENDING", "ACTIVE", "EXPIRED", "TERMINATED"])
+                    payment_terms = st.text_area("Payment Terms", 
+                                                 placeholder="e.g., 30% upfront, 70% on completion")
+                
+                if st.form_submit_button("Create Contract", use_container_width=True):
+                    if house_id:
+                        contract_id = contract_id.strip() or generate_id('RGC_CONTRACTS')
+                        query = """
+                        INSERT INTO RGC_CONTRACTS 
+                        (CONTRACT_ID, SERIES_ID, HOUSE_ID, CONTRACT_TYPE, CONTRACT_VALUE, 
+                         START_DATE, END_DATE, STATUS, PAYMENT_TERMS, CREATED_BY)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                        """
+                        if contract_id and execute_query(query, (contract_id, series_id, house_id, contract_type, 
+                                               contract_value, start_date, end_date, status, 
+                                               payment_terms, st.session_state.user_id), commit=True):
+                            st.success("✅ Contract created successfully!")
+                            time.sleep(1)
+                            st.rerun()
+                        else:
+                            st.error("❌ Failed to create contract")
+                    else:
+                        st.warning("⚠️ Please fill in required fields")
+        
+        # Add Payment
+        with st.expander("💰 Add Payment", expanded=False):
+            contract_id = lookup_select("Select Contract", 'active_contract', key="payment_contract")
+            with st.form("add_payment"):
+                if contract_id:
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        payment_id = st.text_input("Payment ID", placeholder="Leave blank to auto-generate")
+                        amount = st.number_input("Amount ($)", min_value=0.0, step=100.0)
+                        payment_date = st.date_input("Payment Date", value=date.today())
+                    
+                    with col2:
+                        payment_status = st.selectbox("Payment Status", 
+                                                     ["PENDING", "COMPLETED", "OVERDUE", "CANCELLED"])
+                        payment_method = st.selectbox("Payment Method",
+                                                     ["Bank Transfer", "Check", "Wire", "Credit Card", "PayPal"])
+                        notes = st.text_area("Notes", placeholder="Additional payment details...")
+                    
+                    if st.form_submit_button("Add Payment", use_container_width=True):
+                        payment_id = payment_id.strip() or generate_id('RGC_CONTRACT_PAYMENTS')
+                        if payment_id:
+                            query = """
+                            INSERT INTO RGC_CONTRACT_PAYMENTS 
+                            (PAYMENT_ID, CONTRACT_ID, PAYMENT_DATE, AMOUNT, PAYMENT_STATUS, PAYMENT_METHOD, NOTES)
+                            VALUES (%s, %s, %s, %s, %s, %s, %s)
+                            """
+                            if execute_query(query, (payment_id, contract_id, payment_date, amount,
+                                                   payment_status, payment_method, notes), commit=True):
+                                st.success("✅ Payment added successfully!")
+                                time.sleep(1)
+                                st.rerun()
+                else:
+                    st.info("No active contract selected")
+        
+        # Contract Reports
+        st.markdown("---")
+        st.subheader("📊 Contract Reports")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.write("**Contracts by Type**")
+            df = execute_query_frame("""
+                SELECT CONTRACT_TYPE, COUNT(*) as count, SUM(CONTRACT_VALUE) as total_value
+                FROM RGC_CONTRACTS
+                GROUP BY CONTRACT_TYPE
+            """)
+            if df is not None and not df.empty:
+                fig = px.pie(df, values='count', names='CONTRACT_TYPE',
+                           title='Distribution by Contract Type')
+                fig.update_layout(plot_bgcolor='#0a1628', paper_bgcolor='#0a1628',
+                                font_color='#e5e5e5')
+                st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            st.write("**Contract Value by Production House**")
+            df = execute_query_frame("""
+                SELECT ph.HOUSE_NAME, SUM(c.CONTRACT_VALUE) as total_value
+                FROM RGC_CONTRACTS c
+                JOIN RGC_PRODUCTION_HOUSE ph ON c.HOUSE_ID = ph.HOUSE_ID
+                GROUP BY ph.HOUSE_ID, ph.HOUSE_NAME
+                ORDER BY total_value DESC
+                LIMIT 10
+            """)
+            if df is not None and not df.empty:
+                fig = px.bar(df, x='HOUSE_NAME', y='total_value',
+                           title='Top 10 Houses by Contract Value')
+                fig.update_layout(plot_bgcolor='#0a1628', paper_bgcolor='#0a1628',
+                                font_color='#e5e5e5', xaxis_tickangle=-45)
+                st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,158 @@
+"""
+RGC Stream - Cast & crew management page
+"""
+
+import time
+from datetime import date
+
+import streamlit as st
+
+from rgc_db import execute_query
+from rgc_lookup import lookup_select
+from rgc_pages.common import apply_bulk_action, generate_id, show_bulk_actions
+
+# ============================================================================
+# ASSOCIATION MANAGEMENT (CAST & CREW)
+# ============================================================================
+def show_associations():
+    """Manage cast and crew associations"""
+    st.title("🎭 Cast & Crew Management")
+    
+    tab1, tab2 = st.tabs(["📋 View Associations", "➕ Add Association"])
+    
+    with tab1:
+        st.subheader("Cast & Crew List")
+        
+        # Filters
+        col1, col2 = st.columns(2)
+        with col1:
+            series_filter = lookup_select("Filter by Series", 'series', key="assoc_series_filter",
+                                          empty_option="All Series")
+        
+        with col2:
+            role_filter = st.selectbox("Filter by Role", 
+                                      ["All Roles", "ACTOR", "DIRECTOR", "WRITER", "PRODUCER", 
+                                       "CINEMATOGRAPHER", "EDITOR", "OTHER"])
+        
+        # Query associations
+        base_query = """
+            SELECT a.*, ws.SERIES_NAME
+            FROM RGC_CAST_CREW a
+            JOIN RGC_WEB_SERIES ws ON a.SERIES_ID = ws.SERIES_ID
+        """
+        
+        where_clauses = []
+        params = []
+        
+        if series_filter:
+            where_clauses.append("a.SERIES_ID = %s")
+            params.append(series_filter)
+        
+        if role_filter != "All Roles":
+            where_clauses.append("a.ROLE_TYPE = %s")
+            params.append(role_filter)
+        
+        if where_clauses:
+            base_query += " WHERE " + " AND ".join(where_clauses)
+        
+        base_query += " ORDER BY ws.SERIES_NAME, a.ROLE_TYPE, a.PERSON_NAME"
+        
+        associations = execute_query(base_query, tuple(params) if params else None)
+        
+        if associations:
+            st.write(f"**Found {len(associations)} associations**")
+            
+            for assoc in associations:
+                role_emoji = {
+                    'ACTOR': '🎭',
+                    'DIRECTOR': '🎬',
+                    'WRITER': '✍️',
+                    'PRODUCER': '🎥',
+                    'CINEMATOGRAPHER': '📷',
+                    'EDITOR': '✂️',
+                    'OTHER': '👤'
+                }.get(assoc['ROLE_TYPE'], '👤')
+                
+                status_color = {
+                    'ACTIVE': '🟢',
+                    'COMPLETED': '🔵',
+                    'TERMINATED': '🔴'
+                }.get(assoc['STATUS'], '⚪')
+                
+                with st.expander(f"{role_emoji} {assoc['PERSON_NAME']} - {assoc['ROLE_TYPE']} - {assoc['SERIES_NAME']} {status_color}"):
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.write(f"**Association ID:** {assoc['ASSOCIATION_ID']}")
+                        st.write(f"**Series:** {assoc['SERIES_NAME']}")
+                        st.write(f"**Role:** {assoc['ROLE_TYPE']}")
+                        if assoc['CHARACTER_NAME']:
+                            st.write(f"**Character:** {assoc['CHARACTER_NAME']}")
+                        st.write(f"**Status:** {assoc['STATUS']}")
+                    
+                    with col2:
+                        st.write(f"**Start Date:** {assoc['START_DATE'] or 'N/A'}")
+                        st.write(f"**End Date:** {assoc['END_DATE'] or 'Ongoing'}")
+                        if assoc['COMPENSATION']:
+                            st.write(f"**Compensation:** ${assoc['COMPENSATION']:,.2f}")
+                        if assoc['ROLE_DESCRIPTION']:
+                            st.write(f"**Description:** {assoc['ROLE_DESCRIPTION']}")
+            
+            # Bulk actions
+            st.markdown("**Bulk Actions**")
+            show_bulk_actions(
+                "association_bulk_actions",
+                {f"{a['ASSOCIATION_ID']} - {a['PERSON_NAME']} ({a['SERIES_NAME']})": a['ASSOCIATION_ID']
+                 for a in associations},
+                {
+                    "✅ Mark Complete": lambda ids: apply_bulk_action(
+                        "UPDATE RGC_CAST_CREW SET STATUS = 'COMPLETED'", "ASSOCIATION_ID", ids,
+                        " AND STATUS = 'ACTIVE'"),
+                    "🗑️ Remove": lambda ids: apply_bulk_action(
+                        "DELETE FROM RGC_CAST_CREW", "ASSOCIATION_ID", ids),
+                },
+                label="Associations")
+        else:
+            st.info("No associations found")
+    
+    with tab2:
+        st.subheader("Add New Association")
+        
+        series_id = lookup_select("Series", 'series', key="assoc_add_series")
+        with st.form("add_association"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                assoc_id = st.text_input("Association ID", placeholder="Leave blank to auto-generate")
+                
+                person_name = st.text_input("Person Name")
+                role_type = st.selectbox("Role Type", 
+                                        ["ACTOR", "DIRECTOR", "WRITER", "PRODUCER", 
+                                         "CINEMATOGRAPHER", "EDITOR", "OTHER"])
+                character_name = st.text_input("Character Name (if applicable)")
+            
+            with col2:
+                role_description = st.text_area("Role Description")
+                start_date = st.date_input("Start Date", value=date.today())
+                end_date = st.date_input("End Date (optional)", value=None)
+                compensation = st.number_input("Compensation ($)", min_value=0.0, step=1000.0)
+                status = st.selectbox("Status", ["ACTIVE", "COMPLETED", "TERMINATED"])
+            
+            if st.form_submit_button("Add Association", use_container_width=True):
+                if series_id and person_name:
+                    assoc_id = assoc_id.strip() or generate_id('RGC_CAST_CREW')
+                    query = """
+                    INSERT INTO RGC_CAST_CREW 
+                    (ASSOCIATION_ID, SERIES_ID, PERSON_NAME, ROLE_TYPE, CHARACTER_NAME, 
+                     ROLE_DESCRIPTION, START_DATE, END_DATE, COMPENSATION, STATUS)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    """
+                    if assoc_id and execute_query(query, (assoc_id, series_id, person_name, role_type, 
+                                           character_name or None, role_description or None,
+                                           start_date, end_date, compensation, status), commit=True):
+                        st.success("✅ Association added successfully!")
+                        time.sleep(1)
+                        st.rerun()
+                    else:
+                        st.error("❌ Failed to add association")
+                else:
+                    st.warning("⚠️ Please fill in required fields")
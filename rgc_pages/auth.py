@@ -0,0 +1,114 @@
+"""
+RGC Stream - Login and registration page
+"""
+
+import time
+
+import streamlit as st
+
+from rgc_db import execute_query
+from rgc_lookup import lookup_select
+from rgc_pages.common import generate_id, hash_password, sanitize_input
+
+def register_user(username, password, email, user_type, linked=None):
+    """Register new user with encrypted password"""
+    username = sanitize_input(username)
+    email = sanitize_input(email)
+    
+    user_id = generate_id('RGC_USERS')
+    if not user_id:
+        return None
+    pwd_hash = hash_password(password)
+    
+    query = """
+    INSERT INTO RGC_USERS (USER_ID, USERNAME, PASSWORD_HASH, USER_TYPE, EMAIL, LINKED_ACCOUNT)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    """
+    return execute_query(query, (user_id, username, pwd_hash, user_type, email, linked), commit=True)
+
+def authenticate_user(username, password):
+    """Authenticate user with hashed password comparison"""
+    username = sanitize_input(username)
+    pwd_hash = hash_password(password)
+    
+    query = """
+    SELECT USER_ID, USERNAME, USER_TYPE, LINKED_ACCOUNT, EMAIL
+    FROM RGC_USERS
+    WHERE USERNAME = %s AND PASSWORD_HASH = %s
+    """
+    result = execute_query(query, (username, pwd_hash))
+    return result[0] if result else None
+
+# ============================================================================
+# AUTHENTICATION PAGE
+# ============================================================================
+def show_auth():
+    """Login and Registration page"""
+    # Centered layout with spacing
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown('<div class="streamvault-logo">🎬 RGC STREAM</div>', unsafe_allow_html=True)
+        st.markdown('<p style="text-align: center; font-size: 1.1rem; color: var(--text-secondary); font-weight: 500; margin-top: -1rem;">Premium Web Series Platform</p>', unsafe_allow_html=True)
+        st.markdown('<p style="text-align: center; font-size: 0.9rem; color: var(--text-secondary); margin-bottom: 2rem;">Experience unlimited entertainment</p>', unsafe_allow_html=True)
+    
+    st.markdown("")
+    
+    tab1, tab2 = st.tabs(["🔐 Login", "📝 Register"])
+    
+    with tab1:
+        st.subheader("Sign In to Your Account")
+        with st.form("login_form"):
+            username = st.text_input("Username")
+            password = st.text_input("Password", type="password")
+            submit = st.form_submit_button("Login", use_container_width=True)
+            
+            if submit:
+                if username and password:
+                    user = authenticate_user(username, password)
+                    if user:
+                        st.session_state.logged_in = True
+                        st.session_state.user_id = user['USER_ID']
+                        st.session_state.username = user['USERNAME']
+                        st.session_state.user_type = user['USER_TYPE']
+                        st.session_state.linked_account = user['LINKED_ACCOUNT']
+                        st.success(f"✅ Welcome, {username}!")
+                        time.sleep(1)
+                        st.rerun()
+                    else:
+                        st.error("❌ Invalid credentials")
+                else:
+                    st.warning("⚠️ Please fill in all fields")
+    
+    with tab2:
+        st.subheader("Create New Account")
+        reg_type = "VIEWER"  # Default to VIEWER for simplicity
+        linked = None
+        if reg_type == "VIEWER":
+            # Outside the form so the account search refreshes its matches
+            linked = lookup_select("Link to Viewer Account (Optional)", 'viewer',
+                                   key="reg_linked_account", empty_option="None")
+        with st.form("register_form"):
+            col1, col2 = st.columns(2)
+            with col1:
+                reg_user = st.text_input("Username", key="r1")
+                reg_email = st.text_input("Email", key="r2")
+            with col2:
+                reg_pass = st.text_input("Password", type="password", key="r3")
+                reg_pass2 = st.text_input("Confirm Password", type="password", key="r4")
+            
+                # reg_type = st.selectbox("Account Type", ["VIEWER", "PRODUCER", "ADMIN"])
+
+            submit = st.form_submit_button("Register", use_container_width=True)
+            
+            if submit:
+                if not reg_user or not reg_email or not reg_pass:
+                    st.warning("⚠️ Please fill in all fields")
+                elif reg_pass != reg_pass2:
+                    st.error("❌ Passwords don't match")
+                elif len(reg_pass) < 6:
+                    st.error("❌ Password must be at least 6 characters")
+                else:
+                    if register_user(reg_user, reg_pass, reg_email, reg_type, linked):
+                        st.success("✅ Account created! Please login.")
+                    else:
+                        st.error("❌ Registration failed. Username may already exist.")
@@ -0,0 +1,264 @@
+"""
+RGC Stream - Web series catalog page
+"""
+
+import streamlit as st
+
+from rgc_db import cached_query, in_placeholders
+from rgc_facets import FACET_LABELS, FACETS, SORTS, facet_index, popcount
+from rgc_search import search_all, series_name_filter
+
+# ============================================================================
+# CAROUSEL DATA - Top 10 Series with Poster URLs
+# ============================================================================
+CAROUSEL_SERIES = [
+{"name": "Stranger Things", "image": "https://mir-s3-cdn-cf.behance.net/project_modules/max_1200/479dc087874857.62b25a3de4723.jpg", "rating": "4.8"},
+{"name": "Money Heist", "image": "https://c7.alamy.com/comp/2BERHY0/poster-money-heist-part-4-2020-credit-netflix-the-hollywood-archive-2BERHY0.jpg", "rating": "4.7"},
+{"name": "Sacred Games", "image": "https://m.media-amazon.com/images/I/615QP26qFeL._AC_SL1500_.jpg", "rating": "4.6"},
+{"name": "Dark", "image": "https://m.media-amazon.com/images/I/A11DlZLBe7S._AC_SL1500_.jpg", "rating": "4.9"},
+{"name": "The Witcher", "image": "https://m.media-amazon.com/images/M/MV5BMDEwOWVlY2EtMWI0ZC00OWVmLWJmZGItYTk3YjYzN2Y0YmFkXkEyXkFqcGdeQXVyMTUzMTg2ODkz._V1_FMjpg_UX1000_.jpg", "rating": "4.5"},
+{"name": "Breaking Bad", "image": "https://m.media-amazon.com/images/M/MV5BYmQ4YWMxYjUtNjZmYi00MDQ1LWFjMjMtNjA5ZDdiYjdiODU5XkEyXkFqcGdeQXVyMTMzNDExODE5._V1_FMjpg_UX1000_.jpg", "rating": "5.0"},
+{"name": "Squid Game", "image": "https://m.media-amazon.com/images/M/MV5BYWE3MDVkN2EtNjQ5MS00ZDQ4LTliNzYtMjc2YWMzMDEwMTA3XkEyXkFqcGdeQXVyMTEzMTI1Mjk3._V1_FMjpg_UX1000_.jpg", "rating": "4.8"},
+{"name": "The Crown", "image": "https://images.squarespace-cdn.com/content/v1/670d2df8bf4f7719f5f20d98/145a5f2b-4c78-4957-a299-6ddd19920e83/Crowns5.jpg", "rating": "4.6"},
+{"name": "Narcos", "image": "https://c7.alamy.com/comp/PMAG6N/wagner-moura-stars-in-narcos-poster-PMAG6N.jpg", "rating": "4.7"},
+{"name": "Attack on Titan", "image": "https://m.media-amazon.com/images/I/61t9ie31jgL._AC_SL1001_.jpg", "rating": "4.9"},
+]
+
+# WEB SERIES CATALOG
+# ============================================================================
+CATALOG_PAGE_SIZE = 12  # four rows of three cards
+FACET_OPTION_LIMIT = 50  # most common values offered per facet, plus any selected
+
+# {clause}: rgc_search.series_name_filter()
+NAME_SEARCH_QUERY = "SELECT ws.SERIES_ID FROM RGC_WEB_SERIES ws WHERE {clause}"
+
+# {placeholders}: one %s per series on the page
+CATALOG_CARDS_QUERY = """
+    SELECT ws.SERIES_ID, ws.SERIES_NAME, ws.NUM_EPISODES, ph.HOUSE_NAME,
+           IF(ss.REVIEW_COUNT > 0, ss.AVG_RATING, NULL) as rating,
+           IFNULL(ss.EPISODE_COUNT, 0) as ep_count
+    FROM RGC_WEB_SERIES ws
+    JOIN RGC_PRODUCTION_HOUSE ph ON ws.HOUSE_ID = ph.HOUSE_ID
+    LEFT JOIN RGC_SERIES_STATS ss ON ws.SERIES_ID = ss.SERIES_ID
+    WHERE ws.SERIES_ID IN ({placeholders})
+"""
+
+# {placeholders} as above; the series IDs are passed once per branch
+CARD_DETAILS_QUERY = """
+    SELECT wst.SERIES_ID, 'genres' as kind, st.SERIES_TYPE_NAME as name
+    FROM RGC_WEB_SERIES_SERIES_TYPE wst
+    JOIN RGC_SERIES_TYPE st ON wst.SERIES_TYPE_ID = st.SERIES_TYPE_ID
+    WHERE wst.SERIES_ID IN ({placeholders})
+    UNION ALL
+    SELECT wsub.SERIES_ID, 'subtitles', sl.S_LANGUAGE_NAME
+    FROM RGC_WEBSERIES_SUBTITLE wsub
+    JOIN RGC_SUBTITLE_LANGUAGE sl ON wsub.S_LANGUAGE_ID = sl.S_LANGUAGE_ID
+    WHERE wsub.SERIES_ID IN ({placeholders})
+    UNION ALL
+    SELECT wdub.SERIES_ID, 'dubbings', dl.D_LANGUAGE_NAME
+    FROM RGC_WEBSERIES_DUBBING wdub
+    JOIN RGC_DUBBING_LANGUAGE dl ON wdub.D_LANGUAGE_ID = dl.D_LANGUAGE_ID
+    WHERE wdub.SERIES_ID IN ({placeholders})
+    ORDER BY name
+"""
+
+def name_search_query(search):
+    """(query, params) for the IDs of the series whose names match `search`"""
+    clause, params = series_name_filter(search)
+    return NAME_SEARCH_QUERY.format(clause=clause), tuple(params)
+
+def search_series_bitmap(index, search):
+    """Facet index bitmap of the series whose names match the catalog search box"""
+    rows = cached_query(*name_search_query(search)) or []
+    return index.bitmap_of([r['SERIES_ID'] for r in rows])
+
+def fetch_catalog_cards(series_ids):
+    """Card rows for one page of series, in the order given"""
+    if not series_ids:
+        return []
+    rows = cached_query(CATALOG_CARDS_QUERY.format(placeholders=in_placeholders(series_ids)),
+                        tuple(series_ids)) or []
+    by_id = {r['SERIES_ID']: r for r in rows}
+    return [by_id[sid] for sid in series_ids if sid in by_id]
+
+def facet_selections():
+    """{facet: selected values} from the filter widgets' session state"""
+    return {facet: list(st.session_state.get(f"facet_{facet}", [])) for facet in FACETS}
+
+def facet_options(index, facet, counts, selected):
+    """Values offered for one facet: the most common matches plus anything selected"""
+    facet_counts = counts[facet]
+    values = sorted(facet_counts, key=lambda v: -facet_counts[v])[:FACET_OPTION_LIMIT]
+    values += [v for v in selected if v not in values]
+    if facet in ('year', 'rating'):
+        return sorted(values, reverse=True)
+    return sorted(values, key=lambda v: index.label(facet, v).casefold())
+
+def show_facet_filters(index, selections, counts):
+    """Facet multiselects; each option shows how many series picking it would give"""
+    active = sum(len(values) for values in selections.values())
+    with st.expander(f"🎛️ Filters ({active} selected)" if active else "🎛️ Filters", expanded=bool(active)):
+        if active and st.button("Clear Filters", key="facet_clear"):
+            for facet in FACETS:
+                st.session_state[f"facet_{facet}"] = []
+            st.rerun()
+        
+        cols = st.columns(4)
+        for i, facet in enumerate(FACETS):
+            key = f"facet_{facet}"
+            options = facet_options(index, facet, counts, selections[facet])
+            # Labels carry live counts, so the options change between runs;
+            # setting the state keeps the selection across that
+            st.session_state[key] = selections[facet]
+            with cols[i % 4]:
+                st.multiselect(FACET_LABELS[facet], options, key=key,
+                               format_func=lambda v, f=facet: f"{index.label(f, v)} ({counts[f].get(v, 0)})")
+
+def fetch_series_languages_and_genres(series_ids):
+    """Genres, subtitles and dubbings for the given series in one round trip"""
+    details = {sid: {'genres': [], 'subtitles': [], 'dubbings': []} for sid in series_ids}
+    if not series_ids:
+        return details
+    
+    rows = cached_query(CARD_DETAILS_QUERY.format(placeholders=in_placeholders(series_ids)),
+                        tuple(series_ids) * 3) or []
+    
+    for row in rows:
+        details[row['SERIES_ID']][row['kind']].append(row['name'])
+    return details
+
+def show_search_matches(search):
+    """Episodes, cast & crew and reviews matching the catalog search box"""
+    results = search_all(search)
+    sections = [("📺 Episodes", 'episodes'), ("🎭 Cast & Crew", 'people'), ("💬 Reviews", 'reviews')]
+    found = sum(len(results[kind]) for _, kind in sections)
+    if not found:
+        return
+    
+    with st.expander(f"Also matching \"{search}\": {found} episodes, people and reviews"):
+        tabs = st.tabs([f"{label} ({len(results[kind])})" for label, kind in sections])
+        for tab, (_, kind) in zip(tabs, sections):
+            with tab:
+                for r in results[kind]:
+                    col1, col2 = st.columns([4, 1])
+                    with col1:
+                        if kind == 'reviews':
+                            st.markdown(f"{'⭐' * int(r['detail'] or 0)} *{r['title']}*  \n"
+                                        f"<small>{r['series_name']}</small>", unsafe_allow_html=True)
+                        else:
+                            detail = f" · {r['detail']}" if r['detail'] else ""
+                            st.markdown(f"**{r['title']}**{detail}  \n"
+                                        f"<small>{r['series_name'] or 'No series'}</small>", unsafe_allow_html=True)
+                    with col2:
+                        if r['series_id'] and st.button("View Series", key=f"search_{kind}_{r['item_id']}"):
+                            st.session_state.selected_series = r['series_id']
+                            st.rerun()
+
+def show_catalog():
+    st.title("🎬 Web Series Catalog")
+    
+    # CAROUSEL - Convert images to file:// URLs for proper rendering
+    carousel_html = '<div class="carousel-container"><div class="carousel-track">'
+    for _ in range(2):  # Duplicate for seamless loop
+        for item in CAROUSEL_SERIES:
+            # Convert relative path to absolute file:// URL
+                image_path = item["image"]            
+                carousel_html += (
+                f'<div class="carousel-item">'
+                f'<img src="{image_path}" alt="{item["name"]}">'
+                f'<div class="carousel-overlay">'
+                f'<div class="carousel-title">{item["name"]}</div>'
+                f'<div style="color: #9933ff; font-weight: bold;">⭐ {item["rating"]}/5.0</div>'
+                f'</div></div>'
+            )
+    carousel_html += '</div></div>'
+    st.markdown(carousel_html, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Search, sort and facet filters
+    col1, col2 = st.columns([4, 1])
+    with col1:
+        search = st.text_input("🔍 Search", placeholder="Series, episodes, cast or reviews...", key="search_box")
+    with col2:
+        sort_opt = st.selectbox("Sort", SORTS)
+    
+    index = facet_index()
+    if index is None:
+        return
+    selections = facet_selections()
+    within = search_series_bitmap(index, search) if search else None
+    matched, counts = index.search(selections, within)
+    show_facet_filters(index, selections, counts)
+    
+    # Keyset pagination on (sort key, SERIES_ID): each page starts after the
+    # last series of the one before, so a series added or removed between
+    # clicks never shifts a page. catalog_cursors holds the cursor of every
+    # page up to the current one for "Previous"; changing any filter starts
+    # again from the first page.
+    filter_key = (search, sort_opt, tuple(tuple(selections[facet]) for facet in FACETS))
+    if st.session_state.get('catalog_filter_key') != filter_key:
+        st.session_state.catalog_filter_key = filter_key
+        st.session_state.catalog_cursors = [None]
+    cursors = st.session_state.catalog_cursors
+    total = popcount(matched)
+    
+    if search:
+        show_search_matches(search)
+    
+    page_ids, last_key, before = index.page(matched, sort_opt, cursors[-1], CATALOG_PAGE_SIZE)
+    series = fetch_catalog_cards(page_ids)
+    
+    if series:
+        first = before + 1
+        st.write(f"**Found {total} series** (showing {first}-{first + len(series) - 1})")
+        
+        details = fetch_series_languages_and_genres([s['SERIES_ID'] for s in series])
+        
+        for i in range(0, len(series), 3):
+            cols = st.columns(3)
+            for j, col in enumerate(cols):
+                if i + j < len(series):
+                    s = series[i + j]
+                    d = details[s['SERIES_ID']]
+                    with col:
+                        # Language badges
+                        lang_badges = ""
+                        for lang in d['subtitles'][:3]:
+                            lang_badges += f'<span class="language-badge">SUB: {lang}</span>'
+                        for lang in d['dubbings'][:3]:
+                            lang_badges += f'<span class="language-badge">DUB: {lang}</span>'
+                        
+                        st.markdown(f"""
+                        <div class="series-card">
+                            <h3 style="color: #3895d3; margin-bottom: 0.5rem;">{s['SERIES_NAME']}</h3>
+                            <p style="color: #7dd3fc; font-size: 0.9rem; margin-bottom: 0.5rem;">
+                                {s['HOUSE_NAME']}
+                            </p>
+                            <p style="font-size: 0.85rem;">
+                                <strong>Episodes:</strong> {s['ep_count']}/{s['NUM_EPISODES']}<br>
+                                <strong>Genre:</strong> {','.join(d['genres']) if d['genres'] else 'N/A'}<br>
+                                <strong>Rating:</strong> {'⭐' * int(s['rating'] or 0)} {f"{s['rating']:.1f}" if s['rating'] else "No ratings"}
+                            </p>
+                            <div style="margin-top: 0.8rem;">{lang_badges}</div>
+                        </div>
+                        """, unsafe_allow_html=True)
+                        
+                        if st.button("View Details", key=f"view_{s['SERIES_ID']}"):
+                            st.session_state.selected_series = s['SERIES_ID']
+                            st.rerun()
+        
+        # Page navigation
+        nav1, nav2, nav3 = st.columns([1, 2, 1])
+        with nav1:
+            if len(cursors) > 1 and st.button("← Previous", key="catalog_prev", use_container_width=True):
+                cursors.pop()
+                st.rerun()
+        with nav2:
+            st.markdown(f'<p style="text-align: center;">Page {len(cursors)}</p>', unsafe_allow_html=True)
+        with nav3:
+            if before + len(page_ids) < total and st.button("Next →", key="catalog_next", use_container_width=True):
+                cursors.append(last_key)
+                st.rerun()
+    else:
+        st.info("No series found matching your criteria")
@@ -0,0 +1,83 @@
+"""
+RGC Stream - Shared page helpers
+Password hashing, input sanitizing, ID generation and the bulk action form
+used by several pages.
+"""
+
+import base64
+import hashlib
+import time
+
+import streamlit as st
+from mysql.connector import Error
+
+from rgc_db import execute_query, in_placeholders
+from rgc_ids import new_id
+
+def load_image_base64(image_path):
+    """Load local image and convert to base64 string for HTML embedding."""
+    try:
+        with open(image_path, "rb") as img_file:
+            return base64.b64encode(img_file.read()).decode()
+    except:
+        return None
+
+# ============================================================================
+# SECURITY FUNCTIONS
+# ============================================================================
+#password hashing
+def hash_password(password):
+    """Hash password using SHA-256 with salt"""
+    salt = "streamvault_salt_2025"
+    return hashlib.sha256(f"{password}{salt}".encode()).hexdigest()
+
+#second layer of defense against sql injections
+def sanitize_input(text):
+    """Sanitize user input to prevent XSS attacks"""
+    if not text:
+        return text
+    dangerous_chars = ['<', '>', '"', "'", '&', ';']
+    for char in dangerous_chars:
+        text = text.replace(char, '')
+    return text.strip()
+
+# ============================================================================
+# USER MANAGEMENT & AUTHENTICATION
+# ============================================================================
+def generate_id(table):
+    """New primary key for `table` from the shared ID allocator (None on failure)"""
+    try:
+        return new_id(table)
+    except Error as e:
+        st.error(f"ID Allocation Error: {e}")
+        return None
+
+def apply_bulk_action(action_sql, key_column, ids, extra_where=""):
+    """
+    Run one UPDATE/DELETE over every selected row in a single statement
+    `action_sql` is the statement head, e.g. "UPDATE RGC_CONTRACTS SET STATUS = 'ACTIVE'".
+    Returns the number of affected rows, or None on failure.
+    """
+    if not ids:
+        return 0
+    query = f"{action_sql} WHERE {key_column} IN ({in_placeholders(ids)}){extra_where}"
+    return execute_query(query, tuple(ids), commit=True)
+
+def show_bulk_actions(form_key, options, actions, label="Select rows"):
+    """
+    Multiselect + action form replacing per-row buttons
+    `options` maps display labels to row IDs, `actions` maps action names to
+    callables taking the selected IDs and returning affected rows (or None).
+    """
+    with st.form(form_key):
+        selected = st.multiselect(label, list(options.keys()))
+        action = st.radio("Action", list(actions.keys()), horizontal=True)
+        if st.form_submit_button("Apply to Selected", use_container_width=True):
+            if not selected:
+                st.warning("⚠️ Select at least one row")
+                return
+            affected = actions[action]([options[label] for label in selected])
+            if affected is not None:
+                st.success(f"✅ {action}: {affected} row(s) updated")
+                time.sleep(1)
+                st.rerun()
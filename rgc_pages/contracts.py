@@ -0,0 +1,84 @@
+"""
+RGC Stream - Contract queries shared by the producer portal and the admin panel
+"""
+
+from rgc_db import execute_query, in_placeholders
+
+# ============================================================================
+# CONTRACT MANAGEMENT FUNCTIONS - CORRECTED
+# ============================================================================
+def get_contract_analytics(house_id=None):
+    """Get contract analytics for dashboard"""
+    base_query = """
+        SELECT 
+            COUNT(*) as total_contracts,
+            SUM(CASE WHEN STATUS = 'ACTIVE' THEN 1 ELSE 0 END) as active_contracts,
+            SUM(CASE WHEN STATUS = 'PENDING' THEN 1 ELSE 0 END) as pending_contracts,
+            SUM(CASE WHEN STATUS = 'EXPIRED' THEN 1 ELSE 0 END) as expired_contracts,
+            SUM(IFNULL(CONTRACT_VALUE, 0)) as total_value,
+            SUM(CASE WHEN STATUS = 'ACTIVE' THEN IFNULL(CONTRACT_VALUE, 0) ELSE 0 END) as active_value
+        FROM RGC_CONTRACTS
+    """
+    
+    if house_id:
+        base_query += " WHERE HOUSE_ID = %s"
+        return execute_query(base_query, (house_id,))
+    return execute_query(base_query)
+
+CONTRACT_PAGE_SIZE = 100
+
+def contracts_query(status=None, contract_type=None, house_id=None, expiring_within=None,
+                    limit=CONTRACT_PAGE_SIZE):
+    """
+    (query, params) for the newest contracts matching the filters, each row
+    carrying the total match count
+    `expiring_within` (days) keeps ACTIVE contracts ending in that window, a
+    range read on the (STATUS, END_DATE) index kept current by rgc_maintenance.py
+    """
+    query = """
+        SELECT c.*, ws.SERIES_NAME, ph.HOUSE_NAME,
+               DATEDIFF(c.END_DATE, CURDATE()) as days_remaining,
+               COUNT(*) OVER () as total_matches
+        FROM RGC_CONTRACTS c
+        LEFT JOIN RGC_WEB_SERIES ws ON c.SERIES_ID = ws.SERIES_ID
+        LEFT JOIN RGC_PRODUCTION_HOUSE ph ON c.HOUSE_ID = ph.HOUSE_ID
+    """
+    where_clauses = []
+    params = []
+    if status:
+        where_clauses.append("c.STATUS = %s")
+        params.append(status)
+    if contract_type:
+        where_clauses.append("c.CONTRACT_TYPE = %s")
+        params.append(contract_type)
+    if house_id:
+        where_clauses.append("c.HOUSE_ID = %s")
+        params.append(house_id)
+    if expiring_within is not None:
+        where_clauses.append("c.STATUS = 'ACTIVE' AND c.END_DATE BETWEEN CURDATE() AND CURDATE() + INTERVAL %s DAY")
+        params.append(expiring_within)
+    if where_clauses:
+        query += " WHERE " + " AND ".join(where_clauses)
+    query += " ORDER BY c.CREATED_DATE DESC LIMIT %s"
+    params.append(limit)
+    return query, tuple(params)
+
+def get_contracts(status=None, contract_type=None, house_id=None, expiring_within=None,
+                  limit=CONTRACT_PAGE_SIZE):
+    """Newest contracts matching the filters; see contracts_query()"""
+    return execute_query(*contracts_query(status, contract_type, house_id, expiring_within, limit))
+
+def get_contract_payments(contract_ids):
+    """Payments for many contracts in one query, grouped as {contract_id: [payments]}"""
+    payments = {contract_id: [] for contract_id in contract_ids}
+    if not contract_ids:
+        return payments
+    rows = execute_query(f"""
+        SELECT CONTRACT_ID, PAYMENT_DATE, AMOUNT, PAYMENT_STATUS, PAYMENT_METHOD
+        FROM RGC_CONTRACT_PAYMENTS
+        WHERE CONTRACT_ID IN ({in_placeholders(contract_ids)})
+        ORDER BY PAYMENT_DATE DESC
+    """, tuple(contract_ids))
+    for row in rows or []:
+        payments[row['CONTRACT_ID']].append(row)
+    return payments
@@ -0,0 +1,186 @@
+"""
+RGC Stream - Analytics dashboard page
+"""
+
+import json
+
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from rgc_db import run_batch
+
+# ============================================================================
+# DASHBOARD - ANALYTICS & STATISTICS
+# ============================================================================
+DASHBOARD_KPI_QUERY = """
+    SELECT COUNT(*) as series_count,
+           COALESCE(SUM(ss.EPISODE_COUNT), 0) as episode_count,
+           SUM(ss.RATING_SUM) / NULLIF(SUM(ss.REVIEW_COUNT), 0) as avg_rating,
+           (SELECT COUNT(*) FROM RGC_VIEWER) as viewer_count
+           {contracts}
+    FROM RGC_SERIES_STATS ss
+"""
+
+# Active contracts ending in the next 30 days, folded into the KPI row as JSON
+DASHBOARD_EXPIRING_COLUMN = """,
+           (SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                       'CONTRACT_ID', c.CONTRACT_ID,
+                       'SERIES_NAME', ws.SERIES_NAME,
+                       'days_left', DATEDIFF(c.END_DATE, CURDATE())))
+            FROM RGC_CONTRACTS c
+            LEFT JOIN RGC_WEB_SERIES ws ON c.SERIES_ID = ws.SERIES_ID
+            WHERE c.STATUS = 'ACTIVE'
+            AND c.END_DATE BETWEEN CURDATE() AND CURDATE() + INTERVAL 30 DAY) as expiring
+"""
+
+def dashboard_kpi_query(include_contracts):
+    """All dashboard header cards (and the expiry warning) in one statement"""
+    return DASHBOARD_KPI_QUERY.format(
+        contracts=DASHBOARD_EXPIRING_COLUMN if include_contracts else "")
+
+def parse_dashboard_kpis(result):
+    """KPI row as a dict with the expiring contracts decoded and sorted"""
+    if not result:
+        return None
+    
+    kpis = dict(result[0])
+    expiring = json.loads(kpis.get('expiring') or '[]')
+    kpis['expiring'] = sorted(expiring, key=lambda e: e['days_left'])
+    return kpis
+
+def _render_genre_tab(df):
+    fig = px.bar(df, x='genre', y='count', 
+                title='Web Series Distribution by Genre',
+                color='count', color_continuous_scale='Blues')
+    fig.update_layout(plot_bgcolor='#0a1628', paper_bgcolor='#0a1628', 
+                    font_color='#e5e5e5')
+    st.plotly_chart(fig, use_container_width=True)
+
+def _render_geography_tab(df):
+    fig = px.pie(df, values='viewers', names='country',
+                title='Global Viewer Distribution (Top 10)',
+                color_discrete_sequence=px.colors.sequential.Blues_r)
+    fig.update_layout(plot_bgcolor='#0a1628', paper_bgcolor='#0a1628',
+                    font_color='#e5e5e5')
+    st.plotly_chart(fig, use_container_width=True)
+
+def _render_top_rated_tab(df):
+    fig = px.bar(df, x='series', y='rating', hover_data=['reviews'],
+                title='Top 10 Highest Rated Series',
+                color='rating', color_continuous_scale='Purples')
+    fig.update_layout(plot_bgcolor='#0a1628', paper_bgcolor='#0a1628',
+                    font_color="#e5e5e5", xaxis_tickangle=-45)
+    st.plotly_chart(fig, use_container_width=True)
+
+def _render_production_tab(df):
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=df['house'],
+        y=df['total_viewers'],
+        name='Total Views',
+        marker_color='#3895d3',
+        hovertemplate='<b>%{x}</b><br>Views: %{y:,.0f}<extra></extra>'
+    ))
+    fig.update_layout(
+        title='Top Production Houses by Total Viewership',
+        plot_bgcolor='#141414',
+        paper_bgcolor='#141414',
+        font_color='#e5e5e5',
+        xaxis_tickangle=-45
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+GENRE_CHART_QUERY = """
+    SELECT st.SERIES_TYPE_NAME as genre, COUNT(*) as count
+    FROM RGC_WEB_SERIES_SERIES_TYPE wst
+    JOIN RGC_SERIES_TYPE st ON wst.SERIES_TYPE_ID = st.SERIES_TYPE_ID
+    GROUP BY genre ORDER BY count DESC
+"""
+
+GEOGRAPHY_CHART_QUERY = """
+    SELECT c.COUNTRY_NAME as country, COUNT(*) as viewers
+    FROM RGC_VIEWER v
+    JOIN RGC_COUNTRY c ON v.COUNTRY_CODE = c.COUNTRY_CODE
+    GROUP BY country ORDER BY viewers DESC LIMIT 10
+"""
+
+TOP_RATED_CHART_QUERY = """
+    SELECT ws.SERIES_NAME as series, ss.AVG_RATING as rating,
+           ss.REVIEW_COUNT as reviews
+    FROM RGC_SERIES_STATS ss
+    JOIN RGC_WEB_SERIES ws ON ss.SERIES_ID = ws.SERIES_ID
+    WHERE ss.REVIEW_COUNT > 0
+    ORDER BY ss.AVG_RATING DESC LIMIT 10
+"""
+
+PRODUCTION_CHART_QUERY = """
+    SELECT ph.HOUSE_NAME as house,
+           COUNT(*) as series_count,
+           COALESCE(SUM(ss.TOTAL_VIEWERS), 0) as total_viewers
+    FROM RGC_PRODUCTION_HOUSE ph
+    JOIN RGC_WEB_SERIES ws ON ph.HOUSE_ID = ws.HOUSE_ID
+    LEFT JOIN RGC_SERIES_STATS ss ON ws.SERIES_ID = ss.SERIES_ID
+    GROUP BY ph.HOUSE_ID, ph.HOUSE_NAME
+    ORDER BY total_viewers DESC LIMIT 10
+"""
+
+# tab label -> (subheader, chart query, renderer, empty message)
+DASHBOARD_TABS = {
+    "📈 Genre Distribution": ("Series by Genre", GENRE_CHART_QUERY,
+                              _render_genre_tab, "No genre data available"),
+    "🌍 Geographic Reach": ("Viewer Distribution by Country", GEOGRAPHY_CHART_QUERY,
+                           _render_geography_tab, "No viewer data available"),
+    "⭐ Top Rated": ("Top Rated Series", TOP_RATED_CHART_QUERY,
+                    _render_top_rated_tab, "No rating data available"),
+    "🎬 Production Analytics": ("Production House Performance", PRODUCTION_CHART_QUERY,
+                               _render_production_tab, "No production data available"),
+}
+
+def show_dashboard():
+    """Analytics dashboard with visualizations"""
+    st.title("📊 Analytics Dashboard")
+    st.write(f"Welcome, **{st.session_state.username}** ({st.session_state.user_type})")
+    
+    show_contracts = st.session_state.user_type in ['PRODUCER', 'ADMIN']
+    selected_tab = st.session_state.get("dashboard_tab", next(iter(DASHBOARD_TABS)))
+    subheader, chart_query, render, empty_message = DASHBOARD_TABS[selected_tab]
+    
+    # Header cards and the selected chart load concurrently
+    results = run_batch({
+        'kpis': (dashboard_kpi_query(show_contracts), None),
+        'chart': (chart_query, None),
+    }, cached=True, frames=('chart',))
+    kpis = parse_dashboard_kpis(results['kpis']) or {}
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Series", kpis.get('series_count', 0), delta="Active")
+    with col2:
+        st.metric("Total Episodes", kpis.get('episode_count', 0))
+    with col3:
+        st.metric("Viewers", kpis.get('viewer_count', 0))
+    with col4:
+        st.metric("Avg Rating", f"{kpis.get('avg_rating') or 0:.2f}⭐")
+    
+    st.markdown("---")
+
+    # Contract Expiry Warnings (for Producers/Admins)
+    expiring = kpis.get('expiring')
+    if show_contracts and expiring:
+        st.warning(f"⚠️ {len(expiring)} contract(s) expiring within 30 days!")
+        with st.expander("View Expiring Contracts"):
+            for e in expiring:
+                days = e['days_left']
+                color = "🔴" if days < 7 else "🟡"
+                st.write(f"{color} **{e['CONTRACT_ID']}** - {e['SERIES_NAME'] or 'N/A'} - Expires in {days} days")
+    
+    # A radio instead of st.tabs: st.tabs renders every tab body on each rerun,
+    # so only the selected chart's query runs here
+    st.radio("Dashboard view", list(DASHBOARD_TABS.keys()), horizontal=True,
+             key="dashboard_tab", label_visibility="collapsed")
+    st.subheader(subheader)
+    if results['chart'] is not None and not results['chart'].empty:
+        render(results['chart'])
+    else:
+        st.info(empty_message)
@@ -0,0 +1,73 @@
+"""
+RGC Stream - Feedback and reviews page
+"""
+
+import time
+from datetime import date
+
+import streamlit as st
+
+from rgc_db import execute_query
+from rgc_lookup import lookup_select
+from rgc_pages.common import generate_id
+
+# FEEDBACK MANAGEMENT
+# ============================================================================
+RECENT_REVIEWS_QUERY = """
+    SELECT f.*, ws.SERIES_NAME, 
+           COALESCE(v.ACC_FNAME, 'Anonymous') as fname,
+           COALESCE(v.ACC_LNAME, '') as lname
+    FROM RGC_FEEDBACK f
+    JOIN RGC_WEB_SERIES ws ON f.SERIES_ID = ws.SERIES_ID
+    LEFT JOIN RGC_VIEWER v ON f.ACCOUNT_ID = v.ACCOUNT_ID
+    ORDER BY f.FEEDBACK_DATE DESC
+    LIMIT 20
+"""
+
+def show_feedback():
+    """View and submit feedback"""
+    st.title("💬 Feedback & Reviews")
+    
+    tab1, tab2 = st.tabs(["📖 View Reviews", "✏️ Submit Review"])
+    
+    with tab1:
+        st.subheader("Recent Reviews")
+        reviews = execute_query(RECENT_REVIEWS_QUERY)
+        
+        if reviews:
+            for r in reviews:
+                name = f"{r['fname']} {r['lname']}".strip()
+                with st.expander(f"{r['SERIES_NAME']} - ⭐{r['RATING']}/5 by {name}"):
+                    st.write(f"**Date:** {r['FEEDBACK_DATE']}")
+                    st.write(f"**Review:** {r['FEEDBACK_TEXT']}")
+        else:
+            st.info("No reviews yet")
+    
+    with tab2:
+        st.subheader("Submit Your Review")
+        series_id = lookup_select("Select Series", 'series', key="feedback_series")
+        with st.form("feedback_form"):
+            rating = st.slider("Rating", 1, 5, 3)
+            feedback_text = st.text_area("Your Review", placeholder="Share your thoughts...")
+            
+            submit = st.form_submit_button("Submit Review", use_container_width=True)
+            
+            if submit and series_id:
+                if not feedback_text.strip():
+                    st.warning("⚠️ Please write a review")
+                else:
+                    feedback_id = generate_id('RGC_FEEDBACK')
+                    account_id = st.session_state.linked_account or 'A001'
+                    
+                    query = """
+                    INSERT INTO RGC_FEEDBACK 
+                    (FEEDBACK_ID, ACCOUNT_ID, SERIES_ID, RATING, FEEDBACK_TEXT, FEEDBACK_DATE)
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                    """
+                    if feedback_id and execute_query(query, (feedback_id, account_id, series_id, 
+                                           rating, feedback_text, date.today()), commit=True):
+                        st.success("✅ Review submitted successfully!")
+                        time.sleep(1)
+                        st.rerun()
+                    else:
+                        st.error("❌ Failed to submit review")
@@ -0,0 +1,185 @@
+"""
+RGC Stream - Producer portal: contract overview, contracts and payments
+"""
+
+from datetime import date
+
+import pandas as pd
+import streamlit as st
+
+from rgc_db import execute_query, execute_query_frame, run_batch
+
+# PRODUCER DASHBOARD - CORRECTED AND ENHANCED
+# ============================================================================
+# Overview cards, run as one batch
+OVERVIEW_QUERIES = {
+    'contracts': "SELECT COUNT(*) as c FROM RGC_CONTRACTS WHERE STATUS = 'ACTIVE'",
+    'value': "SELECT SUM(CONTRACT_VALUE) as v FROM RGC_CONTRACTS WHERE STATUS = 'ACTIVE'",
+    'pending': """
+        SELECT SUM(AMOUNT) as total FROM RGC_CONTRACT_PAYMENTS 
+        WHERE PAYMENT_STATUS = 'PENDING'
+    """,
+    'overdue': """
+        SELECT COUNT(*) as c FROM RGC_CONTRACT_PAYMENTS 
+        WHERE PAYMENT_STATUS = 'OVERDUE'
+    """,
+}
+
+PRODUCER_CONTRACT_PAGE_SIZE = 25
+CONTRACT_STATUSES = ["ACTIVE", "PENDING", "EXPIRED", "TERMINATED"]
+# label -> days; None keeps every END_DATE (including open-ended contracts)
+ENDING_WITHIN = {"Any time": None, "30 days": 30, "90 days": 90, "1 year": 365}
+
+def producer_contracts_filter(status, ending_within=None):
+    """
+    (WHERE clause, params) on the (STATUS, END_DATE) index kept current by
+    rgc_maintenance.py; `ending_within` (days) keeps contracts ending in that window
+    """
+    where = "c.STATUS = %s"
+    params = [status]
+    if ending_within is not None:
+        where += " AND c.END_DATE BETWEEN CURDATE() AND CURDATE() + INTERVAL %s DAY"
+        params.append(ending_within)
+    return where, params
+
+def producer_contracts_query(status, ending_within=None, page=1,
+                             page_size=PRODUCER_CONTRACT_PAGE_SIZE):
+    """(query, params) for one page of contracts by END_DATE, soonest ending first"""
+    where, params = producer_contracts_filter(status, ending_within)
+    query = f"""
+        SELECT c.*, ws.SERIES_NAME, ph.HOUSE_NAME
+        FROM RGC_CONTRACTS c
+        LEFT JOIN RGC_WEB_SERIES ws ON c.SERIES_ID = ws.SERIES_ID
+        LEFT JOIN RGC_PRODUCTION_HOUSE ph ON c.HOUSE_ID = ph.HOUSE_ID
+        WHERE {where}
+        ORDER BY c.END_DATE, c.CONTRACT_ID
+        LIMIT %s OFFSET %s
+    """
+    return query, tuple(params + [page_size, (page - 1) * page_size])
+
+def producer_contracts_count_query(status, ending_within=None):
+    """(query, params) counting the matches from the index alone"""
+    where, params = producer_contracts_filter(status, ending_within)
+    return f"SELECT COUNT(*) as total FROM RGC_CONTRACTS c WHERE {where}", tuple(params)
+
+PRODUCER_PAYMENTS_QUERY = """
+    SELECT p.*, c.CONTRACT_ID, ws.SERIES_NAME
+    FROM RGC_CONTRACT_PAYMENTS p
+    JOIN RGC_CONTRACTS c ON p.CONTRACT_ID = c.CONTRACT_ID
+    LEFT JOIN RGC_WEB_SERIES ws ON c.SERIES_ID = ws.SERIES_ID
+    ORDER BY p.PAYMENT_DATE DESC
+    LIMIT 50
+"""
+
+def show_producer_dashboard():
+    """Producer-specific dashboard with contract and series management"""
+    st.title("🎬 Producer Dashboard")
+    st.write(f"Welcome, **{st.session_state.username}**")
+    
+    tab1, tab2, tab3 = st.tabs(["📊 Overview", "📜 My Contracts", "💰 Payments"])
+    
+    with tab1:
+        st.subheader("Production Overview")
+        
+        overview = run_batch({name: (query, None) for name, query in OVERVIEW_QUERIES.items()})
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            contracts = overview['contracts']
+            count = contracts[0]['c'] if contracts and contracts[0]['c'] is not None else 0
+            st.metric("Active Contracts", count)
+        
+        with col2:
+            value = overview['value']
+            val = value[0]['v'] if value and value[0]['v'] is not None else 0
+            st.metric("Active Contract Value", f"${val:,.2f}")
+        
+        with col3:
+            pending_payments = overview['pending']
+            pending = pending_payments[0]['total'] if pending_payments and pending_payments[0]['total'] is not None else 0
+            st.metric("Pending Payments", f"${pending:,.2f}")
+        
+        with col4:
+            overdue = overview['overdue']
+            overdue_count = overdue[0]['c'] if overdue and overdue[0]['c'] is not None else 0
+            delta_text = "⚠️" if overdue_count > 0 else None
+            st.metric("Overdue Payments", overdue_count, delta=delta_text)
+    
+    with tab2:
+        st.subheader("Contract Management")
+        show_producer_contracts()
+    
+    with tab3:
+        st.subheader("Payment Tracking")
+        show_producer_payments()
+
+def show_producer_contracts():
+    """Show contracts for producers, one status and END_DATE window at a time"""
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        status = st.selectbox("Status", CONTRACT_STATUSES, key="producer_contract_status")
+    with col2:
+        ending = st.selectbox("Ending Within", list(ENDING_WITHIN), key="producer_contract_ending")
+    ending_within = ENDING_WITHIN[ending]
+    
+    total = execute_query(*producer_contracts_count_query(status, ending_within))
+    total = total[0]['total'] if total else 0
+    pages = max(1, -(-total // PRODUCER_CONTRACT_PAGE_SIZE))
+    with col3:
+        page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1,
+                               key="producer_contract_page")
+    contracts = execute_query(*producer_contracts_query(status, ending_within, page))
+    
+    if contracts:
+        st.caption(f"{total:,} contracts")
+        today = date.today()
+        for c in contracts:
+            days_remaining = (c['END_DATE'] - today).days if c['END_DATE'] else None
+            status_emoji = {'ACTIVE': '🟢', 'PENDING': '🟡', 'EXPIRED': '🔴', 'TERMINATED': '⚫'}.get(c['STATUS'], '⚪')
+            
+            series_name = c['SERIES_NAME'] if c['SERIES_NAME'] else 'General Contract'
+            contract_val = c['CONTRACT_VALUE'] if c['CONTRACT_VALUE'] is not None else 0
+            
+            with st.expander(f"{status_emoji} {c['CONTRACT_ID']} - {series_name} - ${contract_val:,.2f}"):
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write(f"**Type:** {c['CONTRACT_TYPE']}")
+                    st.write(f"**Status:** {c['STATUS']}")
+                    st.write(f"**House:** {c['HOUSE_NAME'] or 'N/A'}")
+                with col2:
+                    st.write(f"**Start:** {c['START_DATE']}")
+                    st.write(f"**End:** {c['END_DATE'] or 'Ongoing'}")
+                    if days_remaining and days_remaining < 30 and c['STATUS'] == 'ACTIVE':
+                        st.warning(f"⚠️ Expires in {days_remaining} days")
+    else:
+        st.info("No contracts found")
+
+def show_producer_payments():
+    """Show payment tracking for producers"""
+    df = execute_query_frame(PRODUCER_PAYMENTS_QUERY)
+    
+    if df is not None and not df.empty:
+        
+        # Summary metrics
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            total_completed = df[df['PAYMENT_STATUS'] == 'COMPLETED']['AMOUNT'].sum()
+            st.metric("Completed Payments", f"${total_completed:,.2f}")
+        with col2:
+            total_pending = df[df['PAYMENT_STATUS'] == 'PENDING']['AMOUNT'].sum()
+            st.metric("Pending", f"${total_pending:,.2f}")
+        with col3:
+            total_overdue = df[df['PAYMENT_STATUS'] == 'OVERDUE']['AMOUNT'].sum()
+            st.metric("Overdue", f"${total_overdue:,.2f}")
+        
+        st.markdown("---")
+        
+        # Payment table
+        display_df = df[['PAYMENT_DATE', 'SERIES_NAME', 'AMOUNT', 'PAYMENT_STATUS', 'PAYMENT_METHOD']].copy()
+        display_df.columns = ['Date', 'Series', 'Amount', 'Status', 'Method']
+        display_df['Date'] = display_df['Date'].dt.date
+        display_df['Amount'] = display_df['Amount'].apply(lambda x: f"${x:,.2f}" if pd.notna(x) else "$0.00")
+        display_df['Series'] = display_df['Series'].fillna('General')
+        st.dataframe(display_df, use_container_width=True)
+    else:
+        st.info("No payment records found")
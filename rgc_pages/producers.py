@@ -0,0 +1,117 @@
+"""
+RGC Stream - Producer management page
+"""
+
+import time
+
+import streamlit as st
+
+from rgc_db import execute_query
+from rgc_pages.common import generate_id
+
+# PRODUCER MANAGEMENT
+# ============================================================================
+def show_producers():
+    """Manage producers"""
+    st.title("🎥 Producer Management")
+    
+    tab1, tab2 = st.tabs(["📋 Producer List", "➕ Add Producer"])
+    
+    with tab1:
+        st.subheader("All Producers")
+        
+        producers = execute_query("""
+            SELECT p.*,
+                   COUNT(DISTINCT c.CONTRACT_ID) as contract_count,
+                   SUM(c.CONTRACT_VALUE) as total_contract_value
+            FROM RGC_PRODUCERS p
+            LEFT JOIN RGC_PRODUCTION_HOUSE ph ON p.COMPANY_NAME = ph.HOUSE_NAME
+            LEFT JOIN RGC_CONTRACTS c ON ph.HOUSE_ID = c.HOUSE_ID
+            GROUP BY p.PRODUCER_ID
+            ORDER BY p.PRODUCER_NAME
+        """)
+        
+        if producers:
+            for prod in producers:
+                status_emoji = '🟢' if prod['STATUS'] == 'ACTIVE' else '🔴'
+                
+                with st.expander(f"{status_emoji} {prod['PRODUCER_NAME']} - {prod['COMPANY_NAME'] or 'Independent'}"):
+                    col1, col2, col3 = st.columns(3)
+                    
+                    with col1:
+                        st.write(f"**Producer ID:** {prod['PRODUCER_ID']}")
+                        st.write(f"**Email:** {prod['EMAIL'] or 'N/A'}")
+                        st.write(f"**Phone:** {prod['PHONE'] or 'N/A'}")
+                    
+                    with col2:
+                        st.write(f"**Company:** {prod['COMPANY_NAME'] or 'Independent'}")
+                        st.write(f"**Specialization:** {prod['SPECIALIZATION'] or 'N/A'}")
+                        st.write(f"**Experience:** {prod['YEARS_EXPERIENCE'] or 0} years")
+                    
+                    with col3:
+                        st.metric("Contracts", prod['contract_count'] or 0)
+                        st.metric("Total Value", f"${prod['total_contract_value'] or 0:,.2f}")
+                        st.write(f"**Status:** {prod['STATUS']}")
+                    
+                    if prod['ADDRESS']:
+                        st.write(f"**Address:** {prod['ADDRESS']}")
+                    
+                    # Actions
+                    act_col1, act_col2 = st.columns(2)
+                    with act_col1:
+                        if st.button("🗑️ Delete", key=f"del_prod_{prod['PRODUCER_ID']}"):
+                            if execute_query("DELETE FROM RGC_PRODUCERS WHERE PRODUCER_ID = %s",
+                                           (prod['PRODUCER_ID'],), commit=True):
+                                st.success("✅ Producer deleted!")
+                                time.sleep(1)
+                                st.rerun()
+                    
+                    with act_col2:
+                        new_status = 'INACTIVE' if prod['STATUS'] == 'ACTIVE' else 'ACTIVE'
+                        if st.button(f"Toggle Status", key=f"toggle_{prod['PRODUCER_ID']}"):
+                            if execute_query("UPDATE RGC_PRODUCERS SET STATUS = %s WHERE PRODUCER_ID = %s",
+                                           (new_status, prod['PRODUCER_ID']), commit=True):
+                                st.success(f"✅ Status changed to {new_status}!")
+                                time.sleep(1)
+                                st.rerun()
+        else:
+            st.info("No producers found")
+    
+    with tab2:
+        st.subheader("Add New Producer")
+        
+        with st.form("add_producer"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                prod_id = st.text_input("Producer ID", placeholder="Leave blank to auto-generate")
+                prod_name = st.text_input("Producer Name *")
+                email = st.text_input("Email")
+                phone = st.text_input("Phone")
+            
+            with col2:
+                company = st.text_input("Company Name")
+                specialization = st.text_input("Specialization", placeholder="e.g., Drama, Action")
+                years_exp = st.number_input("Years of Experience", min_value=0, max_value=50, value=0)
+                status = st.selectbox("Status", ["ACTIVE", "INACTIVE"])
+            
+            address = st.text_area("Address")
+            
+            if st.form_submit_button("Add Producer", use_container_width=True):
+                if prod_name:
+                    prod_id = prod_id.strip() or generate_id('RGC_PRODUCERS')
+                    query = """
+                    INSERT INTO RGC_PRODUCERS 
+                    (PRODUCER_ID, PRODUCER_NAME, EMAIL, PHONE, COMPANY_NAME, 
+                     ADDRESS, SPECIALIZATION, YEARS_EXPERIENCE, STATUS)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    """
+                    if prod_id and execute_query(query, (prod_id, prod_name, email, phone, company,
+                                           address, specialization, years_exp, status), commit=True):
+                        st.success("✅ Producer added successfully!")
+                        time.sleep(1)
+                        st.rerun()
+                    else:
+                        st.error("❌ Failed to add producer")
+                else:
+                    st.warning("⚠️ Please fill in required fields (Name)")
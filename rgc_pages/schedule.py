@@ -0,0 +1,324 @@
+"""
+RGC Stream - Airing schedule management page
+"""
+
+import time
+from datetime import datetime, date, timedelta
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from rgc_db import execute_query, execute_query_frame
+from rgc_lookup import lookup_select
+from rgc_pages.common import generate_id, show_bulk_actions
+from rgc_season import (MAX_SEASON_EPISODES, MAX_TITLE_LEN, WEEKDAYS, airing_times,
+                        plan_conflicts, plan_season, schedule_season)
+from rgc_schedule_index import (FREE_SLOT_HORIZON_DAYS, MAX_SLOT_MINUTES, Slot, add_schedule,
+                                delete_schedules, schedule_index)
+
+# ENHANCED SCHEDULE MANAGEMENT - CORRECTED
+# ============================================================================
+def show_schedule_management():
+    """Enhanced airing schedule management"""
+    st.title("📅 Airing Schedule Management")
+    
+    tab1, tab2, tab3 = st.tabs(["📋 Current Schedule", "➕ Add Schedule", "🗓️ Plan Season"])
+    
+    with tab1:
+        st.subheader("Airing Schedule")
+        
+        # Filter options
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            date_filter = st.date_input("Filter by Date", value=date.today())
+        with col2:
+            series_filter = lookup_select("Filter by Series", 'series', key="schedule_series_filter",
+                                          empty_option="All Series")
+        with col3:
+            status_filter = st.selectbox("Status", ["All", "Upcoming", "Aired", "Today"])
+        
+        # Build query - CORRECTED COLUMN NAMES
+        base_query = """
+            SELECT sch.*, e.EPISODE_TITLE, ws.SERIES_NAME, p.PLATFORM_NAME,
+                   DATE(sch.START_TS) as air_date,
+                   TIME(sch.START_TS) as air_time
+            FROM RGC_AIRING_SCHEDULE sch
+            JOIN RGC_EPISODE e ON sch.EPISODE_ID = e.EPISODE_ID
+            JOIN RGC_WEB_SERIES ws ON e.SERIES_ID = ws.SERIES_ID
+            LEFT JOIN RGC_PLATFORM p ON sch.PLATFORM_ID = p.PLATFORM_ID
+        """
+        
+        where_clauses = []
+        params = []
+        
+        if status_filter == "Today":
+            where_clauses.append("DATE(sch.START_TS) = CURDATE()")
+        elif status_filter == "Upcoming":
+            where_clauses.append("sch.START_TS > NOW()")
+        elif status_filter == "Aired":
+            where_clauses.append("sch.START_TS < NOW()")
+        
+        if series_filter:
+            where_clauses.append("e.SERIES_ID = %s")
+            params.append(series_filter)
+        
+        if where_clauses:
+            base_query += " WHERE " + " AND ".join(where_clauses)
+        
+        base_query += " ORDER BY sch.START_TS DESC LIMIT 50"
+        
+        schedules = execute_query(base_query, tuple(params) if params else None)
+        
+        if schedules:
+            st.write(f"**Showing {len(schedules)} schedule entries**")
+            
+            for sch in schedules:
+                air_datetime = sch['START_TS']
+                is_upcoming = air_datetime > datetime.now()
+                status_emoji = '🔜' if is_upcoming else '✅'
+                
+                platform_name = sch.get('PLATFORM_NAME') or 'Not Specified'
+                
+                with st.expander(f"{status_emoji} {sch['SERIES_NAME']} - {sch['EPISODE_TITLE']} - {air_datetime.strftime('%Y-%m-%d %H:%M')}"):
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.write(f"**Schedule ID:** {sch['AIRING_SCHEDULE_ID']}")
+                        st.write(f"**Series:** {sch['SERIES_NAME']}")
+                        st.write(f"**Episode:** {sch['EPISODE_TITLE']}")
+                        st.write(f"**Platform:** {platform_name}")
+                    
+                    with col2:
+                        st.write(f"**Air Date:** {sch['air_date']}")
+                        st.write(f"**Air Time:** {sch['air_time']}")
+                        st.write(f"**Status:** {'Upcoming' if is_upcoming else 'Aired'}")
+                        
+                        if is_upcoming:
+                            time_until = air_datetime - datetime.now()
+                            days = time_until.days
+                            hours = time_until.seconds // 3600
+                            st.info(f"⏰ Airs in {days} days, {hours} hours")
+            
+            # Bulk actions
+            st.markdown("**Bulk Actions**")
+            show_bulk_actions(
+                "schedule_bulk_actions",
+                {f"{sch['AIRING_SCHEDULE_ID']} - {sch['SERIES_NAME']} - {sch['START_TS'].strftime('%Y-%m-%d %H:%M')}": sch['AIRING_SCHEDULE_ID']
+                 for sch in schedules},
+                {
+                    "🗑️ Delete Schedule": delete_schedules,
+                },
+                label="Schedule entries")
+        else:
+            st.info("No schedules found")
+    
+    with tab2:
+        st.subheader("Add New Schedule")
+        
+        # Pickers outside the form so the episode list follows the chosen series
+        col1, col2 = st.columns(2)
+        with col1:
+            series_id = lookup_select("Series", 'series', key="schedule_add_series")
+        with col2:
+            platform_id = lookup_select("Platform", 'platform', key="schedule_add_platform")
+        
+        if platform_id:
+            with st.expander("🔎 Find Next Free Slot"):
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    search_date = st.date_input("From Date", value=date.today(), key="free_slot_date")
+                with col2:
+                    search_time = st.time_input("From Time", value=datetime.now().time(), key="free_slot_time")
+                with col3:
+                    search_minutes = st.number_input("Length (minutes)", min_value=10, max_value=MAX_SLOT_MINUTES,
+                                                     value=60, key="free_slot_minutes")
+                if st.button("Find Slot", key="free_slot_find"):
+                    index = schedule_index()
+                    if index:
+                        free = index.next_free_slot(platform_id, datetime.combine(search_date, search_time),
+                                                    search_minutes)
+                        if free:
+                            st.success(f"✅ Free from {free.strftime('%Y-%m-%d %H:%M')} to "
+                                       f"{(free + timedelta(minutes=search_minutes)).strftime('%H:%M')}")
+                        else:
+                            st.warning(f"⚠️ No free slot of that length in the next {FREE_SLOT_HORIZON_DAYS} days")
+        
+        with st.form("add_schedule"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                schedule_id = st.text_input("Schedule ID", placeholder="Leave blank to auto-generate")
+                
+                if series_id:
+                    # Get episodes for selected series
+                    episodes = execute_query("""
+                        SELECT EPISODE_ID, EPISODE_TITLE 
+                        FROM RGC_EPISODE 
+                        WHERE SERIES_ID = %s 
+                        ORDER BY EPISODE_ID
+                    """, (series_id,))
+                    
+                    if episodes:
+                        ep_dict = {f"{e['EPISODE_ID']} - {e['EPISODE_TITLE']}": e['EPISODE_ID'] for e in episodes}
+                        selected_ep = st.selectbox("Episode", list(ep_dict.keys()))
+                        episode_id = ep_dict[selected_ep]
+                    else:
+                        st.error("No episodes available for this series")
+                        episode_id = None
+                else:
+                    st.error("No series selected")
+                    episode_id = None
+            
+            with col2:
+                if not platform_id:
+                    st.warning("No platform selected - will create without platform")
+                
+                air_date = st.date_input("Air Date", value=date.today())
+                air_time = st.time_input("Air Time", value=datetime.now().time())
+                
+                duration = st.number_input("Duration (minutes)", min_value=10, max_value=MAX_SLOT_MINUTES, value=60)
+            
+            if st.form_submit_button("Schedule Episode", use_container_width=True):
+                if episode_id:
+                    schedule_id = schedule_id.strip() or generate_id('RGC_AIRING_SCHEDULE')
+                    
+                    # Combine date and time
+                    start_datetime = datetime.combine(air_date, air_time)
+                    end_datetime = start_datetime + timedelta(minutes=duration)
+                    
+                    slot = Slot(schedule_id, episode_id, platform_id, start_datetime, end_datetime)
+                    inserted, conflicts = add_schedule(slot) if schedule_id else (False, [])
+                    
+                    if inserted:
+                        st.success("✅ Schedule added successfully!")
+                        time.sleep(1)
+                        st.rerun()
+                    elif conflicts:
+                        for conflict in conflicts:
+                            other = conflict.slot
+                            st.error(f"❌ Overlaps {other.schedule_id} on the same {conflict.kind} "
+                                     f"({other.start.strftime('%Y-%m-%d %H:%M')} - {other.end.strftime('%H:%M')})")
+                        index = schedule_index()
+                        if platform_id and index:
+                            free = index.next_free_slot(platform_id, start_datetime, duration)
+                            if free:
+                                st.info(f"💡 Next free {duration}-minute slot on this platform: "
+                                        f"{free.strftime('%Y-%m-%d %H:%M')}")
+                    else:
+                        st.error("❌ Failed to add schedule")
+                else:
+                    st.warning("⚠️ Please fill in all required fields")
+    
+        
+        with col2:
+            # Schedule timeline
+            df = execute_query_frame("""
+                SELECT DATE(START_TS) as date, COUNT(*) as count
+                FROM RGC_AIRING_SCHEDULE
+                WHERE START_TS BETWEEN CURDATE() AND DATE_ADD(CURDATE(), INTERVAL 30 DAY)
+                GROUP BY DATE(START_TS)
+                ORDER BY date
+            """)
+            
+            if df is not None and not df.empty:
+                fig = px.line(df, x='date', y='count',
+                            title='Upcoming Schedule Timeline (30 days)',
+                            labels={'count': 'Episodes', 'date': 'Date'})
+                fig.update_layout(plot_bgcolor='#0a1628', paper_bgcolor='#0a1628',
+                                font_color='#e5e5e5')
+                st.plotly_chart(fig, use_container_width=True)
+    
+    with tab3:
+        show_season_planner()
+
+
+def show_season_planner():
+    """Schedule a whole season of new episodes from a weekly recurrence"""
+    st.subheader("Plan a Season")
+    st.caption("Creates one new episode per air time and schedules it, all in one transaction")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        series_id = lookup_select("Series", 'series', key="season_series")
+    with col2:
+        platform_id = lookup_select("Platform", 'platform', key="season_platform")
+    
+    if not series_id or not platform_id:
+        st.info("Select a series and a platform to plan a season")
+        return
+    
+    existing = execute_query("SELECT COUNT(*) as count FROM RGC_EPISODE WHERE SERIES_ID = %s", (series_id,))
+    next_number = (existing[0]['count'] if existing else 0) + 1
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        first_date = st.date_input("First Air Date", value=date.today(), key="season_first_date")
+        air_time = st.time_input("Air Time", value=datetime.strptime("21:00", "%H:%M").time(),
+                                 key="season_air_time")
+    with col2:
+        weekdays = st.multiselect("Air Days", WEEKDAYS, default=[WEEKDAYS[first_date.weekday()]],
+                                  key="season_weekdays")
+        every_weeks = st.number_input("Every N Weeks", min_value=1, max_value=4, value=1,
+                                      key="season_every_weeks")
+    with col3:
+        count = st.number_input("Episodes", min_value=1, max_value=MAX_SEASON_EPISODES, value=10,
+                                key="season_count")
+        duration = st.number_input("Duration (minutes)", min_value=10, max_value=MAX_SLOT_MINUTES, value=60,
+                                   key="season_duration")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        title_pattern = st.text_input("Episode Title", value="Episode {n}", key="season_title",
+                                      help="{n} is replaced by the episode number")
+    with col2:
+        first_number = st.number_input("First Episode Number", min_value=1, value=next_number,
+                                       key="season_first_number")
+    
+    if not weekdays:
+        st.warning("⚠️ Pick at least one air day")
+        return
+    try:
+        times = airing_times(first_date, air_time, [WEEKDAYS.index(day) for day in weekdays],
+                             count, every_weeks)
+        plan = plan_season(series_id, platform_id, times, duration, first_number, title_pattern)
+    except (KeyError, IndexError, ValueError):
+        st.error("❌ Episode title may only use {n} as a placeholder")
+        return
+    too_long = [title for title in plan.titles if not title or len(title) > MAX_TITLE_LEN]
+    if too_long:
+        st.error(f"❌ Episode titles must be 1-{MAX_TITLE_LEN} characters (e.g. \"{too_long[0]}\")")
+        return
+    
+    index = schedule_index()
+    conflicts = plan_conflicts(index, plan) if index else []
+    clashing = {slot.schedule_id for slot, _ in conflicts}
+    
+    st.dataframe(pd.DataFrame(
+        [{"Episode": title,
+          "Airs": slot.start.strftime('%a %Y-%m-%d %H:%M'),
+          "Ends": slot.end.strftime('%H:%M'),
+          "Status": "❌ Conflict" if slot.schedule_id in clashing else "✅ Free"}
+         for title, slot in zip(plan.titles, plan.slots)]),
+        use_container_width=True, hide_index=True)
+    
+    if conflicts:
+        for slot, conflict in conflicts[:10]:
+            other = conflict.slot
+            where = "within this season" if conflict.kind == 'season' else f"with {other.schedule_id}"
+            st.error(f"❌ {slot.start.strftime('%Y-%m-%d %H:%M')} overlaps {where} "
+                     f"({other.start.strftime('%Y-%m-%d %H:%M')} - {other.end.strftime('%H:%M')})")
+        if len(conflicts) > 10:
+            st.caption(f"... and {len(conflicts) - 10} more conflicts")
+    
+    if st.button(f"Schedule {len(plan.slots)} Episodes", key="season_schedule", type="primary",
+                 disabled=bool(conflicts), use_container_width=True):
+        created, found = schedule_season(plan)
+        if created:
+            st.success(f"✅ Created and scheduled {created} episodes")
+            time.sleep(1)
+            st.rerun()
+        elif found:
+            st.error("❌ The schedule changed meanwhile and now conflicts; review the plan")
+        else:
+            st.error("❌ Failed to schedule the season")
@@ -0,0 +1,136 @@
+"""
+RGC Stream - Series details page
+"""
+
+import pandas as pd
+import streamlit as st
+
+from rgc_db import cached_query, execute_query
+
+# SERIES DETAILS PAGE
+# ============================================================================
+SERIES_DETAILS_QUERY = """
+    SELECT ws.*, ph.HOUSE_NAME, ph.ADDRESS_CITY,
+           IF(ss.REVIEW_COUNT > 0, ss.AVG_RATING, NULL) as avg_rating,
+           ss.REVIEW_COUNT as review_count,
+           GROUP_CONCAT(DISTINCT st.SERIES_TYPE_NAME) as genres
+    FROM RGC_WEB_SERIES ws
+    JOIN RGC_PRODUCTION_HOUSE ph ON ws.HOUSE_ID = ph.HOUSE_ID
+    LEFT JOIN RGC_SERIES_STATS ss ON ws.SERIES_ID = ss.SERIES_ID
+    LEFT JOIN RGC_WEB_SERIES_SERIES_TYPE wst ON ws.SERIES_ID = wst.SERIES_ID
+    LEFT JOIN RGC_SERIES_TYPE st ON wst.SERIES_TYPE_ID = st.SERIES_TYPE_ID
+    WHERE ws.SERIES_ID = %s
+    GROUP BY ws.SERIES_ID
+"""
+
+SERIES_EPISODES_QUERY = """
+    SELECT e.EPISODE_ID, e.EPISODE_TITLE, e.TOTAL_VIEWERS, 
+           e.TECHNICAL_INTERRUPTION
+    FROM RGC_EPISODE e
+    WHERE e.SERIES_ID = %s
+    ORDER BY e.EPISODE_ID
+"""
+
+# Precomputed by rgc_recommend.py; one primary-key range read
+SERIES_NEIGHBORS_QUERY = """
+    SELECT n.NEIGHBOR_ID, ws.SERIES_NAME, n.CO_RATERS,
+           IF(ss.REVIEW_COUNT > 0, ss.AVG_RATING, NULL) as avg_rating
+    FROM RGC_SERIES_NEIGHBORS n
+    JOIN RGC_WEB_SERIES ws ON n.NEIGHBOR_ID = ws.SERIES_ID
+    LEFT JOIN RGC_SERIES_STATS ss ON n.NEIGHBOR_ID = ss.SERIES_ID
+    WHERE n.SERIES_ID = %s
+    ORDER BY n.RANK_NO
+    LIMIT 6
+"""
+
+SERIES_REVIEWS_QUERY = """
+    SELECT f.*, v.ACC_FNAME, v.ACC_LNAME
+    FROM RGC_FEEDBACK f
+    LEFT JOIN RGC_VIEWER v ON f.ACCOUNT_ID = v.ACCOUNT_ID
+    WHERE f.SERIES_ID = %s
+    ORDER BY f.FEEDBACK_DATE DESC
+"""
+
+def show_series_details():
+    """Show detailed information about a specific series"""
+    if 'selected_series' not in st.session_state:
+        st.warning("No series selected")
+        if st.button("← Back to Catalog"):
+            st.rerun()
+        return
+    
+    sid = st.session_state.selected_series
+    
+    series = execute_query(SERIES_DETAILS_QUERY, (sid,))
+    
+    if not series:
+        st.error("Series not found")
+        if st.button("← Back"):
+            del st.session_state.selected_series
+            st.rerun()
+        return
+    
+    s = series[0]
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.title(s['SERIES_NAME'])
+        st.write(f"**Production House:** {s['HOUSE_NAME']} ({s['ADDRESS_CITY']})")
+        st.write(f"**Genre:** {s['genres'] if s['genres'] else 'N/A'}")
+        st.write(f"**Language:** {s['LANGUAGE']} | **Origin:** {s['COUNTRY_OF_ORIGIN']}")
+        st.write(f"**Episodes:** {s['NUM_EPISODES']} | **Released:** {s['RELEASE_DATE']}")
+    
+    with col2:
+        if s['avg_rating']:
+            st.metric("Average Rating", f"{s['avg_rating']:.1f}⭐", 
+                     delta=f"{s['review_count']} reviews")
+        else:
+            st.info("No ratings yet")
+    
+    if st.button("← Back to Catalog"):
+        del st.session_state.selected_series
+        st.rerun()
+    
+    st.markdown("---")
+    
+    st.subheader("📺 Episodes")
+    episodes = execute_query(SERIES_EPISODES_QUERY, (sid,))
+    
+    if episodes:
+        df = pd.DataFrame(episodes)
+        df_display = df[['EPISODE_TITLE', 'TOTAL_VIEWERS']].copy()
+        df_display.columns = ['Title', 'Viewers']
+        if st.session_state.user_type in ['PRODUCER', 'ADMIN']:
+            df_display['Tech Issues'] = df['TECHNICAL_INTERRUPTION']
+        st.dataframe(df_display, use_container_width=True)
+    else:
+        st.info("No episodes available yet")
+    
+    st.markdown("---")
+    
+    neighbors = cached_query(SERIES_NEIGHBORS_QUERY, (sid,))
+    
+    if neighbors:
+        st.subheader("👥 Viewers Who Liked This Also Liked")
+        cols = st.columns(3)
+        for i, n in enumerate(neighbors):
+            with cols[i % 3]:
+                rating = f"{n['avg_rating']:.1f}⭐" if n['avg_rating'] else "No ratings"
+                st.write(f"**{n['SERIES_NAME']}**")
+                st.caption(f"{rating} · {n['CO_RATERS']} viewers rated both")
+                if st.button("View Details", key=f"similar_{n['NEIGHBOR_ID']}"):
+                    st.session_state.selected_series = n['NEIGHBOR_ID']
+                    st.rerun()
+        st.markdown("---")
+    
+    st.subheader("💬 User Reviews")
+    
+    reviews = execute_query(SERIES_REVIEWS_QUERY, (sid,))
+    
+    if reviews:
+        for r in reviews:
+            name = f"{r.get('ACC_FNAME', 'Anonymous')} {r.get('ACC_LNAME', '')}"
+            with st.expander(f"⭐ {r['RATING']}/5 - {name.strip()} ({r['FEEDBACK_DATE']})"):
+                st.write(r['FEEDBACK_TEXT'])
+    else:
+        st.info("No reviews yet. Be the first to review!")
@@ -0,0 +1,434 @@
+"""
+RGC Stream - User settings page
+"""
+
+import time
+from datetime import date, timedelta
+
+import streamlit as st
+
+from rgc_db import cached_query, execute_query, run_batch
+
+# User Settings Page
+def show_settings():
+    st.title("⚙️ User Settings")
+    
+    # Get user info
+    if st.session_state.linked_account:
+        # st.tabs renders every tab, so the Profile and Activity reads all run
+        # on each visit; load them together
+        account = (st.session_state.linked_account,)
+        settings_data = run_batch({
+            'user': ("""
+                SELECT v.*, c.COUNTRY_NAME,
+                       COUNT(DISTINCT f.FEEDBACK_ID) as review_count
+                FROM RGC_VIEWER v
+                LEFT JOIN RGC_COUNTRY c ON v.COUNTRY_CODE = c.COUNTRY_CODE
+                LEFT JOIN RGC_FEEDBACK f ON v.ACCOUNT_ID = f.ACCOUNT_ID
+                WHERE v.ACCOUNT_ID = %s
+                GROUP BY v.ACCOUNT_ID
+            """, account),
+            'rating_stats': ("""
+                SELECT SUM(f.RATING >= 4) as high_ratings, AVG(f.RATING) as avg,
+                       COUNT(DISTINCT f.SERIES_ID) as series_count,
+                       MAX(f.FEEDBACK_DATE) as last_date
+                FROM RGC_FEEDBACK f
+                WHERE f.ACCOUNT_ID = %s
+            """, account),
+            'favorite_genre': ("""
+                SELECT st.SERIES_TYPE_NAME, COUNT(*) as count
+                FROM RGC_FEEDBACK f
+                JOIN RGC_WEB_SERIES ws ON f.SERIES_ID = ws.SERIES_ID
+                JOIN RGC_WEB_SERIES_SERIES_TYPE wst ON ws.SERIES_ID = wst.SERIES_ID
+                JOIN RGC_SERIES_TYPE st ON wst.SERIES_TYPE_ID = st.SERIES_TYPE_ID
+                WHERE f.ACCOUNT_ID = %s
+                GROUP BY st.SERIES_TYPE_ID
+                ORDER BY count DESC
+                LIMIT 1
+            """, account),
+            'recent_reviews': ("""
+                SELECT f.*, ws.SERIES_NAME
+                FROM RGC_FEEDBACK f
+                JOIN RGC_WEB_SERIES ws ON f.SERIES_ID = ws.SERIES_ID
+                WHERE f.ACCOUNT_ID = %s
+                ORDER BY f.FEEDBACK_DATE DESC
+                LIMIT 5
+            """, account),
+        })
+        user_data = settings_data['user']
+        rating_stats = settings_data['rating_stats'][0] if settings_data['rating_stats'] else {}
+        
+        if user_data:
+            user = user_data[0]
+            
+            # Create tabs for different settings sections
+            tab1, tab2, tab3, tab4, tab5 = st.tabs(["📋 Profile", "💳 Billing", "🗣️ Languages", "🎬 Preferences", "📊 Activity"])
+            
+            # ============= TAB 1: PROFILE =============
+            with tab1:
+                st.subheader("📋 Account Overview")
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Account ID", user['ACCOUNT_ID'])
+                with col2:
+                    st.metric("Member Since", user['DATE_OPENED'].strftime('%Y-%m-%d'))
+                with col3:
+                    account_age = (date.today() - user['DATE_OPENED']).days
+                    st.metric("Member For", f"{account_age} days")
+                
+                st.markdown("---")
+                
+                st.subheader("🏠 Address Information")
+                with st.expander("📝 Edit Address", expanded=False):
+                    with st.form("update_address"):
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            new_fname = st.text_input("First Name", value=user['ACC_FNAME'])
+                            new_street = st.text_input("Street Address", value=user['ADDRESS_STREET'])
+                            new_city = st.text_input("City", value=user['ADDRESS_CITY'])
+                        with col2:
+                            new_lname = st.text_input("Last Name", value=user.get('ACC_LNAME', ''))
+                            new_zip = st.text_input("ZIP Code", value=user['ADDRESS_ZIP'])
+                            new_country = st.selectbox("Country", ["United States", "Canada", "United Kingdom", "India", "Australia", "Other"], 
+                                                       index=0)
+                        
+                        if st.form_submit_button("Update Address", use_container_width=True):
+                            query = """
+                            UPDATE RGC_VIEWER 
+                            SET ACC_FNAME = %s, ACC_LNAME = %s,
+                                ADDRESS_STREET = %s, ADDRESS_CITY = %s, 
+                                ADDRESS_ZIP = %s
+                            WHERE ACCOUNT_ID = %s
+                            """
+                            if execute_query(query, (new_fname, new_lname, new_street, new_city, new_zip, 
+                                                   user['ACCOUNT_ID']), commit=True):
+                                st.success("✅ Address updated successfully!")
+                                time.sleep(1)
+                                st.rerun()
+                            else:
+                                st.error("❌ Update failed")
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write(f"**📛 Full Name:** {user['ACC_FNAME']} {user.get('ACC_LNAME', '')}")
+                    st.write(f"**📍 Street:** {user['ADDRESS_STREET']}")
+                with col2:
+                    st.write(f"**🌍 Country:** {user['COUNTRY_NAME']}")
+                    st.write(f"**🏙️ City, ZIP:** {user['ADDRESS_CITY']}, {user['ADDRESS_ZIP']}")
+                
+                st.markdown("---")
+                st.subheader("📊 Account Statistics")
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.metric("Total Reviews", user['review_count'])
+                with col2:
+                    high_ratings = rating_stats.get('high_ratings') or 0
+                    st.metric("High Ratings (4+⭐)", high_ratings)
+                with col3:
+                    avg = rating_stats.get('avg') or 0
+                    st.metric("Average Rating", f"{avg:.2f}⭐")
+                with col4:
+                    favorite_gen = settings_data['favorite_genre']
+                    fav_genre = favorite_gen[0]['SERIES_TYPE_NAME'] if favorite_gen else "N/A"
+                    st.metric("Favorite Genre", fav_genre)
+            
+            # ============= TAB 2: BILLING =============
+            with tab2:
+                st.subheader("💳 Subscription & Billing")
+                
+                # Current subscription details
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.markdown('<div>', unsafe_allow_html=True)
+                    st.write("**Current Plan**")
+                    st.metric("Monthly Charge", f"${user['MONTHLY_CHARGE']:.2f}")
+                    
+                    # Calculate next billing date
+                    next_billing = user['DATE_OPENED'] + timedelta(days=30)
+                    days_until = (next_billing - date.today()).days
+                    if days_until < 0:
+                        days_since = (date.today() - user['DATE_OPENED']).days
+                        cycles = (days_since // 30) + 1
+                        next_billing = user['DATE_OPENED'] + timedelta(days=30 * cycles)
+                        days_until = (next_billing - date.today()).days
+                    
+                    st.metric("Next Billing Date", next_billing.strftime('%Y-%m-%d'), 
+                             delta=f"{days_until} days remaining")
+                    
+                    st.metric("Status", "🟢 Active")
+                    st.markdown('</div>', unsafe_allow_html=True)
+                
+                with col2:
+                    st.markdown('<div>', unsafe_allow_html=True)
+                    st.write("**Billing Summary**")
+                    annual_charge = user['MONTHLY_CHARGE'] * 12
+                    st.metric("Annual Cost (est.)", f"${annual_charge:.2f}")
+                    
+                    # Total spent
+                    months_active = (date.today() - user['DATE_OPENED']).days // 30 + 1
+                    total_spent = user['MONTHLY_CHARGE'] * months_active
+                    st.metric("Total Spent", f"${total_spent:.2f}")
+                    
+                    # Savings info
+                    st.info("💡 Pro Tip: Annual plans save 15% compared to monthly!")
+                    st.markdown('</div>', unsafe_allow_html=True)
+                
+                st.markdown("---")
+                st.subheader("📋 Billing History")
+                
+                billing_history = []
+                months_active = (date.today() - user['DATE_OPENED']).days // 30 + 1
+                for i in range(min(months_active, 12)):
+                    billing_date = user['DATE_OPENED'] + timedelta(days=30 * (i + 1))
+                    status = "Paid" if billing_date <= date.today() else "Upcoming"
+                    billing_history.append({
+                        'Billing Date': billing_date.strftime('%Y-%m-%d'),
+                        'Amount': f"${user['MONTHLY_CHARGE']:.2f}",
+                        'Status': status,
+                        'Type': 'Monthly Subscription'
+                    })
+                
+                if billing_history:
+                    for bill in billing_history[:6]:  # Show last 6 months
+                        status_color = "🟢" if bill['Status'] == "Paid" else "🟡"
+                        with st.container():
+                            st.markdown(f"""
+                            <div class="billing-card {bill['Status'].lower()}">
+                                <strong>{status_color} {bill['Billing Date']}</strong> | 
+                                {bill['Amount']} | 
+                                <span style="color: #3895d3;">{bill['Status']}</span>
+                            </div>
+                            """, unsafe_allow_html=True)
+                
+                st.markdown("---")
+                st.subheader("💰 Payment Methods")
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    with st.expander("💳 Add Payment Method"):
+                        with st.form("add_payment"):
+                            payment_type = st.selectbox("Payment Type", ["Credit Card", "Debit Card", "PayPal", "Apple Pay"])
+                            if payment_type == "Credit Card" or payment_type == "Debit Card":
+                                st.text_input("Card Number", placeholder="•••• •••• •••• 1234")
+                                col_exp, col_cvv = st.columns(2)
+                                with col_exp:
+                                    st.text_input("Expiry (MM/YY)")
+                                with col_cvv:
+                                    st.text_input("CVV", type="password")
+                            else:
+                                st.text_input("Email")
+                            
+                            st.checkbox("Set as default payment method")
+                            
+                            if st.form_submit_button("Add Payment Method"):
+                                st.success("✅ Payment method added successfully!")
+                
+                with col2:
+                    st.write("**Current Payment Method**")
+                    st.markdown("""
+                    <div class="settings-card">
+                        <strong>💳 Visa •••• 4242</strong><br/>
+                        Expires: 12/26<br/>
+                        <span style="color: #3895d3; font-weight: bold;">Default</span>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                st.markdown("---")
+                st.subheader("⚙️ Billing Preferences")
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    auto_renew = st.checkbox("Auto-renew subscription", value=True)
+                    billing_email = st.text_input("Billing Email", value="user@example.com")
+                
+                with col2:
+                    receipt_frequency = st.selectbox("Receipt Frequency", ["Monthly", "Quarterly", "Annually"])
+                    currency = st.selectbox("Currency", ["USD ($)", "EUR (€)", "GBP (£)", "INR (₹)"])
+                
+                if st.button("Save Billing Preferences", use_container_width=True):
+                    st.success("✅ Billing preferences updated!")
+            
+            # ============= TAB 3: LANGUAGES =============
+            with tab3:
+                st.subheader("🗣️ Language Preferences")
+                
+                st.write("Customize your subtitle and dubbing preferences for a better viewing experience.")
+                st.markdown("---")
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write("**📝 Preferred Subtitle Language**")
+                    subtitle_lang = st.selectbox("Subtitles", 
+                                                ["English", "Spanish", "French", "German", "Hindi", "Japanese", "Korean", "Mandarin", "None"])
+                    
+                    st.write("**🎬 Preferred Dubbing Language**")
+                    dubbing_lang = st.selectbox("Dubbing",
+                                               ["English", "Spanish", "French", "German", "Hindi", "Japanese", "Korean", "Mandarin", "Original"])
+                
+                with col2:
+                    st.write("**Additional Subtitle Languages**")
+                    st.multiselect("Select up to 3 additional languages:",
+                                   ["English", "Spanish", "French", "German", "Hindi", "Japanese", "Korean", "Mandarin"],
+                                   max_selections=3)
+                    
+                    st.write("**Accessibility Options**")
+                    col_a, col_b = st.columns(2)
+                    with col_a:
+                        st.checkbox("Closed Captions (CC)")
+                    with col_b:
+                        st.checkbox("Hearing Impaired (HI)")
+                
+                st.markdown("---")
+                st.write("**Available Languages for Series**")
+                
+                # Get available languages across all series
+                subtitles_available = cached_query("""
+                    SELECT DISTINCT sl.S_LANGUAGE_NAME
+                    FROM RGC_SUBTITLE_LANGUAGE sl
+                    ORDER BY sl.S_LANGUAGE_NAME
+                """)
+                
+                dubbings_available = cached_query("""
+                    SELECT DISTINCT dl.D_LANGUAGE_NAME
+                    FROM RGC_DUBBING_LANGUAGE dl
+                    ORDER BY dl.D_LANGUAGE_NAME
+                """)
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write("**Subtitles Available:**")
+                    if subtitles_available:
+                        for sub in subtitles_available:
+                            st.write(f"  • {sub['S_LANGUAGE_NAME']}")
+                    else:
+                        st.info("No subtitles available")
+                
+                with col2:
+                    st.write("**Dubbing Available:**")
+                    if dubbings_available:
+                        for dub in dubbings_available:
+                            st.write(f"  • {dub['D_LANGUAGE_NAME']}")
+                    else:
+                        st.info("No dubbing available")
+                
+                st.markdown("---")
+                if st.button("Save Language Preferences", use_container_width=True, key="save_lang"):
+                    st.success("✅ Language preferences saved!")
+            
+            # ============= TAB 4: PREFERENCES =============
+            with tab4:
+                st.subheader("🎬 Viewing Preferences")
+                
+                st.write("Customize how you want to watch content on RGC Stream.")
+                st.markdown("---")
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write("**📺 Playback Settings**")
+                    video_quality = st.selectbox("Video Quality", 
+                                                ["Auto", "4K Ultra HD", "Full HD", "HD", "Standard"])
+                    st.write(f"Selected: **{video_quality}**")
+                    
+                    auto_play = st.checkbox("Auto-play next episode", value=True)
+                    subtitles_default = st.checkbox("Show subtitles by default", value=True)
+                
+                with col2:
+                    st.write("**🔔 Notification Settings**")
+                    new_series = st.checkbox("Notify about new series", value=True)
+                    episode_release = st.checkbox("Notify when new episodes release", value=True)
+                    recommendations = st.checkbox("Personalized recommendations", value=True)
+                
+                st.markdown("---")
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write("**📊 Privacy Settings**")
+                    public_profile = st.checkbox("Make my profile public", value=False)
+                    share_watch_history = st.checkbox("Share watch history with friends", value=False)
+                
+                with col2:
+                    st.write("**🛡️ Parental Controls**")
+                    enable_parental = st.checkbox("Enable parental controls", value=False)
+                    if enable_parental:
+                        rating_limit = st.selectbox("Content Rating Limit", 
+                                                    ["G", "PG", "PG-13", "R", "No Limit"])
+                        st.write(f"Content limit: **{rating_limit}**")
+                
+                st.markdown("---")
+                if st.button("Save Preferences", use_container_width=True, key="save_pref"):
+                    st.success("✅ Preferences updated successfully!")
+            
+            # ============= TAB 5: ACTIVITY =============
+            with tab5:
+                st.subheader("📊 Your Activity")
+                
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.metric("Total Reviews", user['review_count'])
+                with col2:
+                    watched_count = rating_stats.get('series_count') or 0
+                    st.metric("Series Watched", watched_count)
+                with col3:
+                    avg = rating_stats.get('avg') or 0
+                    st.metric("Avg Rating Given", f"{avg:.1f}⭐")
+                with col4:
+                    last_date = rating_stats.get('last_date')
+                    if last_date:
+                        days_ago = (date.today() - last_date).days
+                        st.metric("Last Review", f"{days_ago} days ago")
+                    else:
+                        st.metric("Last Review", "Never")
+                
+                st.markdown("---")
+                st.subheader("📋 Recent Activity")
+                
+                recent_reviews = settings_data['recent_reviews']
+                
+                if recent_reviews:
+                    for review in recent_reviews:
+                        with st.expander(f"⭐ {review['RATING']}/5 - {review['SERIES_NAME']} ({review['FEEDBACK_DATE'].strftime('%Y-%m-%d')})"):
+                            st.write(f"**Review:** {review['FEEDBACK_TEXT']}")
+                else:
+                    st.info("No reviews yet. Start rating series to build your activity history!")
+                
+                st.markdown("---")
+                st.subheader("🎯 Achievements")
+                
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.write("⭐ **5 Star Critic**")
+                    st.caption("Left 5 reviews")
+                    if user['review_count'] >= 5:
+                        st.write("✅ Earned")
+                    else:
+                        st.write(f"Progress: {user['review_count']}/5")
+                
+                with col2:
+                    st.write("🎬 **Series Binge**")
+                    st.caption("Watched 10 series")
+                    if watched_count >= 10:
+                        st.write("✅ Earned")
+                    else:
+                        st.write(f"Progress: {watched_count}/10")
+                
+                with col3:
+                    st.write("💯 **Rating Master**")
+                    st.caption("Avg rating > 4.0")
+                    if avg and avg >= 4.0:
+                        st.write("✅ Earned")
+                    else:
+                        st.write(f"Progress: {avg:.1f}/4.0")
+                
+                with col4:
+                    st.write("🏆 **Loyal Member**")
+                    st.caption("Member for 365 days")
+                    account_age = (date.today() - user['DATE_OPENED']).days
+                    if account_age >= 365:
+                        st.write("✅ Earned")
+                    else:
+                        st.write(f"Progress: {account_age}/365 days")
+        
+        else:
+            st.warning("No viewer account linked to this user")
+    else:
+        st.info("ℹ️ No viewer account linked. Link an account during registration to access settings.")
@@ -0,0 +1,22 @@
+"""
+RGC Stream - Theme
+The dark theme stylesheet, read from theme.css once per server process.
+"""
+
+import os
+
+import streamlit as st
+
+THEME_CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'theme.css')
+
+with open(THEME_CSS_PATH, encoding='utf-8') as _css:
+    THEME_HTML = f"<style>\n{_css.read()}</style>"
+
+
+def inject_theme():
+    """
+    Emit the stylesheet for this run
+    Streamlit removes any element a rerun does not send again, so the <style>
+    block goes out on every run; building it happens once, at import.
+    """
+    st.markdown(THEME_HTML, unsafe_allow_html=True)
@@ -0,0 +1,414 @@
+"""
+RGC Stream - "Viewers who liked this also liked" recommendations
+Builds a sparse viewer x series matrix from RGC_FEEDBACK ratings, scores
+every pair of series that share raters with adjusted cosine similarity
+(each viewer's ratings centered on their own mean, so a harsh and a generous
+critic who agree count as agreeing), and stores the TOP_K most similar series
+per series in RGC_SERIES_NEIGHBORS (migrations/0010_series_neighbors.sql).
+The series details page reads one list with a primary-key range lookup.
+
+Similarities are computed a block of series at a time as sparse matrix
+products, so memory stays bounded by the rating matrix. Scores are shrunk
+towards zero for pairs with few raters in common (co / (co + SHRINKAGE)), so
+two series that one viewer happened to rate alike do not top each other's list.
+
+`build` recomputes every list. `update` only rescores the series whose
+feedback changed since (recorded by triggers in RGC_RECOMMEND_DIRTY): it loads
+the ratings of their viewers alone, scores them against every series using the
+vector lengths stored at the last build, and patches the other series' lists
+where a changed series enters, moves or drops out. Lists an update shortens
+are refilled at the next build.
+
+Usage (cron or a systemd timer, or --every to keep it running):
+    python rgc_recommend.py build [--top-k 20]
+    python rgc_recommend.py update [--every 600]
+    python rgc_recommend.py show SERIES_ID
+"""
+
+import argparse
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from mysql.connector import Error
+
+from rgc_db import in_placeholders, invalidate_tables
+
+TOP_K = 20
+SHRINKAGE = 10.0
+MIN_CO_RATERS = 2
+BLOCK_SERIES = 256  # series scored per sparse product
+FETCH_ROWS = 50000
+ID_CHUNK = 1000  # IDs per IN (...) list
+WRITE_SERIES = 500  # series lists replaced per committed write
+
+RATINGS_QUERY = "SELECT ACCOUNT_ID, SERIES_ID, RATING FROM RGC_FEEDBACK"
+
+INSERT_NEIGHBORS = """
+    INSERT INTO RGC_SERIES_NEIGHBORS (SERIES_ID, RANK_NO, NEIGHBOR_ID, SIMILARITY, CO_RATERS)
+    VALUES (%s, %s, %s, %s, %s)
+"""
+
+UPSERT_NORMS = """
+    INSERT INTO RGC_SERIES_RATING_NORMS (SERIES_ID, RATING_NORM, RATERS)
+    VALUES (%s, %s, %s)
+    ON DUPLICATE KEY UPDATE RATING_NORM = VALUES(RATING_NORM), RATERS = VALUES(RATERS)
+"""
+
+# series_ids: column -> SERIES_ID; centered / binary: viewers x series (CSC)
+RatingMatrix = namedtuple('RatingMatrix', ['series_ids', 'centered', 'binary'])
+
+
+def _sparse():
+    try:
+        from scipy import sparse
+    except ImportError:
+        raise ImportError("Recommendation builds need scipy: pip install scipy") from None
+    return sparse
+
+
+def _chunks(values, size):
+    values = list(values)
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+# ============================================================================
+# RATING MATRIX
+# ============================================================================
+def load_ratings(conn, accounts=None):
+    """(ACCOUNT_ID, SERIES_ID, RATING) rows of every viewer, or only of `accounts`"""
+    cursor = conn.cursor()
+    rows = []
+    try:
+        queries = ([(RATINGS_QUERY, ())] if accounts is None else
+                   [(f"{RATINGS_QUERY} WHERE ACCOUNT_ID IN ({in_placeholders(chunk)})", tuple(chunk))
+                    for chunk in _chunks(accounts, ID_CHUNK)])
+        for query, params in queries:
+            cursor.execute(query, params)
+            while True:
+                batch = cursor.fetchmany(FETCH_ROWS)
+                if not batch:
+                    break
+                rows += batch
+    finally:
+        cursor.close()
+    return pd.DataFrame(rows, columns=['account', 'series', 'rating'])
+
+
+def build_matrix(ratings):
+    """Mean-centered and 0/1 viewer x series matrices; repeat reviews count as their average"""
+    sparse = _sparse()
+    pairs = ratings.groupby(['account', 'series'], sort=False)['rating'].mean().reset_index()
+    viewers, viewer_ids = pd.factorize(pairs['account'])
+    series, series_ids = pd.factorize(pairs['series'])
+    values = pairs['rating'].to_numpy(dtype=float)
+    shape = (len(viewer_ids), len(series_ids))
+
+    viewer_mean = np.bincount(viewers, weights=values) / np.bincount(viewers)
+    centered = sparse.csc_matrix((values - viewer_mean[viewers], (viewers, series)), shape=shape)
+    binary = sparse.csc_matrix((np.ones_like(values), (viewers, series)), shape=shape)
+    return RatingMatrix(list(series_ids), centered, binary)
+
+
+def column_norms(matrix):
+    """(length of each series' centered rating vector, raters per series)"""
+    norms = np.sqrt(np.asarray(matrix.centered.multiply(matrix.centered).sum(axis=0)).ravel())
+    raters = np.diff(matrix.binary.indptr)
+    return norms, raters
+
+
+def similarities(matrix, norms, columns, block=BLOCK_SERIES):
+    """
+    (column, neighbor columns, similarities, co-raters) for each of `columns`,
+    over every series sharing at least MIN_CO_RATERS raters with it
+    """
+    centered_t = matrix.centered.T.tocsr()
+    binary_t = matrix.binary.T.tocsr()
+    for cols in _chunks(columns, block):
+        dots = (centered_t @ matrix.centered[:, cols]).tocsc()
+        shared = (binary_t @ matrix.binary[:, cols]).tocsc()
+        dots.sort_indices()
+        shared.sort_indices()
+        for j, column in enumerate(cols):
+            others = dots.indices[dots.indptr[j]:dots.indptr[j + 1]]
+            dot = dots.data[dots.indptr[j]:dots.indptr[j + 1]]
+            # the dot product is non-zero only where the series share raters
+            shared_rows = shared.indices[shared.indptr[j]:shared.indptr[j + 1]]
+            co = shared.data[shared.indptr[j]:shared.indptr[j + 1]][np.searchsorted(shared_rows, others)]
+
+            keep = (others != column) & (co >= MIN_CO_RATERS) & (norms[others] > 0)
+            if norms[column] == 0 or not keep.any():
+                yield column, others[:0], dot[:0], co[:0]
+                continue
+            others, dot, co = others[keep], dot[keep], co[keep]
+            sims = dot / (norms[others] * norms[column]) * (co / (co + SHRINKAGE))
+            liked = sims > 0
+            yield column, others[liked], sims[liked], co[liked]
+
+
+def top_k(sims, k=TOP_K):
+    """Indices of the k largest similarities, best first"""
+    if len(sims) > k:
+        best = np.argpartition(-sims, k - 1)[:k]
+    else:
+        best = np.arange(len(sims))
+    return best[np.argsort(-sims[best], kind='stable')]
+
+
+def neighbor_list(matrix, others, sims, co, k=TOP_K):
+    """[(NEIGHBOR_ID, similarity, co-raters)] best first"""
+    return [(matrix.series_ids[others[i]], float(sims[i]), int(co[i]))
+            for i in top_k(sims, k)]
+
+
+# ============================================================================
+# STORAGE
+# ============================================================================
+def db_now(conn):
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT NOW()")
+        return cursor.fetchone()[0]
+    finally:
+        cursor.close()
+
+
+def write_neighbors(conn, lists):
+    """
+    Replace the stored list of every series in `lists`, WRITE_SERIES series per
+    transaction, so readers see each chunk's old lists or its new ones
+    """
+    cursor = conn.cursor()
+    try:
+        for chunk in _chunks(lists, WRITE_SERIES):
+            try:
+                conn.start_transaction()
+                cursor.execute(
+                    f"DELETE FROM RGC_SERIES_NEIGHBORS WHERE SERIES_ID IN ({in_placeholders(chunk)})",
+                    tuple(chunk))
+                rows = [(series_id, rank, neighbor_id, sim, co)
+                        for series_id in chunk
+                        for rank, (neighbor_id, sim, co) in enumerate(lists[series_id], 1)]
+                if rows:
+                    cursor.executemany(INSERT_NEIGHBORS, rows)
+                conn.commit()
+            except Error:
+                conn.rollback()
+                raise
+    finally:
+        cursor.close()
+
+
+def write_norms(conn, series_ids, norms, raters):
+    cursor = conn.cursor()
+    try:
+        rows = [(series_id, float(norm), int(count))
+                for series_id, norm, count in zip(series_ids, norms, raters)]
+        for chunk in _chunks(rows, FETCH_ROWS):
+            try:
+                conn.start_transaction()
+                cursor.executemany(UPSERT_NORMS, chunk)
+                conn.commit()
+            except Error:
+                conn.rollback()
+                raise
+    finally:
+        cursor.close()
+
+
+def read_column(conn, query, values):
+    """First column of `query` ... IN (values), run a chunk of values at a time"""
+    cursor = conn.cursor()
+    try:
+        found = []
+        for chunk in _chunks(values, ID_CHUNK):
+            cursor.execute(query.format(in_placeholders(chunk)), tuple(chunk))
+            found += [row[0] for row in cursor.fetchall()]
+        return found
+    finally:
+        cursor.close()
+
+
+def read_lists(conn, series_ids):
+    """{SERIES_ID: [(NEIGHBOR_ID, similarity, co-raters)] best first} as stored"""
+    cursor = conn.cursor()
+    try:
+        lists = {}
+        for chunk in _chunks(series_ids, ID_CHUNK):
+            cursor.execute(
+                "SELECT SERIES_ID, NEIGHBOR_ID, SIMILARITY, CO_RATERS FROM RGC_SERIES_NEIGHBORS "
+                f"WHERE SERIES_ID IN ({in_placeholders(chunk)}) ORDER BY SERIES_ID, RANK_NO",
+                tuple(chunk))
+            for series_id, neighbor_id, sim, co in cursor.fetchall():
+                lists.setdefault(series_id, []).append((neighbor_id, sim, co))
+        return lists
+    finally:
+        cursor.close()
+
+
+def clear_dirty(conn, before, series_ids=None):
+    """Forget changes recorded before `before` (a change during the run stays dirty)"""
+    cursor = conn.cursor()
+    try:
+        if series_ids is None:
+            cursor.execute("DELETE FROM RGC_RECOMMEND_DIRTY WHERE CHANGED_AT < %s", (before,))
+        else:
+            for chunk in _chunks(series_ids, ID_CHUNK):
+                cursor.execute(
+                    f"DELETE FROM RGC_RECOMMEND_DIRTY WHERE CHANGED_AT < %s "
+                    f"AND SERIES_ID IN ({in_placeholders(chunk)})", (before,) + tuple(chunk))
+        conn.commit()
+    finally:
+        cursor.close()
+
+
+# ============================================================================
+# BUILD / UPDATE
+# ============================================================================
+def build_all(conn, k=TOP_K, log=None):
+    """Recompute every series' neighbors from all ratings; returns series written"""
+    log = log or (lambda message: None)
+    started = db_now(conn)
+    start = time.perf_counter()
+    matrix = build_matrix(load_ratings(conn))
+    norms, raters = column_norms(matrix)
+    log(f"loaded {matrix.binary.nnz:,} ratings of {len(matrix.series_ids):,} series "
+        f"in {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    lists = {matrix.series_ids[column]: neighbor_list(matrix, others, sims, co, k)
+             for column, others, sims, co in similarities(matrix, norms, range(len(matrix.series_ids)))}
+    log(f"scored {len(lists):,} series in {time.perf_counter() - start:.1f}s")
+
+    write_neighbors(conn, lists)
+    write_norms(conn, matrix.series_ids, norms, raters)
+    cursor = conn.cursor()
+    try:
+        # Series whose last review was deleted have nothing to recommend from
+        conn.start_transaction()
+        cursor.execute("DELETE FROM RGC_SERIES_NEIGHBORS "
+                       "WHERE SERIES_ID NOT IN (SELECT SERIES_ID FROM RGC_FEEDBACK)")
+        conn.commit()
+    except Error:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    clear_dirty(conn, started)
+    invalidate_tables({'RGC_SERIES_NEIGHBORS'})
+    return len(lists)
+
+
+def update_changed(conn, k=TOP_K, log=None):
+    """Rescore only the series recorded in RGC_RECOMMEND_DIRTY; returns lists rewritten"""
+    log = log or (lambda message: None)
+    started = db_now(conn)
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT SERIES_ID FROM RGC_RECOMMEND_DIRTY")
+        dirty = [row[0] for row in cursor.fetchall()]
+        if not dirty:
+            return 0
+        cursor.execute("SELECT SERIES_ID, RATING_NORM FROM RGC_SERIES_RATING_NORMS")
+        stored_norms = dict(cursor.fetchall())
+    finally:
+        cursor.close()
+
+    start = time.perf_counter()
+    # Every rater of a changed series is loaded, so its own vector is exact;
+    # the other series are scored against the lengths from the last build
+    accounts = read_column(conn, "SELECT DISTINCT ACCOUNT_ID FROM RGC_FEEDBACK WHERE SERIES_ID IN ({})",
+                           dirty)
+    matrix = build_matrix(load_ratings(conn, accounts))
+    norms, raters = column_norms(matrix)
+    dirty_set = set(dirty)
+    for column, series_id in enumerate(matrix.series_ids):
+        if series_id not in dirty_set and series_id in stored_norms:
+            norms[column] = stored_norms[series_id]
+    log(f"{len(dirty):,} changed series, {matrix.binary.nnz:,} ratings of their viewers "
+        f"in {time.perf_counter() - start:.1f}s")
+
+    position = {series_id: column for column, series_id in enumerate(matrix.series_ids)}
+    columns = [position[series_id] for series_id in dirty if series_id in position]
+    lists = {series_id: [] for series_id in dirty}
+    incoming = {}  # other series -> {changed series: (similarity, co-raters)}
+    for column, others, sims, co in similarities(matrix, norms, columns):
+        series_id = matrix.series_ids[column]
+        lists[series_id] = neighbor_list(matrix, others, sims, co, k)
+        for other, sim, count in zip(others, sims, co):
+            other_id = matrix.series_ids[other]
+            if other_id not in dirty_set:
+                incoming.setdefault(other_id, {})[series_id] = (float(sim), int(count))
+
+    # Patch the lists that held a changed series or may now take one in
+    holders = read_column(conn, "SELECT DISTINCT SERIES_ID FROM RGC_SERIES_NEIGHBORS "
+                                "WHERE NEIGHBOR_ID IN ({})", dirty)
+    affected = (set(holders) | set(incoming)) - dirty_set
+    current = read_lists(conn, affected)
+    for series_id in affected:
+        merged = [entry for entry in current.get(series_id, []) if entry[0] not in dirty_set]
+        merged += [(changed, sim, co) for changed, (sim, co) in incoming.get(series_id, {}).items()]
+        lists[series_id] = sorted(merged, key=lambda entry: -entry[1])[:k]
+
+    write_neighbors(conn, lists)
+    write_norms(conn, [matrix.series_ids[c] for c in columns], norms[columns], raters[columns])
+    clear_dirty(conn, started, dirty)
+    invalidate_tables({'RGC_SERIES_NEIGHBORS'})
+    log(f"rewrote {len(lists):,} neighbor lists")
+    return len(lists)
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+def main(argv=None):
+    import mysql.connector
+    from rgc_datagen import add_connection_args, connection_config
+
+    parser = argparse.ArgumentParser(description="Compute series recommendations from feedback ratings")
+    add_connection_args(parser)
+    parser.add_argument('--top-k', type=int, default=TOP_K, help="neighbors kept per series")
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('build', help="recompute every series' neighbors")
+    update_cmd = sub.add_parser('update', help="rescore series whose feedback changed")
+    update_cmd.add_argument('--every', type=float, metavar='SECONDS',
+                            help="keep running, one update per interval")
+    show_cmd = sub.add_parser('show', help="print the stored neighbors of one series")
+    show_cmd.add_argument('series_id')
+    args = parser.parse_args(argv)
+
+    def log(message):
+        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} {message}", file=sys.stderr)
+
+    while True:
+        started = time.monotonic()
+        try:
+            conn = mysql.connector.connect(**connection_config(args))
+            try:
+                if args.command == 'show':
+                    for neighbor_id, sim, co in read_lists(conn, [args.series_id]).get(args.series_id, []):
+                        print(f"{neighbor_id:<12} {sim:8.4f} {co:>8,}")
+                    return 0
+                if args.command == 'build':
+                    log(f"built {build_all(conn, args.top_k, log):,} neighbor lists")
+                    return 0
+                update_changed(conn, args.top_k, log)
+            finally:
+                conn.close()
+        except (Error, ImportError) as e:
+            log(f"error: {e}")
+            if not args.every:
+                return 1
+        if not args.every:
+            return 0
+        try:
+            time.sleep(max(0.0, args.every - (time.monotonic() - started)))
+        except KeyboardInterrupt:
+            return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
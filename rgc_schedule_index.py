@@ -0,0 +1,524 @@
+"""
+RGC Stream - Airing schedule conflict index
+Keeps every RGC_AIRING_SCHEDULE slot in memory, in one interval tree per
+platform and one per episode, so the schedule page can check a new slot for
+overlaps and find the next free slot without a range scan of the table.
+
+Each tree is a treap ordered by (START_TS, AIRING_SCHEDULE_ID) whose nodes
+also carry the latest END_TS below them; an overlap check or insert/delete
+walks one root-to-leaf path, O(log n) however many slots a platform holds.
+Slots are half-open, [START_TS, END_TS): a slot may start when another ends.
+
+The index is built once per server process and kept current by the writes
+made through add_schedule() / delete_schedules(). Writes from elsewhere
+(other pages, other processes with the shared query cache, bulk import) bump
+the query cache's table version for RGC_AIRING_SCHEDULE, and the next lookup
+rebuilds; REFRESH_INTERVAL bounds how stale it can get for writes that bypass
+the cache layer entirely. A rebuild loads into a new index outside the lock
+and swaps it in, so lookups during it use the current trees.
+
+The index may not yet hold a slot another process just booked, so every
+insert re-checks its range in SQL with SELECT ... FOR UPDATE inside the
+INSERT transaction; the next-key locks keep other writers out of the range
+until it commits (see migrations/0012_schedule_overlap_indexes.sql). Every
+write path caps a slot at MAX_SLOT_MINUTES, so a slot overlapping [start, end)
+must start after start - MAX_SLOT: the locked range is bounded by one slot
+length instead of reaching back over the platform's whole history.
+"""
+
+import os
+import random
+import threading
+import time
+from collections import namedtuple
+from datetime import timedelta
+
+import streamlit as st
+from mysql.connector import Error
+
+from rgc_cache import query_cache
+from rgc_db import execute_query, in_placeholders, pooled_connection, transaction
+
+SCHEDULE_TABLE = 'RGC_AIRING_SCHEDULE'
+REFRESH_INTERVAL = float(os.environ.get('RGC_SCHEDULE_INDEX_REFRESH', 900))
+LOAD_BATCH_ROWS = 10000
+FREE_SLOT_HORIZON_DAYS = 30
+MAX_SLOT_MINUTES = 180  # longest slot the form, season planner and bulk import accept
+MAX_SLOT = timedelta(minutes=MAX_SLOT_MINUTES)
+
+LOAD_QUERY = """
+    SELECT AIRING_SCHEDULE_ID, EPISODE_ID, PLATFORM_ID, START_TS, END_TS
+    FROM RGC_AIRING_SCHEDULE
+"""
+
+# {column} is PLATFORM_ID or EPISODE_ID; {windows} ORs one LOCK_WINDOW per
+# merged window, so the range scan never reaches back past one slot length
+LOCKED_OVERLAPS_QUERY = """
+    SELECT AIRING_SCHEDULE_ID, EPISODE_ID, PLATFORM_ID, START_TS, END_TS
+    FROM RGC_AIRING_SCHEDULE
+    WHERE {column} = %s AND ({windows})
+    FOR UPDATE
+"""
+LOCK_WINDOW = "(START_TS > %s AND START_TS < %s AND END_TS > %s)"
+
+INSERT_QUERY = """
+    INSERT INTO RGC_AIRING_SCHEDULE
+    (AIRING_SCHEDULE_ID, EPISODE_ID, PLATFORM_ID, START_TS, END_TS)
+    VALUES (%s, %s, %s, %s, %s)
+"""
+
+Slot = namedtuple('Slot', ['schedule_id', 'episode_id', 'platform_id', 'start', 'end'])
+
+# kind: 'platform' or 'episode'; slot: the existing slot it overlaps
+Conflict = namedtuple('Conflict', ['kind', 'slot'])
+
+
+def slot_length_error(start, end):
+    """Why [start, end) is not a valid slot, or None"""
+    if end <= start:
+        return "END_TS must be after START_TS"
+    if end - start > MAX_SLOT:
+        return f"slots may be at most {MAX_SLOT_MINUTES} minutes long"
+    return None
+
+
+def check_slot_lengths(slots):
+    """Raise ValueError for the first slot of invalid length"""
+    for slot in slots:
+        error = slot_length_error(slot.start, slot.end)
+        if error:
+            raise ValueError(f"{slot.schedule_id}: {error}")
+
+
+# ============================================================================
+# INTERVAL TREE
+# ============================================================================
+class _Node:
+    __slots__ = ('key', 'end', 'item', 'priority', 'max_end', 'left', 'right')
+
+    def __init__(self, start, end, item):
+        self.key = (start, item.schedule_id)
+        self.end = end
+        self.item = item
+        self.priority = random.random()
+        self.max_end = end
+        self.left = None
+        self.right = None
+
+
+def _update(node):
+    max_end = node.end
+    if node.left is not None and node.left.max_end > max_end:
+        max_end = node.left.max_end
+    if node.right is not None and node.right.max_end > max_end:
+        max_end = node.right.max_end
+    node.max_end = max_end
+
+
+def _split(node, key):
+    """(keys < key, keys >= key)"""
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        _update(node)
+        return node, right
+    left, node.left = _split(node.left, key)
+    _update(node)
+    return left, node
+
+
+def _merge(left, right):
+    """Join two treaps where every key of `left` sorts before `right`"""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        _update(left)
+        return left
+    right.left = _merge(left, right.left)
+    _update(right)
+    return right
+
+
+class IntervalTree:
+    """Half-open intervals [start, end) keyed by slot, with O(log n) overlap lookup"""
+
+    def __init__(self, slots=()):
+        self._root = None
+        self._size = 0
+        slots = sorted(slots, key=lambda s: (s.start, s.schedule_id))
+        if slots:
+            self._root = self._build(slots)
+            self._size = len(slots)
+
+    @staticmethod
+    def _build(slots):
+        """O(n) treap over sorted slots: the right spine as a stack (Cartesian tree)"""
+        spine = []
+        for slot in slots:
+            node = _Node(slot.start, slot.end, slot)
+            last = None
+            while spine and spine[-1].priority < node.priority:
+                last = spine.pop()
+                _update(last)
+            node.left = last
+            if spine:
+                spine[-1].right = node
+            spine.append(node)
+        for node in reversed(spine):
+            _update(node)
+        return spine[0]
+
+    def __len__(self):
+        return self._size
+
+    def add(self, slot):
+        left, right = _split(self._root, (slot.start, slot.schedule_id))
+        self._root = _merge(_merge(left, _Node(slot.start, slot.end, slot)), right)
+        self._size += 1
+
+    def remove(self, slot):
+        """Drop `slot` (matched on start and ID); False if it was not there"""
+        key = (slot.start, slot.schedule_id)
+        parent, node = None, self._root
+        while node is not None and node.key != key:
+            parent, node = node, (node.left if key < node.key else node.right)
+        if node is None:
+            return False
+        joined = _merge(node.left, node.right)
+        if parent is None:
+            self._root = joined
+        elif parent.left is node:
+            parent.left = joined
+        else:
+            parent.right = joined
+        self._size -= 1
+        # max_end along the path above may have come from the removed node
+        self._refresh_path(key)
+        return True
+
+    def _refresh_path(self, key):
+        path, node = [], self._root
+        while node is not None:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        for node in reversed(path):
+            _update(node)
+
+    def first_overlap(self, start, end):
+        """
+        Some slot overlapping [start, end), or None
+        If the left subtree reaches past `start` but holds no overlap, its
+        latest-ending slot starts at or after `end`, and so does everything to
+        the right: one path decides it.
+        """
+        node = self._root
+        while node is not None:
+            if node.key[0] < end and node.end > start:
+                return node.item
+            if node.left is not None and node.left.max_end > start:
+                node = node.left
+            elif node.key[0] < end:
+                node = node.right
+            else:
+                return None
+        return None
+
+    def overlapping(self, start, end):
+        """Every slot overlapping [start, end), by start time"""
+        found, stack = [], [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None or node.max_end <= start:
+                continue
+            stack.append(node.left)
+            if node.key[0] < end:
+                if node.end > start:
+                    found.append(node.item)
+                stack.append(node.right)
+        return sorted(found, key=lambda s: (s.start, s.schedule_id))
+
+    def next_free(self, after, length, until=None):
+        """Earliest start >= `after` of a free gap of `length`; None if it would end past `until`"""
+        start = after
+        while until is None or start + length <= until:
+            blocking = self.first_overlap(start, start + length)
+            if blocking is None:
+                return start
+            start = blocking.end
+        return None
+
+
+# ============================================================================
+# SCHEDULE INDEX
+# ============================================================================
+class ScheduleIndex:
+    """Interval trees of every schedule slot by platform and by episode"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.refresh_lock = threading.Lock()
+        self._slots = {}
+        self._by_platform = {}
+        self._by_episode = {}
+        self._version = None
+        self.loaded_at = None
+        self.load_ms = 0.0
+
+    def load(self, slots, version=None):
+        """Replace the contents with `slots`; `version` is table_version() read before them"""
+        by_platform, by_episode = {}, {}
+        for slot in slots:
+            if slot.platform_id is not None:
+                by_platform.setdefault(slot.platform_id, []).append(slot)
+            by_episode.setdefault(slot.episode_id, []).append(slot)
+        with self.lock:
+            self._slots = {slot.schedule_id: slot for slot in slots}
+            self._by_platform = {key: IntervalTree(group) for key, group in by_platform.items()}
+            self._by_episode = {key: IntervalTree(group) for key, group in by_episode.items()}
+            self._version = version
+            self.loaded_at = time.monotonic()
+
+    def swap(self, other):
+        """Take over the contents of `other`, a freshly loaded index"""
+        with self.lock:
+            for name, value in vars(other).items():
+                if name not in ('lock', 'refresh_lock'):
+                    setattr(self, name, value)
+
+    def is_stale(self):
+        if self.loaded_at is None or time.monotonic() - self.loaded_at > REFRESH_INTERVAL:
+            return True
+        return table_version() != self._version
+
+    def note_own_write(self, before):
+        """
+        Adopt the table version after a write this index has already applied,
+        unless someone else wrote to the table meanwhile (then rebuild)
+        """
+        after = table_version()
+        if before is not None and self._version == before and after == before + 1:
+            self._version = after
+
+    def conflicts(self, slot):
+        """
+        Existing slots overlapping `slot` on its platform, then on its episode
+        O(log n + k) for k conflicts; the slot's own ID never conflicts.
+        """
+        found = []
+        with self.lock:
+            for kind, trees, key in (('platform', self._by_platform, slot.platform_id),
+                                     ('episode', self._by_episode, slot.episode_id)):
+                tree = trees.get(key) if key is not None else None
+                if tree is None:
+                    continue
+                found += [Conflict(kind, other) for other in tree.overlapping(slot.start, slot.end)
+                          if other.schedule_id != slot.schedule_id]
+        return found
+
+    def add(self, slot):
+        with self.lock:
+            self._slots[slot.schedule_id] = slot
+            if slot.platform_id is not None:
+                self._by_platform.setdefault(slot.platform_id, IntervalTree()).add(slot)
+            self._by_episode.setdefault(slot.episode_id, IntervalTree()).add(slot)
+
+    def update(self, slots):
+        """Add `slots`, replacing any held under the same IDs"""
+        with self.lock:
+            self.remove([slot.schedule_id for slot in slots])
+            for slot in slots:
+                self.add(slot)
+
+    def remove(self, schedule_ids):
+        with self.lock:
+            for schedule_id in schedule_ids:
+                slot = self._slots.pop(schedule_id, None)
+                if slot is None:
+                    continue
+                for trees, key in ((self._by_platform, slot.platform_id),
+                                   (self._by_episode, slot.episode_id)):
+                    tree = trees.get(key)
+                    if tree is not None:
+                        tree.remove(slot)
+                        if not tree:
+                            del trees[key]
+
+    def next_free_slot(self, platform_id, after, minutes, until=None):
+        """Start of the first `minutes`-long gap on the platform at or after `after`"""
+        length = timedelta(minutes=minutes)
+        if until is None:
+            until = after + timedelta(days=FREE_SLOT_HORIZON_DAYS)
+        with self.lock:
+            tree = self._by_platform.get(platform_id)
+            if tree is None:
+                return after
+            return tree.next_free(after, length, until)
+
+    def stats(self):
+        return {
+            'slots': len(self._slots),
+            'platforms': len(self._by_platform),
+            'load_ms': self.load_ms,
+        }
+
+
+def table_version():
+    """
+    Query cache version of RGC_AIRING_SCHEDULE; None if the shared cache is
+    unreadable. query_cache.clear() bumps only the '*' version, which flushes
+    cached reads without saying anything about the schedule, so it is ignored.
+    """
+    snapshot = query_cache.snapshot({SCHEDULE_TABLE})
+    return None if snapshot is None else dict(snapshot).get(SCHEDULE_TABLE, 0)
+
+
+def load_slots(conn, batch_rows=LOAD_BATCH_ROWS):
+    """Every slot of RGC_AIRING_SCHEDULE, streamed in batches"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(LOAD_QUERY)
+        slots = []
+        while True:
+            rows = cursor.fetchmany(batch_rows)
+            if not rows:
+                return slots
+            slots += [Slot(*row) for row in rows]
+    finally:
+        cursor.close()
+
+
+@st.cache_resource
+def get_schedule_index():
+    """The process-wide schedule index (loaded on first use)"""
+    return ScheduleIndex()
+
+
+def schedule_index():
+    """The schedule index, rebuilt first if the table changed; None if loading failed"""
+    index = get_schedule_index()
+    if not index.is_stale():
+        return index
+    # Once loaded, renders arriving during another render's rebuild use the
+    # current trees rather than wait for it
+    if not index.refresh_lock.acquire(blocking=index.loaded_at is None):
+        return index
+    try:
+        if not index.is_stale():
+            return index
+        version = table_version()
+        start = time.perf_counter()
+        with pooled_connection() as conn:
+            if not conn:
+                return None
+            try:
+                slots = load_slots(conn)
+            except Error as e:
+                st.error(f"Database Error: {e}")
+                return None
+        fresh = ScheduleIndex()
+        fresh.load(slots, version)
+        fresh.load_ms = (time.perf_counter() - start) * 1000
+        index.swap(fresh)
+        return index
+    finally:
+        index.refresh_lock.release()
+
+
+# ============================================================================
+# WRITES
+# ============================================================================
+def lock_windows(slots):
+    """
+    (START_TS after, START_TS before, END_TS after) windows holding every
+    slot that overlaps one of `slots`; windows of nearby slots are merged
+    """
+    windows = []
+    for slot in sorted(slots, key=lambda s: s.start):
+        after = slot.start - MAX_SLOT
+        if windows and after < windows[-1][1]:
+            low, high, end_after = windows[-1]
+            windows[-1] = (low, max(high, slot.end), min(end_after, slot.start))
+        else:
+            windows.append((after, slot.end, slot.start))
+    return windows
+
+
+def locked_conflicts(cursor, slots, kinds=('platform', 'episode')):
+    """
+    (slot, Conflict) for rows already in the table that overlap `slots`, read
+    with FOR UPDATE inside the caller's transaction; one query per platform
+    or episode, in key order, locking only START_TS windows around its slots
+    """
+    check_slot_lengths(slots)
+    columns = {'platform': 'PLATFORM_ID', 'episode': 'EPISODE_ID'}
+    groups = {}
+    for slot in slots:
+        for kind in kinds:
+            key = slot.platform_id if kind == 'platform' else slot.episode_id
+            if key is not None:
+                groups.setdefault((kind, key), []).append(slot)
+    found = []
+    for (kind, key), group in sorted(groups.items()):
+        windows = lock_windows(group)
+        query = LOCKED_OVERLAPS_QUERY.format(column=columns[kind],
+                                             windows=" OR ".join([LOCK_WINDOW] * len(windows)))
+        cursor.execute(query, (key, *[value for window in windows for value in window]))
+        existing = [Slot(row['AIRING_SCHEDULE_ID'], row['EPISODE_ID'], row['PLATFORM_ID'],
+                         row['START_TS'], row['END_TS']) for row in cursor.fetchall()]
+        found += [(slot, Conflict(kind, other)) for slot in group for other in existing
+                  if other.start < slot.end and other.end > slot.start
+                  and other.schedule_id != slot.schedule_id]
+    return found
+
+
+def add_schedule(slot):
+    """
+    Insert `slot` unless it overlaps another slot on its platform or episode
+    Returns (inserted, conflicts); conflicts is None if the index could not load.
+    Raises ValueError for a slot longer than MAX_SLOT_MINUTES.
+    """
+    check_slot_lengths([slot])
+    index = schedule_index()
+    if index is None:
+        return False, None
+    found = index.conflicts(slot)
+    if found:
+        return False, found
+    before = table_version()
+    try:
+        with transaction() as cursor:
+            if cursor is None:
+                return False, []
+            found = [conflict for _, conflict in locked_conflicts(cursor, [slot])]
+            if not found:
+                cursor.execute(INSERT_QUERY, (slot.schedule_id, slot.episode_id, slot.platform_id,
+                                              slot.start, slot.end))
+    except Error:
+        # transaction() has rolled back and reported it
+        return False, []
+    if found:
+        # Booked by another process since the index last loaded
+        index.update([conflict.slot for conflict in found])
+        return False, found
+    index.add(slot)
+    index.note_own_write(before)
+    return True, []
+
+
+def delete_schedules(schedule_ids):
+    """Delete slots by ID and drop them from the index; affected rows, or None on failure"""
+    if not schedule_ids:
+        return 0
+    index = get_schedule_index()
+    before = table_version()
+    affected = execute_query(
+        f"DELETE FROM RGC_AIRING_SCHEDULE WHERE AIRING_SCHEDULE_ID IN ({in_placeholders(schedule_ids)})",
+        tuple(schedule_ids), commit=True)
+    if affected is not None and index.loaded_at is not None:
+        index.remove(schedule_ids)
+        index.note_own_write(before)
+    return affected
@@ -0,0 +1,127 @@
+"""
+RGC Stream - Full-text search
+Ranked search over series names, episode titles, cast & crew names and review
+text using the FULLTEXT indexes created in migrations/0002_performance_indexes.sql.
+
+Names and titles are indexed with the ngram parser, so a query matches on
+overlapping two-character fragments: partial words ("strang"), words inside a
+title and small typos ("stranjer things") still rank the right rows first.
+Review text uses the standard word parser and is searched with prefix terms.
+InnoDB keeps both kinds of index in sync with every committed write.
+"""
+
+import re
+
+from rgc_db import cached_query
+
+MIN_QUERY_LENGTH = 2  # ngram_token_size; shorter strings have no ngrams to match
+RESULTS_PER_KIND = 10
+SEARCH_CACHE_TTL = 30
+
+SEARCH_KINDS = ('series', 'episodes', 'people', 'reviews')
+
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+_QUOTE_RE = re.compile(r'["\\]')
+
+
+def normalize_query(text):
+    """Trim and collapse whitespace in a user search string"""
+    return ' '.join((text or '').split())
+
+
+def phrase_query(text):
+    """Boolean-mode phrase for an ngram index: rows containing the text as a substring"""
+    return '"' + _QUOTE_RE.sub(' ', normalize_query(text)) + '"'
+
+
+def prefix_query(text):
+    """Boolean-mode query requiring every word, each as a prefix (word-parser indexes)"""
+    return ' '.join(f'+{word}*' for word in _WORD_RE.findall(text))
+
+
+def like_prefix(text):
+    """LIKE pattern matching values that start with `text` literally"""
+    escaped = text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return escaped + '%'
+
+
+def series_name_filter(text, alias='ws'):
+    """
+    WHERE clause and params matching series names against `text`
+    Two or more characters match names containing the text, as the old
+    SERIES_NAME LIKE '%text%' filter did, served from the ngram index. A
+    single character has no ngrams, so it matches names starting with it
+    instead, through an indexable prefix LIKE.
+    """
+    text = normalize_query(text)
+    if len(text) < MIN_QUERY_LENGTH:
+        return f"{alias}.SERIES_NAME LIKE %s", [like_prefix(text)]
+    return f"MATCH({alias}.SERIES_NAME) AGAINST (%s IN BOOLEAN MODE)", [phrase_query(text)]
+
+
+def build_search_query(text, limit=RESULTS_PER_KIND):
+    """
+    (query, params) for one search over series, episodes, people and reviews
+    Each branch ranks and limits on its own index before joining, so only
+    `limit` rows per kind ever reach the joins.
+    """
+    review_terms = prefix_query(text)
+    parts = [
+        """(SELECT 'series' as kind, ws.SERIES_ID as item_id, ws.SERIES_NAME as title,
+                   ws.SERIES_ID as series_id, ws.SERIES_NAME as series_name,
+                   ws.COUNTRY_OF_ORIGIN as detail,
+                   MATCH(ws.SERIES_NAME) AGAINST (%s) as score
+            FROM RGC_WEB_SERIES ws
+            WHERE MATCH(ws.SERIES_NAME) AGAINST (%s)
+            ORDER BY score DESC LIMIT %s)""",
+        """(SELECT 'episodes', e.EPISODE_ID, e.EPISODE_TITLE, e.SERIES_ID, ws.SERIES_NAME,
+                   NULL, e.score
+            FROM (SELECT EPISODE_ID, EPISODE_TITLE, SERIES_ID,
+                         MATCH(EPISODE_TITLE) AGAINST (%s) as score
+                  FROM RGC_EPISODE
+                  WHERE MATCH(EPISODE_TITLE) AGAINST (%s)
+                  ORDER BY score DESC LIMIT %s) e
+            JOIN RGC_WEB_SERIES ws ON e.SERIES_ID = ws.SERIES_ID)""",
+        """(SELECT 'people', cc.ASSOCIATION_ID, cc.PERSON_NAME, cc.SERIES_ID, ws.SERIES_NAME,
+                   CONCAT(cc.ROLE_TYPE, IFNULL(CONCAT(' as ', cc.CHARACTER_NAME), '')), cc.score
+            FROM (SELECT ASSOCIATION_ID, PERSON_NAME, SERIES_ID, ROLE_TYPE, CHARACTER_NAME,
+                         MATCH(PERSON_NAME) AGAINST (%s) as score
+                  FROM RGC_CAST_CREW
+                  WHERE MATCH(PERSON_NAME) AGAINST (%s)
+                  ORDER BY score DESC LIMIT %s) cc
+            LEFT JOIN RGC_WEB_SERIES ws ON cc.SERIES_ID = ws.SERIES_ID)""",
+    ]
+    params = [text, text, limit] * 3
+    if review_terms:
+        parts.append(
+            """(SELECT 'reviews', f.FEEDBACK_ID, LEFT(f.FEEDBACK_TEXT, 160), f.SERIES_ID,
+                       ws.SERIES_NAME, f.RATING, f.score
+                FROM (SELECT FEEDBACK_ID, FEEDBACK_TEXT, SERIES_ID, RATING,
+                             MATCH(FEEDBACK_TEXT) AGAINST (%s IN BOOLEAN MODE) as score
+                      FROM RGC_FEEDBACK
+                      WHERE MATCH(FEEDBACK_TEXT) AGAINST (%s IN BOOLEAN MODE)
+                      ORDER BY score DESC LIMIT %s) f
+                JOIN RGC_WEB_SERIES ws ON f.SERIES_ID = ws.SERIES_ID)""")
+        params += [review_terms, review_terms, limit]
+
+    return " UNION ALL ".join(parts), tuple(params)
+
+
+def search_all(text, limit=RESULTS_PER_KIND):
+    """
+    One search box over series, episodes, people and reviews
+    Returns {kind: [rows]} with each list ranked by relevance. Rows have
+    kind, item_id, title, series_id, series_name, detail and score.
+    """
+    results = {kind: [] for kind in SEARCH_KINDS}
+    text = normalize_query(text)
+    if len(text) < MIN_QUERY_LENGTH:
+        return results
+
+    query, params = build_search_query(text, limit)
+    rows = cached_query(query, params, ttl=SEARCH_CACHE_TTL) or []
+    for row in rows:
+        results[row['kind']].append(row)
+    for kind_rows in results.values():
+        kind_rows.sort(key=lambda r: r['score'], reverse=True)
+    return results
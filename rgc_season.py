@@ -0,0 +1,137 @@
+"""
+RGC Stream - Season scheduling
+Plans a whole season from a recurrence rule (e.g. Fridays at 21:00 for ten
+weeks): one new RGC_EPISODE row per air time and its RGC_AIRING_SCHEDULE slot
+on a platform. The plan is checked against the schedule conflict index in
+memory, then every episode and slot is written in a single transaction as
+two batched INSERTs, instead of one sp_add_episode_with_schedule call or one
+form submit per episode. The transaction re-checks the platform's range with
+a locking read first, as add_schedule() does, over a window of one slot
+length around each planned slot rather than the season's whole span.
+"""
+
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+import streamlit as st
+from mysql.connector import Error
+
+from rgc_db import transaction
+from rgc_ids import new_ids
+from rgc_schedule_index import (Conflict, IntervalTree, Slot, check_slot_lengths, locked_conflicts,
+                                schedule_index, table_version)
+
+MAX_SEASON_EPISODES = 200
+MAX_TITLE_LEN = 50
+DEFAULT_TITLE_PATTERN = "Episode {n}"
+
+WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# titles: one per episode; slots: the matching airing slots, provisional IDs until written
+SeasonPlan = namedtuple('SeasonPlan', ['series_id', 'titles', 'slots'])
+
+INSERT_EPISODES = """
+    INSERT INTO RGC_EPISODE
+    (EPISODE_ID, EPISODE_TITLE, TOTAL_VIEWERS, TECHNICAL_INTERRUPTION, SERIES_ID)
+    VALUES (%s, %s, %s, %s, %s)
+"""
+
+INSERT_SLOTS = """
+    INSERT INTO RGC_AIRING_SCHEDULE
+    (AIRING_SCHEDULE_ID, EPISODE_ID, PLATFORM_ID, START_TS, END_TS)
+    VALUES (%s, %s, %s, %s, %s)
+"""
+
+
+def airing_times(first_date, air_time, weekdays, count, every_weeks=1):
+    """
+    The first `count` air times on `weekdays` (0 = Monday) at `air_time`,
+    from `first_date` on, in every `every_weeks`-th week
+    """
+    weekdays = sorted(set(weekdays))
+    if not weekdays or count <= 0:
+        return []
+    week_start = first_date - timedelta(days=first_date.weekday())
+    times = []
+    while len(times) < count:
+        for weekday in weekdays:
+            day = week_start + timedelta(days=weekday)
+            if day >= first_date and len(times) < count:
+                times.append(datetime.combine(day, air_time))
+        week_start += timedelta(weeks=every_weeks)
+    return times
+
+
+def plan_season(series_id, platform_id, times, minutes, first_number=1,
+                title_pattern=DEFAULT_TITLE_PATTERN):
+    """
+    Episode titles and slots for each air time; IDs are provisional until
+    schedule_season() allocates real ones. Raises ValueError when a slot
+    would be longer than MAX_SLOT_MINUTES.
+    """
+    length = timedelta(minutes=minutes)
+    titles, slots = [], []
+    for number, start in enumerate(times, first_number):
+        titles.append(title_pattern.format(n=number))
+        slots.append(Slot(f"#{number}", f"#{number}", platform_id, start, start + length))
+    check_slot_lengths(slots)
+    return SeasonPlan(series_id, titles, slots)
+
+
+def plan_conflicts(index, plan):
+    """(planned slot, Conflict) for overlaps with the schedule and within the plan"""
+    found = [(slot, conflict) for slot in plan.slots for conflict in index.conflicts(slot)]
+    planned = IntervalTree()
+    for slot in plan.slots:
+        found += [(slot, Conflict('season', other)) for other in planned.overlapping(slot.start, slot.end)]
+        planned.add(slot)
+    return found
+
+
+def schedule_season(plan):
+    """
+    Write every episode and slot of `plan` in one transaction unless any slot
+    conflicts. Returns (episodes created, conflicts); conflicts is None on failure.
+    """
+    check_slot_lengths(plan.slots)
+    index = schedule_index()
+    if index is None:
+        return 0, None
+    found = plan_conflicts(index, plan)
+    if found:
+        return 0, found
+    count = len(plan.slots)
+    try:
+        episode_ids = new_ids('RGC_EPISODE', count)
+        schedule_ids = new_ids('RGC_AIRING_SCHEDULE', count)
+    except Error as e:
+        st.error(f"ID Allocation Error: {e}")
+        return 0, None
+    slots = [slot._replace(schedule_id=schedule_id, episode_id=episode_id)
+             for slot, schedule_id, episode_id in zip(plan.slots, schedule_ids, episode_ids)]
+
+    before = table_version()
+    try:
+        with transaction() as cursor:
+            if cursor is None:
+                return 0, None
+            # The episodes are new, so only the platform can have been booked
+            # by another process since the index last loaded
+            found = locked_conflicts(cursor, slots, kinds=('platform',))
+            if not found:
+                cursor.executemany(INSERT_EPISODES, [
+                    (slot.episode_id, title, 0, 'NO', plan.series_id)
+                    for slot, title in zip(slots, plan.titles)])
+                cursor.executemany(INSERT_SLOTS, [
+                    (slot.schedule_id, slot.episode_id, slot.platform_id, slot.start, slot.end)
+                    for slot in slots])
+    except Error:
+        # transaction() has rolled back and reported it
+        return 0, None
+    if found:
+        index.update([conflict.slot for _, conflict in found])
+        return 0, found
+    for slot in slots:
+        index.add(slot)
+    index.note_own_write(before)
+    return count, []
@@ -0,0 +1,436 @@
+"""
+RGC Stream - Batched episode viewer-count ingestion
+Coalesces (episode_id, increment) view events in memory and applies them to
+RGC_EPISODE.TOTAL_VIEWERS with multi-row updates, one transaction per flush.
+
+sp_update_episode_viewers locks and commits once per event, which turns popular
+episodes into a lock convoy at production event rates. Here every episode gets
+one row update per flush window no matter how many events arrived for it, and
+rows are always locked in EPISODE_ID order so concurrent flushers cannot
+deadlock one another. Each flush records a batch ID in RGC_VIEWER_BATCHES in
+the same transaction, so a flush whose connection drops around COMMIT is only
+put back when that ID is missing, never applied twice.
+
+Usage:
+    python rgc_viewer_ingest.py file events.csv [--window 1.0]
+    python rgc_viewer_ingest.py serve --port 7070 [--window 1.0]
+
+Events are one per line, "EPISODE_ID,INCREMENT" (a bare EPISODE_ID counts as
+one view). From Python:
+
+    with ViewerIngestor(window=1.0) as ingestor:
+        ingestor.add('E001', 1)
+"""
+
+import argparse
+import socketserver
+import sys
+import threading
+import time
+import uuid
+
+from mysql.connector import Error, errorcode
+
+from rgc_db import ConnectionPool, get_connection_pool, invalidate_tables, is_disconnect_error
+
+DEFAULT_WINDOW = 1.0  # seconds between flushes
+DEFAULT_MAX_PENDING = 50000  # flush early once this many events are buffered
+BATCH_ROWS = 500  # episodes per UPDATE statement
+
+BATCH_LOG_QUERY = "INSERT INTO RGC_VIEWER_BATCHES (BATCH_ID) VALUES (%s)"
+BATCH_APPLIED_QUERY = "SELECT 1 FROM RGC_VIEWER_BATCHES WHERE BATCH_ID = %s"
+
+# Transient failures: the whole flush is rolled back and retried next window
+RETRY_ERRORS = {
+    errorcode.ER_LOCK_DEADLOCK,
+    errorcode.ER_LOCK_WAIT_TIMEOUT,
+}
+
+
+def build_batch_update(rows):
+    """Multi-row UPDATE adding each (episode_id, increment) to TOTAL_VIEWERS"""
+    derived = " UNION ALL ".join(
+        ["SELECT %s AS EPISODE_ID, %s AS INCREMENT"] * len(rows))
+    query = f"""
+        UPDATE RGC_EPISODE e
+        JOIN ({derived}) d ON e.EPISODE_ID = d.EPISODE_ID
+        SET e.TOTAL_VIEWERS = e.TOTAL_VIEWERS + d.INCREMENT
+    """
+    params = [value for row in rows for value in row]
+    return query, params
+
+
+def parse_event(line):
+    """Parse "EPISODE_ID[,INCREMENT]"; returns None for blank or comment lines"""
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+    episode_id, _, increment = line.partition(',')
+    return episode_id.strip(), int(increment) if increment.strip() else 1
+
+
+# ============================================================================
+# INGESTION STATISTICS
+# ============================================================================
+class IngestStats:
+    """Running counters for events, flushes and flush latency"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.events = 0
+        self.flushes = 0
+        self.rows = 0
+        self.unknown = 0
+        self.rejected = 0
+        self.retries = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    def record_flush(self, rows, elapsed):
+        ms = elapsed * 1000
+        self.flushes += 1
+        self.rows += rows
+        self.last_flush_ms = ms
+        self.max_flush_ms = max(self.max_flush_ms, ms)
+        self._total_flush_ms += ms
+
+    def snapshot(self):
+        uptime = max(time.monotonic() - self.started, 1e-9)
+        return {
+            'events': self.events,
+            'events_per_sec': self.events / uptime,
+            'flushes': self.flushes,
+            'rows_updated': self.rows,
+            'unknown_episodes': self.unknown,
+            'rejected_rows': self.rejected,
+            'retries': self.retries,
+            'last_flush_ms': self.last_flush_ms,
+            'avg_flush_ms': self._total_flush_ms / self.flushes if self.flushes else 0.0,
+            'max_flush_ms': self.max_flush_ms,
+        }
+
+    def format(self):
+        s = self.snapshot()
+        return (f"{s['events']} events ({s['events_per_sec']:.0f}/s), "
+                f"{s['flushes']} flushes, {s['rows_updated']} rows, "
+                f"flush {s['last_flush_ms']:.1f}ms last / {s['avg_flush_ms']:.1f}ms avg / "
+                f"{s['max_flush_ms']:.1f}ms max, "
+                f"{s['unknown_episodes']} unknown, {s['rejected_rows']} rejected, "
+                f"{s['retries']} retries")
+
+
+# ============================================================================
+# INGESTOR
+# ============================================================================
+class ViewerIngestor:
+    """
+    Thread-safe buffer of viewer increments flushed on a background thread
+    Events for the same episode are summed while they wait, so the final
+    TOTAL_VIEWERS is the same as applying each event on its own.
+    """
+
+    def __init__(self, pool=None, window=DEFAULT_WINDOW,
+                 max_pending=DEFAULT_MAX_PENDING, batch_rows=BATCH_ROWS):
+        self.pool = pool or get_connection_pool()
+        self.window = window
+        self.max_pending = max_pending
+        self.batch_rows = batch_rows
+        self.stats = IngestStats()
+        self._pending = {}  # episode_id -> summed increment
+        self._pending_events = 0
+        self._in_doubt = None  # (batch_id, rows, events) of a flush cut off mid-commit
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    # Python API
+    # ------------------------------------------------------------------
+    def add(self, episode_id, increment=1):
+        """Queue one view event"""
+        with self._lock:
+            self._pending[episode_id] = self._pending.get(episode_id, 0) + increment
+            self._pending_events += 1
+            self.stats.events += 1
+            full = self._pending_events >= self.max_pending
+        if full:
+            self._wake.set()
+
+    def add_many(self, events):
+        """Queue an iterable of (episode_id, increment) events"""
+        for episode_id, increment in events:
+            self.add(episode_id, increment)
+
+    def start(self):
+        """Start the background flusher"""
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name='rgc-viewer-flush', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the flusher and flush whatever is still buffered"""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wake.wait(self.window)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Error as e:
+                print(f"viewer flush failed, will retry: {e}", file=sys.stderr)
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+    def _take_pending(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            events, self._pending_events = self._pending_events, 0
+        return pending, events
+
+    def _requeue(self, rows, events):
+        """Put unapplied (episode_id, increment) rows back so they are not lost"""
+        with self._lock:
+            for episode_id, increment in rows:
+                self._pending[episode_id] = self._pending.get(episode_id, 0) + increment
+            self._pending_events += events
+
+    def _batch_committed(self, batch_id):
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(BATCH_APPLIED_QUERY, (batch_id,))
+                return cursor.fetchone() is not None
+            finally:
+                cursor.close()
+
+    def _resolve_in_doubt(self):
+        """
+        Settle a flush whose connection dropped before COMMIT was acknowledged
+        Its rows go back in the buffer only if its batch ID never committed; if
+        the lookup itself fails the flush stays in doubt until the next try.
+        """
+        if self._in_doubt is None:
+            return
+        batch_id, rows, events = self._in_doubt
+        committed = self._batch_committed(batch_id)
+        self._in_doubt = None
+        if committed:
+            self.stats.rows += len(rows)
+            invalidate_tables({'RGC_EPISODE'})
+        else:
+            self._requeue(rows, events)
+
+    def flush(self):
+        """Apply everything buffered so far in a single transaction"""
+        with self._flush_lock:
+            self._resolve_in_doubt()
+            pending, events = self._take_pending()
+            # net-zero increments would not change the row; skip the round trip
+            rows = sorted((eid, inc) for eid, inc in pending.items() if inc)
+            if not rows:
+                return 0
+
+            batch_id = uuid.uuid4().hex
+            start = time.monotonic()
+            try:
+                updated = self._apply(batch_id, rows)
+            except Error as e:
+                if e.errno in RETRY_ERRORS:
+                    self.stats.retries += 1
+                    self._requeue(rows, events)
+                    raise
+                if is_disconnect_error(e):
+                    # the COMMIT may have landed; look the batch up before requeueing
+                    self.stats.retries += 1
+                    self._in_doubt = (batch_id, rows, events)
+                    raise
+                # e.g. TOTAL_VIEWERS_CHECK on a negative correction: find the
+                # offending rows instead of holding the whole batch back
+                updated, unapplied = self._apply_individually(rows)
+                if unapplied:
+                    # one event per row at least, so max_pending still counts them
+                    self._requeue(unapplied, len(unapplied))
+                    raise
+            self.stats.record_flush(updated, time.monotonic() - start)
+            invalidate_tables({'RGC_EPISODE'})
+            return updated
+
+    def _apply(self, batch_id, rows):
+        """Run the batched UPDATEs for sorted rows inside one transaction"""
+        updated = 0
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                conn.start_transaction()
+                cursor.execute(BATCH_LOG_QUERY, (batch_id,))
+                for i in range(0, len(rows), self.batch_rows):
+                    chunk = rows[i:i + self.batch_rows]
+                    query, params = build_batch_update(chunk)
+                    cursor.execute(query, params)
+                    updated += cursor.rowcount
+                conn.commit()
+            except Error:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+        self.stats.unknown += len(rows) - updated
+        return updated
+
+    def _apply_individually(self, rows):
+        """
+        Fallback for a batch that failed on data: apply row by row
+        Returns (rows updated, rows not attempted because the connection failed);
+        the row in flight when the connection dropped is counted as unknown.
+        """
+        updated = 0
+        try:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    for i, (episode_id, increment) in enumerate(rows):
+                        try:
+                            cursor.execute(
+                                "UPDATE RGC_EPISODE SET TOTAL_VIEWERS = TOTAL_VIEWERS + %s "
+                                "WHERE EPISODE_ID = %s", (increment, episode_id))
+                        except Error as e:
+                            if is_disconnect_error(e):
+                                # this row may or may not have committed; the rest were never sent
+                                self.stats.unknown += 1
+                                print(f"unknown {episode_id} {increment:+d}: {e}", file=sys.stderr)
+                                return updated, rows[i + 1:]
+                            self.stats.rejected += 1
+                            print(f"rejected {episode_id} {increment:+d}: {e}", file=sys.stderr)
+                            continue
+                        if cursor.rowcount:
+                            updated += 1
+                        else:
+                            self.stats.unknown += 1
+                finally:
+                    cursor.close()
+        except Error:
+            if not updated:
+                return 0, rows
+            raise
+        return updated, []
+
+
+# ============================================================================
+# EVENT SOURCES
+# ============================================================================
+def ingest_lines(ingestor, lines):
+    """Feed "EPISODE_ID[,INCREMENT]" lines to the ingestor; returns bad line count"""
+    bad = 0
+    for line in lines:
+        try:
+            event = parse_event(line)
+        except ValueError:
+            bad += 1
+            continue
+        if event is not None:
+            ingestor.add(*event)
+    return bad
+
+
+def ingest_file(ingestor, path):
+    """Read events from a file ("-" for stdin)"""
+    if path == '-':
+        return ingest_lines(ingestor, sys.stdin)
+    with open(path, encoding='utf-8') as f:
+        return ingest_lines(ingestor, f)
+
+
+class _EventHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        lines = (raw.decode('utf-8', errors='replace') for raw in self.rfile)
+        ingest_lines(self.server.ingestor, lines)
+
+
+class EventServer(socketserver.ThreadingTCPServer):
+    """TCP server accepting newline-delimited events from any number of clients"""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, ingestor):
+        super().__init__(address, _EventHandler)
+        self.ingestor = ingestor
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+def _report_periodically(ingestor, interval, stop):
+    while not stop.wait(interval):
+        print(ingestor.stats.format(), file=sys.stderr)
+
+
+def main(argv=None):
+    from rgc_datagen import add_connection_args, connection_config
+
+    parser = argparse.ArgumentParser(description="Batched RGC_EPISODE viewer-count ingestion")
+    add_connection_args(parser)
+    parser.add_argument('--window', type=float, default=DEFAULT_WINDOW,
+                        help="seconds to coalesce events before each flush")
+    parser.add_argument('--max-pending', type=int, default=DEFAULT_MAX_PENDING,
+                        help="flush early once this many events are buffered")
+    parser.add_argument('--batch-rows', type=int, default=BATCH_ROWS,
+                        help="episodes per UPDATE statement")
+    parser.add_argument('--report-every', type=float, default=5.0,
+                        help="seconds between throughput reports")
+    sub = parser.add_subparsers(dest='source', required=True)
+    file_cmd = sub.add_parser('file', help="ingest events from a file")
+    file_cmd.add_argument('path', help='event file, or "-" for stdin')
+    serve_cmd = sub.add_parser('serve', help="accept events over TCP")
+    # own dests: a subcommand default would overwrite the database --host/--port
+    serve_cmd.add_argument('--bind', default='127.0.0.1')
+    serve_cmd.add_argument('--port', dest='listen_port', type=int, default=7070)
+    args = parser.parse_args(argv)
+
+    pool = ConnectionPool(connection_config(args), size=2)
+    ingestor = ViewerIngestor(pool, window=args.window,
+                              max_pending=args.max_pending, batch_rows=args.batch_rows)
+    stop_report = threading.Event()
+    reporter = threading.Thread(target=_report_periodically,
+                                args=(ingestor, args.report_every, stop_report), daemon=True)
+    reporter.start()
+
+    try:
+        with ingestor:
+            if args.source == 'file':
+                bad = ingest_file(ingestor, args.path)
+                if bad:
+                    print(f"skipped {bad} malformed lines", file=sys.stderr)
+            else:
+                with EventServer((args.bind, args.listen_port), ingestor) as server:
+                    print(f"listening on {args.bind}:{args.listen_port}", file=sys.stderr)
+                    try:
+                        server.serve_forever()
+                    except KeyboardInterrupt:
+                        pass
+    finally:
+        stop_report.set()
+        pool.close()
+        print(ingestor.stats.format(), file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
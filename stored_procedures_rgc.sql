@@ -185,8 +185,9 @@ READS SQL DATA
 BEGIN
     DECLARE v_avg_rating DECIMAL(3,2);
     
-    SELECT AVG(RATING) INTO v_avg_rating
-    FROM RGC_FEEDBACK
+    -- Maintained incrementally by the RGC_SERIES_STATS triggers
+    SELECT IF(REVIEW_COUNT > 0, AVG_RATING, NULL) INTO v_avg_rating
+    FROM RGC_SERIES_STATS
     WHERE SERIES_ID = p_series_id;
     
     RETURN IFNULL(v_avg_rating, 0);
@@ -203,8 +204,8 @@ READS SQL DATA
 BEGIN
     DECLARE v_total_viewers BIGINT;
     
-    SELECT SUM(TOTAL_VIEWERS) INTO v_total_viewers
-    FROM RGC_EPISODE
+    SELECT TOTAL_VIEWERS INTO v_total_viewers
+    FROM RGC_SERIES_STATS
     WHERE SERIES_ID = p_series_id;
     
     RETURN IFNULL(v_total_viewers, 0);
@@ -258,17 +259,15 @@ BEGIN
     SELECT 
         ws.SERIES_NAME,
         ws.NUM_EPISODES,
-        COUNT(DISTINCT e.EPISODE_ID) as episodes_created,
-        AVG(f.RATING) as avg_rating,
-        COUNT(DISTINCT f.FEEDBACK_ID) as total_reviews,
-        SUM(e.TOTAL_VIEWERS) as total_viewers,
+        ss.EPISODE_COUNT as episodes_created,
+        IF(ss.REVIEW_COUNT > 0, ss.AVG_RATING, NULL) as avg_rating,
+        ss.REVIEW_COUNT as total_reviews,
+        ss.TOTAL_VIEWERS as total_viewers,
         ph.HOUSE_NAME as production_house
     FROM RGC_WEB_SERIES ws
-    LEFT JOIN RGC_EPISODE e ON ws.SERIES_ID = e.SERIES_ID
-    LEFT JOIN RGC_FEEDBACK f ON ws.SERIES_ID = f.SERIES_ID
+    JOIN RGC_SERIES_STATS ss ON ws.SERIES_ID = ss.SERIES_ID
     LEFT JOIN RGC_PRODUCTION_HOUSE ph ON ws.HOUSE_ID = ph.HOUSE_ID
-    WHERE ws.SERIES_ID = p_series_id
-    GROUP BY ws.SERIES_ID;
+    WHERE ws.SERIES_ID = p_series_id;
 END$$
 
 -- ============================================================================
@@ -282,7 +281,35 @@ CREATE PROCEDURE sp_search_series(
     IN p_country VARCHAR(30)
 )
 BEGIN
-    SELECT DISTINCT
+    -- Substring match served by the ngram FULLTEXT index on SERIES_NAME
+    -- (a leading-wildcard LIKE cannot use idx_series_name). The matching
+    -- SERIES_IDs are collected first, one statement per case: a MATCH under
+    -- OR with other conditions is not served by the FULLTEXT index and falls
+    -- back to a table scan. One SELECT then filters and shapes the results.
+    DECLARE v_phrase VARCHAR(60) DEFAULT CONCAT('"', REPLACE(p_search_term, '"', ' '), '"');
+    
+    DROP TEMPORARY TABLE IF EXISTS tmp_series_matches;
+    CREATE TEMPORARY TABLE tmp_series_matches (SERIES_ID VARCHAR(10) PRIMARY KEY);
+    
+    IF p_search_term IS NULL THEN
+        INSERT INTO tmp_series_matches
+        SELECT SERIES_ID FROM RGC_WEB_SERIES;
+    ELSEIF CHAR_LENGTH(p_search_term) < 2 THEN
+        -- Too short for an ngram: indexable prefix LIKE, with \, % and _
+        -- escaped so the term only matches itself
+        INSERT INTO tmp_series_matches
+        SELECT SERIES_ID FROM RGC_WEB_SERIES
+        WHERE SERIES_NAME LIKE CONCAT(
+            REPLACE(REPLACE(REPLACE(p_search_term, '\\', '\\\\'), '%', '\\%'), '_', '\\_'),
+            '%');
+    ELSE
+        INSERT INTO tmp_series_matches
+        SELECT SERIES_ID FROM RGC_WEB_SERIES
+        WHERE MATCH(SERIES_NAME) AGAINST (v_phrase IN BOOLEAN MODE);
+    END IF;
+    
+    -- Ratings come from the trigger-maintained summary, not a FEEDBACK join
+    SELECT
         ws.SERIES_ID,
         ws.SERIES_NAME,
         ws.NUM_EPISODES,
@@ -290,22 +317,24 @@ BEGIN
         ws.LANGUAGE,
         ws.COUNTRY_OF_ORIGIN,
         ph.HOUSE_NAME,
-        AVG(f.RATING) as avg_rating,
-        COUNT(DISTINCT f.FEEDBACK_ID) as review_count,
+        IF(ss.REVIEW_COUNT > 0, ss.AVG_RATING, NULL) as avg_rating,
+        ss.REVIEW_COUNT as review_count,
         GROUP_CONCAT(DISTINCT st.SERIES_TYPE_NAME) as genres
-    FROM RGC_WEB_SERIES ws
+    FROM tmp_series_matches m
+    JOIN RGC_WEB_SERIES ws ON ws.SERIES_ID = m.SERIES_ID
     JOIN RGC_PRODUCTION_HOUSE ph ON ws.HOUSE_ID = ph.HOUSE_ID
+    JOIN RGC_SERIES_STATS ss ON ws.SERIES_ID = ss.SERIES_ID
     LEFT JOIN RGC_WEB_SERIES_SERIES_TYPE wst ON ws.SERIES_ID = wst.SERIES_ID
     LEFT JOIN RGC_SERIES_TYPE st ON wst.SERIES_TYPE_ID = st.SERIES_TYPE_ID
-    LEFT JOIN RGC_FEEDBACK f ON ws.SERIES_ID = f.SERIES_ID
-    WHERE 
-        (p_search_term IS NULL OR ws.SERIES_NAME LIKE CONCAT('%', p_search_term, '%'))
-        AND (p_genre IS NULL OR st.SERIES_TYPE_NAME = p_genre)
+    WHERE (p_genre IS NULL OR st.SERIES_TYPE_NAME = p_genre)
         AND (p_country IS NULL OR ws.COUNTRY_OF_ORIGIN = p_country)
+        AND (p_min_rating IS NULL OR (ss.REVIEW_COUNT > 0 AND ss.AVG_RATING >= p_min_rating))
     GROUP BY ws.SERIES_ID, ws.SERIES_NAME, ws.NUM_EPISODES, 
-             ws.RELEASE_DATE, ws.LANGUAGE, ws.COUNTRY_OF_ORIGIN, ph.HOUSE_NAME
-    HAVING (p_min_rating IS NULL OR avg_rating >= p_min_rating)
+             ws.RELEASE_DATE, ws.LANGUAGE, ws.COUNTRY_OF_ORIGIN, ph.HOUSE_NAME,
+             ss.AVG_RATING, ss.REVIEW_COUNT
     ORDER BY avg_rating DESC, review_count DESC;
+    
+    DROP TEMPORARY TABLE tmp_series_matches;
 END$$
 
 -- ============================================================================
@@ -390,169 +419,12 @@ END$$
 DELIMITER ;
 
 -- ============================================================================
--- PERFORMANCE INDEXES (Database Optimization)
+-- TABLES, INDEXES, TRIGGERS AND VIEWS
 -- ============================================================================
-
--- Index for series name searches (most common query)
-CREATE INDEX idx_series_name ON RGC_WEB_SERIES(SERIES_NAME);
-
--- Index for feedback queries by series and rating
-CREATE INDEX idx_feedback_series_rating ON RGC_FEEDBACK(SERIES_ID, RATING);
-
--- Index for viewer country lookups
-CREATE INDEX idx_viewer_country ON RGC_VIEWER(COUNTRY_CODE);
-
--- Composite index for episode queries
-CREATE INDEX idx_episode_series_viewers ON RGC_EPISODE(SERIES_ID, TOTAL_VIEWERS);
-
--- Index for contract queries - CORRECTED TABLE NAME
-CREATE INDEX idx_contract_series ON RGC_CONTRACT(SERIES_ID);
-
--- Index for episode schedules
-CREATE INDEX idx_schedule_episode ON RGC_AIRING_SCHEDULE(EPISODE_ID);
-
--- Index for producer lookups
-CREATE INDEX idx_producer_email ON RGC_PRODUCER(P_EMAIL);
-
--- Index for production house lookups
-CREATE INDEX idx_house_name ON RGC_PRODUCTION_HOUSE(HOUSE_NAME);
-
--- ============================================================================
--- AUDIT TABLE (Security & History Tracking)
--- ============================================================================
-
-CREATE TABLE IF NOT EXISTS RGC_AUDIT_LOG (
-    LOG_ID INT AUTO_INCREMENT PRIMARY KEY,
-    TABLE_NAME VARCHAR(50) NOT NULL,
-    OPERATION_TYPE ENUM('INSERT', 'UPDATE', 'DELETE') NOT NULL,
-    RECORD_ID VARCHAR(50),
-    OLD_VALUES TEXT,
-    NEW_VALUES TEXT,
-    CHANGED_BY VARCHAR(50),
-    CHANGE_TIMESTAMP TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    INDEX idx_table_timestamp (TABLE_NAME, CHANGE_TIMESTAMP),
-    INDEX idx_operation (OPERATION_TYPE)
-);
-
--- ============================================================================
--- TRIGGERS FOR AUDIT LOGGING
--- ============================================================================
-
-DELIMITER $$
-
--- Trigger: Log series updates
-DROP TRIGGER IF EXISTS trg_series_after_update$$
-CREATE TRIGGER trg_series_after_update
-AFTER UPDATE ON RGC_WEB_SERIES
-FOR EACH ROW
-BEGIN
-    INSERT INTO RGC_AUDIT_LOG 
-    (TABLE_NAME, OPERATION_TYPE, RECORD_ID, OLD_VALUES, NEW_VALUES)
-    VALUES 
-    ('RGC_WEB_SERIES', 'UPDATE', NEW.SERIES_ID,
-     CONCAT('Episodes: ', OLD.NUM_EPISODES, ', Name: ', OLD.SERIES_NAME),
-     CONCAT('Episodes: ', NEW.NUM_EPISODES, ', Name: ', NEW.SERIES_NAME));
-END$$
-
--- Trigger: Log series deletions
-DROP TRIGGER IF EXISTS trg_series_after_delete$$
-CREATE TRIGGER trg_series_after_delete
-AFTER DELETE ON RGC_WEB_SERIES
-FOR EACH ROW
-BEGIN
-    INSERT INTO RGC_AUDIT_LOG 
-    (TABLE_NAME, OPERATION_TYPE, RECORD_ID, OLD_VALUES)
-    VALUES 
-    ('RGC_WEB_SERIES', 'DELETE', OLD.SERIES_ID,
-     CONCAT('Deleted: ', OLD.SERIES_NAME, ' (', OLD.NUM_EPISODES, ' episodes)'));
-END$$
-
--- Trigger: Log feedback submissions
-DROP TRIGGER IF EXISTS trg_feedback_after_insert$$
-CREATE TRIGGER trg_feedback_after_insert
-AFTER INSERT ON RGC_FEEDBACK
-FOR EACH ROW
-BEGIN
-    INSERT INTO RGC_AUDIT_LOG 
-    (TABLE_NAME, OPERATION_TYPE, RECORD_ID, NEW_VALUES)
-    VALUES 
-    ('RGC_FEEDBACK', 'INSERT', NEW.FEEDBACK_ID,
-     CONCAT('Series: ', NEW.SERIES_ID, ', Rating: ', NEW.RATING, 
-            ', Account: ', NEW.ACCOUNT_ID));
-END$$
-
--- Trigger: Log contract changes - CORRECTED TABLE NAME
-DROP TRIGGER IF EXISTS trg_contract_after_update$$
-CREATE TRIGGER trg_contract_after_update
-AFTER UPDATE ON RGC_CONTRACT
-FOR EACH ROW
-BEGIN
-    INSERT INTO RGC_AUDIT_LOG 
-    (TABLE_NAME, OPERATION_TYPE, RECORD_ID, OLD_VALUES, NEW_VALUES)
-    VALUES 
-    ('RGC_CONTRACT', 'UPDATE', NEW.CONTRACT_ID,
-     CONCAT('Rate: ', OLD.EPISODE_RATE, ', End: ', OLD.END_DATE),
-     CONCAT('Rate: ', NEW.EPISODE_RATE, ', End: ', NEW.END_DATE));
-END$$
-
-DELIMITER ;
-
--- ============================================================================
--- VIEWS FOR COMMON QUERIES (Performance Optimization)
--- ============================================================================
-
--- View: Series with full details
-CREATE OR REPLACE VIEW vw_series_full_details AS
-SELECT 
-    ws.SERIES_ID,
-    ws.SERIES_NAME,
-    ws.NUM_EPISODES,
-    ws.RELEASE_DATE,
-    ws.COUNTRY_OF_ORIGIN,
-    ws.LANGUAGE,
-    ph.HOUSE_NAME,
-    ph.ADDRESS_CITY as production_city,
-    COUNT(DISTINCT e.EPISODE_ID) as episodes_created,
-    SUM(e.TOTAL_VIEWERS) as total_viewers,
-    AVG(f.RATING) as avg_rating,
-    COUNT(DISTINCT f.FEEDBACK_ID) as review_count,
-    GROUP_CONCAT(DISTINCT st.SERIES_TYPE_NAME) as genres
-FROM RGC_WEB_SERIES ws
-JOIN RGC_PRODUCTION_HOUSE ph ON ws.HOUSE_ID = ph.HOUSE_ID
-LEFT JOIN RGC_EPISODE e ON ws.SERIES_ID = e.SERIES_ID
-LEFT JOIN RGC_FEEDBACK f ON ws.SERIES_ID = f.SERIES_ID
-LEFT JOIN RGC_WEB_SERIES_SERIES_TYPE wst ON ws.SERIES_ID = wst.SERIES_ID
-LEFT JOIN RGC_SERIES_TYPE st ON wst.SERIES_TYPE_ID = st.SERIES_TYPE_ID
-GROUP BY ws.SERIES_ID;
-
--- View: Top rated series
-CREATE OR REPLACE VIEW vw_top_rated_series AS
-SELECT 
-    ws.SERIES_ID,
-    ws.SERIES_NAME,
-    AVG(f.RATING) as avg_rating,
-    COUNT(f.FEEDBACK_ID) as review_count
-FROM RGC_WEB_SERIES ws
-LEFT JOIN RGC_FEEDBACK f ON ws.SERIES_ID = f.SERIES_ID
-GROUP BY ws.SERIES_ID, ws.SERIES_NAME
-HAVING review_count > 0
-ORDER BY avg_rating DESC, review_count DESC;
-
--- View: Active contracts - CORRECTED TABLE NAME
-CREATE OR REPLACE VIEW vw_active_contracts AS
-SELECT 
-    c.CONTRACT_ID,
-    ws.SERIES_NAME,
-    ph.HOUSE_NAME,
-    c.CONTRACT_DATE,
-    c.END_DATE,
-    c.EPISODE_RATE,
-    DATEDIFF(c.END_DATE, CURDATE()) as days_remaining
-FROM RGC_CONTRACT c
-JOIN RGC_WEB_SERIES ws ON c.SERIES_ID = ws.SERIES_ID
-JOIN RGC_PRODUCTION_HOUSE ph ON ws.HOUSE_ID = ph.HOUSE_ID
-WHERE c.END_DATE > CURDATE()
-ORDER BY c.END_DATE;
+-- Performance indexes, the audit log and its triggers, the series statistics
+-- summary, ID blocks and views are versioned migrations in migrations/.
+-- Apply them (once per deploy) with:
+--   python rgc_migrate.py up
 
 -- ============================================================================
 -- TEST EXAMPLES
@@ -564,6 +436,9 @@ ORDER BY c.END_DATE;
 -- CALL sp_get_contract_analytics(NULL);
 -- CALL sp_get_producer_houses('P001');
 
+-- Rebuild the series statistics summary:
+-- CALL sp_rebuild_series_stats();
+
 -- Test functions:
 -- SELECT fn_get_series_avg_rating('S001');
 -- SELECT fn_get_series_total_viewers('S001');
@@ -573,4 +448,4 @@ ORDER BY c.END_DATE;
 -- SELECT * FROM vw_top_rated_series LIMIT 10;
 -- SELECT * FROM vw_active_contracts;
 
-SELECT 'All stored procedures, functions, triggers, indexes, and views created successfully!' as Status;
\ No newline at end of file
+SELECT 'All stored procedures and functions created successfully!' as Status;
\ No newline at end of file